@@ -16,9 +16,7 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
 
   NAME = 'browser_search'
 
-  _EVENT_TAG_LABELS = ['browser_search']
-
-  _SUPPORTED_EVENT_DATA_TYPES = frozenset([
+  DATA_TYPES = frozenset([
       'chrome:autofill:entry',
       'chrome:cache:entry',
       'chrome:cookie:entry',
@@ -49,6 +47,8 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
       'safari:history:visit',
       'safari:history:visit_sqlite'])
 
+  _EVENT_TAG_LABELS = ['browser_search']
+
   # TODO: use groups to build a single RE.
 
   # Here we define filters and callback methods for all hits on each filter.
@@ -281,7 +281,7 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
       event_data (EventData): event data.
       event_data_stream (EventDataStream): event data stream.
     """
-    if event_data.data_type not in self._SUPPORTED_EVENT_DATA_TYPES:
+    if event_data.data_type not in self.DATA_TYPES:
       return
 
     url = getattr(event_data, 'url', None)
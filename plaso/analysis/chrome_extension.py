@@ -16,7 +16,7 @@ class ChromeExtensionPlugin(interface.AnalysisPlugin):
 
   NAME = 'chrome_extension'
 
-  _SUPPORTED_EVENT_DATA_TYPES = frozenset([
+  DATA_TYPES = frozenset([
       'fs:stat'])
 
   _TITLE_RE = re.compile(r'<title>([^<]+)</title>')
@@ -145,7 +145,7 @@ class ChromeExtensionPlugin(interface.AnalysisPlugin):
       event_data (EventData): event data.
       event_data_stream (EventDataStream): event data stream.
     """
-    if event_data.data_type not in self._SUPPORTED_EVENT_DATA_TYPES:
+    if event_data.data_type not in self.DATA_TYPES:
       return
 
     filename = getattr(event_data, 'filename', None)
@@ -39,7 +39,7 @@ class HashTaggingAnalysisPlugin(interface.AnalysisPlugin):
 
   # The event data types the plugin will collect hashes from. Subclasses
   # must override this attribute.
-  DATA_TYPES = []
+  DATA_TYPES = frozenset()
 
   # Lookup hashes supported by the hash tagging analysis plugin.
   SUPPORTED_HASHES = frozenset([])
@@ -21,6 +21,12 @@ class AnalysisPlugin(object):
   # explains the nature of the plugin easily. It also needs to be unique.
   NAME = 'analysis_plugin'
 
+  # The data types of the event data the plugin analyzes, where an empty set
+  # represents all data types. A plugin that only analyzes specific data types
+  # reads the matching events directly from the storage file, in the order
+  # they were stored instead of in chronological order.
+  DATA_TYPES = frozenset()
+
   # Flag to indicate the analysis is for testing purposes only.
   TEST_PLUGIN = False
 
@@ -17,7 +17,7 @@ class UniqueDomainsVisitedPlugin(interface.AnalysisPlugin):
 
   NAME = 'unique_domains_visited'
 
-  _SUPPORTED_EVENT_DATA_TYPES = frozenset([
+  DATA_TYPES = frozenset([
       'chrome:history:file_downloaded',
       'chrome:history:page_visited',
       'firefox:downloads:download',
@@ -44,7 +44,7 @@ class UniqueDomainsVisitedPlugin(interface.AnalysisPlugin):
       event_data (EventData): event data.
       event_data_stream (EventDataStream): event data stream.
     """
-    if event_data.data_type not in self._SUPPORTED_EVENT_DATA_TYPES:
+    if event_data.data_type not in self.DATA_TYPES:
       return
 
     url = getattr(event_data, 'url', None)
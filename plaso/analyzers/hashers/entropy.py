@@ -4,6 +4,11 @@
 import collections
 import math
 
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
 from plaso.analyzers.hashers import interface
 from plaso.analyzers.hashers import manager
 
@@ -18,9 +23,31 @@ class EntropyHasher(interface.BaseHasher):
   def __init__(self):
     """Initializes the entropy hasher."""
     super(EntropyHasher, self).__init__()
-    self._byte_frequency_counter = collections.Counter()
+    self._byte_frequency_counter = None
+    self._byte_histogram = None
     self._file_length = 0
 
+    # If numpy is available the byte histogram is calculated vectorized,
+    # otherwise the byte values are counted using a Counter.
+    if numpy:
+      self._byte_histogram = numpy.zeros(256, dtype=numpy.uint64)
+    else:
+      self._byte_frequency_counter = collections.Counter()
+
+  def _GetByteFrequencies(self):
+    """Retrieves the byte frequencies.
+
+    Returns:
+      list[int]: number of occurrences per byte value, in order of byte value.
+          Byte values that do not occur can be omitted.
+    """
+    if self._byte_histogram is not None:
+      return self._byte_histogram.tolist()
+
+    return [
+        byte_frequency for _, byte_frequency in sorted(
+            self._byte_frequency_counter.items())]
+
   def GetStringDigest(self):
     """Calculates the byte entropy value.
 
@@ -35,7 +62,7 @@ class EntropyHasher(interface.BaseHasher):
       return '0.000000'
 
     entropy = 0.0
-    for byte_frequency in self._byte_frequency_counter.values():
+    for byte_frequency in self._GetByteFrequencies():
       byte_probability = byte_frequency / self._file_length
       if byte_probability:
         entropy += - byte_probability * math.log(byte_probability, 2)
@@ -48,12 +75,18 @@ class EntropyHasher(interface.BaseHasher):
     concatenation of the arguments.
 
     Args:
-      data(bytes): block of data with which to update the context of the entropy
-          calculator.
+      data(bytes|memoryview): block of data with which to update the context
+          of the entropy calculator.
     """
-    # The call to update() determines the number of occurrences of a byte value
-    # within data.
-    self._byte_frequency_counter.update(data)
+    if self._byte_histogram is not None:
+      byte_values = numpy.frombuffer(data, dtype=numpy.uint8)
+      self._byte_histogram += numpy.bincount(
+          byte_values, minlength=256).astype(numpy.uint64)
+    else:
+      # The call to update() determines the number of occurrences of a byte
+      # value within data.
+      self._byte_frequency_counter.update(data)
+
     self._file_length += len(data)
 
 
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 """The hashing analyzer implementation."""
 
+import time
+
+from concurrent import futures
+
 from plaso.analyzers import interface
 from plaso.analyzers import logger
 from plaso.analyzers import manager
@@ -28,7 +32,26 @@ class HashingAnalyzer(interface.BaseAnalyzer):
     """Initializes a hashing analyzer."""
     super(HashingAnalyzer, self).__init__()
     self._hasher_names_string = ''
+    self._hasher_statistics = {}
     self._hashers = []
+    self._thread_pool = None
+
+  def _UpdateHasher(self, hasher, data):
+    """Updates a hasher with a block of data.
+
+    Args:
+      hasher (BaseHasher): hasher.
+      data (bytes|memoryview): block of data from the data stream.
+    """
+    start_time = time.perf_counter()
+
+    hasher.Update(data)
+
+    processing_time = time.perf_counter() - start_time
+
+    statistics = self._hasher_statistics.setdefault(hasher.NAME, [0, 0.0])
+    statistics[0] += len(data)
+    statistics[1] += processing_time
 
   def Analyze(self, data):
     """Updates the internal state of the analyzer, processing a block of data.
@@ -39,8 +62,24 @@ class HashingAnalyzer(interface.BaseAnalyzer):
     Args:
       data (bytes): block of data from the data stream.
     """
-    for hasher in self._hashers:
-      hasher.Update(data)
+    # A memoryview is passed to the hashers so that the block of data is not
+    # copied per hasher.
+    if isinstance(data, bytes):
+      data = memoryview(data)
+
+    if not self._thread_pool or len(self._hashers) < 2:
+      for hasher in self._hashers:
+        self._UpdateHasher(hasher, data)
+
+    else:
+      # hashlib releases the GIL for large blocks of data, which allows the
+      # hashers to run concurrently.
+      pending_futures = [
+          self._thread_pool.submit(self._UpdateHasher, hasher, data)
+          for hasher in self._hashers]
+
+      for future in pending_futures:
+        future.result()
 
   def GetResults(self):
     """Retrieves the hashing results.
@@ -58,6 +97,21 @@ class HashingAnalyzer(interface.BaseAnalyzer):
       results.append(result)
     return results
 
+  def SampleHasherStatistics(self, analyzers_profiler):
+    """Samples the hasher throughput statistics.
+
+    The statistics are reset after they have been sampled.
+
+    Args:
+      analyzers_profiler (AnalyzersProfiler): analyzers profiler.
+    """
+    for hasher_name, statistics in sorted(self._hasher_statistics.items()):
+      number_of_bytes, processing_time = statistics
+      analyzers_profiler.SampleHasher(
+          hasher_name, number_of_bytes, processing_time)
+
+    self._hasher_statistics = {}
+
   def Reset(self):
     """Resets the internal state of the analyzer."""
     hasher_names = hashers_manager.HashersManager.GetHasherNamesFromString(
@@ -79,5 +133,20 @@ class HashingAnalyzer(interface.BaseAnalyzer):
     self._hashers = hashers_manager.HashersManager.GetHashers(hasher_names)
     self._hasher_names_string = hasher_names_string
 
+  def SetNumberOfThreads(self, number_of_threads):
+    """Sets the number of threads used to run the hashers concurrently.
+
+    Args:
+      number_of_threads (int): number of threads, where 0 or 1 represents
+          the hashers are run sequentially.
+    """
+    if self._thread_pool:
+      self._thread_pool.shutdown(wait=True)
+      self._thread_pool = None
+
+    if number_of_threads > 1:
+      self._thread_pool = futures.ThreadPoolExecutor(
+          max_workers=number_of_threads)
+
 
 manager.AnalyzersManager.RegisterAnalyzer(HashingAnalyzer)
@@ -2,6 +2,7 @@
 """Definitions to provide a whole-file processing framework."""
 
 import abc
+import os
 
 from plaso.lib import definitions
 
@@ -18,6 +19,10 @@ class BaseAnalyzer(object):
   INCREMENTAL_ANALYZER = False
   SIZE_LIMIT = 32 * 1024 * 1024
 
+  # True if the analyzer analyzes the entire data stream at once using
+  # AnalyzeFileObject() instead of per block of data using Analyze().
+  WHOLE_FILE_ANALYZER = False
+
   @abc.abstractmethod
   def Analyze(self, data):
     """Analyzes a block of data, updating the state of the analyzer.
@@ -26,6 +31,20 @@ class BaseAnalyzer(object):
       data(bytes): block of data to process.
     """
 
+  def AnalyzeFileObject(self, file_object):
+    """Analyzes an entire data stream, updating the state of the analyzer.
+
+    Args:
+      file_object (dfvfs.FileIO|BytesFileIO): file-like object of the data
+          stream to process.
+    """
+    file_object.seek(0, os.SEEK_SET)
+
+    data = file_object.read(self.SIZE_LIMIT)
+    while data:
+      self.Analyze(data)
+      data = file_object.read(self.SIZE_LIMIT)
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def GetResults(self):
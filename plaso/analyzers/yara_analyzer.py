@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
 """Analyzer that matches Yara rules."""
 
+import io
+import mmap
+import os
+import shutil
+import tempfile
+
 import yara
 
 try:
@@ -31,34 +37,130 @@ class YaraAnalyzer(interface.BaseAnalyzer):
   PROCESSING_STATUS_HINT = definitions.STATUS_INDICATOR_YARA_SCAN
 
   INCREMENTAL_ANALYZER = False
+  WHOLE_FILE_ANALYZER = True
 
   _ATTRIBUTE_NAME = 'yara_match'
   _MATCH_TIMEOUT = 60
 
+  # The size of the blocks used to copy a data stream to a temporary file.
+  _COPY_BLOCK_SIZE = 16 * 1024 * 1024
+
+  # Minimum amount of free disk space that should remain after a data stream
+  # has been copied to a temporary file.
+  _MINIMUM_FREE_DISK_SPACE = 256 * 1024 * 1024
+
   def __init__(self):
     """Initializes the Yara analyzer."""
     super(YaraAnalyzer, self).__init__()
     self._matches = []
     self._rules = None
+    self._temporary_directory = None
 
-  def Analyze(self, data):
-    """Analyzes a block of data, attempting to match Yara rules to it.
+  def _HasFreeDiskSpace(self, size):
+    """Determines if there is enough free disk space for a temporary file.
 
     Args:
-      data(bytes): a block of data.
+      size (int): size of the data stream to copy to a temporary file.
+
+    Returns:
+      bool: True if there is enough free disk space to copy the data stream to
+          a temporary file.
     """
-    if not self._rules:
-      return
+    temporary_directory = self._temporary_directory or tempfile.gettempdir()
 
     try:
-      self._matches = self._rules.match(data=data, timeout=self._MATCH_TIMEOUT)
+      disk_usage = shutil.disk_usage(temporary_directory)
+    except OSError as exception:
+      logger.warning((
+          f'Unable to determine free disk space of: {temporary_directory:s} '
+          f'with error: {exception!s}'))
+      return False
+
+    return disk_usage.free - size >= self._MINIMUM_FREE_DISK_SPACE
+
+  def _MatchData(self, data):
+    """Matches Yara rules against data.
+
+    Args:
+      data (bytes|memoryview|mmap.mmap): data to match.
+    """
+    try:
+      matches = self._rules.match(data=data, timeout=self._MATCH_TIMEOUT)
 
     except YaraTimeoutError:
       logger.error(
           f'Could not process file within timeout: {self._MATCH_TIMEOUT:d}')
+      return
 
     except YaraError as exception:
       logger.error(f'Error processing file with Yara: {exception!s}.')
+      return
+
+    self._matches.extend(matches)
+
+  def Analyze(self, data):
+    """Analyzes a block of data, attempting to match Yara rules to it.
+
+    Args:
+      data(bytes): a block of data.
+    """
+    if not self._rules:
+      return
+
+    self._MatchData(data)
+
+  def AnalyzeFileObject(self, file_object):
+    """Analyzes an entire data stream, attempting to match Yara rules to it.
+
+    An in-memory data stream is matched directly, otherwise the data stream
+    is copied to a temporary file that is memory mapped, so that the data
+    stream does not need to be read into memory. If there is not enough free
+    disk space for the temporary file, the data stream is matched per block
+    instead, which can miss matches that span blocks or depend on the size
+    of the data stream.
+
+    Args:
+      file_object (dfvfs.FileIO|BytesFileIO): file-like object of the data
+          stream to process.
+    """
+    if not self._rules:
+      return
+
+    if isinstance(file_object, io.BytesIO):
+      with file_object.getbuffer() as data:
+        self._MatchData(data)
+      return
+
+    file_object.seek(0, os.SEEK_SET)
+
+    size = file_object.get_size()
+    if not self._HasFreeDiskSpace(size):
+      logger.warning((
+          f'Not enough free disk space to copy data stream of size: '
+          f'{size:d} to a temporary file, matching Yara rules per block.'))
+
+      data = file_object.read(self._COPY_BLOCK_SIZE)
+      while data:
+        self._MatchData(data)
+        data = file_object.read(self._COPY_BLOCK_SIZE)
+      return
+
+    with tempfile.TemporaryFile(
+        dir=self._temporary_directory) as temporary_file:
+      data = file_object.read(self._COPY_BLOCK_SIZE)
+      while data:
+        temporary_file.write(data)
+        data = file_object.read(self._COPY_BLOCK_SIZE)
+
+      temporary_file.flush()
+
+      if not temporary_file.tell():
+        self._MatchData(b'')
+        return
+
+      with mmap.mmap(
+          temporary_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        self._MatchData(data)
 
   def GetResults(self):
     """Retrieves results of the most recent analysis.
@@ -69,13 +171,23 @@ class YaraAnalyzer(interface.BaseAnalyzer):
     result = analyzer_result.AnalyzerResult()
     result.analyzer_name = self.NAME
     result.attribute_name = self._ATTRIBUTE_NAME
-    result.attribute_value = [match.rule for match in self._matches]
+    # Rules can match multiple blocks of data but are reported only once.
+    result.attribute_value = list(dict.fromkeys(
+        match.rule for match in self._matches))
     return [result]
 
   def Reset(self):
     """Resets the internal state of the analyzer."""
     self._matches = []
 
+  def LoadRules(self, path):
+    """Loads precompiled rules that the Yara analyzer will use.
+
+    Args:
+      path (str): path of the precompiled Yara rules file.
+    """
+    self._rules = yara.load(filepath=path)
+
   def SetRules(self, rules_string):
     """Sets the rules that the Yara analyzer will use.
 
@@ -84,5 +196,14 @@ class YaraAnalyzer(interface.BaseAnalyzer):
     """
     self._rules = yara.compile(source=rules_string)
 
+  def SetTemporaryDirectory(self, temporary_directory):
+    """Sets the directory where data streams are copied to temporary files.
+
+    Args:
+      temporary_directory (str): path of the directory for temporary files,
+          where None represents the default directory of the system.
+    """
+    self._temporary_directory = temporary_directory
+
 
 manager.AnalyzersManager.RegisterAnalyzer(YaraAnalyzer)
@@ -37,6 +37,7 @@ from plaso.multi_process import extraction_engine as multi_extraction_engine
 from plaso.parsers import manager as parsers_manager
 from plaso.parsers import presets as parsers_presets
 from plaso.storage import factory as storage_factory
+from plaso.storage.fake import writer as fake_writer
 
 
 class ExtractionTool(
@@ -85,6 +86,7 @@ class ExtractionTool(
     self._artifacts_registry = None
     self._buffer_size = 0
     self._command_line_arguments = None
+    self._data_stream_buffer_size = None
     self._enable_sigsegv_handler = False
     self._expanded_parser_filter_expression = None
     self._extract_winevt_resources = True
@@ -101,13 +103,18 @@ class ExtractionTool(
     self._process_memory_limit = None
     self._queue_size = self._DEFAULT_QUEUE_SIZE
     self._resolver_context = dfvfs_context.Context()
+    self._resume = False
     self._single_process_mode = False
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
     self._status_view_file = 'status.info'
     self._status_view_interval = 0.5
     self._status_view_mode = status_view.StatusView.MODE_WINDOW
+    self._storage_compression_format = definitions.DEFAULT_COMPRESSION_FORMAT
     self._storage_file_path = None
     self._storage_format = definitions.STORAGE_FORMAT_SQLITE
+    self._storage_serialization_format = definitions.DEFAULT_SERIALIZER_FORMAT
+    self._task_batch_file_size_limit = None
+    self._task_batch_size = None
     self._task_storage_format = definitions.STORAGE_FORMAT_SQLITE
     self._temporary_directory = None
     self._worker_memory_limit = None
@@ -186,6 +193,8 @@ class ExtractionTool(
     configuration.custom_artifacts_path = self._custom_artifacts_path
     configuration.data_location = self._data_location
     configuration.extraction.archive_types_string = self._archive_types_string
+    configuration.extraction.data_stream_buffer_size = (
+        self._data_stream_buffer_size)
     configuration.artifact_filters = self._artifact_filters
     configuration.credentials = self._credential_configurations
     configuration.debug_output = self._debug_mode
@@ -195,6 +204,8 @@ class ExtractionTool(
         self._extract_winevt_resources)
     configuration.extraction.extract_winreg_binary = self._extract_winreg_binary
     configuration.extraction.hasher_names_string = self._hasher_names_string
+    configuration.extraction.hasher_number_of_threads = (
+        self._hasher_number_of_threads)
     configuration.extraction.process_compressed_streams = (
         self._process_compressed_streams)
     configuration.extraction.yara_rules_string = self._yara_rules_string
@@ -209,6 +220,9 @@ class ExtractionTool(
     configuration.profiling.directory = self._profiling_directory
     configuration.profiling.sample_rate = self._profiling_sample_rate
     configuration.profiling.profilers = self._profilers
+    configuration.task_batch_file_size_limit = (
+        self._task_batch_file_size_limit)
+    configuration.task_batch_size = self._task_batch_size
     configuration.task_storage_format = self._task_storage_format
     configuration.temporary_directory = self._temporary_directory
 
@@ -300,6 +314,45 @@ class ExtractionTool(
 
     return ','.join(sorted(parser_elements))
 
+  def _GetResumableSession(self, storage_writer):
+    """Retrieves the session to resume and its checkpoint.
+
+    Only the last session in the storage can be resumed and only if it did
+    not complete.
+
+    Args:
+      storage_writer (StorageWriter): storage writer.
+
+    Returns:
+      tuple: containing:
+
+        Session: session to resume.
+        SessionCheckpoint: checkpoint to resume the session from.
+
+    Raises:
+      BadConfigOption: if the storage does not contain a session that can be
+          resumed.
+    """
+    session = None
+    for session in storage_writer.GetAttributeContainers('session'):
+      pass
+
+    if not session:
+      raise errors.BadConfigOption(
+          'Unable to resume extraction: storage file contains no session.')
+
+    if session.completion_time is not None and not session.aborted:
+      raise errors.BadConfigOption(
+          'Unable to resume extraction: last session completed.')
+
+    for session_checkpoint in storage_writer.GetAttributeContainers(
+        'session_checkpoint'):
+      if session_checkpoint.session_identifier == session.identifier:
+        return session, session_checkpoint
+
+    raise errors.BadConfigOption(
+        'Unable to resume extraction: last session has no checkpoint.')
+
   def _ParseExtractionOptions(self, options):
     """Parses the extraction options.
 
@@ -342,20 +395,10 @@ class ExtractionTool(
     Raises:
       BadConfigOption: if the options are invalid.
     """
-    self._buffer_size = getattr(options, 'buffer_size', 0)
-    if self._buffer_size:
-      # TODO: turn this into a generic function that supports more size
-      # suffixes both MB and MiB and also that does not allow m as a valid
-      # indicator for MiB since m represents milli not Mega.
-      try:
-        if self._buffer_size[-1].lower() == 'm':
-          self._buffer_size = int(self._buffer_size[:-1], 10)
-          self._buffer_size *= self._BYTES_IN_A_MIB
-        else:
-          self._buffer_size = int(self._buffer_size, 10)
-      except ValueError:
-        raise errors.BadConfigOption(
-            f'Invalid buffer size: {self._buffer_size!s}.')
+    self._buffer_size = self._ParseSizeOption(options, 'buffer_size') or 0
+
+    self._data_stream_buffer_size = self._ParseSizeOption(
+        options, 'data_stream_buffer_size')
 
     self._queue_size = self.ParseNumericOption(options, 'queue_size')
 
@@ -368,8 +411,13 @@ class ExtractionTool(
     Raises:
       BadConfigOption: if the options are invalid.
     """
+    self._resume = getattr(options, 'resume', False)
     self._single_process_mode = getattr(options, 'single_process', False)
 
+    if self._resume and self._single_process_mode:
+      raise errors.BadConfigOption(
+          'Resuming extraction is not supported in single process mode.')
+
     argument_helper_names = [
         'process_resources', 'temporary_directory', 'vfs_backend', 'workers',
         'zeromq']
@@ -408,23 +456,65 @@ class ExtractionTool(
       dfvfs_definitions.PREFERRED_GPT_BACK_END = (
           dfvfs_definitions.TYPE_INDICATOR_GPT)
 
-  def _ProcessSource(self, session, storage_writer):
+  def _ParseSizeOption(self, options, argument_name):
+    """Parses a size option.
+
+    Args:
+      options (argparse.Namespace): command line arguments.
+      argument_name (str): name of the command line argument.
+
+    Returns:
+      int: size in bytes or None if not set.
+
+    Raises:
+      BadConfigOption: if the size is invalid.
+    """
+    size = getattr(options, argument_name, None)
+    if size is None or isinstance(size, int):
+      return size
+
+    # TODO: turn this into a generic function that supports more size
+    # suffixes both MB and MiB and also that does not allow m as a valid
+    # indicator for MiB since m represents milli not Mega.
+    try:
+      if size[-1].lower() == 'm':
+        size_in_bytes = int(size[:-1], 10) * self._BYTES_IN_A_MIB
+      else:
+        size_in_bytes = int(size, 10)
+    except (IndexError, ValueError):
+      size_in_bytes = -1
+
+    if size_in_bytes < 0:
+      argument_description = argument_name.replace('_', ' ')
+      raise errors.BadConfigOption(
+          f'Invalid {argument_description:s}: {size!s}.')
+
+    return size_in_bytes
+
+  def _ProcessSource(self, session, storage_writer, session_checkpoint=None):
     """Processes the source and extract events.
 
     Args:
       session (Session): session in which the source is processed.
       storage_writer (StorageWriter): storage writer to store extracted events.
+      session_checkpoint (Optional[SessionCheckpoint]): session checkpoint to
+          resume the extraction from, where None represents a new extraction.
 
     Returns:
       ProcessingStatus: processing status.
 
     Raises:
-      BadConfigOption: if an invalid collection filter was specified.
+      BadConfigOption: if an invalid collection filter was specified or
+          the extraction cannot be resumed.
     """
     single_process_mode = self._single_process_mode
     if self._source_type == dfvfs_definitions.SOURCE_TYPE_FILE:
       single_process_mode = True
 
+    if session_checkpoint and single_process_mode:
+      raise errors.BadConfigOption(
+          'Resuming extraction is only supported in multi process mode.')
+
     extraction_engine = self._CreateExtractionEngine(single_process_mode)
 
     extraction_engine.BuildArtifactsRegistry(
@@ -438,13 +528,20 @@ class ExtractionTool(
 
     # If the source is a directory or a storage media image run pre-processing.
 
+    # When resuming, the results of pre-processing are already stored, hence
+    # pre-processing only is run to populate the knowledge base.
+    preprocess_storage_writer = storage_writer
+    if session_checkpoint:
+      preprocess_storage_writer = fake_writer.FakeStorageWriter()
+      preprocess_storage_writer.Open()
+
     system_configurations = []
     if self._source_type in self._SOURCE_TYPES_TO_PREPROCESS:
       try:
         logger.debug('Starting preprocessing.')
 
         system_configurations = extraction_engine.PreprocessSource(
-            self._file_system_path_specs, storage_writer,
+            self._file_system_path_specs, preprocess_storage_writer,
             resolver_context=self._resolver_context)
 
         logger.debug('Preprocessing done.')
@@ -520,15 +617,24 @@ class ExtractionTool(
     session.preferred_time_zone = self._preferred_time_zone
     session.preferred_year = self._preferred_year
 
-    storage_writer.AddAttributeContainer(session)
-
     processing_status = None
 
+    if session_checkpoint:
+      preprocess_storage_writer.Close()
+
+      session.aborted = False
+      session.completion_time = None
+      storage_writer.UpdateAttributeContainer(session)
+
+    else:
+      storage_writer.AddAttributeContainer(session)
+
     try:
-      storage_writer.AddAttributeContainer(source_configuration)
+      if not session_checkpoint:
+        storage_writer.AddAttributeContainer(source_configuration)
 
-      for system_configuration in system_configurations:
-        storage_writer.AddAttributeContainer(system_configuration)
+        for system_configuration in system_configurations:
+          storage_writer.AddAttributeContainer(system_configuration)
 
       if single_process_mode:
         logger.debug('Starting extraction in single process mode.')
@@ -547,6 +653,7 @@ class ExtractionTool(
             storage_writer, session.identifier, processing_configuration,
             system_configurations, self._file_system_path_specs,
             enable_sigsegv_handler=self._enable_sigsegv_handler,
+            session_checkpoint=session_checkpoint,
             storage_file_path=self._storage_file_path)
 
     finally:
@@ -667,6 +774,15 @@ class ExtractionTool(
         action='store', default=0, help=(
             'The buffer size for the output (defaults to 196MiB).'))
 
+    argument_group.add_argument(
+        '--data_stream_buffer_size', '--data-stream-buffer-size',
+        dest='data_stream_buffer_size', action='store', default=None,
+        metavar='SIZE', help=(
+            'The maximum size of a data stream that is buffered in memory, '
+            'so that the data read by the analyzers, such as the hashers, is '
+            'reused by the parsers. A size suffix of "m" represents MiB, '
+            'where 0 disables buffering (defaults to 16MiB).'))
+
     argument_group.add_argument(
         '--queue_size', '--queue-size', dest='queue_size', action='store',
         default=0, help=(
@@ -679,6 +795,12 @@ class ExtractionTool(
     Args:
       argument_group (argparse._ArgumentGroup): argparse argument group.
     """
+    argument_group.add_argument(
+        '--resume', dest='resume', action='store_true', default=False, help=(
+            'Resume an aborted extraction into the existing storage file '
+            'from its last checkpoint. Event sources that were processed '
+            'before the checkpoint are not processed again.'))
+
     argument_group.add_argument(
         '--single_process', '--single-process', dest='single_process',
         action='store_true', default=False, help=(
@@ -704,7 +826,14 @@ class ExtractionTool(
           file system.
       UserAbort: if the user initiated an abort.
     """
-    self._CheckStorageFile(self._storage_file_path, warn_about_existing=True)
+    if self._resume:
+      if not os.path.isfile(self._storage_file_path):
+        raise errors.BadConfigOption((
+            f'Unable to resume extraction: storage file: '
+            f'{self._storage_file_path:s} does not exist.'))
+
+    self._CheckStorageFile(
+        self._storage_file_path, warn_about_existing=not self._resume)
 
     try:
       self.ScanSource(self._source_path)
@@ -729,9 +858,6 @@ class ExtractionTool(
     self._status_view.PrintExtractionStatusHeader(None)
     self._output_writer.Write('Processing started.\n')
 
-    # TODO: attach processing configuration to session?
-    session = engine.BaseEngine.CreateSession()
-
     storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
         self._storage_format)
     if not storage_writer:
@@ -739,7 +865,10 @@ class ExtractionTool(
           f'Unsupported storage format: {self._storage_format:s}')
 
     try:
-      storage_writer.Open(path=self._storage_file_path)
+      storage_writer.Open(
+          compression_format=self._storage_compression_format,
+          path=self._storage_file_path,
+          serialization_format=self._storage_serialization_format)
     except IOError as exception:
       raise IOError(f'Unable to open storage with error: {exception!s}')
 
@@ -747,11 +876,29 @@ class ExtractionTool(
     number_of_extraction_warnings = 0
 
     try:
-      stored_number_of_extraction_warnings = (
-          storage_writer.GetNumberOfAttributeContainers('extraction_warning'))
+      session_checkpoint = None
+      if self._resume:
+        session, session_checkpoint = self._GetResumableSession(storage_writer)
+
+        # Extraction warnings added after the checkpoint are removed when
+        # the extraction is resumed.
+        number_of_containers_per_type = dict(zip(
+            session_checkpoint.container_types or [],
+            session_checkpoint.number_of_containers or []))
+        stored_number_of_extraction_warnings = (
+            number_of_containers_per_type.get('extraction_warning', 0))
+
+      else:
+        # TODO: attach processing configuration to session?
+        session = engine.BaseEngine.CreateSession()
+
+        stored_number_of_extraction_warnings = (
+            storage_writer.GetNumberOfAttributeContainers(
+                'extraction_warning'))
 
       try:
-        processing_status = self._ProcessSource(session, storage_writer)
+        processing_status = self._ProcessSource(
+            session, storage_writer, session_checkpoint=session_checkpoint)
 
       finally:
         number_of_extraction_warnings = (
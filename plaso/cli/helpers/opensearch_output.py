@@ -25,8 +25,10 @@ class OpenSearchOutputArgumentsHelper(interface.ArgumentsHelper):
       'datetime', 'display_name', 'message', 'source_long', 'source_short',
       'tag', 'timestamp', 'timestamp_desc']
 
+  _DEFAULT_BULK_REQUEST_SIZE = 5 * 1024 * 1024
   _DEFAULT_FLUSH_INTERVAL = 1000
   _DEFAULT_INDEX_NAME = uuid4().hex
+  _DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS = 2
   _DEFAULT_PORT = 9200
   _DEFAULT_SERVER = '127.0.0.1'
 
@@ -51,6 +53,25 @@ class OpenSearchOutputArgumentsHelper(interface.ArgumentsHelper):
         action='store', default=cls._DEFAULT_FLUSH_INTERVAL, metavar='INTERVAL',
         help='Events to queue up before bulk insert to OpenSearch.')
 
+    argument_group.add_argument(
+        '--opensearch-bulk-request-size', '--opensearch_bulk_request_size',
+        dest='opensearch_bulk_request_size', type=int, action='store',
+        default=cls._DEFAULT_BULK_REQUEST_SIZE, metavar='SIZE', help=(
+            'Maximum size, in bytes, of the events to queue up before bulk '
+            'insert to OpenSearch.'))
+
+    argument_group.add_argument(
+        '--opensearch-concurrent-requests',
+        '--opensearch_concurrent_requests',
+        dest='opensearch_concurrent_requests', type=int, action='store',
+        default=cls._DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS, metavar='NUMBER',
+        help='Number of bulk inserts to send to OpenSearch concurrently.')
+
+    argument_group.add_argument(
+        '--opensearch-compress', '--opensearch_compress',
+        dest='opensearch_compress', action='store_true', default=False, help=(
+            'Compress the bulk inserts sent to OpenSearch with gzip.'))
+
     argument_group.add_argument(
         '--opensearch-server', '--opensearch_server', '--server', dest='server',
         type=str, action='store', default=cls._DEFAULT_SERVER,
@@ -118,10 +139,26 @@ class OpenSearchOutputArgumentsHelper(interface.ArgumentsHelper):
         options, 'index_name', default_value=cls._DEFAULT_INDEX_NAME)
     flush_interval = cls._ParseNumericOption(
         options, 'flush_interval', default_value=cls._DEFAULT_FLUSH_INTERVAL)
+    bulk_request_size = cls._ParseNumericOption(
+        options, 'opensearch_bulk_request_size',
+        default_value=cls._DEFAULT_BULK_REQUEST_SIZE)
+    number_of_concurrent_requests = cls._ParseNumericOption(
+        options, 'opensearch_concurrent_requests',
+        default_value=cls._DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS)
+
+    if bulk_request_size < 1:
+      raise errors.BadConfigOption(
+          f'Unsupported bulk request size: {bulk_request_size:d}')
+
+    if number_of_concurrent_requests < 1:
+      raise errors.BadConfigOption((
+          f'Unsupported number of concurrent requests: '
+          f'{number_of_concurrent_requests:d}'))
 
     mappings_file_path = cls._ParseStringOption(options, 'opensearch_mappings')
     opensearch_user = cls._ParseStringOption(options, 'opensearch_user')
     opensearch_password = cls._ParseStringOption(options, 'opensearch_password')
+    use_http_compression = getattr(options, 'opensearch_compress', False)
     use_ssl = getattr(options, 'use_ssl', False)
 
     ca_certificates_path = cls._ParseStringOption(
@@ -150,9 +187,12 @@ class OpenSearchOutputArgumentsHelper(interface.ArgumentsHelper):
 
     output_module.SetIndexName(index_name)
     output_module.SetFlushInterval(flush_interval)
+    output_module.SetBulkRequestSize(bulk_request_size)
+    output_module.SetNumberOfConcurrentRequests(number_of_concurrent_requests)
 
     output_module.SetUsername(opensearch_user)
     output_module.SetPassword(opensearch_password)
+    output_module.SetUseHTTPCompression(use_http_compression)
     output_module.SetUseSSL(use_ssl)
     output_module.SetCACertificatesPath(ca_certificates_path)
     output_module.SetURLPrefix(opensearch_url_prefix)
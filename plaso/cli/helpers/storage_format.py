@@ -25,6 +25,8 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    compression_formats = sorted(definitions.COMPRESSION_FORMATS)
+    serialization_formats = sorted(definitions.SERIALIZER_FORMATS)
     session_storage_formats = sorted(definitions.SESSION_STORAGE_FORMATS)
     task_storage_formats = sorted(definitions.TASK_STORAGE_FORMATS)
 
@@ -37,6 +39,27 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
             f'{definitions.DEFAULT_STORAGE_FORMAT:s}. Supported options: '
             f'{storage_formats_string:s}'))
 
+    compression_formats_string = ', '.join(compression_formats)
+    argument_group.add_argument(
+        '--storage_compression_format', '--storage-compression-format',
+        action='store', choices=compression_formats,
+        dest='storage_compression_format', type=str, metavar='FORMAT',
+        default=definitions.DEFAULT_COMPRESSION_FORMAT, help=(
+            f'Compression format of serialized data in the storage file, '
+            f'the default is: {definitions.DEFAULT_COMPRESSION_FORMAT:s}. '
+            f'Supported options: {compression_formats_string:s}'))
+
+    serialization_formats_string = ', '.join(serialization_formats)
+    argument_group.add_argument(
+        '--storage_serialization_format', '--storage-serialization-format',
+        action='store', choices=serialization_formats,
+        dest='storage_serialization_format', type=str, metavar='FORMAT',
+        default=definitions.DEFAULT_SERIALIZER_FORMAT, help=(
+            f'Serialization format of attribute containers without a schema, '
+            f'such as event data, in the storage file, the default is: '
+            f'{definitions.DEFAULT_SERIALIZER_FORMAT:s}. Supported options: '
+            f'{serialization_formats_string:s}'))
+
     storage_formats_string = ', '.join(task_storage_formats)
     argument_group.add_argument(
         '--task_storage_format', '--task-storage-format', action='store',
@@ -57,8 +80,9 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
-      BadConfigOption: if the storage format or task storage is not defined
-          or supported.
+      BadConfigOption: if the storage format, storage compression format,
+          storage serialization format or task storage is not defined or
+          supported.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
@@ -74,6 +98,32 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
 
     setattr(configuration_object, '_storage_format', storage_format)
 
+    storage_compression_format = cls._ParseStringOption(
+        options, 'storage_compression_format',
+        default_value=definitions.DEFAULT_COMPRESSION_FORMAT)
+
+    if storage_compression_format not in definitions.COMPRESSION_FORMATS:
+      raise errors.BadConfigOption((
+          f'Unsupported storage compression format: '
+          f'{storage_compression_format:s}'))
+
+    setattr(
+        configuration_object, '_storage_compression_format',
+        storage_compression_format)
+
+    storage_serialization_format = cls._ParseStringOption(
+        options, 'storage_serialization_format',
+        default_value=definitions.DEFAULT_SERIALIZER_FORMAT)
+
+    if storage_serialization_format not in definitions.SERIALIZER_FORMATS:
+      raise errors.BadConfigOption((
+          f'Unsupported storage serialization format: '
+          f'{storage_serialization_format:s}'))
+
+    setattr(
+        configuration_object, '_storage_serialization_format',
+        storage_serialization_format)
+
     task_storage_format = cls._ParseStringOption(options, 'task_storage_format')
     if not task_storage_format:
       raise errors.BadConfigOption('Unable to determine task storage format.')
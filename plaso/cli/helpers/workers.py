@@ -24,6 +24,21 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    argument_group.add_argument(
+        '--task_batch_file_size_limit', '--task-batch-file-size-limit',
+        dest='task_batch_file_size_limit', action='store', type=int,
+        metavar='SIZE', help=(
+            'Maximum size of a file in bytes, for it to be processed together '
+            'with other small files in a single task, where 0 represents no '
+            'batching. The default limit is 262144 (256 KiB).'))
+
+    argument_group.add_argument(
+        '--task_batch_size', '--task-batch-size', dest='task_batch_size',
+        action='store', type=int, metavar='NUMBER', help=(
+            'Maximum number of small files that are processed together in '
+            'a single task, where 1 represents no batching. The default is '
+            '32.'))
+
     argument_group.add_argument(
         '--worker_memory_limit', '--worker-memory-limit',
         dest='worker_memory_limit', action='store', type=int,
@@ -71,6 +86,19 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigOption(
           'Invalid number of extraction workers value cannot be less than 0.')
 
+    task_batch_file_size_limit = cls._ParseNumericOption(
+        options, 'task_batch_file_size_limit')
+
+    if task_batch_file_size_limit and task_batch_file_size_limit < 0:
+      raise errors.BadConfigOption(
+          'Invalid task batch file size limit value cannot be less than 0.')
+
+    task_batch_size = cls._ParseNumericOption(options, 'task_batch_size')
+
+    if task_batch_size is not None and task_batch_size < 1:
+      raise errors.BadConfigOption(
+          'Invalid task batch size value cannot be less than 1.')
+
     worker_memory_limit = cls._ParseNumericOption(
         options, 'worker_memory_limit')
 
@@ -87,6 +115,10 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
     setattr(
         configuration_object, '_number_of_extraction_workers',
         number_of_extraction_workers)
+    setattr(
+        configuration_object, '_task_batch_file_size_limit',
+        task_batch_file_size_limit)
+    setattr(configuration_object, '_task_batch_size', task_batch_size)
     setattr(configuration_object, '_worker_memory_limit', worker_memory_limit)
     setattr(configuration_object, '_worker_timeout', worker_timeout)
 
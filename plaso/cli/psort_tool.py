@@ -60,11 +60,13 @@ class PsortTool(
     super(PsortTool, self).__init__(
         input_reader=input_reader, output_writer=output_writer)
     self._deduplicate_events = True
+    self._number_of_worker_processes = 0
     self._preferred_language = None
     self._process_memory_limit = None
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
     self._status_view_file = 'status.info'
     self._status_view_mode = status_view.StatusView.MODE_WINDOW
+    self._temporary_directory = None
     self._time_slice = None
     self._use_time_slicer = False
 
@@ -136,6 +138,7 @@ class PsortTool(
     configuration.profiling.directory = self._profiling_directory
     configuration.profiling.profilers = self._profilers
     configuration.profiling.sample_rate = self._profiling_sample_rate
+    configuration.temporary_directory = self._temporary_directory
 
     return configuration
 
@@ -239,6 +242,14 @@ class PsortTool(
           f'Invalid worker timeout: {worker_timeout:f}, value must be greater '
           f'than 0.0 minutes.'))
 
+    number_of_worker_processes = getattr(options, 'workers', None) or 0
+
+    if number_of_worker_processes < 0:
+      raise errors.BadConfigOption((
+          f'Invalid number of workers: {number_of_worker_processes:d}, value '
+          f'must be 0 or greater.'))
+
+    self._number_of_worker_processes = number_of_worker_processes
     self._worker_memory_limit = worker_memory_limit
     self._worker_timeout = worker_timeout
 
@@ -272,6 +283,15 @@ class PsortTool(
             '15.0 minutes. If a worker process exceeds this timeout it is '
             'killed by the main (foreman) process.'))
 
+    argument_group.add_argument(
+        '--workers', dest='workers', action='store', type=int, default=0,
+        help=(
+            'Number of worker processes used to format the events. The '
+            'events are divided into time ranges that are formatted in '
+            'parallel, which is supported by text based output formats, such '
+            'as dynamic and json_line. The default is 0, which represents '
+            'that the events are formatted by the main process.'))
+
   def ListLanguageTags(self):
     """Lists the language tags."""
     table_view = views.ViewsFactory.GetTableView(
@@ -502,7 +522,8 @@ class PsortTool(
 
       # TODO: add single process output and formatting engine support.
       output_engine = (
-          multi_output_engine.OutputAndFormattingMultiProcessEngine())
+          multi_output_engine.OutputAndFormattingMultiProcessEngine(
+              number_of_worker_processes=self._number_of_worker_processes))
 
       output_engine.SetStatusUpdateInterval(self._status_view_interval)
 
@@ -511,6 +532,7 @@ class PsortTool(
           deduplicate_events=self._deduplicate_events,
           event_filter=self._event_filter,
           status_update_callback=status_update_callback,
+          storage_file_path=self._storage_file_path,
           time_slice=self._time_slice, use_time_slicer=self._use_time_slicer)
 
       self._output_module.Close()
@@ -242,6 +242,9 @@ class StatusView(object):
     if processing_status and processing_status.events_status:
       self._PrintEventsStatus(processing_status.events_status)
 
+    if processing_status and processing_status.output_status:
+      self._PrintOutputStatus(processing_status)
+
     self._output_writer.Write('\n')
 
   def _GetPathSpecificationString(self, path_spec):
@@ -274,6 +277,14 @@ class StatusView(object):
             f'grouped: {events_status.number_of_macb_grouped_events:d} Total: '
             f'{events_status.total_number_of_events:d}\n'))
 
+        output_status = processing_status.output_status
+        if output_status:
+          file_object.write((
+              f'Output: Written: {output_status.number_of_written_events:d} '
+              f'Rejected: {output_status.number_of_rejected_events:d} '
+              f'Retries: {output_status.number_of_retries:d} Bytes: '
+              f'{output_status.number_of_bytes_written:d}\n'))
+
   def _PrintAnalysisStatusUpdateLinear(self, processing_status):
     """Prints an analysis status update in linear mode.
 
@@ -295,6 +306,14 @@ class StatusView(object):
           f'{worker_status.status:s}, events consumed: '
           f'{worker_status.number_of_consumed_events:d}\n'))
 
+    output_status = processing_status.output_status
+    if output_status:
+      self._output_writer.Write((
+          f'Output: events written: '
+          f'{output_status.number_of_written_events:d}, rejected: '
+          f'{output_status.number_of_rejected_events:d}, retries: '
+          f'{output_status.number_of_retries:d}\n'))
+
     self._output_writer.Write('\n')
 
   def _PrintAnalysisStatusUpdateWindow(self, processing_status):
@@ -450,6 +469,37 @@ class StatusView(object):
       self._output_writer.Write('\n')
       table_view.Write(self._output_writer)
 
+  def _PrintOutputStatus(self, processing_status):
+    """Prints the status of the output.
+
+    Args:
+      processing_status (ProcessingStatus): processing status.
+    """
+    output_status = processing_status.output_status
+
+    processing_time = time.time() - processing_status.start_time
+
+    events_per_second = 0
+    if processing_time > 0:
+      events_per_second = int(
+          output_status.number_of_written_events / processing_time)
+
+    size_written = self._FormatSizeInUnitsOf1024(
+        output_status.number_of_bytes_written)
+
+    table_view = views.CLITabularTableView(
+        column_names=['Output:', 'Written', 'Rejected', 'Retries',
+                      'Size written', 'Events/s'],
+        column_sizes=[15, 15, 15, 15, 15, 0])
+
+    table_view.AddRow([
+        '', output_status.number_of_written_events,
+        output_status.number_of_rejected_events,
+        output_status.number_of_retries, size_written, events_per_second])
+
+    self._output_writer.Write('\n')
+    table_view.Write(self._output_writer)
+
   def _PrintTasksStatus(self, processing_status):
     """Prints the status of the tasks.
 
@@ -75,6 +75,7 @@ class HashersOptions(object):
     super(HashersOptions, self).__init__()
     self._hasher_file_size_limit = None
     self._hasher_names_string = None
+    self._hasher_number_of_threads = None
 
   def ListHashers(self):
     """Lists information about the available hashers."""
@@ -16,6 +16,8 @@ class EventSource(interface.AttributeContainer):
     data_type (str): attribute container type indicator.
     file_entry_type (str): dfVFS file entry type.
     path_spec (dfvfs.PathSpec): path specification.
+    size (int): size of the default data stream of the file entry, in bytes,
+        or None if not available.
   """
   CONTAINER_TYPE = 'event_source'
   DATA_TYPE = None
@@ -23,19 +25,23 @@ class EventSource(interface.AttributeContainer):
   SCHEMA = {
       'data_type': 'str',
       'file_entry_type': 'str',
-      'path_spec': 'dfvfs.PathSpec'}
+      'path_spec': 'dfvfs.PathSpec',
+      'size': 'int'}
 
-  def __init__(self, file_entry_type=None, path_spec=None):
+  def __init__(self, file_entry_type=None, path_spec=None, size=None):
     """Initializes an event source.
 
     Args:
       file_entry_type (Optional[str]): dfVFS file entry type.
       path_spec (Optional[dfvfs.PathSpec]): path specification.
+      size (Optional[int]): size of the default data stream of the file
+          entry, in bytes.
     """
     super(EventSource, self).__init__()
     self.data_type = self.DATA_TYPE
     self.file_entry_type = file_entry_type
     self.path_spec = path_spec
+    self.size = size
 
   # This method is necessary for heap sort.
   def __lt__(self, other):
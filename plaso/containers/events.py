@@ -10,13 +10,77 @@ from acstore.containers import manager
 from dfdatetime import interface as dfdatetime_interface
 
 
-def CalculateEventValuesHash(event_data, event_data_stream):
+# Attributes of event data that are not part of the event values hash.
+_EVENT_VALUES_HASH_IGNORED_ATTRIBUTES = frozenset([
+    '_event_data_stream_identifier', '_event_values_hash', '_parser_chain',
+    'data_type'])
+
+
+def _CalculateDigestHash(attributes):
+  """Calculates a digest hash of attribute strings.
+
+  BLAKE2b is used instead of a cryptographic hash, such as MD5, since the
+  digest hash is only used to identify duplicate values and BLAKE2b is faster.
+
+  Args:
+    attributes (list[str]): attribute strings.
+
+  Returns:
+    str: digest hash of the attribute strings.
+  """
+  content = ', '.join(attributes)
+  content_data = content.encode('utf-8')
+
+  blake2b_context = hashlib.blake2b(content_data, digest_size=16)
+
+  return blake2b_context.hexdigest()
+
+
+def CalculateEventDataStreamValuesHash(event_data_stream):
+  """Calculates a digest hash of the event data stream values.
+
+  The event data stream values hash only needs to be calculated once per
+  event data stream and can be reused for all event data that refers to it.
+
+  Args:
+    event_data_stream (EventDataStream): an event data stream.
+
+  Returns:
+    str: digest hash of the event data stream values content.
+
+  Raises:
+    RuntimeError: if the event data stream values hash cannot be determined.
+  """
+  attributes = []
+
+  for attribute_name, attribute_value in sorted(
+      event_data_stream.GetAttributes()):
+
+    if attribute_name == 'path_spec':
+      attribute_value = attribute_value.comparable
+
+    elif not isinstance(attribute_value, (bool, float, int, list, str)):
+      raise RuntimeError((
+          f'Unsupported attribute: {attribute_name:s} value type: '
+          f'{type(attribute_value)!s}'))
+
+    attributes.append(f'{attribute_name:s}: {attribute_value!s}')
+
+  return _CalculateDigestHash(attributes)
+
+
+def CalculateEventValuesHash(
+    event_data, event_data_stream, event_data_stream_values_hash=None):
   """Calculates a digest hash of the event values.
 
   Args:
     event_data (EventData): event data.
     event_data_stream (EventDataStream): an event data stream or None if not
         available.
+    event_data_stream_values_hash (Optional[str]): digest hash of the event
+        data stream values, as calculated by CalculateEventDataStreamValuesHash,
+        where None represents the digest hash should be calculated from
+        the event data stream.
 
   Returns:
     str: digest hash of the event values content.
@@ -24,62 +88,36 @@ def CalculateEventValuesHash(event_data, event_data_stream):
   Raises:
     RuntimeError: if the event values hash cannot be determined.
   """
-  attributes = ['data_type: {0:s}'.format(event_data.data_type)]
+  attributes = [f'data_type: {event_data.data_type:s}']
 
   for attribute_name, attribute_value in sorted(event_data.GetAttributes()):
-    if attribute_value is None or attribute_name in (
-        '_event_data_stream_identifier', '_event_values_hash', '_parser_chain',
-        'data_type'):
+    if attribute_name in _EVENT_VALUES_HASH_IGNORED_ATTRIBUTES:
       continue
 
-    # Ignore date and time values.
-    if isinstance(attribute_value, dfdatetime_interface.DateTimeValues):
-      continue
+    if not isinstance(attribute_value, (bool, float, int, str)):
+      # Ignore date and time values.
+      if isinstance(attribute_value, dfdatetime_interface.DateTimeValues):
+        continue
 
-    if (isinstance(attribute_value, list) and attribute_value and
-        isinstance(attribute_value[0],
-                     dfdatetime_interface.DateTimeValues)):
-      continue
+      if not isinstance(attribute_value, list):
+        raise RuntimeError((
+            f'Unsupported attribute: {attribute_name:s} value type: '
+            f'{type(attribute_value)!s}'))
 
-    if not isinstance(attribute_value, (bool, float, int, list, str)):
-      raise RuntimeError(
-          'Unsupported attribute: {0:s} value type: {1!s}'.format(
-              attribute_name, type(attribute_value)))
+      if attribute_value and isinstance(
+          attribute_value[0], dfdatetime_interface.DateTimeValues):
+        continue
 
-    try:
-      attribute_string = '{0:s}: {1!s}'.format(
-          attribute_name, attribute_value)
-      attributes.append(attribute_string)
-    except UnicodeDecodeError:
-      raise RuntimeError(
-          'Failed to decode attribute {0:s}'.format(attribute_name))
-
-  if event_data_stream:
-    for attribute_name, attribute_value in sorted(
-        event_data_stream.GetAttributes()):
-
-      if attribute_name == 'path_spec':
-        attribute_value = attribute_value.comparable
-
-      elif not isinstance(attribute_value, (bool, float, int, list, str)):
-        raise RuntimeError(
-            'Unsupported attribute: {0:s} value type: {1!s}'.format(
-                attribute_name, type(attribute_value)))
-
-      try:
-        attribute_string = '{0:s}: {1!s}'.format(
-            attribute_name, attribute_value)
-        attributes.append(attribute_string)
-      except UnicodeDecodeError:
-        raise RuntimeError(
-            'Failed to decode attribute {0:s}'.format(attribute_name))
+    attributes.append(f'{attribute_name:s}: {attribute_value!s}')
 
-  content = ', '.join(attributes)
-  content_data = content.encode('utf-8')
+  if event_data_stream_values_hash is None and event_data_stream:
+    event_data_stream_values_hash = CalculateEventDataStreamValuesHash(
+        event_data_stream)
 
-  md5_context = hashlib.md5(content_data)
+  if event_data_stream_values_hash:
+    attributes.append(f'event_data_stream: {event_data_stream_values_hash:s}')
 
-  return md5_context.hexdigest()
+  return _CalculateDigestHash(attributes)
 
 
 class DateLessLogHelper(interface.AttributeContainer):
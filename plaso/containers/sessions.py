@@ -82,4 +82,65 @@ class Session(interface.AttributeContainer):
     self.start_time = int(time.time() * 1000000)
 
 
-manager.AttributeContainersManager.RegisterAttributeContainer(Session)
+class SessionCheckpoint(interface.AttributeContainer):
+  """Session checkpoint attribute container.
+
+  A session checkpoint describes the state of an extraction session, in which
+  all attribute containers stored before the checkpoint are consistent, so
+  that an interrupted extraction can be resumed from the checkpoint.
+
+  Attributes:
+    container_types (list[str]): attribute container types.
+    event_source_indexes (list[int]): indexes of the event sources that were
+        read from the session storage, but not yet scheduled.
+    next_event_source_index (int): index of the first event source that was
+        not yet read from the session storage.
+    number_of_containers (list[int]): number of attribute containers stored
+        per attribute container type in container_types.
+    number_of_events (list[int]): number of events per parser in
+        parser_names.
+    parser_names (list[str]): names of the parsers and parser plugins that
+        produced events.
+    path_specs (list[dfvfs.PathSpec]): path specifications of the event
+        sources that were scheduled, but of which the results were not yet
+        merged into the session storage.
+    session_identifier (str): the identifier of the session the checkpoint
+        is part of.
+    timestamp (int): time that the checkpoint was written. Contains the number
+        of micro seconds since January 1, 1970, 00:00:00 UTC.
+  """
+
+  CONTAINER_TYPE = 'session_checkpoint'
+
+  SCHEMA = {
+      'container_types': 'List[str]',
+      'event_source_indexes': 'List[int]',
+      'next_event_source_index': 'int',
+      'number_of_containers': 'List[int]',
+      'number_of_events': 'List[int]',
+      'parser_names': 'List[str]',
+      'path_specs': 'List[dfvfs.PathSpec]',
+      'session_identifier': 'str',
+      'timestamp': 'int'}
+
+  def __init__(self, session_identifier=None):
+    """Initializes a session checkpoint attribute container.
+
+    Args:
+      session_identifier (Optional[str]): identifier of the session the
+          checkpoint is part of.
+    """
+    super(SessionCheckpoint, self).__init__()
+    self.container_types = None
+    self.event_source_indexes = None
+    self.next_event_source_index = None
+    self.number_of_containers = None
+    self.number_of_events = None
+    self.parser_names = None
+    self.path_specs = None
+    self.session_identifier = session_identifier
+    self.timestamp = None
+
+
+manager.AttributeContainersManager.RegisterAttributeContainers([
+    Session, SessionCheckpoint])
@@ -30,6 +30,9 @@ class Task(interface.AttributeContainer):
     merge_priority (int): priority used for the task storage file merge, where
         a lower value indicates a higher priority to merge.
     path_spec (dfvfs.PathSpec): path specification.
+    path_specs (list[dfvfs.PathSpec]): path specifications of a task that
+        processes a batch of event sources, instead of a single path
+        specification.
     session_identifier (str): the identifier of the session the task is part of.
     start_time (int): time that the task was started. Contains the number
         of micro seconds since January 1, 1970, 00:00:00 UTC.
@@ -48,6 +51,7 @@ class Task(interface.AttributeContainer):
       'last_processing_time': 'int',
       'merge_priority': 'int',
       'path_spec': 'dfvfs.PathSpec',
+      'path_specs': 'List[dfvfs.PathSpec]',
       'session_identifier': 'str',
       'start_time': 'int',
       'storage_file_size': 'int',
@@ -69,6 +73,7 @@ class Task(interface.AttributeContainer):
     self.last_processing_time = None
     self.merge_priority = None
     self.path_spec = None
+    self.path_specs = None
     self.session_identifier = session_identifier
     self.start_time = int(time.time() * definitions.MICROSECONDS_PER_SECOND)
     self.storage_file_size = None
@@ -99,6 +104,7 @@ class Task(interface.AttributeContainer):
     retry_task.file_entry_type = self.file_entry_type
     retry_task.merge_priority = self.merge_priority
     retry_task.path_spec = self.path_spec
+    retry_task.path_specs = self.path_specs
     retry_task.storage_file_size = self.storage_file_size
     retry_task.storage_format = self.storage_format
 
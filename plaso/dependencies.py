@@ -28,6 +28,7 @@ PYTHON_DEPENDENCIES = {
     'dtfabric': ('__version__', '20230518', None, True),
     'flor': ('__version__', '1.1.3', None, False),
     'lz4': ('__version__', '0.10.0', None, True),
+    'numpy': ('__version__', '1.17.0', None, False),
     'opensearchpy': ('__versionstr__', '', None, False),
     'pefile': ('__version__', '2023.2.7', None, True),
     'psutil': ('__version__', '5.4.3', None, True),
@@ -54,6 +54,11 @@ class ExtractionConfiguration(interface.AttributeContainer):
   Attributes:
     archive_types_string (str): comma separated archive types for which embedded
         file entries should be processed.
+    compiled_yara_rules_path (str): path of a precompiled Yara rules file,
+        that when set is used instead of the Yara rule definitions.
+    data_stream_buffer_size (int): maximum size of a data stream, in bytes,
+        that is buffered in memory to be shared between analyzers and parsers,
+        where 0 represents no buffering and None the default.
     extract_winevt_resources (bool): True if Windows EventLog resources should
         be extracted.
     extract_winreg_binary (bool): True if Windows Registry binary values should
@@ -62,6 +67,8 @@ class ExtractionConfiguration(interface.AttributeContainer):
         should process, where 0 or None represents unlimited.
     hasher_names_string (str): comma separated names of hashers to use during
         processing.
+    hasher_number_of_threads (int): number of threads used to run the hashers
+        concurrently, where 0, 1 or None represents sequentially.
     process_compressed_streams (bool): True if file content in compressed
         streams should be processed.
     yara_rules_string (str): Yara rule definitions.
@@ -72,10 +79,13 @@ class ExtractionConfiguration(interface.AttributeContainer):
     """Initializes an extraction configuration object."""
     super(ExtractionConfiguration, self).__init__()
     self.archive_types_string = None
+    self.compiled_yara_rules_path = None
+    self.data_stream_buffer_size = None
     self.extract_winevt_resources = True
     self.extract_winreg_binary = False
     self.hasher_file_size_limit = None
     self.hasher_names_string = None
+    self.hasher_number_of_threads = None
     self.process_compressed_streams = True
     self.yara_rules_string = None
 
@@ -215,6 +225,12 @@ class ProcessingConfiguration(interface.AttributeContainer):
     preferred_year (int): preferred initial year value for year-less date and
         time values.
     profiling (ProfilingConfiguration): profiling configuration.
+    task_batch_file_size_limit (int): maximum size of a file, in bytes, for
+        its event source to be processed together with other event sources
+        in a batch task, where 0 represents no batching and None the default.
+    task_batch_size (int): maximum number of event sources processed in
+        a batch task, where 1 represents no batching and 0 or None the
+        default.
     task_storage_format (str): format to use for storing task results.
     task_storage_path (str): path of the directory containing SQLite task
         storage files.
@@ -246,6 +262,8 @@ class ProcessingConfiguration(interface.AttributeContainer):
     self.preferred_time_zone = None
     self.preferred_year = None
     self.profiling = ProfilingConfiguration()
+    self.task_batch_file_size_limit = None
+    self.task_batch_size = None
     self.task_storage_format = None
     self.task_storage_path = None
     self.temporary_directory = None
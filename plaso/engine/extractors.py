@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 """Extractor classes, used to extract information from sources."""
 
+import collections
 import copy
+import os
 
 import pysigscan
 
@@ -17,6 +19,133 @@ from plaso.parsers import interface as parsers_interface
 from plaso.parsers import manager as parsers_manager
 
 
+class NonSignatureParserIndex(object):
+  """Index of parsers without a format signature.
+
+  The index is used to pre-filter the parsers without a format signature that
+  are applied to a data stream, based on features that are cheap to determine
+  such as the name of the file, the size and the leading bytes of the data
+  stream.
+  """
+
+  def __init__(self, parsers):
+    """Initializes a parser index.
+
+    Args:
+      parsers (dict[str, BaseParser]): parsers per name.
+    """
+    super(NonSignatureParserIndex, self).__init__()
+    self._maximum_prefix_size = 0
+    self._minimum_size_per_parser_name = {}
+    self._parser_names = []
+    self._parser_names_per_filename = collections.defaultdict(set)
+    self._parser_names_per_prefix = collections.defaultdict(set)
+    self._parser_names_with_filters = {}
+    self._parser_names_with_prefixes = set()
+    self._parser_names_without_filters = set()
+
+    for parser_name, parser in parsers.items():
+      self._parser_names.append(parser_name)
+
+      filters = []
+      for filter_object in parser.FILTERS:
+        if isinstance(
+            filter_object, parsers_interface.FileNameFileEntryFilter):
+          self._parser_names_per_filename[filter_object.filename].add(
+              parser_name)
+        else:
+          filters.append(filter_object)
+
+      if filters:
+        self._parser_names_with_filters[parser_name] = filters
+      elif not parser.FILTERS:
+        self._parser_names_without_filters.add(parser_name)
+
+      for prefix in parser.DATA_STREAM_PREFIXES:
+        self._maximum_prefix_size = max(self._maximum_prefix_size, len(prefix))
+        self._parser_names_per_prefix[prefix].add(parser_name)
+        self._parser_names_with_prefixes.add(parser_name)
+
+      if parser.MINIMUM_DATA_STREAM_SIZE:
+        self._minimum_size_per_parser_name[parser_name] = (
+            parser.MINIMUM_DATA_STREAM_SIZE)
+
+  def _GetParserNamesByFileEntry(self, file_entry):
+    """Determines the parsers that can process a file entry.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      set[str]: names of the parsers that can process the file entry.
+    """
+    parser_names = set(self._parser_names_without_filters)
+
+    filename = file_entry.name.lower()
+    parser_names.update(self._parser_names_per_filename.get(filename, []))
+
+    for parser_name, filters in self._parser_names_with_filters.items():
+      if parser_name not in parser_names:
+        for filter_object in filters:
+          if filter_object.Match(file_entry):
+            parser_names.add(parser_name)
+            break
+
+    return parser_names
+
+  def _GetParserNamesByPrefix(self, file_object):
+    """Determines the parsers without a matching data stream prefix.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object of the data stream.
+
+    Returns:
+      set[str]: names of the parsers that require a data stream prefix that
+          does not match the leading bytes of the data stream.
+    """
+    if not self._parser_names_with_prefixes:
+      return set()
+
+    file_offset = file_object.get_offset()
+    try:
+      file_object.seek(0, os.SEEK_SET)
+      leading_bytes = file_object.read(self._maximum_prefix_size)
+    finally:
+      file_object.seek(file_offset, os.SEEK_SET)
+
+    parser_names = set(self._parser_names_with_prefixes)
+    for prefix, prefix_parser_names in self._parser_names_per_prefix.items():
+      if leading_bytes.startswith(prefix):
+        parser_names.difference_update(prefix_parser_names)
+
+    return parser_names
+
+  def GetParserNames(self, file_entry, file_object):
+    """Determines the parsers that should be applied to a data stream.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+      file_object (dfvfs.FileIO): file-like object of the data stream.
+
+    Returns:
+      list[str]: names of the parsers that should be applied to the data
+          stream, in the order they were added to the index.
+    """
+    parser_names = self._GetParserNamesByFileEntry(file_entry)
+
+    data_stream_size = file_object.get_size()
+    for parser_name, minimum_size in (
+        self._minimum_size_per_parser_name.items()):
+      if data_stream_size < minimum_size:
+        parser_names.discard(parser_name)
+
+    parser_names.difference_update(self._GetParserNamesByPrefix(file_object))
+
+    return [
+        parser_name for parser_name in self._parser_names
+        if parser_name in parser_names]
+
+
 class EventDataExtractor(object):
   """The event data extractor."""
 
@@ -43,7 +172,11 @@ class EventDataExtractor(object):
     self._format_scanner = None
     self._formats_with_signatures = None
     self._mft_parser = None
+    self._non_sigscan_parser_hits = collections.Counter()
+    self._non_sigscan_parser_index = None
+    self._non_sigscan_parser_misses = collections.Counter()
     self._non_sigscan_parser_names = None
+    self._non_sigscan_parser_skips = collections.Counter()
     self._parsers = None
     self._usnjrnl_parser = None
 
@@ -131,6 +264,11 @@ class EventDataExtractor(object):
     if 'usnjrnl' in self._parsers:
       del self._parsers['usnjrnl']
 
+    self._non_sigscan_parser_index = NonSignatureParserIndex({
+        parser_name: self._parsers[parser_name]
+        for parser_name in self._non_sigscan_parser_names
+        if parser_name in self._parsers})
+
   def _ParseDataStreamWithParser(
       self, parser_mediator, parser, file_entry, data_stream_name):
     """Parses a data stream of a file entry with a specific parser.
@@ -152,6 +290,40 @@ class EventDataExtractor(object):
     self._ParseFileEntryWithParser(
         parser_mediator, parser, file_entry, file_object=file_object)
 
+  def _ParseFileEntryWithNonSignatureParsers(
+      self, parser_mediator, file_entry, file_object):
+    """Parses a file entry with the parsers without a format signature.
+
+    Only the parsers selected by the non-signature parser index are applied.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_entry (dfvfs.FileEntry): file entry.
+      file_object (dfvfs.FileIO): file-like object to parse.
+
+    Raises:
+      RuntimeError: if the parser object is missing.
+    """
+    parser_names = self._non_sigscan_parser_index.GetParserNames(
+        file_entry, file_object)
+
+    for parser_name in self._non_sigscan_parser_names.difference(
+        parser_names):
+      self._non_sigscan_parser_skips[parser_name] += 1
+
+    for parser_name in parser_names:
+      parse_result = self._ParseFileEntryWithParsers(
+          parser_mediator, [parser_name], file_entry, file_object=file_object)
+
+      if parse_result == self._PARSE_RESULT_SUCCESS:
+        self._non_sigscan_parser_hits[parser_name] += 1
+      else:
+        self._non_sigscan_parser_misses[parser_name] += 1
+
+      if parse_result == self._PARSE_RESULT_FAILURE:
+        break
+
   def _ParseFileEntryWithParser(
       self, parser_mediator, parser, file_entry, file_object=None):
     """Parses a file entry with a specific parser.
@@ -256,7 +428,8 @@ class EventDataExtractor(object):
 
     return parse_results
 
-  def ParseDataStream(self, parser_mediator, file_entry, data_stream_name):
+  def ParseDataStream(
+      self, parser_mediator, file_entry, data_stream_name, file_object=None):
     """Parses a data stream of a file entry with the enabled parsers.
 
     Args:
@@ -264,11 +437,18 @@ class EventDataExtractor(object):
           and other components, such as storage and dfVFS.
       file_entry (dfvfs.FileEntry): file entry.
       data_stream_name (str): data stream name.
+      file_object (Optional[file]): file-like object of the data stream, such
+          as an in-memory buffer, where None represents the data stream
+          should be opened from the file entry.
 
     Raises:
       RuntimeError: if the file-like object or the parser object is missing.
     """
-    file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+    if file_object:
+      file_object.seek(0, os.SEEK_SET)
+    else:
+      file_object = file_entry.GetFileObject(
+          data_stream_name=data_stream_name)
     if not file_object:
       raise RuntimeError(
           'Unable to retrieve file-like object from file entry.')
@@ -288,9 +468,8 @@ class EventDataExtractor(object):
         parse_with_non_sigscan_parsers = False
 
     if parse_with_non_sigscan_parsers:
-      self._ParseFileEntryWithParsers(
-          parser_mediator, self._non_sigscan_parser_names, file_entry,
-          file_object=file_object)
+      self._ParseFileEntryWithNonSignatureParsers(
+          parser_mediator, file_entry, file_object)
 
     if self._force_parser and self._usnjrnl_parser:
       # TODO: the usnjrnl needs to be adjusted to be used on an export of
@@ -339,6 +518,26 @@ class EventDataExtractor(object):
           parser_mediator, self._usnjrnl_parser, file_entry,
           file_object=volume_file_object)
 
+  def SampleNonSignatureParserStatistics(self, processing_profiler):
+    """Samples the statistics of the parsers without a format signature.
+
+    The statistics are reset after sampling.
+
+    Args:
+      processing_profiler (ProcessingProfiler): processing profiler.
+    """
+    for parser_name in sorted(self._non_sigscan_parser_names):
+      number_of_hits = self._non_sigscan_parser_hits[parser_name]
+      number_of_misses = self._non_sigscan_parser_misses[parser_name]
+      number_of_skipped = self._non_sigscan_parser_skips[parser_name]
+      if number_of_hits or number_of_misses or number_of_skipped:
+        processing_profiler.SampleParser(
+            parser_name, number_of_hits, number_of_misses, number_of_skipped)
+
+    self._non_sigscan_parser_hits = collections.Counter()
+    self._non_sigscan_parser_misses = collections.Counter()
+    self._non_sigscan_parser_skips = collections.Counter()
+
 
 class PathSpecExtractor(object):
   """Path specification extractor.
@@ -22,6 +22,25 @@ class ProcessInfo(object):
 
     self._process = psutil.Process(pid)
 
+    # The first call of cpu_percent() sets the start of the interval over
+    # which the CPU utilization is determined.
+    self._process.cpu_percent(interval=None)
+
+  def GetCPUUtilization(self):
+    """Retrieves the CPU utilization of the process.
+
+    The CPU utilization is determined over the interval since the previous
+    call or since the process information was created.
+
+    Returns:
+      float: CPU utilization of the process as a percentage of a single CPU
+          or None if not available.
+    """
+    try:
+      return self._process.cpu_percent(interval=None)
+    except psutil.NoSuchProcess:
+      return None
+
   def GetUsedMemory(self):
     """Retrieves the amount of memory used by the process.
 
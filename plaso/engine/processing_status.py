@@ -257,6 +257,7 @@ class ProcessingStatus(object):
         caused critical errors during processing.
     events_status (EventsStatus): status information about events.
     foreman_status (ProcessingStatus): foreman processing status.
+    output_status (OutputStatus): status information about the output.
     start_time (float): time that the processing was started. Contains the
         number of micro seconds since January 1, 1970, 00:00:00 UTC.
     tasks_status (TasksStatus): status information about tasks.
@@ -271,6 +272,7 @@ class ProcessingStatus(object):
     self.error_path_specs = []
     self.events_status = None
     self.foreman_status = None
+    self.output_status = None
     self.start_time = time.time()
     self.tasks_status = None
 
@@ -401,6 +403,14 @@ class ProcessingStatus(object):
     """
     self.events_status = events_status
 
+  def UpdateOutputStatus(self, output_status):
+    """Updates the output status.
+
+    Args:
+      output_status (OutputStatus): status information about the output.
+    """
+    self.output_status = output_status
+
   def UpdateTasksStatus(self, tasks_status):
     """Updates the tasks status.
 
@@ -484,6 +494,25 @@ class EventsStatus(object):
     self.total_number_of_events = 0
 
 
+class OutputStatus(object):
+  """The status of the output.
+
+  Attributes:
+    number_of_bytes_written (int): number of bytes written to the output.
+    number_of_rejected_events (int): number of events rejected by the output.
+    number_of_retries (int): number of times writing events was retried.
+    number_of_written_events (int): number of events written to the output.
+  """
+
+  def __init__(self):
+    """Initializes an output status."""
+    super(OutputStatus, self).__init__()
+    self.number_of_bytes_written = 0
+    self.number_of_rejected_events = 0
+    self.number_of_retries = 0
+    self.number_of_written_events = 0
+
+
 class TasksStatus(object):
   """The status of the tasks.
 
@@ -129,6 +129,31 @@ class CPUTimeProfiler(SampleFileProfiler):
           f'{measurements.total_cpu_time:f}\n'))
 
 
+class IndexProfiler(SampleFileProfiler):
+  """The index profiler."""
+
+  _FILENAME_PREFIX = 'index'
+
+  _FILE_HEADER = 'Time\tName\tHits\tMisses\tSkipped\n'
+
+  def Sample(
+      self, profile_name, number_of_hits, number_of_misses, number_of_skipped):
+    """Takes a sample of an index lookup for profiling.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+      number_of_hits (int): number of candidates returned by the index that
+          matched.
+      number_of_misses (int): number of candidates returned by the index that
+          did not match.
+      number_of_skipped (int): number of items not returned by the index.
+    """
+    sample_time = time.time()
+    self._WritesString((
+        f'{sample_time:f}\t{profile_name:s}\t{number_of_hits:d}\t'
+        f'{number_of_misses:d}\t{number_of_skipped:d}\n'))
+
+
 class MemoryProfiler(SampleFileProfiler):
   """The memory profiler."""
 
@@ -152,12 +177,122 @@ class AnalyzersProfiler(CPUTimeProfiler):
 
   _FILENAME_PREFIX = 'analyzers'
 
+  # The hasher throughput statistics are stored in a separate sample file
+  # since they are per hasher and not per analyzer.
+  _HASHERS_FILENAME_PREFIX = 'analyzers_hashers'
+
+  _HASHERS_FILE_HEADER = 'Time\tName\tBytes\tProcessing time\tMB/s\n'
+
+  def __init__(self, identifier, configuration):
+    """Initializes an analyzers profiler.
+
+    Args:
+      identifier (str): identifier of the profiling session used to create
+          the sample filename.
+      configuration (ProfilingConfiguration): profiling configuration.
+    """
+    super(AnalyzersProfiler, self).__init__(identifier, configuration)
+    self._hashers_sample_file = None
+
+  def SampleHasher(self, hasher_name, number_of_bytes, processing_time):
+    """Takes a sample of the hasher throughput for profiling.
+
+    Args:
+      hasher_name (str): name of the hasher.
+      number_of_bytes (int): number of bytes processed by the hasher.
+      processing_time (float): time in seconds the hasher spent processing
+          the bytes.
+    """
+    throughput = 0.0
+    if processing_time > 0.0:
+      throughput = number_of_bytes / ((1024 * 1024) * processing_time)
+
+    sample_time = time.time()
+    content = (
+        f'{sample_time:f}\t{hasher_name:s}\t{number_of_bytes:d}\t'
+        f'{processing_time:f}\t{throughput:f}\n')
+    self._hashers_sample_file.write(codecs.encode(content, 'utf-8'))
+
+  def Start(self):
+    """Starts the profiler."""
+    super(AnalyzersProfiler, self).Start()
+
+    filename = f'{self._HASHERS_FILENAME_PREFIX:s}-{self._identifier:s}.csv.gz'
+    if self._path:
+      filename = os.path.join(self._path, filename)
+
+    self._hashers_sample_file = gzip.open(filename, 'wb')
+    self._hashers_sample_file.write(
+        codecs.encode(self._HASHERS_FILE_HEADER, 'utf-8'))
+
+  def Stop(self):
+    """Stops the profiler."""
+    self._hashers_sample_file.close()
+    self._hashers_sample_file = None
+
+    super(AnalyzersProfiler, self).Stop()
+
 
 class ProcessingProfiler(CPUTimeProfiler):
   """The processing profiler."""
 
   _FILENAME_PREFIX = 'processing'
 
+  # The parser pre-filter statistics are stored in a separate sample file
+  # since they are counts and not processing times.
+  _PARSERS_FILENAME_PREFIX = 'processing_parsers'
+
+  _PARSERS_FILE_HEADER = 'Time\tName\tHits\tMisses\tSkipped\n'
+
+  def __init__(self, identifier, configuration):
+    """Initializes a processing profiler.
+
+    Args:
+      identifier (str): identifier of the profiling session used to create
+          the sample filename.
+      configuration (ProfilingConfiguration): profiling configuration.
+    """
+    super(ProcessingProfiler, self).__init__(identifier, configuration)
+    self._parsers_sample_file = None
+
+  def SampleParser(
+      self, parser_name, number_of_hits, number_of_misses, number_of_skipped):
+    """Takes a sample of the parser pre-filter statistics for profiling.
+
+    Args:
+      parser_name (str): name of the parser.
+      number_of_hits (int): number of data streams that were selected for
+          the parser by the pre-filter and successfully parsed.
+      number_of_misses (int): number of data streams that were selected for
+          the parser by the pre-filter but not supported by the parser.
+      number_of_skipped (int): number of data streams that were not selected
+          for the parser by the pre-filter.
+    """
+    sample_time = time.time()
+    content = (
+        f'{sample_time:f}\t{parser_name:s}\t{number_of_hits:d}\t'
+        f'{number_of_misses:d}\t{number_of_skipped:d}\n')
+    self._parsers_sample_file.write(codecs.encode(content, 'utf-8'))
+
+  def Start(self):
+    """Starts the profiler."""
+    super(ProcessingProfiler, self).Start()
+
+    filename = f'{self._PARSERS_FILENAME_PREFIX:s}-{self._identifier:s}.csv.gz'
+    if self._path:
+      filename = os.path.join(self._path, filename)
+
+    self._parsers_sample_file = gzip.open(filename, 'wb')
+    self._parsers_sample_file.write(
+        codecs.encode(self._PARSERS_FILE_HEADER, 'utf-8'))
+
+  def Stop(self):
+    """Stops the profiler."""
+    self._parsers_sample_file.close()
+    self._parsers_sample_file = None
+
+    super(ProcessingProfiler, self).Stop()
+
 
 class SerializersProfiler(CPUTimeProfiler):
   """The serializers profiler."""
@@ -226,21 +361,38 @@ class TaskQueueProfiler(SampleFileProfiler):
   _FILENAME_PREFIX = 'task_queue'
 
   _FILE_HEADER = (
-      'Time\tQueued\tProcessing\tTo merge\tAbandoned\tTotal\n')
+      'Time\tQueued\tProcessing\tTo merge\tAbandoned\tTotal\tWorkers\t'
+      'CPU utilization\tMemory headroom\tDecision\tReason\n')
 
-  def Sample(self, tasks_status):
+  def Sample(self, tasks_status, worker_pool_decision=None):
     """Takes a sample of the status of queued tasks for profiling.
 
     Args:
       tasks_status (TasksStatus): status information about tasks.
+      worker_pool_decision (Optional[WorkerPoolDecision]): worker pool
+          decision that was made based on the status information about tasks
+          or None if no decision was made.
     """
     sample_time = time.time()
+
+    worker_pool_values = ['', '', '', '', '']
+    if worker_pool_decision:
+      cpu_utilization = worker_pool_decision.cpu_utilization
+      memory_headroom = worker_pool_decision.memory_headroom
+
+      worker_pool_values = [
+          f'{worker_pool_decision.number_of_workers:d}',
+          '' if cpu_utilization is None else f'{cpu_utilization:.1f}',
+          '' if memory_headroom is None else f'{memory_headroom:d}',
+          worker_pool_decision.action, worker_pool_decision.reason]
+
+    worker_pool_string = '\t'.join(worker_pool_values)
     self._WritesString((
         f'{sample_time:f}\t{tasks_status.number_of_queued_tasks:d}\t'
         f'{tasks_status.number_of_tasks_processing:d}\t'
         f'{tasks_status.number_of_tasks_pending_merge:d}\t'
         f'{tasks_status.number_of_abandoned_tasks:d}\t'
-        f'{tasks_status.total_number_of_tasks:d}\n'))
+        f'{tasks_status.total_number_of_tasks:d}\t{worker_pool_string:s}\n'))
 
 
 class TasksProfiler(SampleFileProfiler):
@@ -432,6 +432,18 @@ class EventDataTimeliner(object):
 
       self.number_of_produced_events += 1
 
+  def Reset(self):
+    """Resets the state that is specific to a storage.
+
+    The cached base dates are looked up by event data stream identifier,
+    which is only unique within a storage, therefore the timeliner needs to
+    be reset before processing event data of another storage.
+    """
+    self._base_dates = {}
+
+    self.number_of_produced_events = 0
+    self.parsers_counter = collections.Counter()
+
   def SetPreferredTimeZone(self, time_zone_string):
     """Sets the preferred time zone for zone-less date and time values.
 
@@ -21,6 +21,7 @@ from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.engine import extractors
 from plaso.engine import logger
+from plaso.lib import bytes_file
 from plaso.lib import definitions
 from plaso.lib import errors
 
@@ -73,6 +74,10 @@ class EventExtractionWorker(object):
         'Extracting', 'Hashing'.
   """
 
+  # The default maximum size of a data stream that is buffered in memory, so
+  # that the data read by the analyzers can be reused by the parsers.
+  _DEFAULT_DATA_STREAM_BUFFER_SIZE = 16 * 1024 * 1024
+
   # NTFS metadata files that need special handling.
   _METADATA_FILE_LOCATIONS_NTFS = frozenset([
       '\\$AttrDef',
@@ -151,6 +156,7 @@ class EventExtractionWorker(object):
     self._analyzers_profiler = None
     self._achive_type_scanner = self._CreateArchiveTypeScanner([])
     self._archive_types = []
+    self._data_stream_buffer_size = self._DEFAULT_DATA_STREAM_BUFFER_SIZE
     self._event_data_extractor = extractors.EventDataExtractor(
         force_parser=force_parser,
         parser_filter_expression=parser_filter_expression)
@@ -180,6 +186,11 @@ class EventExtractionWorker(object):
       event_data_stream (EventDataStream): event data stream attribute
            container.
 
+    Returns:
+      BytesFileIO: in-memory file-like object of the data stream, if the data
+          stream was read completely and fits in the data stream buffer, or
+          None otherwise.
+
     Raises:
       RuntimeError: if the file-like object cannot be retrieved from
           the file entry.
@@ -197,7 +208,8 @@ class EventExtractionWorker(object):
             'Unable to retrieve file-like object for file entry: '
             '{0:s}.').format(display_name))
 
-      self._AnalyzeFileObject(file_object, display_name, event_data_stream)
+      data_stream_file_object = self._AnalyzeFileObject(
+          file_object, display_name, event_data_stream)
 
     finally:
       if self._processing_profiler:
@@ -206,6 +218,8 @@ class EventExtractionWorker(object):
     logger.debug('[AnalyzeDataStream] completed analyzing file: {0:s}'.format(
         display_name))
 
+    return data_stream_file_object
+
   def _AnalyzeFileObject(self, file_object, display_name, event_data_stream):
     """Processes a file-like object with analyzers.
 
@@ -215,6 +229,11 @@ class EventExtractionWorker(object):
           currently being analyzed.
       event_data_stream (EventDataStream): event data stream attribute
            container.
+
+    Returns:
+      BytesFileIO: in-memory file-like object of the data stream, if the data
+          stream was read completely and fits in the data stream buffer, or
+          None otherwise.
     """
     maximum_read_size = max(
         analyzer_object.SIZE_LIMIT for analyzer_object in self._analyzers)
@@ -229,28 +248,50 @@ class EventExtractionWorker(object):
 
     if (hashers_only and self._hasher_file_size_limit and
         file_size > self._hasher_file_size_limit):
-      return
+      return None
+
+    block_analyzers = []
+    whole_file_analyzers = []
+    for analyzer_object in self._analyzers:
+      if analyzer_object.WHOLE_FILE_ANALYZER:
+        whole_file_analyzers.append(analyzer_object)
+
+      elif (not analyzer_object.INCREMENTAL_ANALYZER and
+            file_size > analyzer_object.SIZE_LIMIT):
+        continue
+
+      elif (isinstance(analyzer_object, hashing_analyzer.HashingAnalyzer) and
+            self._hasher_file_size_limit and
+            file_size > self._hasher_file_size_limit):
+        continue
+
+      else:
+        block_analyzers.append(analyzer_object)
+
+    # The data read for the analyzers is buffered so that it can be reused
+    # by the parsers instead of reading and decoding the data stream again.
+    buffered_data = None
+    if file_size <= self._data_stream_buffer_size:
+      buffered_data = []
 
     file_object.seek(0, os.SEEK_SET)
 
-    data = file_object.read(maximum_read_size)
+    data = None
+    if block_analyzers or buffered_data is not None:
+      data = file_object.read(maximum_read_size)
+
     while data:
       if self._abort:
+        buffered_data = None
         break
 
-      for analyzer_object in self._analyzers:
+      if buffered_data is not None:
+        buffered_data.append(data)
+
+      for analyzer_object in block_analyzers:
         if self._abort:
           break
 
-        if (not analyzer_object.INCREMENTAL_ANALYZER and
-            file_size > analyzer_object.SIZE_LIMIT):
-          continue
-
-        if (isinstance(analyzer_object, hashing_analyzer.HashingAnalyzer) and
-            self._hasher_file_size_limit and
-            file_size > self._hasher_file_size_limit):
-          continue
-
         self.processing_status = analyzer_object.PROCESSING_STATUS_HINT
 
         if self._analyzers_profiler:
@@ -266,6 +307,36 @@ class EventExtractionWorker(object):
 
       data = file_object.read(maximum_read_size)
 
+    data_stream_file_object = None
+    if buffered_data is not None:
+      data = b''.join(buffered_data)
+      if len(data) == file_size:
+        data_stream_file_object = bytes_file.BytesFileIO(data)
+
+    for analyzer_object in whole_file_analyzers:
+      if self._abort:
+        break
+
+      self.processing_status = analyzer_object.PROCESSING_STATUS_HINT
+
+      if self._analyzers_profiler:
+        self._analyzers_profiler.StartTiming(analyzer_object.NAME)
+
+      try:
+        # The whole data stream is analyzed at once, from the buffered data
+        # if available, to prevent the analyzer from reading it again.
+        if data_stream_file_object:
+          analyzer_object.AnalyzeFileObject(data_stream_file_object)
+          data_stream_file_object.seek(0, os.SEEK_SET)
+        else:
+          analyzer_object.AnalyzeFileObject(file_object)
+
+      finally:
+        if self._analyzers_profiler:
+          self._analyzers_profiler.StopTiming(analyzer_object.NAME)
+
+      self.last_activity_timestamp = time.time()
+
     for analyzer_object in self._analyzers:
       for result in analyzer_object.GetResults():
         logger.debug((
@@ -280,6 +351,8 @@ class EventExtractionWorker(object):
 
     self.processing_status = definitions.STATUS_INDICATOR_RUNNING
 
+    return data_stream_file_object
+
   def _CanSkipDataStream(self, file_entry, data_stream):
     """Determines if analysis and extraction of a data stream can be skipped.
 
@@ -428,7 +501,7 @@ class EventExtractionWorker(object):
     return scanner_object
 
   def _ExtractContentFromDataStream(
-      self, parser_mediator, file_entry, data_stream_name):
+      self, parser_mediator, file_entry, data_stream_name, file_object=None):
     """Extracts content from a data stream.
 
     Args:
@@ -437,6 +510,9 @@ class EventExtractionWorker(object):
       file_entry (dfvfs.FileEntry): file entry to extract its content.
       data_stream_name (str): name of the data stream whose content is to be
           extracted.
+      file_object (Optional[BytesFileIO]): in-memory file-like object of
+          the data stream, where None represents the data stream should be
+          read from the file entry.
     """
     self.processing_status = definitions.STATUS_INDICATOR_EXTRACTING
 
@@ -444,7 +520,7 @@ class EventExtractionWorker(object):
       self._processing_profiler.StartTiming('extracting')
 
     self._event_data_extractor.ParseDataStream(
-        parser_mediator, file_entry, data_stream_name)
+        parser_mediator, file_entry, data_stream_name, file_object=file_object)
 
     if self._processing_profiler:
       self._processing_profiler.StopTiming('extracting')
@@ -739,9 +815,14 @@ class EventExtractionWorker(object):
         if file_entry.IsRoot() and sub_file_entry.name == '$OrphanFiles':
           continue
 
+      # The size is used to schedule the processing of large files first.
+      size = None
+      if sub_file_entry.entry_type == dfvfs_definitions.FILE_ENTRY_TYPE_FILE:
+        size = sub_file_entry.size
+
       event_source = event_sources.FileEntryEventSource(
           file_entry_type=sub_file_entry.entry_type,
-          path_spec=sub_file_entry.path_spec)
+          path_spec=sub_file_entry.path_spec, size=size)
 
       parser_mediator.ProduceEventSource(event_source)
 
@@ -810,6 +891,7 @@ class EventExtractionWorker(object):
         '[ProcessFileEntryDataStream] processing data stream: "{0:s}" of '
         'file entry: {1:s}').format(data_stream_name, display_name))
 
+    data_stream_file_object = None
     event_data_stream = None
     if data_stream:
       display_name = parser_mediator.GetDisplayName()
@@ -824,7 +906,7 @@ class EventExtractionWorker(object):
       if self._analyzers:
         # Since AnalyzeDataStream generates event data stream attributes it
         # needs to be called before producing events.
-        self._AnalyzeDataStream(
+        data_stream_file_object = self._AnalyzeDataStream(
             file_entry, data_stream.name, display_name, event_data_stream)
 
     parser_mediator.ProduceEventDataStream(event_data_stream)
@@ -861,8 +943,10 @@ class EventExtractionWorker(object):
     else:
       results = []
       try:
-        file_object = file_entry.GetFileObject(
-            data_stream_name=data_stream_name)
+        file_object = data_stream_file_object
+        if not file_object:
+          file_object = file_entry.GetFileObject(
+              data_stream_name=data_stream_name)
         if file_object:
           scan_state = pysigscan.scan_state()
           self._achive_type_scanner.scan_file_object(scan_state, file_object)
@@ -895,7 +979,8 @@ class EventExtractionWorker(object):
 
         # Note that ZIP is also a compound format.
         self._ExtractContentFromDataStream(
-            parser_mediator, file_entry, data_stream.name)
+            parser_mediator, file_entry, data_stream.name,
+            file_object=data_stream_file_object)
 
       else:
         if len(results) > 1:
@@ -905,7 +990,8 @@ class EventExtractionWorker(object):
               '{1:s}').format(results, display_name))
 
         self._ExtractContentFromDataStream(
-             parser_mediator, file_entry, data_stream.name)
+             parser_mediator, file_entry, data_stream.name,
+             file_object=data_stream_file_object)
 
   def _ProcessMetadataFile(self, parser_mediator, file_entry):
     """Processes a metadata file.
@@ -954,12 +1040,15 @@ class EventExtractionWorker(object):
     self._achive_type_scanner = self._CreateArchiveTypeScanner(
         self._archive_types)
 
-  def _SetHashers(self, hasher_names_string):
+  def _SetHashers(self, hasher_names_string, number_of_threads=None):
     """Sets the hasher names.
 
     Args:
       hasher_names_string (str): comma separated names of the hashers
           to enable, where 'none' disables the hashing analyzer.
+      number_of_threads (Optional[int]): number of threads used to run
+          the hashers concurrently, where 0, 1 or None represents
+          sequentially.
     """
     if not hasher_names_string or hasher_names_string == 'none':
       return
@@ -967,20 +1056,32 @@ class EventExtractionWorker(object):
     analyzer_object = analyzers_manager.AnalyzersManager.GetAnalyzerInstance(
         'hashing')
     analyzer_object.SetHasherNames(hasher_names_string)
+    if number_of_threads:
+      analyzer_object.SetNumberOfThreads(number_of_threads)
     self._analyzers.append(analyzer_object)
 
-  def _SetYaraRules(self, yara_rules_string):
+  def _SetYaraRules(
+      self, yara_rules_string, compiled_rules_path=None,
+      temporary_directory=None):
     """Sets the Yara rules.
 
     Args:
       yara_rules_string (str): unparsed Yara rule definitions.
+      compiled_rules_path (Optional[str]): path of a precompiled Yara rules
+          file, that when set is used instead of the Yara rule definitions.
+      temporary_directory (Optional[str]): path of the directory for temporary
+          files.
     """
-    if not yara_rules_string:
+    if not yara_rules_string and not compiled_rules_path:
       return
 
     analyzer_object = analyzers_manager.AnalyzersManager.GetAnalyzerInstance(
         'yara')
-    analyzer_object.SetRules(yara_rules_string)
+    if compiled_rules_path:
+      analyzer_object.LoadRules(compiled_rules_path)
+    else:
+      analyzer_object.SetRules(yara_rules_string)
+    analyzer_object.SetTemporaryDirectory(temporary_directory)
     self._analyzers.append(analyzer_object)
 
   def GetAnalyzerNames(self):
@@ -1036,17 +1137,27 @@ class EventExtractionWorker(object):
     self.ProcessFileEntry(parser_mediator, file_entry)
 
   # TODO: move the functionality of this method into the constructor.
-  def SetExtractionConfiguration(self, configuration):
+  def SetExtractionConfiguration(
+      self, configuration, temporary_directory=None):
     """Sets the extraction configuration settings.
 
     Args:
       configuration (ExtractionConfiguration): extraction configuration.
+      temporary_directory (Optional[str]): path of the directory for temporary
+          files.
     """
     self._SetArchiveTypes(configuration.archive_types_string)
+    if configuration.data_stream_buffer_size is not None:
+      self._data_stream_buffer_size = configuration.data_stream_buffer_size
     self._hasher_file_size_limit = configuration.hasher_file_size_limit
-    self._SetHashers(configuration.hasher_names_string)
+    self._SetHashers(
+        configuration.hasher_names_string,
+        number_of_threads=configuration.hasher_number_of_threads)
     self._process_compressed_streams = configuration.process_compressed_streams
-    self._SetYaraRules(configuration.yara_rules_string)
+    self._SetYaraRules(
+        configuration.yara_rules_string,
+        compiled_rules_path=configuration.compiled_yara_rules_path,
+        temporary_directory=temporary_directory)
 
   def SetAnalyzersProfiler(self, analyzers_profiler):
     """Sets the analyzers profiler.
@@ -1054,6 +1165,11 @@ class EventExtractionWorker(object):
     Args:
       analyzers_profiler (AnalyzersProfiler): analyzers profile.
     """
+    if self._analyzers_profiler:
+      for analyzer_object in self._analyzers:
+        if isinstance(analyzer_object, hashing_analyzer.HashingAnalyzer):
+          analyzer_object.SampleHasherStatistics(self._analyzers_profiler)
+
     self._analyzers_profiler = analyzers_profiler
 
   def SetProcessingProfiler(self, processing_profiler):
@@ -1062,6 +1178,10 @@ class EventExtractionWorker(object):
     Args:
       processing_profiler (ProcessingProfiler): processing profile.
     """
+    if self._processing_profiler:
+      self._event_data_extractor.SampleNonSignatureParserStatistics(
+          self._processing_profiler)
+
     self._processing_profiler = processing_profiler
 
   def SignalAbort(self):
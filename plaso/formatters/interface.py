@@ -237,7 +237,7 @@ class EventFormatter(object):
       str: formatted message.
     """
     try:
-      message_string = format_string.format(**event_values)
+      message_string = format_string.format_map(event_values)
 
     except KeyError as exception:
       data_type = event_values.get('data_type', None) or 'N/A'
@@ -282,6 +282,17 @@ class EventFormatter(object):
     # string.strip().
     return message_string.replace('\r', '').replace('\n', '')
 
+  def Compile(self):
+    """Compiles the formatter.
+
+    Compiling determines the attribute names in the format strings upfront
+    instead of when the first event is formatted.
+
+    Raises:
+      RuntimeError: when an invalid format string piece is encountered.
+    """
+    self.GetFormatStringAttributeNames()
+
   def FormatEventValues(self, output_mediator, event_values):
     """Formats event values using the helper.
 
@@ -297,7 +308,7 @@ class EventFormatter(object):
     """Retrieves the attribute names in the format string.
 
     Returns:
-      set(str): attribute names.
+      frozenset(str): attribute names.
     """
 
   # pylint: disable=unused-argument
@@ -376,14 +387,14 @@ class BasicEventFormatter(EventFormatter):
     """Retrieves the attribute names in the format string.
 
     Returns:
-      set(str): attribute names.
+      frozenset(str): attribute names.
     """
     if self._format_string_attribute_names is None:
-      self._format_string_attribute_names = (
+      self._format_string_attribute_names = frozenset(
           self._FORMAT_STRING_ATTRIBUTE_NAME_RE.findall(
               self._format_string))
 
-    return set(self._format_string_attribute_names)
+    return self._format_string_attribute_names
 
   def GetMessage(self, event_values):
     """Determines the message.
@@ -453,6 +464,8 @@ class ConditionalEventFormatter(EventFormatter):
     self._format_string_separator = format_string_separator
     self._format_string_short_pieces = format_string_short_pieces or []
     self._format_string_short_pieces_map = []
+    self._format_strings = {}
+    self._format_strings_short = {}
 
   def _CreateFormatStringMap(
       self, format_string_pieces, format_string_pieces_map):
@@ -506,13 +519,19 @@ class ConditionalEventFormatter(EventFormatter):
     self._CreateFormatStringMap(
         self._format_string_short_pieces, self._format_string_short_pieces_map)
 
+    self._format_strings = {}
+    self._format_strings_short = {}
+
   def _ConditionalFormatMessage(
-      self, format_string_pieces, format_string_pieces_map, event_values):
+      self, format_string_pieces, format_string_pieces_map, format_strings,
+      event_values):
     """Determines the conditional formatted message.
 
     Args:
       format_string_pieces (dict[str, str]): format string pieces.
       format_string_pieces_map (list[int, str]): format string pieces map.
+      format_strings (dict[tuple[bool], str]): format strings per combination
+          of attribute values that are set, which is used as a cache.
       event_values (dict[str, object]): event values.
 
     Returns:
@@ -521,31 +540,51 @@ class ConditionalEventFormatter(EventFormatter):
     Raises:
       RuntimeError: when an invalid format string piece is encountered.
     """
-    string_pieces = []
-    for map_index, attribute_name in enumerate(format_string_pieces_map):
-      if not attribute_name or event_values.get(
-          attribute_name, None) is not None:
-        string_pieces.append(format_string_pieces[map_index])
+    lookup_key = tuple(
+        event_values.get(attribute_name, None) is not None
+        for attribute_name in format_string_pieces_map if attribute_name)
+
+    format_string = format_strings.get(lookup_key, None)
+    if format_string is None:
+      string_pieces = []
+      for map_index, attribute_name in enumerate(format_string_pieces_map):
+        if not attribute_name or event_values.get(
+            attribute_name, None) is not None:
+          string_pieces.append(format_string_pieces[map_index])
+
+      format_string = self._format_string_separator.join(string_pieces)
+      format_strings[lookup_key] = format_string
 
-    format_string = self._format_string_separator.join(string_pieces)
     return self._FormatMessage(format_string, event_values)
 
+  def Compile(self):
+    """Compiles the formatter.
+
+    Compiling determines the attribute names and maps of the format string
+    pieces upfront instead of when the first event is formatted.
+
+    Raises:
+      RuntimeError: when an invalid format string piece is encountered.
+    """
+    super(ConditionalEventFormatter, self).Compile()
+
+    self._CreateFormatStringMaps()
+
   def GetFormatStringAttributeNames(self):
     """Retrieves the attribute names in the format string.
 
     Returns:
-      set(str): attribute names.
+      frozenset(str): attribute names.
     """
     if self._format_string_attribute_names is None:
-      self._format_string_attribute_names = []
+      attribute_names = []
       for format_string_piece in self._format_string_pieces:
-        attribute_names = self._FORMAT_STRING_ATTRIBUTE_NAME_RE.findall(
-            format_string_piece)
+        attribute_names.extend(self._FORMAT_STRING_ATTRIBUTE_NAME_RE.findall(
+            format_string_piece))
 
-        if attribute_names:
-          self._format_string_attribute_names.extend(attribute_names)
+      self._format_string_attribute_names = frozenset(attribute_names)
 
-    return set(self._format_string_attribute_names)
+    return self._format_string_attribute_names
 
   def GetMessage(self, event_values):
     """Determines the message.
@@ -561,7 +600,7 @@ class ConditionalEventFormatter(EventFormatter):
 
     return self._ConditionalFormatMessage(
         self._format_string_pieces, self._format_string_pieces_map,
-        event_values)
+        self._format_strings, event_values)
 
   def GetMessageShort(self, event_values):
     """Determines the short message.
@@ -579,12 +618,15 @@ class ConditionalEventFormatter(EventFormatter):
         self._format_string_short_pieces != ['']):
       format_string_pieces = self._format_string_short_pieces
       format_string_pieces_map = self._format_string_short_pieces_map
+      format_strings = self._format_strings_short
     else:
       format_string_pieces = self._format_string_pieces
       format_string_pieces_map = self._format_string_pieces_map
+      format_strings = self._format_strings
 
     short_message_string = self._ConditionalFormatMessage(
-        format_string_pieces, format_string_pieces_map, event_values)
+        format_string_pieces, format_string_pieces_map, format_strings,
+        event_values)
 
     # Truncate the short message string if necessary.
     if len(short_message_string) > 80:
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""In-memory bytes file-like object."""
+
+import io
+import os
+
+
+class BytesFileIO(io.BytesIO):
+  """In-memory bytes file-like object with a dfVFS file IO interface.
+
+  The file-like object can be used by parsers as a replacement of the dfVFS
+  file IO of a data stream that was already read into memory.
+  """
+
+  def __init__(self, data):
+    """Initializes an in-memory bytes file-like object.
+
+    Args:
+      data (bytes): data of the data stream.
+    """
+    super(BytesFileIO, self).__init__(data)
+    self._size = len(data)
+
+  # pylint: disable=arguments-renamed
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an
+          absolute or relative position within the file.
+
+    Returns:
+      int: new offset.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if whence == os.SEEK_CUR:
+      offset += self.tell()
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    return super(BytesFileIO, self).seek(offset, os.SEEK_SET)
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the dfVFS file IO interface.
+  # pylint: disable=invalid-name
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self.tell()
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+    """
+    return self._size
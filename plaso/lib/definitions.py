@@ -26,12 +26,18 @@ NON_PRINTABLE_CHARACTER_TRANSLATION_TABLE = str.maketrans(
     NON_PRINTABLE_CHARACTERS)
 
 # Compression formats.
+COMPRESSION_FORMAT_LZ4 = 'lz4'
 COMPRESSION_FORMAT_NONE = 'none'
 COMPRESSION_FORMAT_ZLIB = 'zlib'
+COMPRESSION_FORMAT_ZSTD = 'zstd'
 
 COMPRESSION_FORMATS = frozenset([
+    COMPRESSION_FORMAT_LZ4,
     COMPRESSION_FORMAT_NONE,
-    COMPRESSION_FORMAT_ZLIB])
+    COMPRESSION_FORMAT_ZLIB,
+    COMPRESSION_FORMAT_ZSTD])
+
+DEFAULT_COMPRESSION_FORMAT = COMPRESSION_FORMAT_ZLIB
 
 # Operating system families.
 OPERATING_SYSTEM_FAMILY_LINUX = 'Linux'
@@ -48,9 +54,14 @@ OPERATING_SYSTEM_FAMILIES = frozenset([
     OPERATING_SYSTEM_FAMILY_WINDOWS_NT])
 
 # Serialization formats.
+SERIALIZER_FORMAT_BINARY = 'binary'
 SERIALIZER_FORMAT_JSON = 'json'
 
-SERIALIZER_FORMATS = frozenset([SERIALIZER_FORMAT_JSON])
+SERIALIZER_FORMATS = frozenset([
+    SERIALIZER_FORMAT_BINARY,
+    SERIALIZER_FORMAT_JSON])
+
+DEFAULT_SERIALIZER_FORMAT = SERIALIZER_FORMAT_JSON
 
 # Source types.
 SOURCE_TYPE_ARCHIVE = 'archive'
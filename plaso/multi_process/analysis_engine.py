@@ -3,6 +3,7 @@
 
 import collections
 import os
+import pickle
 import time
 
 from plaso.containers import counts
@@ -33,6 +34,10 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   _CONTAINER_TYPE_ANALYSIS_REPORT = reports.AnalysisReport.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
+  # Maximum number of events that are pushed to the analysis processes
+  # in a single batch.
+  _MAXIMUM_NUMBER_OF_BATCHED_EVENTS = 500
+
   _PROCESS_JOIN_TIMEOUT = 5.0
 
   _QUEUE_TIMEOUT = 10 * 60
@@ -55,6 +60,7 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._analysis_plugins = {}
     self._completed_analysis_processes = set()
     self._data_location = None
+    self._event_filter = None
     self._event_filter_expression = None
     self._event_labels_counter = None
     self._event_queues = {}
@@ -114,21 +120,15 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     filter_limit = getattr(event_filter, 'limit', None)
 
-    for event in storage_writer.GetSortedEvents():
-      event_data_identifier = event.GetEventDataIdentifier()
-      event_data = storage_writer.GetAttributeContainerByIdentifier(
-          events.EventData.CONTAINER_TYPE, event_data_identifier)
-
-      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
-      if event_data_stream_identifier:
-        event_data_stream = storage_writer.GetAttributeContainerByIdentifier(
-            events.EventDataStream.CONTAINER_TYPE, event_data_stream_identifier)
-      else:
-        event_data_stream = None
-
-      event_identifier = event.GetIdentifier()
-      event_tag = storage_writer.GetEventTagByEventIdentifer(event_identifier)
+    # Analysis plugins that read the events directly from the storage file
+    # have no event queue.
+    if self._event_queues:
+      sorted_events = storage_writer.GetSortedEventsWithEventData()
+    else:
+      sorted_events = []
 
+    event_batch = []
+    for event, event_data, event_data_stream, event_tag in sorted_events:
       if event_filter:
         filter_match = event_filter.Match(
             event, event_data, event_data_stream, event_tag)
@@ -140,9 +140,10 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         number_of_filtered_events += 1
         continue
 
-      for event_queue in self._event_queues.values():
-        # TODO: Check for premature exit of analysis plugins.
-        event_queue.PushItem((event, event_data, event_data_stream))
+      event_batch.append((event, event_data, event_data_stream))
+      if len(event_batch) >= self._MAXIMUM_NUMBER_OF_BATCHED_EVENTS:
+        self._PushEventBatch(event_batch)
+        event_batch = []
 
       self._number_of_consumed_events += 1
 
@@ -150,6 +151,9 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           filter_limit == self._number_of_consumed_events):
         break
 
+    if event_batch:
+      self._PushEventBatch(event_batch)
+
     logger.debug('Finished pushing events to analysis plugins.')
     # Signal that we have finished adding events.
     for event_queue in self._event_queues.values():
@@ -175,10 +179,9 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           self._PrepareMergeTaskStorage(definitions.STORAGE_FORMAT_SQLITE, task)
           self._status = definitions.STATUS_INDICATOR_MERGING
 
-          event_queue = self._event_queues[plugin_name]
-          del self._event_queues[plugin_name]
-
-          event_queue.Close()
+          event_queue = self._event_queues.pop(plugin_name, None)
+          if event_queue:
+            event_queue.Close()
 
           task_storage_reader = self._GetMergeTaskStorage(
               definitions.STORAGE_FORMAT_SQLITE, task)
@@ -328,6 +331,42 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     return number_of_containers
 
+  def _PushEventBatch(self, event_batch):
+    """Pushes a batch of events onto the event queues of the analysis processes.
+
+    The batch is serialized once and the same serialized data is pushed onto
+    every event queue, instead of serializing every event for every analysis
+    process.
+
+    Args:
+      event_batch (list[tuple[EventObject, EventData, EventDataStream]]):
+          events with their corresponding event data and event data stream.
+    """
+    serialized_event_batch = pickle.dumps(
+        event_batch, protocol=pickle.HIGHEST_PROTOCOL)
+
+    for event_queue in self._event_queues.values():
+      # TODO: Check for premature exit of analysis plugins.
+      event_queue.PushItem(serialized_event_batch)
+
+  def _ReadsEventsFromStorageFile(self, analysis_plugin):
+    """Determines if an analysis plugin reads events from the storage file.
+
+    An analysis plugin that only analyzes specific data types reads the events
+    of these data types directly from the storage file, instead of all events
+    being pushed onto its event queue. Since the events are not filtered by
+    the analysis process, this is not done when an event filter is used.
+
+    Args:
+      analysis_plugin (AnalysisPlugin): analysis plugin.
+
+    Returns:
+      bool: True if the analysis plugin reads events from the storage file.
+    """
+    return bool(
+        analysis_plugin.DATA_TYPES and not self._event_filter and
+        self._storage_file_path and os.path.isfile(self._storage_file_path))
+
   def _StartAnalysisProcesses(self, analysis_plugins):
     """Starts the analysis processes.
 
@@ -361,25 +400,32 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       logger.error('Missing analysis plugin: {0:s}'.format(process_name))
       return None
 
-    queue_name = '{0:s} output event queue'.format(process_name)
-    output_event_queue = zeromq_queue.ZeroMQPushBindQueue(
-        name=queue_name, timeout_seconds=self._QUEUE_TIMEOUT)
-    # Open the queue so it can bind to a random port, and we can get the
-    # port number to use in the input queue.
-    output_event_queue.Open()
+    input_event_queue = None
+    storage_file_path = None
+
+    if self._ReadsEventsFromStorageFile(analysis_plugin):
+      storage_file_path = self._storage_file_path
+
+    else:
+      queue_name = '{0:s} output event queue'.format(process_name)
+      output_event_queue = zeromq_queue.ZeroMQPushBindQueue(
+          name=queue_name, timeout_seconds=self._QUEUE_TIMEOUT)
+      # Open the queue so it can bind to a random port, and we can get the
+      # port number to use in the input queue.
+      output_event_queue.Open()
 
-    self._event_queues[process_name] = output_event_queue
+      self._event_queues[process_name] = output_event_queue
 
-    queue_name = '{0:s} input event queue'.format(process_name)
-    input_event_queue = zeromq_queue.ZeroMQPullConnectQueue(
-        name=queue_name, delay_open=True, port=output_event_queue.port,
-        timeout_seconds=self._QUEUE_TIMEOUT)
+      queue_name = '{0:s} input event queue'.format(process_name)
+      input_event_queue = zeromq_queue.ZeroMQPullConnectQueue(
+          name=queue_name, delay_open=True, port=output_event_queue.port,
+          timeout_seconds=self._QUEUE_TIMEOUT)
 
     process = analysis_process.AnalysisProcess(
         input_event_queue, analysis_plugin, self._processing_configuration,
         self._user_accounts, data_location=self._data_location,
         event_filter_expression=self._event_filter_expression,
-        name=process_name)
+        storage_file_path=storage_file_path, name=process_name)
 
     process.start()
 
@@ -575,6 +621,7 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     self._analysis_plugins = {}
     self._data_location = data_location
+    self._event_filter = event_filter
     self._event_filter_expression = event_filter_expression
     self._events_status = processing_status.EventsStatus()
     self._processing_configuration = processing_configuration
@@ -616,6 +663,9 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     self._StartProfiling(self._processing_configuration.profiling)
 
+    if self._storage_profiler:
+      storage_writer.SetStorageProfiler(self._storage_profiler)
+
     # Start the status update thread after open of the storage writer
     # so we don't have to clean up the thread if the open fails.
     self._StartStatusUpdateThread()
@@ -652,6 +702,9 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       # so we include the storage sync to disk in the status updates.
       self._StopStatusUpdateThread()
 
+      if self._storage_profiler:
+        storage_writer.SetStorageProfiler(None)
+
       self._StopProfiling()
 
     # Update the status view one last time before the analysis processses are
@@ -695,6 +748,7 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     # Reset values.
     self._analysis_plugins = {}
     self._data_location = None
+    self._event_filter = None
     self._event_filter_expression = None
     self._processing_configuration = None
     self._session = None
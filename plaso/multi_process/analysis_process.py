@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The multi-process analysis worker process."""
 
+import pickle
 import threading
 
 from plaso.analysis import mediator as analysis_mediator
@@ -10,6 +11,7 @@ from plaso.lib import errors
 from plaso.multi_process import logger
 from plaso.multi_process import plaso_queue
 from plaso.multi_process import task_process
+from plaso.storage import factory as storage_factory
 
 
 class AnalysisProcess(task_process.MultiProcessTaskProcess):
@@ -22,14 +24,15 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
   def __init__(
       self, event_queue, analysis_plugin, processing_configuration,
       user_accounts, data_location=None, event_filter_expression=None,
-      **kwargs):
+      storage_file_path=None, **kwargs):
     """Initializes an analysis worker process.
 
     Non-specified keyword arguments (kwargs) are directly passed to
     multiprocessing.Process.
 
     Args:
-      event_queue (plaso_queue.Queue): event queue.
+      event_queue (plaso_queue.Queue): event queue, where None represents
+          the events are read directly from the storage file.
       analysis_plugin (AnalysisPlugin): plugin running in the process.
       processing_configuration (ProcessingConfiguration): processing
           configuration.
@@ -37,6 +40,9 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
       data_location (Optional[str]): path to the location that data files
           should be loaded from.
       event_filter_expression (Optional[str]): event filter expression.
+      storage_file_path (Optional[str]): path of the storage file to read
+          the events of the data types of the analysis plugin from, when
+          no event queue is used.
     """
     super(AnalysisProcess, self).__init__(processing_configuration, **kwargs)
     self._abort = False
@@ -48,6 +54,7 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
     self._foreman_status_wait_event = None
     self._number_of_consumed_events = 0
     self._status = definitions.STATUS_INDICATOR_INITIALIZED
+    self._storage_file_path = storage_file_path
     self._task = None
     self._user_accounts = user_accounts
 
@@ -148,30 +155,10 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
     task_storage_writer.AddAttributeContainer(task)
 
     try:
-      logger.debug(
-          '{0!s} (PID: {1:d}) started monitoring event queue.'.format(
-              self._name, self._pid))
-
-      while not self._abort:
-        try:
-          queued_object = self._event_queue.PopItem()
-
-        except (errors.QueueClose, errors.QueueEmpty) as exception:
-          logger.debug('ConsumeItems exiting with exception {0!s}.'.format(
-              type(exception)))
-          break
-
-        if isinstance(queued_object, plaso_queue.QueueAbort):
-          logger.debug('ConsumeItems exiting, dequeued QueueAbort object.')
-          break
-
-        self._ProcessEvent(self._analysis_mediator, *queued_object)
-
-        self._number_of_consumed_events += 1
-
-      logger.debug(
-          '{0!s} (PID: {1:d}) stopped monitoring event queue.'.format(
-              self._name, self._pid))
+      if self._event_queue:
+        self._ProcessEventQueue(self._analysis_mediator)
+      else:
+        self._ProcessStorageFile(self._analysis_mediator)
 
       if not self._abort:
         self._status = definitions.STATUS_INDICATOR_REPORTING
@@ -225,10 +212,11 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
     self._foreman_status_wait_event = None
     self._task = None
 
-    try:
-      self._event_queue.Close(abort=self._abort)
-    except errors.QueueAlreadyClosed:
-      logger.error('Queue for {0:s} was already closed.'.format(self.name))
+    if self._event_queue:
+      try:
+        self._event_queue.Close(abort=self._abort)
+      except errors.QueueAlreadyClosed:
+        logger.error('Queue for {0:s} was already closed.'.format(self.name))
 
   def _ProcessEvent(self, mediator, event, event_data, event_data_stream):
     """Processes an event.
@@ -250,6 +238,99 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
       logger.warning('Unhandled exception while processing event object.')
       logger.exception(exception)
 
+  def _ProcessEventBatch(self, mediator, serialized_event_batch):
+    """Processes a batch of events.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between
+          analysis plugins and other components, such as storage and dfvfs.
+      serialized_event_batch (bytes): serialized batch of events with their
+          corresponding event data and event data stream.
+    """
+    # The batch is serialized by the analysis engine of the foreman process.
+    event_batch = pickle.loads(serialized_event_batch)  # nosec
+
+    for event, event_data, event_data_stream in event_batch:
+      if self._abort:
+        break
+
+      self._ProcessEvent(mediator, event, event_data, event_data_stream)
+
+      self._number_of_consumed_events += 1
+
+  def _ProcessEventQueue(self, mediator):
+    """Processes the batches of events pushed onto the event queue.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between
+          analysis plugins and other components, such as storage and dfvfs.
+    """
+    logger.debug(
+        '{0!s} (PID: {1:d}) started monitoring event queue.'.format(
+            self._name, self._pid))
+
+    while not self._abort:
+      try:
+        queued_object = self._event_queue.PopItem()
+
+      except (errors.QueueClose, errors.QueueEmpty) as exception:
+        logger.debug('ConsumeItems exiting with exception {0!s}.'.format(
+            type(exception)))
+        break
+
+      if isinstance(queued_object, plaso_queue.QueueAbort):
+        logger.debug('ConsumeItems exiting, dequeued QueueAbort object.')
+        break
+
+      self._ProcessEventBatch(mediator, queued_object)
+
+    logger.debug(
+        '{0!s} (PID: {1:d}) stopped monitoring event queue.'.format(
+            self._name, self._pid))
+
+  def _ProcessStorageFile(self, mediator):
+    """Processes the events read directly from the storage file.
+
+    Only the events of the data types analyzed by the analysis plugin are
+    read, in the order they were stored.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between
+          analysis plugins and other components, such as storage and dfvfs.
+
+    Raises:
+      IOError: if the storage file cannot be opened.
+      OSError: if the storage file cannot be opened.
+    """
+    storage_reader = (
+        storage_factory.StorageFactory.CreateStorageReaderForFile(
+            self._storage_file_path))
+    if not storage_reader:
+      raise IOError(
+          f'Unable to open storage file: {self._storage_file_path!s}')
+
+    logger.debug(
+        f'{self._name!s} (PID: {self._pid!s}) started reading events from '
+        f'storage file.')
+
+    try:
+      for event, event_data, event_data_stream in (
+          storage_reader.GetEventsWithEventDataByDataType(
+              self._analysis_plugin.DATA_TYPES)):
+        if self._abort:
+          break
+
+        self._ProcessEvent(mediator, event, event_data, event_data_stream)
+
+        self._number_of_consumed_events += 1
+
+    finally:
+      storage_reader.Close()
+
+    logger.debug(
+        f'{self._name!s} (PID: {self._pid!s}) stopped reading events from '
+        f'storage file.')
+
   def SignalAbort(self):
     """Signals the process to abort."""
     self._abort = True
@@ -116,6 +116,9 @@ class MultiProcessEngine(engine.BaseEngine):
     else:
       process_is_alive = True
 
+    if not process_is_alive and self._StopRetiredWorkerProcess(pid):
+      return
+
     process_information = self._process_information_per_pid[pid]
     used_memory = process_information.GetUsedMemory() or 0
 
@@ -388,6 +391,18 @@ class MultiProcessEngine(engine.BaseEngine):
 
       self._StopMonitoringProcess(process)
 
+  # pylint: disable=unused-argument
+  def _StopRetiredWorkerProcess(self, pid):
+    """Stops a worker process that stopped after being retired.
+
+    Args:
+      pid (int): process identifier (PID).
+
+    Returns:
+      bool: True if the worker process was retired and has been stopped.
+    """
+    return False
+
   def _StopStatusUpdateThread(self):
     """Stops the status update thread."""
     if self._status_update_thread:
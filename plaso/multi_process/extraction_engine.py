@@ -6,20 +6,27 @@ import heapq
 import logging
 import multiprocessing
 import os
+import tempfile
 import time
 import traceback
 
+import psutil
+import pytz
+import yara
+
+from acstore.containers import manager as containers_manager
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.analyzers import yara_analyzer
 from plaso.containers import counts
 from plaso.containers import event_sources
 from plaso.containers import events
+from plaso.containers import sessions
 from plaso.containers import warnings
 from plaso.engine import extractors
 from plaso.engine import path_helper
-from plaso.engine import timeliner
 from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.lib import loggers
@@ -29,11 +36,19 @@ from plaso.multi_process import merge_helpers
 from plaso.multi_process import plaso_queue
 from plaso.multi_process import task_engine
 from plaso.multi_process import task_manager
+from plaso.multi_process import worker_pool
 from plaso.multi_process import zeromq_queue
+from plaso.storage.sqlite import writer as sqlite_writer
 
 
 class _EventSourceHeap(object):
-  """Class that defines an event source heap."""
+  """Class that defines an event source heap.
+
+  Event sources of directories are popped first, since these produce the
+  event sources of the files in the directory. Event sources of files are
+  popped largest first, so that a large file, that takes a long time to
+  process, is not scheduled last while the other workers are idle.
+  """
 
   def __init__(self, maximum_number_of_items=50000):
     """Initializes an event source heap.
@@ -46,6 +61,14 @@ class _EventSourceHeap(object):
     self._heap = []
     self._maximum_number_of_items = maximum_number_of_items
 
+  def GetEventSources(self):
+    """Retrieves the event sources on the heap without removing them.
+
+    Returns:
+      list[EventSource]: event sources.
+    """
+    return [event_source for _, _, _, event_source in self._heap]
+
   def IsFull(self):
     """Determines if the heap is full.
 
@@ -61,7 +84,7 @@ class _EventSourceHeap(object):
       EventSource: an event source or None on if no event source is available.
     """
     try:
-      _, _, event_source = heapq.heappop(self._heap)
+      _, _, _, event_source = heapq.heappop(self._heap)
 
     except IndexError:
       return None
@@ -80,7 +103,7 @@ class _EventSourceHeap(object):
     else:
       weight = 100
 
-    heap_values = (weight, time.time(), event_source)
+    heap_values = (weight, -(event_source.size or 0), time.time(), event_source)
     heapq.heappush(self._heap, heap_values)
 
 
@@ -93,12 +116,34 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   """
 
   _CONTAINER_TYPE_DATE_LESS_LOG_HELPER = events.DateLessLogHelper.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
-
-  # Maximum number of dfVFS file system objects to cache in the foreman process.
-  _FILE_SYSTEM_CACHE_SIZE = 3
+  _CONTAINER_TYPE_PARSER_COUNT = counts.ParserCount.CONTAINER_TYPE
+  _CONTAINER_TYPE_SESSION = sessions.Session.CONTAINER_TYPE
+  _CONTAINER_TYPE_SESSION_CHECKPOINT = (
+      sessions.SessionCheckpoint.CONTAINER_TYPE)
+
+  # Minimum interval, in seconds, between session checkpoints. A checkpoint
+  # is written between merges of task storage and its size is bounded by
+  # the number of pending event sources and tasks.
+  _CHECKPOINT_INTERVAL = 60.0
+
+  # Attribute container types that are not restored to a session checkpoint,
+  # since these are not added but updated during extraction. The number of
+  # events per parser is stored in the checkpoint.
+  _CHECKPOINT_EXCLUDED_CONTAINER_TYPES = frozenset([
+      _CONTAINER_TYPE_PARSER_COUNT,
+      _CONTAINER_TYPE_SESSION,
+      _CONTAINER_TYPE_SESSION_CHECKPOINT])
+
+  # Default maximum size of a file, in bytes, for its event source to be
+  # processed together with other event sources in a batch task.
+  _DEFAULT_TASK_BATCH_FILE_SIZE_LIMIT = 256 * 1024
+
+  # Default maximum number of event sources processed in a batch task.
+  _DEFAULT_TASK_BATCH_SIZE = 32
 
   # Maximum number of concurrent tasks.
   _MAXIMUM_NUMBER_OF_TASKS = 10000
@@ -108,6 +153,11 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   _WORKER_PROCESSES_MINIMUM = 2
   _WORKER_PROCESSES_MAXIMUM = 99
 
+  # Minimum interval, in seconds, between adjustments of the number of worker
+  # processes. The CPU utilization of the worker processes is determined over
+  # this interval.
+  _WORKER_POOL_ADJUSTMENT_INTERVAL = 30.0
+
   _ZEROMQ_NO_WORKER_REQUEST_TIME_SECONDS = 10 * 60
 
   def __init__(
@@ -119,7 +169,9 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     Args:
       maximum_number_of_tasks (Optional[int]): maximum number of concurrent
           tasks, where 0 represents no limit.
-      number_of_worker_processes (Optional[int]): number of worker processes.
+      number_of_worker_processes (Optional[int]): number of worker processes,
+          where 0 represents a number of worker processes based on the number
+          of available CPUs, that is adjusted during extraction.
       status_update_callback (Optional[function]): callback function for status
           updates.
       worker_memory_limit (Optional[int]): maximum amount of memory a worker is
@@ -132,6 +184,12 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if maximum_number_of_tasks is None:
       maximum_number_of_tasks = self._MAXIMUM_NUMBER_OF_TASKS
 
+    if worker_memory_limit is None:
+      worker_memory_limit = definitions.DEFAULT_WORKER_MEMORY_LIMIT
+
+    number_of_cpus = None
+    worker_pool_controller = None
+
     if number_of_worker_processes < 1:
       # One worker for each "available" CPU (minus other processes).
       # The number here is derived from the fact that the engine starts up:
@@ -141,7 +199,8 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       # up workers that amounts to the total number of CPUs - the other
       # processes.
       try:
-        cpu_count = multiprocessing.cpu_count() - 1
+        number_of_cpus = multiprocessing.cpu_count()
+        cpu_count = number_of_cpus - 1
 
         if cpu_count <= self._WORKER_PROCESSES_MINIMUM:
           cpu_count = self._WORKER_PROCESSES_MINIMUM
@@ -157,32 +216,46 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
       number_of_worker_processes = cpu_count
 
-    if worker_memory_limit is None:
-      worker_memory_limit = definitions.DEFAULT_WORKER_MEMORY_LIMIT
+      # Since the number of worker processes was not specified, it is adjusted
+      # during extraction. More worker processes than available CPUs are
+      # only started when the worker processes are I/O bound.
+      worker_pool_controller = worker_pool.WorkerPoolController(
+          self._WORKER_PROCESSES_MINIMUM,
+          min(2 * cpu_count, self._WORKER_PROCESSES_MAXIMUM), cpu_count,
+          number_of_cpus=number_of_cpus or cpu_count,
+          worker_memory_limit=worker_memory_limit)
 
     if not worker_timeout:
       worker_timeout = definitions.DEFAULT_WORKER_TIMEOUT
 
     super(ExtractionMultiProcessEngine, self).__init__()
+    self._compiled_yara_rules_path = None
     self._enable_sigsegv_handler = False
-    self._event_data_timeliner = None
     self._extraction_worker = None
-    self._file_system_cache = []
+    self._last_checkpoint_time = 0.0
+    self._last_worker_pool_adjustment_time = 0.0
     self._maximum_number_of_containers = 50
     self._maximum_number_of_tasks = maximum_number_of_tasks
     self._merge_task = None
     self._merge_task_on_hold = None
+    self._next_event_source_index = 0
     self._number_of_consumed_event_data = 0
     self._number_of_consumed_sources = 0
     self._number_of_produced_event_data = 0
     self._number_of_produced_events = 0
     self._number_of_produced_sources = 0
+    self._number_of_retiring_worker_processes = 0
     self._number_of_worker_processes = number_of_worker_processes
+    self._parsers_counter = collections.Counter()
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._resolver_context = context.Context()
+    self._session_checkpoint = None
     self._status = definitions.STATUS_INDICATOR_IDLE
     self._status_update_callback = status_update_callback
     self._system_configurations = None
+    self._task_batch_file_size_limit = self._DEFAULT_TASK_BATCH_FILE_SIZE_LIMIT
+    self._task_batch_path_specs = []
+    self._task_batch_size = self._DEFAULT_TASK_BATCH_SIZE
     self._task_manager = task_manager.TaskManager()
     self._task_merge_helper = None
     self._task_merge_helper_on_hold = None
@@ -191,28 +264,64 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._task_storage_format = None
     self._windows_event_log_providers = None
     self._worker_memory_limit = worker_memory_limit
+    self._worker_pool_controller = worker_pool_controller
     self._worker_timeout = worker_timeout
 
-  def _CacheFileSystem(self, file_system):
-    """Caches a dfVFS file system object.
+  def _AdjustWorkerPool(self, tasks_status):
+    """Adjusts the number of worker processes to the load.
 
-    Keeping and additional reference to a dfVFS file system object causes the
-    object to remain cached in the resolver context. This minimizes the number
-    times the file system is re-opened.
+    A worker process is added by starting it and removed by pushing an abort
+    onto the task queue, upon which the first worker process that requests
+    a new task stops.
 
     Args:
-      file_system (dfvfs.FileSystem): file system.
+      tasks_status (TasksStatus): status information about tasks.
+
+    Returns:
+      WorkerPoolDecision: worker pool decision.
     """
-    if file_system not in self._file_system_cache:
-      if len(self._file_system_cache) == self._FILE_SYSTEM_CACHE_SIZE:
-        self._file_system_cache.pop(0)
-      self._file_system_cache.append(file_system)
+    self._last_worker_pool_adjustment_time = time.time()
+
+    number_of_worker_processes = (
+        len(self._processes_per_pid) -
+        self._number_of_retiring_worker_processes)
+
+    cpu_utilizations = []
+    maximum_used_memory = 0
+    for process_information in list(
+        self._process_information_per_pid.values()):
+      cpu_utilization = process_information.GetCPUUtilization()
+      if cpu_utilization is not None:
+        cpu_utilizations.append(cpu_utilization)
+
+      used_memory = process_information.GetUsedMemory() or 0
+      maximum_used_memory = max(maximum_used_memory, used_memory)
+
+    available_memory = psutil.virtual_memory().available
+
+    decision = self._worker_pool_controller.DetermineNumberOfWorkers(
+        number_of_worker_processes, tasks_status.number_of_queued_tasks,
+        tasks_status.number_of_tasks_processing,
+        tasks_status.number_of_tasks_pending_merge, cpu_utilizations,
+        maximum_used_memory, available_memory)
+
+    if decision.number_of_workers > number_of_worker_processes:
+      process_name = f'Worker_{self._last_worker_number:02d}'
+      if not self._StartWorkerProcess(process_name):
+        logger.error(f'Unable to create worker process: {process_name:s}')
+
+    elif decision.number_of_workers < number_of_worker_processes:
+      # The abort is pushed in front of the queued tasks, so that the first
+      # worker process that requests a new task stops.
+      self._task_queue.PushItemFirst(plaso_queue.QueueAbort())
+      self._number_of_retiring_worker_processes += 1
 
-    elif len(self._file_system_cache) == self._FILE_SYSTEM_CACHE_SIZE:
-      # Move the file system to the end of the list to preserve the most
-      # recently file system object.
-      self._file_system_cache.remove(file_system)
-      self._file_system_cache.append(file_system)
+    if decision.action != 'keep':
+      logger.debug((
+          f'Worker pool {decision.action:s} to {decision.number_of_workers:d} '
+          f'worker processes: {decision.reason:s}.'))
+
+    return decision
 
   def _CheckExcludedPathSpec(self, file_system, path_spec):
     """Determines if the path specification should be excluded from extraction.
@@ -292,35 +401,94 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             f'unable to process path specification with error: '
             f'{exception!s}'), file_system_path_spec)
 
-  def _CreateTask(self, storage_writer, session_identifier, event_source):
-    """Creates a task to processes an event source.
+  def _CompileYaraRules(self, extraction_configuration, temporary_directory):
+    """Compiles the Yara rules into a file shared with the worker processes.
+
+    The worker processes load the precompiled Yara rules file instead of
+    each compiling the Yara rule definitions.
+
+    Args:
+      extraction_configuration (ExtractionConfiguration): extraction
+          configuration.
+      temporary_directory (str): path of the directory for the precompiled
+          Yara rules file, where None represents the default temporary
+          directory.
+
+    Raises:
+      BadConfigOption: if the Yara rules cannot be compiled.
+    """
+    if not extraction_configuration.yara_rules_string:
+      return
+
+    try:
+      rules = yara.compile(source=extraction_configuration.yara_rules_string)
+    except yara_analyzer.YaraError as exception:
+      raise errors.BadConfigOption(
+          f'Unable to compile Yara rules with error: {exception!s}')
+
+    file_descriptor, path = tempfile.mkstemp(
+        suffix='.yarac', dir=temporary_directory)
+    os.close(file_descriptor)
+
+    rules.save(path)
+
+    self._compiled_yara_rules_path = path
+    extraction_configuration.compiled_yara_rules_path = path
+
+  def _CreateBatchTask(self, session_identifier):
+    """Creates a task to process the event sources in the pending batch.
 
     Args:
-      storage_writer (StorageWriter): storage writer for a session storage.
       session_identifier (str): the identifier of the session the tasks are
           part of.
-      event_source (EventSource): event source.
 
     Returns:
-      Task: task or None if no task could be created.
+      Task: task or None if there are no event sources in the pending batch.
     """
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
-        event_source.path_spec, resolver_context=self._resolver_context)
-    if file_entry is None:
-      self._ProduceExtractionWarning(
-          storage_writer, 'Unable to open file entry', event_source.path_spec)
+    if not self._task_batch_path_specs:
       return None
 
-    file_system = file_entry.GetFileSystem()
+    task = self._task_manager.CreateTask(
+        session_identifier, storage_format=self._task_storage_format)
+    task.file_entry_type = dfvfs_definitions.FILE_ENTRY_TYPE_FILE
 
-    if not event_source.path_spec.IsSystemLevel():
-      self._CacheFileSystem(file_system)
+    if len(self._task_batch_path_specs) == 1:
+      task.path_spec = self._task_batch_path_specs[0]
+    else:
+      task.path_specs = self._task_batch_path_specs
 
-    if self._CheckExcludedPathSpec(file_system, event_source.path_spec):
-      display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
-          event_source.path_spec)
-      logger.debug(f'Excluded from extraction: {display_name:s}.')
-      return None
+    self._task_batch_path_specs = []
+
+    return task
+
+  def _CreateTask(self, session_identifier, event_source):
+    """Creates a task to processes an event source.
+
+    The path specification of the event source is not resolved, since that
+    is done by the worker process, which also determines if the path
+    specification is excluded from extraction.
+
+    Event sources of small files are added to the pending batch, which is
+    processed in a single task once it contains the maximum number of event
+    sources, to reduce the overhead of creating and merging task storage.
+
+    Args:
+      session_identifier (str): the identifier of the session the tasks are
+          part of.
+      event_source (EventSource): event source.
+
+    Returns:
+      Task: task or None if the event source was added to the pending batch.
+    """
+    if (self._task_batch_size > 1 and self._task_batch_file_size_limit and
+        event_source.file_entry_type == dfvfs_definitions.FILE_ENTRY_TYPE_FILE
+        and event_source.size is not None and
+        event_source.size <= self._task_batch_file_size_limit):
+      self._task_batch_path_specs.append(event_source.path_spec)
+      if len(self._task_batch_path_specs) < self._task_batch_size:
+        return None
+
+      return self._CreateBatchTask(session_identifier)
 
     task = self._task_manager.CreateTask(
         session_identifier, storage_format=self._task_storage_format)
@@ -329,15 +497,15 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     return task
 
-  def _FillEventSourceHeap(
-      self, storage_writer, event_source_heap, start_with_first=False):
+  def _FillEventSourceHeap(self, storage_writer, event_source_heap):
     """Fills the event source heap with the available written event sources.
 
+    The event sources are read in order of addition, starting with the event
+    source of the next event source index.
+
     Args:
       storage_writer (StorageWriter): storage writer for a session storage.
       event_source_heap (_EventSourceHeap): event source heap.
-      start_with_first (Optional[bool]): True if the function should start
-          with the first written event source.
     """
     if self._processing_profiler:
       self._processing_profiler.StartTiming('fill_event_source_heap')
@@ -345,15 +513,15 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if self._processing_profiler:
       self._processing_profiler.StartTiming('get_event_source')
 
-    if start_with_first:
-      event_source = storage_writer.GetFirstWrittenEventSource()
-    else:
-      event_source = storage_writer.GetNextWrittenEventSource()
+    event_source = storage_writer.GetAttributeContainerByIndex(
+        self._CONTAINER_TYPE_EVENT_SOURCE, self._next_event_source_index)
 
     if self._processing_profiler:
       self._processing_profiler.StopTiming('get_event_source')
 
     while event_source:
+      self._next_event_source_index += 1
+
       event_source_heap.PushEventSource(event_source)
       if event_source_heap.IsFull():
         logger.debug('Event source heap is full.')
@@ -362,7 +530,8 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       if self._processing_profiler:
         self._processing_profiler.StartTiming('get_event_source')
 
-      event_source = storage_writer.GetNextWrittenEventSource()
+      event_source = storage_writer.GetAttributeContainerByIndex(
+          self._CONTAINER_TYPE_EVENT_SOURCE, self._next_event_source_index)
 
       if self._processing_profiler:
         self._processing_profiler.StopTiming('get_event_source')
@@ -422,6 +591,35 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             f'found.'))
         return
 
+    elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT:
+      event_data_lookup_key = None
+      event_data_identifier = container.GetEventDataIdentifier()
+      if event_data_identifier:
+        event_data_lookup_key = event_data_identifier.CopyToString()
+
+        event_data_identifier = merge_helper.GetAttributeContainerIdentifier(
+            event_data_lookup_key)
+
+      if not event_data_identifier:
+        identifier = container.GetIdentifier()
+        identifier_string = identifier.CopyToString()
+
+        # TODO: store this as a merge warning so this is preserved
+        # in the storage file.
+        logger.error((
+            f'Unable to merge event attribute container: '
+            f'{identifier_string:s} since corresponding event data: '
+            f'{event_data_lookup_key!s} could not be found.'))
+        return
+
+      container.SetEventDataIdentifier(event_data_identifier)
+
+    elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_PARSER_COUNT:
+      # The number of events per parser are aggregated and stored when
+      # processing has completed.
+      self._parsers_counter[container.name] += container.number_of_events
+      return
+
     elif container.CONTAINER_TYPE in (
         'windows_eventlog_message_string', 'windows_wevt_template_event'):
       message_file_identifier = container.GetMessageFileIdentifier()
@@ -465,27 +663,12 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       identifier = container.GetIdentifier()
       merge_helper.SetAttributeContainerIdentifier(lookup_key, identifier)
 
-    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
-      self._number_of_produced_event_data += 1
-
-      self._status = definitions.STATUS_INDICATOR_TIMELINING
-
-      event_data_stream_identifier = container.GetEventDataStreamIdentifier()
-
-      event_data_stream = None
-      if event_data_stream_identifier:
-        event_data_stream = (
-            self._storage_writer.GetAttributeContainerByIdentifier(
-                self._CONTAINER_TYPE_EVENT_DATA_STREAM,
-                event_data_stream_identifier))
-
-      # Generate events on merge.
-      self._event_data_timeliner.ProcessEventData(
-          storage_writer, container, event_data_stream)
+    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT:
+      self._number_of_produced_events += 1
 
+    elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
       self._number_of_consumed_event_data += 1
-      self._number_of_produced_events += (
-          self._event_data_timeliner.number_of_produced_events)
+      self._number_of_produced_event_data += 1
 
     elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_SOURCE:
       self._number_of_produced_sources += 1
@@ -522,6 +705,65 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     return number_of_containers
 
+  def _MergeAttributeContainersInBulk(
+        self, storage_writer, merge_helper, task_storage_path):
+    """Merges attribute containers of a single type from a task store in bulk.
+
+    Args:
+      storage_writer (SQLiteStorageWriter): storage writer.
+      merge_helper (ExtractionTaskMergeHelper): helper to merge attribute
+          containers.
+      task_storage_path (str): path of the SQLite task storage file.
+
+    Returns:
+      int: number of containers merged.
+
+    Raises:
+      IOError: when there is an error merging the task storage file.
+      OSError: when there is an error merging the task storage file.
+    """
+    container_type = merge_helper.GetContainerType()
+    if not container_type:
+      return 0
+
+    self._status = definitions.STATUS_INDICATOR_MERGING
+
+    if container_type == self._CONTAINER_TYPE_PARSER_COUNT:
+      # The number of events per parser are aggregated and stored when
+      # processing has completed.
+      number_of_containers = 0
+      for parser_count in merge_helper.GetAttributeContainersByType(
+          container_type):
+        self._parsers_counter[parser_count.name] += (
+            parser_count.number_of_events)
+        number_of_containers += 1
+
+    else:
+      identifier_offset = storage_writer.GetNumberOfAttributeContainers(
+          container_type)
+
+      number_of_containers = storage_writer.MergeAttributeContainers(
+          task_storage_path, container_type,
+          identifier_offsets=(
+              merge_helper.GetAttributeContainerIdentifierOffsets()))
+
+      merge_helper.SetAttributeContainerIdentifierOffset(
+          container_type, identifier_offset)
+
+      if container_type == self._CONTAINER_TYPE_EVENT:
+        self._number_of_produced_events += number_of_containers
+
+      elif container_type == self._CONTAINER_TYPE_EVENT_DATA:
+        self._number_of_consumed_event_data += number_of_containers
+        self._number_of_produced_event_data += number_of_containers
+
+      elif container_type == self._CONTAINER_TYPE_EVENT_SOURCE:
+        self._number_of_produced_sources += number_of_containers
+
+    self._status = definitions.STATUS_INDICATOR_RUNNING
+
+    return number_of_containers
+
   def _MergeTaskStorage(self, storage_writer, session_identifier):
     """Merges a task storage with the session storage.
 
@@ -602,9 +844,36 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       if self._task_merge_helper:
         merge_duration = time.time()
 
-        number_of_containers = self._MergeAttributeContainers(
-            storage_writer, self._task_merge_helper,
-            maximum_number_of_containers=self._maximum_number_of_containers)
+        # If both the session and task stores are SQLite, attribute containers
+        # are merged in bulk, otherwise they are merged one at a time.
+        if (self._task_storage_format == definitions.STORAGE_FORMAT_SQLITE and
+            isinstance(storage_writer, sqlite_writer.SQLiteStorageWriter)):
+          task_storage_path = self._GetMergeTaskStorageFilePath(
+              self._task_storage_format, self._merge_task)
+
+          try:
+            number_of_containers = self._MergeAttributeContainersInBulk(
+                storage_writer, self._task_merge_helper, task_storage_path)
+
+          except IOError as exception:
+            # The remaining attribute containers of the task are not merged,
+            # since they can reference attribute containers of the type that
+            # could not be merged. Hence the task is abandoned.
+            message = (
+                f'Unable to merge results of task: '
+                f'{self._merge_task.identifier:s} with error: {exception!s}')
+            logger.error(message)
+
+            self._ProduceExtractionWarning(
+                storage_writer, message, self._merge_task.path_spec)
+
+            self._task_merge_helper.fully_merged = True
+            number_of_containers = 0
+
+        else:
+          number_of_containers = self._MergeAttributeContainers(
+              storage_writer, self._task_merge_helper,
+              maximum_number_of_containers=self._maximum_number_of_containers)
 
         merge_duration = time.time() - merge_duration
 
@@ -676,34 +945,44 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if path_spec:
       self._processing_status.error_path_specs.append(path_spec)
 
-  def _ProcessEventSources(self, storage_writer, session_identifier):
+  def _ProcessEventSources(
+      self, storage_writer, session_identifier, pending_event_sources=None):
     """Processes event sources.
 
     Args:
       storage_writer (StorageWriter): storage writer for a session storage.
       session_identifier (str): the identifier of the session the tasks are
           part of.
+      pending_event_sources (Optional[list[EventSource]]): event sources that
+          were pending when the session checkpoint was written, that the
+          extraction is resumed from.
     """
     logger.debug('Task scheduler started')
 
     self._status = definitions.STATUS_INDICATOR_RUNNING
 
-    # TODO: make tasks persistent.
-
     # TODO: protect task scheduler loop by catch all and
     # handle abort path.
 
     event_source_heap = _EventSourceHeap()
 
-    self._FillEventSourceHeap(
-        storage_writer, event_source_heap, start_with_first=True)
+    for event_source in pending_event_sources or []:
+      event_source_heap.PushEventSource(event_source)
+
+    self._FillEventSourceHeap(storage_writer, event_source_heap)
 
     event_source = event_source_heap.PopEventSource()
 
+    # Only a SQLite session storage can be restored to a session checkpoint.
+    write_checkpoints = isinstance(
+        storage_writer, sqlite_writer.SQLiteStorageWriter)
+
+    self._last_checkpoint_time = 0.0
+
     task = None
     has_pending_tasks = True
 
-    while event_source or has_pending_tasks:
+    while event_source or has_pending_tasks or self._task_batch_path_specs:
       if self._abort:
         break
 
@@ -712,8 +991,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           task = self._task_manager.CreateRetryTask()
 
         if not task and event_source:
-          task = self._CreateTask(
-              storage_writer, session_identifier, event_source)
+          task = self._CreateTask(session_identifier, event_source)
 
           event_source = None
 
@@ -724,7 +1002,14 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             self._task_manager.SampleTaskStatus(task, 'schedule_attempted')
 
           else:
-            path_spec_string = self._GetPathSpecificationString(task.path_spec)
+            if task.path_specs:
+              number_of_path_specs = len(task.path_specs)
+              path_spec_string = (
+                  f'batch of {number_of_path_specs:d} path specifications')
+            else:
+              path_spec_string = self._GetPathSpecificationString(
+                  task.path_spec)
+
             logger.debug((
                 f'Scheduled task: {task.identifier:s} for path specification: '
                 f'{path_spec_string:s}'))
@@ -735,6 +1020,16 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
         self._MergeTaskStorage(storage_writer, session_identifier)
 
+        # A session checkpoint is only written when no task storage is being
+        # merged, so that the checkpoint does not contain partially merged
+        # results.
+        if (write_checkpoints and not self._merge_task and
+            time.time() - self._last_checkpoint_time >= (
+                self._CHECKPOINT_INTERVAL)):
+          self._WriteSessionCheckpoint(
+              storage_writer, session_identifier, event_source_heap,
+              event_source)
+
         if event_source_heap.IsFull():
           logger.debug('Event source heap is full.')
         else:
@@ -743,6 +1038,11 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         if not task and not event_source:
           event_source = event_source_heap.PopEventSource()
 
+          # Schedule the pending batch when there are no more event sources
+          # available, to not hold back the event sources in the batch.
+          if not event_source:
+            task = self._CreateBatchTask(session_identifier)
+
         has_pending_tasks = self._task_manager.HasPendingTasks()
 
       except KeyboardInterrupt:
@@ -763,10 +1063,17 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             f'{exception!s}'), path_spec)
         event_source = None
 
+    # Write a final session checkpoint, so that an aborted extraction can be
+    # resumed from where it was aborted.
+    if write_checkpoints and not self._merge_task:
+      self._WriteSessionCheckpoint(
+          storage_writer, session_identifier, event_source_heap, event_source)
+
     for task in self._task_manager.GetFailedTasks():
-      self._ProduceExtractionWarning(
-          storage_writer, 'Worker failed to process path specification',
-          task.path_spec)
+      for path_spec in task.path_specs or [task.path_spec]:
+        self._ProduceExtractionWarning(
+            storage_writer, 'Worker failed to process path specification',
+            path_spec)
 
     self._status = definitions.STATUS_INDICATOR_IDLE
 
@@ -776,7 +1083,8 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       logger.debug('Task scheduler stopped')
 
   def _ProcessSource(
-      self, storage_writer, session_identifier, file_system_path_specs):
+      self, storage_writer, session_identifier, file_system_path_specs,
+      session_checkpoint=None):
     """Processes file systems within a source.
 
     Args:
@@ -785,6 +1093,8 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           part of.
       file_system_path_specs (list[dfvfs.PathSpec]): path specifications of
           the source file systems to process.
+      session_checkpoint (Optional[SessionCheckpoint]): session checkpoint to
+          resume the extraction from, where None represents a new extraction.
     """
     if self._processing_profiler:
       self._processing_profiler.StartTiming('process_source')
@@ -794,23 +1104,37 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._number_of_produced_event_data = 0
     self._number_of_produced_events = 0
     self._number_of_produced_sources = 0
+    self._parsers_counter = collections.Counter()
+
+    if session_checkpoint:
+      pending_event_sources = self._RestoreSessionCheckpoint(
+          storage_writer, session_checkpoint)
+
+    else:
+      pending_event_sources = []
+
+      self._next_event_source_index = (
+          storage_writer.GetNumberOfAttributeContainers(
+              self._CONTAINER_TYPE_EVENT_SOURCE))
+
+      self._CollectInitialEventSources(storage_writer, file_system_path_specs)
 
     stored_parsers_counter = collections.Counter({
         parser_count.name: parser_count
         for parser_count in storage_writer.GetAttributeContainers(
             'parser_count')})
 
-    self._CollectInitialEventSources(storage_writer, file_system_path_specs)
-
     if not self._abort:
-      self._ProcessEventSources(storage_writer, session_identifier)
+      self._ProcessEventSources(
+          storage_writer, session_identifier,
+          pending_event_sources=pending_event_sources)
 
     if self._abort:
       self._status = definitions.STATUS_INDICATOR_ABORTED
     else:
       self._status = definitions.STATUS_INDICATOR_COMPLETED
 
-    for key, value in self._event_data_timeliner.parsers_counter.items():
+    for key, value in self._parsers_counter.items():
       parser_count = stored_parsers_counter.get(key, None)
       if parser_count:
         parser_count.number_of_events += value
@@ -835,6 +1159,87 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
 
+  def _RemoveCompiledYaraRules(self, extraction_configuration):
+    """Removes the precompiled Yara rules file.
+
+    Args:
+      extraction_configuration (ExtractionConfiguration): extraction
+          configuration.
+    """
+    if not self._compiled_yara_rules_path:
+      return
+
+    extraction_configuration.compiled_yara_rules_path = None
+
+    try:
+      os.remove(self._compiled_yara_rules_path)
+    except (IOError, OSError) as exception:
+      logger.warning((
+          'Unable to remove precompiled Yara rules file: '
+          f'{self._compiled_yara_rules_path:s} with error: {exception!s}'))
+
+    self._compiled_yara_rules_path = None
+
+  def _RestoreSessionCheckpoint(self, storage_writer, session_checkpoint):
+    """Restores the session storage to a session checkpoint.
+
+    Attribute containers that were added after the checkpoint are removed,
+    since these contain results of tasks that are pending according to
+    the checkpoint.
+
+    Args:
+      storage_writer (SQLiteStorageWriter): storage writer for a session
+          storage.
+      session_checkpoint (SessionCheckpoint): session checkpoint.
+
+    Returns:
+      list[EventSource]: event sources that were pending when the checkpoint
+          was written.
+    """
+    number_of_containers_per_type = dict(zip(
+        session_checkpoint.container_types or [],
+        session_checkpoint.number_of_containers or []))
+
+    for container_type in sorted(
+        containers_manager.AttributeContainersManager.GetContainerTypes()):
+      if container_type not in self._CHECKPOINT_EXCLUDED_CONTAINER_TYPES:
+        storage_writer.TruncateAttributeContainers(
+            container_type, number_of_containers_per_type.get(
+                container_type, 0))
+
+    storage_writer.TruncateAttributeContainers(
+        self._CONTAINER_TYPE_PARSER_COUNT, 0)
+
+    for name, number_of_events in zip(
+        session_checkpoint.parser_names or [],
+        session_checkpoint.number_of_events or []):
+      parser_count = counts.ParserCount(
+          name=name, number_of_events=number_of_events)
+      storage_writer.AddAttributeContainer(parser_count)
+
+    pending_event_sources = []
+    for index in session_checkpoint.event_source_indexes or []:
+      event_source = storage_writer.GetAttributeContainerByIndex(
+          self._CONTAINER_TYPE_EVENT_SOURCE, index)
+      if event_source:
+        pending_event_sources.append(event_source)
+
+    # The path specifications of pending tasks are rescheduled as new event
+    # sources.
+    for path_spec in session_checkpoint.path_specs or []:
+      event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
+      pending_event_sources.append(event_source)
+
+    self._next_event_source_index = (
+        session_checkpoint.next_event_source_index or 0)
+    self._session_checkpoint = session_checkpoint
+
+    logger.debug((
+        f'Restored session checkpoint with {len(pending_event_sources):d} '
+        f'pending event sources.'))
+
+    return pending_event_sources
+
   def _ScheduleTask(self, task):
     """Schedules a task.
 
@@ -880,7 +1285,9 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     process = extraction_process.ExtractionWorkerProcess(
         task_queue, self._processing_configuration, self._system_configurations,
         self._windows_event_log_providers, self._registry_find_specs,
-        enable_sigsegv_handler=self._enable_sigsegv_handler, name=process_name)
+        enable_sigsegv_handler=self._enable_sigsegv_handler,
+        excluded_find_specs=self._excluded_file_system_find_specs,
+        name=process_name)
 
     # Remove all possible log handlers to prevent a child process from logging
     # to the main process log file and garbling the log. The log handlers are
@@ -950,6 +1357,48 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     # Kill any lingering processes.
     self._AbortKill()
 
+  def _StopRetiredWorkerProcess(self, pid):
+    """Stops a worker process that stopped after being retired.
+
+    The worker process that dequeues an abort cannot be determined in advance,
+    therefore a worker process that stops while worker processes are being
+    retired is considered retired, regardless of its exit code. If a worker
+    process stopped due to an error instead, the abort that remains on the
+    task queue retires another worker process, that is then replaced.
+
+    Args:
+      pid (int): process identifier (PID).
+
+    Returns:
+      bool: True if the worker process was retired and has been stopped.
+    """
+    if not self._number_of_retiring_worker_processes:
+      return False
+
+    process = self._processes_per_pid.get(pid, None)
+    if not process:
+      return False
+
+    # The status of a worker process that is stopping cannot be queried,
+    # while the process can still be alive.
+    process.join(timeout=self._PROCESS_JOIN_TIMEOUT)
+    if process.is_alive():
+      return False
+
+    self._UpdateProcessingStatus(pid, {
+        'processing_status': definitions.STATUS_INDICATOR_COMPLETED}, 0)
+
+    self._StopMonitoringProcess(process)
+    del self._processes_per_pid[pid]
+
+    self._number_of_retiring_worker_processes -= 1
+
+    logger.debug((
+        f'Retired worker process: {process.name:s} (PID: {pid:d}) stopped '
+        f'with exit code: {process.exitcode!s}.'))
+
+    return True
+
   def _UpdateForemanProcessStatus(self):
     """Update the foreman process status."""
     used_memory = self._process_information.GetUsedMemory() or 0
@@ -1049,18 +1498,118 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._UpdateForemanProcessStatus()
 
     tasks_status = self._task_manager.GetStatusInformation()
+
+    worker_pool_decision = None
+    if (self._worker_pool_controller and
+        self._status == definitions.STATUS_INDICATOR_RUNNING and
+        time.time() - self._last_worker_pool_adjustment_time >= (
+            self._WORKER_POOL_ADJUSTMENT_INTERVAL)):
+      worker_pool_decision = self._AdjustWorkerPool(tasks_status)
+
     if self._task_queue_profiler:
-      self._task_queue_profiler.Sample(tasks_status)
+      self._task_queue_profiler.Sample(
+          tasks_status, worker_pool_decision=worker_pool_decision)
 
     self._processing_status.UpdateTasksStatus(tasks_status)
 
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
 
+  def _WriteSessionCheckpoint(
+      self, storage_writer, session_identifier, event_source_heap,
+      event_source):
+    """Writes a session checkpoint.
+
+    The checkpoint is updated in place, so that a session storage contains
+    at most one checkpoint per session.
+
+    Args:
+      storage_writer (SQLiteStorageWriter): storage writer for a session
+          storage.
+      session_identifier (str): the identifier of the session the tasks are
+          part of.
+      event_source_heap (_EventSourceHeap): event source heap.
+      event_source (EventSource): event source that was popped from the heap
+          but not yet scheduled or None if not available.
+    """
+    if self._processing_profiler:
+      self._processing_profiler.StartTiming('write_checkpoint')
+
+    pending_event_sources = event_source_heap.GetEventSources()
+    if event_source:
+      pending_event_sources.append(event_source)
+
+    event_source_indexes = []
+    path_specs = list(self._task_batch_path_specs)
+    for pending_event_source in pending_event_sources:
+      identifier = pending_event_source.GetIdentifier()
+      if identifier:
+        event_source_indexes.append(identifier.sequence_number - 1)
+      else:
+        # Event sources restored from the path specifications of pending tasks
+        # are not stored in the session storage.
+        path_specs.append(pending_event_source.path_spec)
+
+    path_specs.extend(self._task_manager.GetPendingTaskPathSpecs())
+
+    container_types = []
+    number_of_containers = []
+    for container_type in sorted(
+        containers_manager.AttributeContainersManager.GetContainerTypes()):
+      if container_type in self._CHECKPOINT_EXCLUDED_CONTAINER_TYPES:
+        continue
+
+      number_of_containers_of_type = (
+          storage_writer.GetNumberOfAttributeContainers(container_type))
+      if number_of_containers_of_type:
+        container_types.append(container_type)
+        number_of_containers.append(number_of_containers_of_type)
+
+    # The number of events per parser are only stored when processing has
+    # completed, hence the checkpoint contains the stored number of events
+    # and the number of events merged since.
+    parsers_counter = collections.Counter({
+        parser_count.name: parser_count.number_of_events
+        for parser_count in storage_writer.GetAttributeContainers(
+            self._CONTAINER_TYPE_PARSER_COUNT)})
+    parsers_counter.update(self._parsers_counter)
+
+    parser_names = sorted(parsers_counter.keys())
+
+    is_new_checkpoint = not self._session_checkpoint
+    if is_new_checkpoint:
+      self._session_checkpoint = sessions.SessionCheckpoint(
+          session_identifier=session_identifier)
+
+    self._session_checkpoint.container_types = container_types
+    self._session_checkpoint.event_source_indexes = event_source_indexes
+    self._session_checkpoint.next_event_source_index = (
+        self._next_event_source_index)
+    self._session_checkpoint.number_of_containers = number_of_containers
+    self._session_checkpoint.number_of_events = [
+        parsers_counter[name] for name in parser_names]
+    self._session_checkpoint.parser_names = parser_names
+    self._session_checkpoint.path_specs = path_specs
+    self._session_checkpoint.timestamp = int(
+        time.time() * definitions.MICROSECONDS_PER_SECOND)
+
+    if is_new_checkpoint:
+      storage_writer.AddAttributeContainer(self._session_checkpoint)
+    else:
+      storage_writer.UpdateAttributeContainer(self._session_checkpoint)
+
+    storage_writer.Flush()
+
+    self._last_checkpoint_time = time.time()
+
+    if self._processing_profiler:
+      self._processing_profiler.StopTiming('write_checkpoint')
+
   def ProcessSourceMulti(
       self, storage_writer, session_identifier, processing_configuration,
       system_configurations, file_system_path_specs,
-      enable_sigsegv_handler=False, storage_file_path=None):
+      enable_sigsegv_handler=False, session_checkpoint=None,
+      storage_file_path=None):
     """Processes file systems within a source.
 
     Args:
@@ -1075,6 +1624,8 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           the source file systems to process.
       enable_sigsegv_handler (Optional[bool]): True if the SIGSEGV handler
           should be enabled.
+      session_checkpoint (Optional[SessionCheckpoint]): session checkpoint to
+          resume the extraction from, where None represents a new extraction.
       storage_file_path (Optional[str]): path to the session storage file.
 
     Returns:
@@ -1106,16 +1657,15 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       raise errors.BadConfigOption(
           f'Unable to build collection filters with error: {exception!s}')
 
-    self._event_data_timeliner = timeliner.EventDataTimeliner(
-        data_location=processing_configuration.data_location,
-        preferred_year=processing_configuration.preferred_year,
-        system_configurations=system_configurations)
-
-    try:
-      self._event_data_timeliner.SetPreferredTimeZone(
-          processing_configuration.preferred_time_zone)
-    except ValueError as exception:
-      raise errors.BadConfigOption(exception)
+    # Events are generated by the worker processes, therefore the preferred
+    # time zone is validated before the worker processes are started.
+    preferred_time_zone = processing_configuration.preferred_time_zone
+    if preferred_time_zone:
+      try:
+        pytz.timezone(preferred_time_zone)
+      except pytz.UnknownTimeZoneError:
+        raise errors.BadConfigOption(
+            f'Unsupported time zone: {preferred_time_zone!s}')
 
     # Keep track of certain values so we can spawn new extraction workers.
     self._processing_configuration = processing_configuration
@@ -1124,6 +1674,14 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._log_filename = processing_configuration.log_filename
     self._storage_file_path = storage_file_path
     self._storage_writer = storage_writer
+
+    if processing_configuration.task_batch_file_size_limit is not None:
+      self._task_batch_file_size_limit = (
+          processing_configuration.task_batch_file_size_limit)
+
+    if processing_configuration.task_batch_size:
+      self._task_batch_size = processing_configuration.task_batch_size
+
     self._task_storage_format = processing_configuration.task_storage_format
     self._windows_event_log_providers = list(
         storage_writer.GetAttributeContainers('windows_eventlog_provider'))
@@ -1144,6 +1702,10 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     # Set up the task storage before the worker processes.
     self._StartTaskStorage(self._task_storage_format)
 
+    self._CompileYaraRules(
+        processing_configuration.extraction,
+        processing_configuration.temporary_directory)
+
     for worker_number in range(self._number_of_worker_processes):
       process_name = f'Worker_{self._last_worker_number:02d}'
       worker_process = self._StartWorkerProcess(process_name)
@@ -1160,11 +1722,14 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if self._storage_profiler:
       storage_writer.SetStorageProfiler(self._storage_profiler)
 
+    self._last_worker_pool_adjustment_time = time.time()
+
     self._StartStatusUpdateThread()
 
     try:
       self._ProcessSource(
-          storage_writer, session_identifier, file_system_path_specs)
+          storage_writer, session_identifier, file_system_path_specs,
+          session_checkpoint=session_checkpoint)
 
     finally:
       # Stop the status update thread after close of the storage writer
@@ -1180,6 +1745,11 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       self._task_manager.StopProfiling()
       self._StopProfiling()
 
+      # The worker processes load the precompiled Yara rules when they are
+      # started and no worker processes are started after the status update
+      # thread was stopped.
+      self._RemoveCompiledYaraRules(processing_configuration.extraction)
+
     try:
       self._StopExtractionProcesses(abort=self._abort)
 
@@ -1217,12 +1787,13 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     # Reset values.
     self._enable_sigsegv_handler = None
-    self._event_data_timeliner = None
-    self._file_system_cache = []
+    self._number_of_retiring_worker_processes = 0
     self._processing_configuration = None
+    self._session_checkpoint = None
     self._storage_file_path = None
     self._storage_writer = None
     self._system_configurations = None
+    self._task_batch_path_specs = []
     self._task_storage_format = None
     self._windows_event_log_providers = None
 
@@ -5,6 +5,9 @@ from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.containers import counts
+from plaso.containers import events
+from plaso.engine import timeliner
 from plaso.engine import worker
 from plaso.lib import definitions
 from plaso.lib import errors
@@ -17,12 +20,16 @@ from plaso.parsers import mediator as parsers_mediator
 class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
   """Multi-processing extraction worker process."""
 
+  _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
+
   # Maximum number of dfVFS file system objects to cache in the worker process.
   _FILE_SYSTEM_CACHE_SIZE = 3
 
   def __init__(
       self, task_queue, processing_configuration, system_configurations,
-      windows_event_log_providers, registry_find_specs, **kwargs):
+      windows_event_log_providers, registry_find_specs,
+      excluded_find_specs=None, **kwargs):
     """Initializes an extraction worker process.
 
     Non-specified keyword arguments (kwargs) are directly passed to
@@ -38,6 +45,9 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
           Windows EventLog providers.
       registry_find_specs (list[dfwinreg.FindSpec]): Windows Registry find
           specifications.
+      excluded_find_specs (Optional[list[dfvfs.FindSpec]]): find
+          specifications of the path specifications that are excluded from
+          extraction.
       kwargs: keyword arguments to pass to multiprocessing.Process.
     """
     super(ExtractionWorkerProcess, self).__init__(
@@ -45,9 +55,13 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     self._abort = False
     self._buffer_size = 0
     self._current_display_name = ''
+    self._event_data_timeliner = None
+    self._excluded_file_system_find_specs = excluded_find_specs
     self._extraction_worker = None
     self._file_system_cache = []
+    self._number_of_consumed_event_data = 0
     self._number_of_consumed_sources = 0
+    self._number_of_produced_events = 0
     self._parser_mediator = None
     self._registry_find_specs = registry_find_specs
     self._resolver_context = None
@@ -78,6 +92,23 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
       self._file_system_cache.remove(file_system)
       self._file_system_cache.append(file_system)
 
+  def _CheckExcludedPathSpec(self, file_system, path_spec):
+    """Determines if the path specification should be excluded from extraction.
+
+    Args:
+      file_system (dfvfs.FileSystem): file system which the path specification
+          is part of.
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      bool: True if the path specification should be excluded from extraction.
+    """
+    for find_spec in self._excluded_file_system_find_specs or []:
+      if find_spec.ComparePathSpecLocation(path_spec, file_system):
+        return True
+
+    return False
+
   def _CreateParserMediator(
       self, resolver_context, processing_configuration, system_configurations,
       windows_event_log_providers):
@@ -157,13 +188,13 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         'display_name': self._current_display_name,
         'identifier': self._name,
         'last_activity_timestamp': last_activity_timestamp,
-        'number_of_consumed_event_data': None,
+        'number_of_consumed_event_data': self._number_of_consumed_event_data,
         'number_of_consumed_event_tags': None,
         'number_of_consumed_events': None,
         'number_of_consumed_sources': self._number_of_consumed_sources,
         'number_of_produced_event_data': number_of_produced_event_data,
         'number_of_produced_event_tags': None,
-        'number_of_produced_events': None,
+        'number_of_produced_events': self._number_of_produced_events,
         'number_of_produced_sources': number_of_produced_sources,
         'processing_status': processing_status,
         'task_identifier': task_identifier,
@@ -195,7 +226,18 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
             self._processing_configuration.parser_filter_expression))
 
     self._extraction_worker.SetExtractionConfiguration(
-        self._processing_configuration.extraction)
+        self._processing_configuration.extraction,
+        temporary_directory=(
+            self._processing_configuration.temporary_directory))
+
+    # Note that the preferred time zone is validated by the foreman before
+    # the worker processes are started.
+    self._event_data_timeliner = timeliner.EventDataTimeliner(
+        data_location=self._processing_configuration.data_location,
+        preferred_year=self._processing_configuration.preferred_year,
+        system_configurations=self._system_configurations)
+    self._event_data_timeliner.SetPreferredTimeZone(
+        self._processing_configuration.preferred_time_zone)
 
     self._parser_mediator.StartProfiling(
         self._processing_configuration.profiling, self._name,
@@ -253,6 +295,7 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     self._StopProfiling()
     self._parser_mediator.StopProfiling()
 
+    self._event_data_timeliner = None
     self._extraction_worker = None
     self._file_system_cache = []
     self._parser_mediator = None
@@ -270,6 +313,61 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     except errors.QueueAlreadyClosed:
       logger.error(f'Queue for {self.name:s} was already closed.')
 
+  def _ProduceEvents(self, storage_writer):
+    """Produces events from the event data in a task storage.
+
+    Events are generated in the worker process, instead of on merge, so that
+    the foreman only needs to remap identifiers. The date-less log helpers
+    are written to the same task storage by the parsers and therefore
+    resolve with the task-local event data stream identifiers.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a task storage.
+    """
+    if self._processing_profiler:
+      self._processing_profiler.StartTiming('timelining')
+
+    # Identifiers, such as those of event data streams, are specific to
+    # the task storage.
+    self._event_data_timeliner.Reset()
+
+    # Note that the event data are retrieved by index since the timeliner
+    # adds events and warnings to the same storage.
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_DATA)
+
+    for index in range(number_of_event_data):
+      if self._abort:
+        break
+
+      event_data = storage_writer.GetAttributeContainerByIndex(
+          self._CONTAINER_TYPE_EVENT_DATA, index)
+
+      event_data_stream = None
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        event_data_stream = storage_writer.GetAttributeContainerByIdentifier(
+            self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+            event_data_stream_identifier)
+
+      self._event_data_timeliner.ProcessEventData(
+          storage_writer, event_data, event_data_stream)
+
+      self._number_of_consumed_event_data += 1
+      self._number_of_produced_events += (
+          self._event_data_timeliner.number_of_produced_events)
+
+    # The number of events per parser are stored in the task storage so
+    # the foreman can aggregate them on merge.
+    for name, number_of_events in (
+        self._event_data_timeliner.parsers_counter.items()):
+      parser_count = counts.ParserCount(
+          name=name, number_of_events=number_of_events)
+      storage_writer.AddAttributeContainer(parser_count)
+
+    if self._processing_profiler:
+      self._processing_profiler.StopTiming('timelining')
+
   def _ProcessPathSpec(self, extraction_worker, parser_mediator, path_spec):
     """Processes a path specification.
 
@@ -285,15 +383,21 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
       file_entry = path_spec_resolver.Resolver.OpenFileEntry(
           path_spec, resolver_context=parser_mediator.resolver_context)
       if file_entry is None:
-        logger.warning(
-            f'Unable to open file entry: {self._current_display_name:s}')
+        parser_mediator.ProduceExtractionWarning(
+            'unable to open file entry', path_spec=path_spec)
         return
 
+      file_system = file_entry.GetFileSystem()
+
       if (path_spec and not path_spec.IsSystemLevel() and
           path_spec.type_indicator != dfvfs_definitions.TYPE_INDICATOR_GZIP):
-        file_system = file_entry.GetFileSystem()
         self._CacheFileSystem(file_system)
 
+      if self._CheckExcludedPathSpec(file_system, path_spec):
+        logger.debug(
+            f'Excluded from extraction: {self._current_display_name:s}.')
+        return
+
       extraction_worker.ProcessFileEntry(parser_mediator, file_entry)
 
     except Exception as exception:  # pylint: disable=broad-except
@@ -343,9 +447,15 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
       task_storage_writer.AddAttributeContainer(task)
 
       # TODO: add support for more task types.
-      self._ProcessPathSpec(
-          self._extraction_worker, self._parser_mediator, task.path_spec)
-      self._number_of_consumed_sources += 1
+      for path_spec in task.path_specs or [task.path_spec]:
+        if self._abort:
+          break
+
+        self._ProcessPathSpec(
+            self._extraction_worker, self._parser_mediator, path_spec)
+        self._number_of_consumed_sources += 1
+
+      self._ProduceEvents(task_storage_writer)
 
     finally:
       task.aborted = self._abort
@@ -3,6 +3,7 @@
 
 from plaso.containers import analysis_results
 from plaso.containers import artifacts
+from plaso.containers import counts
 from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import reports
@@ -27,6 +28,8 @@ class BaseTaskMergeHelper(object):
     """
     super(BaseTaskMergeHelper, self).__init__()
     self._container_identifier_mappings = {}
+    self._container_identifier_offsets = {}
+    self._container_types = list(self._CONTAINER_TYPES)
     self._generator = self._GetAttributeContainers(task_storage_reader)
     self._task_storage_reader = task_storage_reader
 
@@ -79,6 +82,46 @@ class BaseTaskMergeHelper(object):
     """
     return self._container_identifier_mappings.get(lookup_key, None)
 
+  def GetAttributeContainerIdentifierOffsets(self):
+    """Retrieves the sequence number offsets of merged container types.
+
+    Returns:
+      dict[str, int]: sequence number offsets per attribute container type,
+          that was merged in bulk.
+    """
+    return dict(self._container_identifier_offsets)
+
+  def GetAttributeContainersByType(self, container_type):
+    """Retrieves attribute containers of a specific type.
+
+    Args:
+      container_type (str): attribute container type.
+
+    Returns:
+      generator(AttributeContainers): attribute container generator.
+    """
+    return self._task_storage_reader.GetAttributeContainers(container_type)
+
+  def GetContainerType(self):
+    """Retrieves the next attribute container type to merge in bulk.
+
+    Container types are returned in the order in which they need to be merged.
+    After the last container type has been returned the task is considered
+    fully merged.
+
+    Returns:
+      str: attribute container type or None if not available.
+    """
+    if not self._container_types:
+      self.fully_merged = True
+      return None
+
+    container_type = self._container_types.pop(0)
+    if not self._container_types:
+      self.fully_merged = True
+
+    return container_type
+
   def SetAttributeContainerIdentifier(self, lookup_key, identifier):
     """Sets an attribute container.
 
@@ -88,6 +131,20 @@ class BaseTaskMergeHelper(object):
     """
     self._container_identifier_mappings[lookup_key] = identifier
 
+  def SetAttributeContainerIdentifierOffset(self, container_type, offset):
+    """Sets the sequence number offset of a container type merged in bulk.
+
+    Attribute containers merged in bulk are appended in order, therefore
+    the identifier of a merged attribute container can be determined by
+    adding the number of containers of the same type that were stored before
+    the merge to its task-local sequence number.
+
+    Args:
+      container_type (str): attribute container type.
+      offset (int): sequence number offset.
+    """
+    self._container_identifier_offsets[container_type] = offset
+
 
 class AnalysisTaskMergeHelper(BaseTaskMergeHelper):
   """Assists in merging attribute containers of an analysis task."""
@@ -116,13 +173,16 @@ class ExtractionTaskMergeHelper(BaseTaskMergeHelper):
   _CONTAINER_TYPES = (
       event_sources.EventSource.CONTAINER_TYPE,
       events.EventDataStream.CONTAINER_TYPE,
-      # The date-less log helper is needed to generate event from the event
-      # data by the timeliner and therefore needs to be merged before event
-      # data containers.
       events.DateLessLogHelper.CONTAINER_TYPE,
       events.EventData.CONTAINER_TYPE,
+      # Events are generated by the extraction worker processes and reference
+      # event data, therefore they need to be merged after event data
+      # containers.
+      events.EventObject.CONTAINER_TYPE,
+      counts.ParserCount.CONTAINER_TYPE,
       warnings.ExtractionWarning.CONTAINER_TYPE,
       warnings.RecoveryWarning.CONTAINER_TYPE,
+      warnings.TimeliningWarning.CONTAINER_TYPE,
       artifacts.WindowsEventLogMessageFileArtifact.CONTAINER_TYPE,
       artifacts.WindowsEventLogMessageStringArtifact.CONTAINER_TYPE,
       artifacts.WindowsWevtTemplateEvent.CONTAINER_TYPE)
@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
 """The output and formatting multi-processing engine."""
 
+import copy
 import heapq
+import multiprocessing
 import os
+import queue
+import shutil
+import signal
+import tempfile
 
-from plaso.containers import events
 from plaso.engine import processing_status
 from plaso.lib import bufferlib
 from plaso.lib import definitions
@@ -12,6 +17,7 @@ from plaso.lib import errors
 from plaso.multi_process import engine
 from plaso.multi_process import logger
 from plaso.output import mediator as output_mediator
+from plaso.storage import factory as storage_factory
 from plaso.storage import time_range as storage_time_range
 
 
@@ -40,11 +46,13 @@ class PsortEventHeap(object):
         EventObject: event.
         EventData: event data.
         EventDataStream: event data stream.
+        EventTag: event tag.
     """
     try:
-      (event_values_hash, _, event, event_data,
-       event_data_stream) = heapq.heappop(self._heap)
-      return event_values_hash, event, event_data, event_data_stream
+      (event_values_hash, _, event, event_data, event_data_stream,
+       event_tag) = heapq.heappop(self._heap)
+      return (
+          event_values_hash, event, event_data, event_data_stream, event_tag)
 
     except IndexError:
       return None
@@ -61,19 +69,21 @@ class PsortEventHeap(object):
         EventObject: event.
         EventData: event data.
         EventDataStream: event data stream.
+        EventTag: event tag.
     """
     heap_values = self.PopEvent()
     while heap_values:
       yield heap_values
       heap_values = self.PopEvent()
 
-  def PushEvent(self, event, event_data, event_data_stream):
+  def PushEvent(self, event, event_data, event_data_stream, event_tag=None):
     """Pushes an event onto the heap.
 
     Args:
       event (EventObject): event.
       event_data (EventData): event data.
       event_data_stream (EventDataStream): event data stream.
+      event_tag (Optional[EventTag]): event tag.
     """
     event_values_hash = getattr(event_data, '_event_values_hash', None)
     if event_values_hash is None:
@@ -86,11 +96,13 @@ class PsortEventHeap(object):
       timestamp_desc = definitions.TIME_DESCRIPTION_UNKNOWN
 
     # Note that only events with the same timestamp are stored in the event
-    # heap. The event values hash is stored first to cluster events with
-    # similar event values.
+    # heap, or with the same timestamp and event values hash if the storage
+    # sorts events by event values hash. The event values hash is stored first
+    # to cluster events with similar event values. This determines the final
+    # order in which events are passed to the output module.
     heapq.heappush(self._heap, (
         event_values_hash, timestamp_desc, event, event_data,
-        event_data_stream))
+        event_data_stream, event_tag))
 
 
 class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
@@ -101,20 +113,44 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
 
   _HEAP_MAXIMUM_EVENTS = 100000
 
+  # The largest timestamp, used as the end of the last time range when
+  # exporting events in time ranges.
+  _MAXIMUM_TIMESTAMP = (1 << 63) - 1
+
   _MESSAGE_FORMATTERS_DIRECTORY_NAME = 'formatters'
 
   _MESSAGE_FORMATTERS_FILE_NAME = 'formatters.yaml'
 
-  def __init__(self):
-    """Initializes an output and formatting multi-processing engine."""
+  # Number of microseconds in a second.
+  _MICROSECONDS_PER_SECOND = definitions.MICROSECONDS_PER_SECOND
+
+  # Size of the chunks in which the output of a time range is copied.
+  _OUTPUT_COPY_CHUNK_SIZE = 16 * 1024 * 1024
+
+  # Number of seconds to wait for the result of a worker process before
+  # checking if the worker process is still alive.
+  _WORKER_RESULT_TIMEOUT = 1.0
+
+  def __init__(self, number_of_worker_processes=0):
+    """Initializes an output and formatting multi-processing engine.
+
+    Args:
+      number_of_worker_processes (Optional[int]): number of worker processes
+          used to format events, where 0 or 1 represents that events are
+          formatted by the main process.
+    """
     super(OutputAndFormattingMultiProcessEngine, self).__init__()
     # The export event heap is used to make sure the events are sorted in
     # a deterministic way.
+    self._events_sorted_by_event_values_hash = False
     self._events_status = processing_status.EventsStatus()
     self._export_event_heap = PsortEventHeap()
     self._export_event_timestamp = 0
+    self._export_event_values_hash = None
     self._number_of_consumed_events = 0
+    self._number_of_worker_processes = number_of_worker_processes
     self._output_mediator = None
+    self._output_module = None
     self._processing_configuration = None
     self._status = definitions.STATUS_INDICATOR_IDLE
     self._status_update_callback = None
@@ -157,30 +193,42 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     return mediator
 
   def _ExportEvent(
-      self, storage_reader, output_module, event, event_data, event_data_stream,
+      self, output_module, event, event_data, event_data_stream, event_tag,
       deduplicate_events=True):
     """Exports an event using an output module.
 
+    Events are buffered in the export event heap until the timestamp changes.
+    If the storage sorts events with the same timestamp by event values hash,
+    the buffered events are also flushed when the event values hash changes,
+    since duplicate and MACB grouped events have the same event values hash.
+
     Args:
-      storage_reader (StorageReader): storage reader.
       output_module (OutputModule): output module.
       event (EventObject): event.
       event_data (EventData): event data.
       event_data_stream (EventDataStream): event data stream.
+      event_tag (EventTag): event tag.
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
     """
+    event_values_hash = getattr(event_data, '_event_values_hash', None)
+
     if (event.timestamp != self._export_event_timestamp or
+        (self._events_sorted_by_event_values_hash and
+         event_values_hash != self._export_event_values_hash) or
         self._export_event_heap.number_of_events > self._HEAP_MAXIMUM_EVENTS):
       self._FlushExportBuffer(
-          storage_reader, output_module, deduplicate_events=deduplicate_events)
+          output_module, deduplicate_events=deduplicate_events)
       self._export_event_timestamp = event.timestamp
+      self._export_event_values_hash = event_values_hash
 
-    self._export_event_heap.PushEvent(event, event_data, event_data_stream)
+    self._export_event_heap.PushEvent(
+        event, event_data, event_data_stream, event_tag=event_tag)
 
   def _ExportEvents(
       self, storage_reader, output_module, deduplicate_events=True,
-      event_filter=None, time_slice=None, use_time_slicer=False):
+      event_filter=None, time_range=None, time_slice=None,
+      use_time_slicer=False):
     """Exports events using an output module.
 
     Args:
@@ -189,6 +237,9 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
       event_filter (Optional[EventObjectFilter]): event filter.
+      time_range (Optional[TimeRange]): time range of the events to export,
+          where None represents all events. The time range is ignored if
+          a time slice is defined.
       time_slice (Optional[TimeRange]): time range that defines a time slice
           to filter events.
       use_time_slicer (Optional[bool]): True if the 'time slicer' should be
@@ -197,6 +248,9 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     """
     self._status = definitions.STATUS_INDICATOR_EXPORTING
 
+    self._events_sorted_by_event_values_hash = (
+        storage_reader.HasEventsSortedByEventValuesHash())
+
     time_slice_buffer = None
     time_slice_range = None
 
@@ -214,21 +268,9 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     self._events_status.number_of_filtered_events = 0
     self._events_status.number_of_events_from_time_slice = 0
 
-    for event in storage_reader.GetSortedEvents(time_range=time_slice_range):
-      event_data_identifier = event.GetEventDataIdentifier()
-      event_data = storage_reader.GetAttributeContainerByIdentifier(
-          events.EventData.CONTAINER_TYPE, event_data_identifier)
-
-      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
-      if event_data_stream_identifier:
-        event_data_stream = storage_reader.GetAttributeContainerByIdentifier(
-            events.EventDataStream.CONTAINER_TYPE, event_data_stream_identifier)
-      else:
-        event_data_stream = None
-
-      event_identifier = event.GetIdentifier()
-      event_tag = storage_reader.GetEventTagByEventIdentifer(event_identifier)
-
+    for event, event_data, event_data_stream, event_tag in (
+        storage_reader.GetSortedEventsWithEventData(
+            time_range=time_slice_range or time_range)):
       if time_slice_range and event.timestamp != time_slice.event_timestamp:
         self._events_status.number_of_events_from_time_slice += 1
 
@@ -244,13 +286,14 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
           self._events_status.number_of_filtered_events += 1
 
         elif forward_entries == 0:
-          time_slice_buffer.Append((event, event_data))
+          time_slice_buffer.Append(
+              (event, event_data, event_data_stream, event_tag))
           self._events_status.number_of_filtered_events += 1
 
         elif forward_entries <= time_slice_buffer.size:
           self._ExportEvent(
-              storage_reader, output_module, event, event_data,
-              event_data_stream, deduplicate_events=deduplicate_events)
+              output_module, event, event_data, event_data_stream, event_tag,
+              deduplicate_events=deduplicate_events)
           self._number_of_consumed_events += 1
           self._events_status.number_of_events_from_time_slice += 1
           forward_entries += 1
@@ -265,11 +308,12 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         # pylint: disable=singleton-comparison
         if filter_match == True and time_slice_buffer:
           # Empty the time slice buffer.
-          for event_in_buffer, event_data_in_buffer in (
-              time_slice_buffer.Flush()):
+          for (event_in_buffer, event_data_in_buffer,
+               event_data_stream_in_buffer, event_tag_in_buffer) in (
+                   time_slice_buffer.Flush()):
             self._ExportEvent(
-                storage_reader, output_module, event_in_buffer,
-                event_data_in_buffer, event_data_stream,
+                output_module, event_in_buffer, event_data_in_buffer,
+                event_data_stream_in_buffer, event_tag_in_buffer,
                 deduplicate_events=deduplicate_events)
             self._number_of_consumed_events += 1
             self._events_status.number_of_filtered_events += 1
@@ -278,7 +322,7 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
           forward_entries = 1
 
         self._ExportEvent(
-            storage_reader, output_module, event, event_data, event_data_stream,
+            output_module, event, event_data, event_data_stream, event_tag,
             deduplicate_events=deduplicate_events)
         self._number_of_consumed_events += 1
 
@@ -287,14 +331,167 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
             filter_limit == self._number_of_consumed_events):
           break
 
-    self._FlushExportBuffer(storage_reader, output_module)
+    self._FlushExportBuffer(output_module)
 
-  def _FlushExportBuffer(
-      self, storage_reader, output_module, deduplicate_events=True):
-    """Flushes buffered events and writes them to the output module.
+  def _ExportEventsInTimeRange(
+      self, storage_file_path, output_module, output_path, time_range_index,
+      time_range, results_queue, deduplicate_events=True, event_filter=None):
+    """Exports the events in a time range to a separate output file.
+
+    This method is run in a worker process.
+
+    Args:
+      storage_file_path (str): path of the storage file.
+      output_module (OutputModule): output module.
+      output_path (str): path of the output file of the time range.
+      time_range_index (int): index of the time range.
+      time_range (TimeRange): time range of the events to export.
+      results_queue (multiprocessing.Queue): queue to which the events status
+          of the time range is sent.
+      deduplicate_events (Optional[bool]): True if events should be
+          deduplicated.
+      event_filter (Optional[EventObjectFilter]): event filter.
+    """
+    # Prevent the KeyboardInterrupt being raised inside the worker process,
+    # the main process will terminate the worker process instead.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    self._events_status = processing_status.EventsStatus()
+    self._export_event_heap = PsortEventHeap()
+    self._export_event_timestamp = 0
+    self._export_event_values_hash = None
+    self._number_of_consumed_events = 0
+
+    storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+        storage_file_path)
+
+    # A copy of the output module is used so that the output file of the main
+    # process is left untouched by the worker process.
+    output_module = copy.copy(output_module)
+    output_module.Open(path=output_path)
+
+    try:
+      self._output_mediator = self._CreateOutputMediator(
+          storage_reader, self._processing_configuration)
+
+      self._ExportEvents(
+          storage_reader, output_module, deduplicate_events=deduplicate_events,
+          event_filter=event_filter, time_range=time_range)
+
+      # The footer of an output module that supports time ranges only writes
+      # buffered output.
+      output_module.WriteFooter()
+
+    finally:
+      output_module.Close()
+      storage_reader.Close()
+
+    results_queue.put((time_range_index, {
+        'number_of_consumed_events': self._number_of_consumed_events,
+        'number_of_duplicate_events': (
+            self._events_status.number_of_duplicate_events),
+        'number_of_filtered_events': (
+            self._events_status.number_of_filtered_events),
+        'number_of_macb_grouped_events': (
+            self._events_status.number_of_macb_grouped_events)}))
+
+  def _ExportEventsInTimeRanges(
+      self, storage_reader, storage_file_path, output_module,
+      deduplicate_events=True, event_filter=None):
+    """Exports events in time ranges using worker processes.
+
+    The events are divided in time ranges with approximately the same number
+    of events. The events of each time range are formatted by a separate
+    worker process and the resulting output is concatenated in chronological
+    order. Time ranges start at a whole second so that events that are
+    deduplicated, grouped or sorted by the output module, are exported by
+    the same worker process.
 
     Args:
       storage_reader (StorageReader): storage reader.
+      storage_file_path (str): path of the storage file.
+      output_module (OutputModule): output module.
+      deduplicate_events (Optional[bool]): True if events should be
+          deduplicated.
+      event_filter (Optional[EventObjectFilter]): event filter.
+
+    Raises:
+      RuntimeError: if a worker process failed to export its time range.
+    """
+    self._status = definitions.STATUS_INDICATOR_EXPORTING
+
+    time_ranges = self._GetExportTimeRanges(storage_reader)
+
+    temporary_directory = tempfile.mkdtemp(
+        prefix='psort-', dir=self._processing_configuration.temporary_directory)
+
+    results_queue = multiprocessing.Queue()
+    processes = []
+    results = {}
+
+    try:
+      for time_range_index, time_range in enumerate(time_ranges):
+        output_path = os.path.join(
+            temporary_directory, f'{time_range_index:06d}.output')
+
+        process = multiprocessing.Process(
+            name=f'Worker_{time_range_index:02d}',
+            target=self._ExportEventsInTimeRange, args=(
+                storage_file_path, output_module, output_path,
+                time_range_index, time_range, results_queue),
+            kwargs={
+                'deduplicate_events': deduplicate_events,
+                'event_filter': event_filter})
+        process.start()
+        processes.append(process)
+
+      while len(results) < len(processes):
+        try:
+          time_range_index, result = results_queue.get(
+              timeout=self._WORKER_RESULT_TIMEOUT)
+        except queue.Empty:
+          for time_range_index, process in enumerate(processes):
+            if (time_range_index not in results and not process.is_alive() and
+                process.exitcode != 0):
+              raise RuntimeError((
+                  f'Worker process: {process.name:s} failed with exit code: '
+                  f'{process.exitcode!s}'))
+          continue
+
+        results[time_range_index] = result
+
+        self._number_of_consumed_events += result['number_of_consumed_events']
+        self._events_status.number_of_duplicate_events += result[
+            'number_of_duplicate_events']
+        self._events_status.number_of_filtered_events += result[
+            'number_of_filtered_events']
+        self._events_status.number_of_macb_grouped_events += result[
+            'number_of_macb_grouped_events']
+
+      for time_range_index in range(len(time_ranges)):
+        output_path = os.path.join(
+            temporary_directory, f'{time_range_index:06d}.output')
+
+        with open(output_path, 'r', encoding='utf-8') as file_object:
+          output_text = file_object.read(self._OUTPUT_COPY_CHUNK_SIZE)
+          while output_text:
+            output_module.WriteText(output_text)
+            output_text = file_object.read(self._OUTPUT_COPY_CHUNK_SIZE)
+
+    finally:
+      for process in processes:
+        if process.is_alive():
+          process.terminate()
+        process.join(timeout=self._PROCESS_JOIN_TIMEOUT)
+
+      results_queue.close()
+
+      shutil.rmtree(temporary_directory, True)
+
+  def _FlushExportBuffer(self, output_module, deduplicate_events=True):
+    """Flushes buffered events and writes them to the output module.
+
+    Args:
       output_module (OutputModule): output module.
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
@@ -304,8 +501,8 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     last_timestamp_desc = None
     macb_group = []
 
-    for (event_values_hash, event, event_data,
-         event_data_stream) in self._export_event_heap.PopEvents():
+    for (event_values_hash, event, event_data, event_data_stream,
+         event_tag) in self._export_event_heap.PopEvents():
       timestamp_desc = event.timestamp_desc
 
       if (deduplicate_events and timestamp_desc == last_timestamp_desc and
@@ -313,9 +510,6 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         self._events_status.number_of_duplicate_events += 1
         continue
 
-      event_identifier = event.GetIdentifier()
-      event_tag = storage_reader.GetEventTagByEventIdentifer(event_identifier)
-
       if timestamp_desc in (
           definitions.TIME_DESCRIPTION_LAST_ACCESS,
           definitions.TIME_DESCRIPTION_CREATION,
@@ -356,6 +550,35 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       output_module.WriteFieldValuesOfMACBGroup(
           self._output_mediator, macb_group)
 
+  def _GetExportTimeRanges(self, storage_reader):
+    """Divides the events into time ranges to export in parallel.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+
+    Returns:
+      list[TimeRange]: time ranges in chronological order, where each time
+          range, except for the first, starts at a whole second.
+    """
+    timestamps = storage_reader.GetEventTimestampQuantiles(
+        self._number_of_worker_processes)
+    if not timestamps:
+      return []
+
+    start_timestamps = [timestamps[0]]
+    for timestamp in timestamps[1:]:
+      timestamp -= timestamp % self._MICROSECONDS_PER_SECOND
+      if timestamp > start_timestamps[-1]:
+        start_timestamps.append(timestamp)
+
+    end_timestamps = [timestamp - 1 for timestamp in start_timestamps[1:]]
+    end_timestamps.append(self._MAXIMUM_TIMESTAMP)
+
+    return [
+        storage_time_range.TimeRange(start_timestamp, end_timestamp)
+        for start_timestamp, end_timestamp in zip(
+            start_timestamps, end_timestamps)]
+
   def _ReadMessageFormatters(
       self, output_mediator_object, data_location, custom_formatters_path):
     """Reads the message formatters from a formatters file or directory.
@@ -414,6 +637,10 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
 
     self._processing_status.UpdateEventsStatus(self._events_status)
 
+    if self._output_module:
+      self._processing_status.UpdateOutputStatus(
+          self._output_module.GetStatus())
+
   def _UpdateStatus(self):
     """Update the status."""
     self._UpdateForemanProcessStatus()
@@ -424,9 +651,14 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
   def ExportEvents(
       self, storage_reader, output_module, processing_configuration,
       deduplicate_events=True, event_filter=None, status_update_callback=None,
-      time_slice=None, use_time_slicer=False):
+      storage_file_path=None, time_slice=None, use_time_slicer=False):
     """Exports events using an output module.
 
+    The events are formatted by worker processes when multiple worker
+    processes are configured, the output module supports time ranges, the
+    storage file path is provided and neither a time slice nor an event
+    filter limit is used.
+
     Args:
       storage_reader (StorageReader): storage reader.
       output_module (OutputModule): output module.
@@ -437,6 +669,8 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       event_filter (Optional[EventObjectFilter]): event filter.
       status_update_callback (Optional[function]): callback function for status
           updates.
+      storage_file_path (Optional[str]): path of the storage file, which is
+          opened by the worker processes.
       time_slice (Optional[TimeSlice]): slice of time to output.
       use_time_slicer (Optional[bool]): True if the 'time slicer' should be
           used. The 'time slicer' will provide a context of events around
@@ -445,8 +679,10 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     Raises:
       BadConfigOption: if the message formatters file or directory cannot be
           read.
+      RuntimeError: if a worker process failed to export its time range.
     """
     self._events_status = processing_status.EventsStatus()
+    self._output_module = output_module
     self._processing_configuration = processing_configuration
     self._status_update_callback = status_update_callback
 
@@ -470,11 +706,25 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
 
     self._StartProfiling(self._processing_configuration.profiling)
 
+    if self._storage_profiler:
+      storage_reader.SetStorageProfiler(self._storage_profiler)
+
+    export_in_time_ranges = bool(
+        self._number_of_worker_processes > 1 and
+        output_module.SUPPORTS_TIME_RANGES and storage_file_path and
+        not time_slice and not getattr(event_filter, 'limit', None))
+
     try:
-      self._ExportEvents(
-          storage_reader, output_module, deduplicate_events=deduplicate_events,
-          event_filter=event_filter, time_slice=time_slice,
-          use_time_slicer=use_time_slicer)
+      if export_in_time_ranges:
+        self._ExportEventsInTimeRanges(
+            storage_reader, storage_file_path, output_module,
+            deduplicate_events=deduplicate_events, event_filter=event_filter)
+
+      else:
+        self._ExportEvents(
+            storage_reader, output_module,
+            deduplicate_events=deduplicate_events, event_filter=event_filter,
+            time_slice=time_slice, use_time_slicer=use_time_slicer)
 
       self._status = definitions.STATUS_INDICATOR_COMPLETED
 
@@ -483,6 +733,9 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       # so we include the storage sync to disk in the status updates.
       self._StopStatusUpdateThread()
 
+      if self._storage_profiler:
+        storage_reader.SetStorageProfiler(None)
+
     output_module.WriteFooter()
 
     # Update the status view one last time.
@@ -493,5 +746,6 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     # Reset values.
     self._events_status = None
     self._output_mediator = None
+    self._output_module = None
     self._processing_configuration = None
     self._status_update_callback = None
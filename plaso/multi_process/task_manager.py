@@ -35,6 +35,15 @@ class _PendingMergeTaskHeap(object):
     """
     return task_identifier in self._task_identifiers
 
+  def __iter__(self):
+    """Iterates over the tasks on the heap.
+
+    Yields:
+      Task: task.
+    """
+    for _, task in self._heap:
+      yield task
+
   def __len__(self):
     """Determines the number of tasks on the heap.
 
@@ -166,6 +175,10 @@ class TaskManager(object):
 
     self._tasks_profiler = None
 
+    # Retry tasks of the event sources of an abandoned batch task, that still
+    # need to be scheduled.
+    self._retry_tasks = collections.deque()
+
     # TODO: implement a limit on the number of tasks.
     self._total_number_of_tasks = 0
 
@@ -247,7 +260,7 @@ class TaskManager(object):
     Returns:
       bool: True if there are abandoned tasks that need to be retried.
     """
-    return bool(self._GetTaskPendingRetry())
+    return bool(self._retry_tasks) or bool(self._GetTaskPendingRetry())
 
   def _UpdateLatestProcessingTime(self, task):
     """Updates the latest processing time of the task manager from the task.
@@ -287,21 +300,42 @@ class TaskManager(object):
   def CreateRetryTask(self):
     """Creates a task that to retry a previously abandoned task.
 
+    The event sources of an abandoned batch task are retried in separate
+    tasks, so that an event source that causes a worker to fail does not
+    cause the other event sources of the batch to fail again.
+
     Returns:
       Task: a task that was abandoned but should be retried or None if there are
           no abandoned tasks that should be retried.
     """
     with self._lock:
-      abandoned_task = self._GetTaskPendingRetry()
-      if not abandoned_task:
-        return None
+      if not self._retry_tasks:
+        abandoned_task = self._GetTaskPendingRetry()
+        if not abandoned_task:
+          return None
+
+        # The abandoned task is kept in _tasks_abandoned so it can be still
+        # identified in CheckTaskToMerge and UpdateTaskAsPendingMerge.
+
+        retry_task = abandoned_task.CreateRetryTask()
+        if not retry_task.path_specs:
+          self._retry_tasks.append(retry_task)
+
+        else:
+          for path_spec in retry_task.path_specs:
+            path_spec_retry_task = tasks.Task(
+                session_identifier=retry_task.session_identifier)
+            path_spec_retry_task.file_entry_type = retry_task.file_entry_type
+            path_spec_retry_task.path_spec = path_spec
+            path_spec_retry_task.storage_format = retry_task.storage_format
 
-      # The abandoned task is kept in _tasks_abandoned so it can be still
-      # identified in CheckTaskToMerge and UpdateTaskAsPendingMerge.
+            self._retry_tasks.append(path_spec_retry_task)
 
-      retry_task = abandoned_task.CreateRetryTask()
-      logger.debug('Retrying task {0:s} as {1:s}.'.format(
-          abandoned_task.identifier, retry_task.identifier))
+        for retry_task in self._retry_tasks:
+          logger.debug('Retrying task {0:s} as {1:s}.'.format(
+              abandoned_task.identifier, retry_task.identifier))
+
+      retry_task = self._retry_tasks.popleft()
 
       self._tasks_queued[retry_task.identifier] = retry_task
       self._total_number_of_tasks += 1
@@ -373,6 +407,32 @@ class TaskManager(object):
       return [task for task in self._tasks_abandoned.values()
               if not task.has_retry]
 
+  def GetPendingTaskPathSpecs(self):
+    """Retrieves the path specifications of the pending tasks.
+
+    Abandoned tasks that have a retry task are not included, since their path
+    specifications are part of the retry tasks.
+
+    Returns:
+      list[dfvfs.PathSpec]: path specifications of the tasks that still need
+          to be processed or merged.
+    """
+    with self._lock:
+      pending_tasks = list(self._tasks_queued.values())
+      pending_tasks.extend(self._tasks_processing.values())
+      pending_tasks.extend(self._tasks_pending_merge)
+      pending_tasks.extend(self._tasks_merging.values())
+      pending_tasks.extend(
+          task for task in self._tasks_abandoned.values()
+          if not task.has_retry)
+      pending_tasks.extend(self._retry_tasks)
+
+    path_specs = []
+    for task in pending_tasks:
+      path_specs.extend(task.path_specs or [task.path_spec])
+
+    return path_specs
+
   def GetProcessedTaskByIdentifier(self, task_identifier):
     """Retrieves a task that has been processed.
 
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""The worker pool controller."""
+
+
+class WorkerPoolDecision(object):
+  """Worker pool decision.
+
+  Attributes:
+    action (str): action, either "grow", "keep" or "shrink".
+    cpu_utilization (float): average CPU utilization of the worker processes
+        as a percentage of a single CPU or None if not available.
+    memory_headroom (int): amount of available memory in bytes that remains
+        when an additional worker process consumes its memory limit, or None
+        if not available.
+    number_of_workers (int): number of worker processes after the decision.
+    reason (str): reason for the decision.
+  """
+
+  def __init__(
+      self, action='keep', cpu_utilization=None, memory_headroom=None,
+      number_of_workers=0, reason=''):
+    """Initializes a worker pool decision.
+
+    Args:
+      action (Optional[str]): action, either "grow", "keep" or "shrink".
+      cpu_utilization (Optional[float]): average CPU utilization of the
+          worker processes as a percentage of a single CPU.
+      memory_headroom (Optional[int]): amount of available memory in bytes
+          that remains when an additional worker process consumes its memory
+          limit.
+      number_of_workers (Optional[int]): number of worker processes after
+          the decision.
+      reason (Optional[str]): reason for the decision.
+    """
+    super(WorkerPoolDecision, self).__init__()
+    self.action = action
+    self.cpu_utilization = cpu_utilization
+    self.memory_headroom = memory_headroom
+    self.number_of_workers = number_of_workers
+    self.reason = reason
+
+
+class WorkerPoolController(object):
+  """Controller that adapts the number of worker processes to the load.
+
+  Worker processes pull tasks from a shared task queue, hence an additional
+  worker process starts taking work as soon as it is started and a worker
+  process that is stopped stops taking work once it completed its task.
+
+  The number of worker processes is changed by one at a time:
+  * shrink when the available memory cannot accommodate another worker
+    process, when merging of task results falls behind or when there are
+    more worker processes than preferred and the CPUs are saturated;
+  * grow when tasks are waiting while all worker processes are busy, merging
+    keeps up and there is sufficient memory, up to the preferred number of
+    worker processes or beyond when the worker processes are I/O bound and
+    a CPU is available.
+  """
+
+  # Average CPU utilization of the worker processes, as a percentage of
+  # a single CPU, below which the worker processes are considered I/O bound.
+  _IO_BOUND_CPU_UTILIZATION = 50.0
+
+  # Total CPU utilization of the worker processes, as a percentage of all
+  # CPUs, above which the CPUs are considered saturated.
+  _SATURATED_CPU_UTILIZATION = 90.0
+
+  # Maximum number of tasks pending merge per worker process, above which
+  # merging is considered to fall behind.
+  _MAXIMUM_PENDING_MERGE_PER_WORKER = 2
+
+  def __init__(
+      self, minimum_number_of_workers, maximum_number_of_workers,
+      preferred_number_of_workers, number_of_cpus=1,
+      worker_memory_limit=None):
+    """Initializes a worker pool controller.
+
+    Args:
+      minimum_number_of_workers (int): minimum number of worker processes.
+      maximum_number_of_workers (int): maximum number of worker processes.
+      preferred_number_of_workers (int): preferred number of worker processes,
+          such as the number of available CPUs.
+      number_of_cpus (Optional[int]): number of CPUs of the system.
+      worker_memory_limit (Optional[int]): maximum amount of memory a worker
+          is allowed to consume, where None or 0 represents no limit.
+    """
+    super(WorkerPoolController, self).__init__()
+    self._maximum_number_of_workers = maximum_number_of_workers
+    self._minimum_number_of_workers = minimum_number_of_workers
+    self._number_of_cpus = number_of_cpus
+    self._preferred_number_of_workers = preferred_number_of_workers
+    self._worker_memory_limit = worker_memory_limit
+
+  def DetermineNumberOfWorkers(
+      self, number_of_workers, number_of_queued_tasks,
+      number_of_tasks_processing, number_of_tasks_pending_merge,
+      cpu_utilizations, used_memory, available_memory):
+    """Determines the number of worker processes.
+
+    Args:
+      number_of_workers (int): number of active worker processes.
+      number_of_queued_tasks (int): number of tasks waiting for a worker
+          process.
+      number_of_tasks_processing (int): number of tasks being processed.
+      number_of_tasks_pending_merge (int): number of tasks pending merge.
+      cpu_utilizations (list[float]): CPU utilization of each worker process
+          as a percentage of a single CPU.
+      used_memory (int): largest amount of memory in bytes used by a worker
+          process, which is used when there is no worker memory limit.
+      available_memory (int): amount of available system memory in bytes or
+          None if not available.
+
+    Returns:
+      WorkerPoolDecision: worker pool decision.
+    """
+    cpu_utilization = None
+    total_cpu_utilization = sum(cpu_utilizations)
+    if cpu_utilizations:
+      cpu_utilization = total_cpu_utilization / len(cpu_utilizations)
+
+    # Total CPU utilization as a percentage of all CPUs.
+    cpu_capacity = 100.0 * self._number_of_cpus
+    system_cpu_utilization = 100.0 * total_cpu_utilization / cpu_capacity
+
+    memory_headroom = None
+    if available_memory is not None:
+      memory_headroom = available_memory - (
+          self._worker_memory_limit or used_memory)
+
+    decision = WorkerPoolDecision(
+        cpu_utilization=cpu_utilization, memory_headroom=memory_headroom,
+        number_of_workers=number_of_workers)
+
+    can_shrink = number_of_workers > self._minimum_number_of_workers
+    has_memory_headroom = memory_headroom is None or memory_headroom >= 0
+    merge_falls_behind = number_of_tasks_pending_merge > (
+        self._MAXIMUM_PENDING_MERGE_PER_WORKER * number_of_workers)
+
+    if can_shrink and not has_memory_headroom:
+      decision.action = 'shrink'
+      decision.reason = 'insufficient memory headroom'
+
+    elif can_shrink and merge_falls_behind:
+      decision.action = 'shrink'
+      decision.reason = 'merge backlog'
+
+    elif (number_of_workers > self._preferred_number_of_workers and
+          system_cpu_utilization >= self._SATURATED_CPU_UTILIZATION):
+      decision.action = 'shrink'
+      decision.reason = 'CPU saturated'
+
+    elif (number_of_tasks_pending_merge <= number_of_workers <
+          self._maximum_number_of_workers and
+          number_of_queued_tasks > 0 and
+          number_of_tasks_processing >= number_of_workers and
+          has_memory_headroom):
+      if number_of_workers < self._preferred_number_of_workers:
+        decision.action = 'grow'
+        decision.reason = 'tasks queued'
+
+      # An additional worker process is only started when there is a CPU
+      # available to run it.
+      elif (cpu_utilization is not None and
+            cpu_utilization < self._IO_BOUND_CPU_UTILIZATION and
+            total_cpu_utilization + 100.0 <= cpu_capacity):
+        decision.action = 'grow'
+        decision.reason = 'I/O bound'
+
+    if decision.action == 'grow':
+      decision.number_of_workers += 1
+    elif decision.action == 'shrink':
+      decision.number_of_workers -= 1
+
+    return decision
@@ -779,6 +779,36 @@ class ZeroMQBufferedReplyQueue(ZeroMQBufferedQueue):
     except queue.Full as exception:
       raise errors.QueueFull(exception)
 
+  def PushItemFirst(self, item):
+    """Push an item on to the front of the queue.
+
+    The item is sent before the items that are already in the internal buffer,
+    regardless of the maximum number of items in the buffer.
+
+    If no ZeroMQ socket has been created, one will be created the first time
+    this method is called.
+
+    Args:
+      item (object): item to push on the queue.
+
+    Raises:
+      QueueAlreadyClosed: if the queue is closed.
+      RuntimeError: if closed event is missing.
+    """
+    if not self._closed_event:
+      raise RuntimeError('Missing closed event.')
+
+    if self._closed_event.is_set():
+      raise errors.QueueAlreadyClosed()
+
+    if not self._zmq_socket:
+      self._CreateZMQSocket()
+
+    with self._queue.mutex:
+      self._queue.queue.appendleft(item)
+      self._queue.unfinished_tasks += 1
+      self._queue.not_empty.notify()
+
 
 class ZeroMQBufferedReplyBindQueue(ZeroMQBufferedReplyQueue):
   """A Plaso queue backed by a ZeroMQ REP socket that binds to a port.
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 """Dynamic selected delimiter separated values output module."""
 
-import datetime
 import pytz
 
 from dfdatetime import posix_time as dfdatetime_posix_time
@@ -76,20 +75,12 @@ class DynamicFieldFormattingHelper(formatting_helper.FieldFormattingHelper):
 
     # Note that GetDateWithTimeOfDay will return the date and time in UTC,
     # so no adjustment for date_time.time_zone_offset is needed.
-    year, month, day_of_month, hours, minutes, seconds = (
-        date_time.GetDateWithTimeOfDay())
+    year, month, day_of_month, _, _, _ = date_time.GetDateWithTimeOfDay()
 
     if output_mediator.time_zone != pytz.UTC:
       try:
-        datetime_object = datetime.datetime(
-            year, month, day_of_month, hours, minutes, seconds,
-            tzinfo=pytz.UTC)
-
-        datetime_object = datetime_object.astimezone(output_mediator.time_zone)
-
-        year = datetime_object.year
-        month = datetime_object.month
-        day_of_month = datetime_object.day
+        year, month, day_of_month, _, _, _, _, _ = (
+            self._GetLocalDateTimeValues(date_time, output_mediator.time_zone))
 
       except (OSError, OverflowError, TypeError, ValueError):
         year, month, day_of_month = (None, None, None)
@@ -152,8 +143,6 @@ class DynamicOutputModule(shared_dsv.DSVOutputModule):
       'datetime', 'timestamp_desc', 'source', 'source_long', 'message',
       'parser', 'display_name', 'tag']
 
-  _SORT_KEY_FIELD_NAMES = ['datetime', 'display_name', 'message']
-
   def __init__(self):
     """Initializes an output module."""
     field_formatting_helper = DynamicFieldFormattingHelper()
@@ -2,10 +2,13 @@
 """Output module field formatting helper."""
 
 import abc
+import bisect
+import calendar
 import datetime
 import math
 import pytz
 
+from dfdatetime import definitions as dfdatetime_definitions
 from dfdatetime import posix_time as dfdatetime_posix_time
 from dfvfs.lib import definitions as dfvfs_definitions
 
@@ -14,6 +17,159 @@ from plaso.formatters import default
 from plaso.output import logger
 
 
+class DateTimeFormattingCache(object):
+  """Date and time formatting cache of a specific time zone.
+
+  The time zone offset is determined once per time zone transition window,
+  the period between 2 transitions such as daylight saving time, and the
+  date and time values in the time zone are cached per POSIX timestamp in
+  seconds.
+
+  Attributes:
+    time_zone (datetime.tzinfo): time zone.
+  """
+
+  # The maximum number of cached date and time values.
+  _MAXIMUM_CACHED_VALUES = 64 * 1024
+
+  # The ordinal of the POSIX epoch (1970-01-01).
+  _POSIX_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+  def __init__(self, time_zone):
+    """Initializes a date and time formatting cache.
+
+    Args:
+      time_zone (datetime.tzinfo): time zone.
+    """
+    super(DateTimeFormattingCache, self).__init__()
+    self._cached_values = {}
+    self._transition_end_timestamp = None
+    self._transition_start_timestamp = None
+    self._transition_time_zone_name = None
+    self._transition_time_zone_offset = None
+    self._transition_timestamps = None
+    self._transitions = None
+
+    self.time_zone = time_zone
+
+    if isinstance(time_zone, pytz.tzinfo.DstTzInfo):
+      # pylint: disable=protected-access
+      posix_epoch = datetime.datetime(1970, 1, 1)
+      self._transition_timestamps = [
+          (transition_time - posix_epoch) // datetime.timedelta(seconds=1)
+          for transition_time in time_zone._utc_transition_times]
+      self._transitions = [
+          (utc_offset // datetime.timedelta(seconds=1), time_zone_name)
+          for utc_offset, _, time_zone_name in time_zone._transition_info]
+
+    else:
+      utc_offset = time_zone.utcoffset(None)
+      if utc_offset is not None:
+        # The time zone has a static offset, hence a single transition window.
+        self._transition_end_timestamp = math.inf
+        self._transition_start_timestamp = -math.inf
+        self._transition_time_zone_name = time_zone.tzname(None)
+        self._transition_time_zone_offset = (
+            utc_offset // datetime.timedelta(seconds=1))
+
+  def _GetTimeZoneOffsetAndName(self, timestamp):
+    """Retrieves the time zone offset and name of a specific timestamp.
+
+    Args:
+      timestamp (int): number of seconds since 1970-01-01 00:00:00 UTC.
+
+    Returns:
+      tuple[int, str]: time zone offset in seconds and time zone name.
+
+    Raises:
+      OverflowError: if the timestamp is out of bounds.
+      ValueError: if the timestamp is out of bounds.
+    """
+    if self._transition_start_timestamp is not None and (
+        self._transition_start_timestamp <= timestamp <
+        self._transition_end_timestamp):
+      return self._transition_time_zone_offset, self._transition_time_zone_name
+
+    if self._transitions is None:
+      # The time zone does not expose its transitions, hence fall back to
+      # a per timestamp conversion.
+      datetime_object = datetime.datetime.fromtimestamp(
+          timestamp, tz=self.time_zone)
+      utc_offset = datetime_object.utcoffset()
+      return (
+          utc_offset // datetime.timedelta(seconds=1), datetime_object.tzname())
+
+    # Similar to pytz the transition window is determined by the last
+    # transition that precedes or is equal to the timestamp.
+    transition_index = max(bisect.bisect_right(
+        self._transition_timestamps, timestamp) - 1, 0)
+
+    self._transition_start_timestamp = -math.inf
+    if transition_index > 0:
+      self._transition_start_timestamp = self._transition_timestamps[
+          transition_index]
+
+    self._transition_end_timestamp = math.inf
+    if transition_index + 1 < len(self._transition_timestamps):
+      self._transition_end_timestamp = self._transition_timestamps[
+          transition_index + 1]
+
+    self._transition_time_zone_offset, self._transition_time_zone_name = (
+        self._transitions[transition_index])
+
+    return self._transition_time_zone_offset, self._transition_time_zone_name
+
+  def GetDateTimeValues(self, timestamp):
+    """Retrieves the date and time values of a specific timestamp.
+
+    Args:
+      timestamp (int): number of seconds since 1970-01-01 00:00:00 UTC.
+
+    Returns:
+      tuple[int, int, int, int, int, int, str, str]: year, month, day of month,
+          hours, minutes and seconds in the time zone, time zone offset
+          formatted as "+HH:MM" and time zone name.
+
+    Raises:
+      OverflowError: if the timestamp is out of bounds.
+      ValueError: if the timestamp is out of bounds.
+    """
+    date_time_values = self._cached_values.get(timestamp, None)
+    if date_time_values:
+      return date_time_values
+
+    time_zone_offset, time_zone_name = self._GetTimeZoneOffsetAndName(
+        timestamp)
+
+    number_of_days, number_of_seconds = divmod(
+        timestamp + time_zone_offset, 86400)
+    date_object = datetime.date.fromordinal(
+        self._POSIX_EPOCH_ORDINAL + number_of_days)
+
+    hours, number_of_seconds = divmod(number_of_seconds, 3600)
+    minutes, seconds = divmod(number_of_seconds, 60)
+
+    time_zone_offset_sign = '+'
+    if time_zone_offset < 0:
+      time_zone_offset_sign = '-'
+      time_zone_offset *= -1
+
+    time_zone_offset_hours, time_zone_offset_minutes = divmod(
+        time_zone_offset // 60, 60)
+
+    date_time_values = (
+        date_object.year, date_object.month, date_object.day, hours, minutes,
+        seconds, (f'{time_zone_offset_sign:s}{time_zone_offset_hours:02d}:'
+                  f'{time_zone_offset_minutes:02d}'), time_zone_name)
+
+    if len(self._cached_values) >= self._MAXIMUM_CACHED_VALUES:
+      self._cached_values = {}
+
+    self._cached_values[timestamp] = date_time_values
+
+    return date_time_values
+
+
 class EventFormattingHelper(object):
   """Output module event formatting helper."""
 
@@ -43,12 +199,32 @@ class FieldFormattingHelper(object):
   # Maps the name of a field to callback function that formats the field value.
   _FIELD_FORMAT_CALLBACKS = {}
 
+  # The maximum number of cached date and time strings.
+  _MAXIMUM_CACHED_DATE_TIME_STRINGS = 64 * 1024
+
+  # Precisions of which the date and time string is fully defined by
+  # a timestamp in microseconds.
+  _MICROSECOND_COMPATIBLE_PRECISIONS = frozenset([
+      dfdatetime_definitions.PRECISION_1_SECOND,
+      dfdatetime_definitions.PRECISION_100_MILLISECONDS,
+      dfdatetime_definitions.PRECISION_10_MILLISECONDS,
+      dfdatetime_definitions.PRECISION_1_MILLISECOND,
+      dfdatetime_definitions.PRECISION_100_MICROSECONDS,
+      dfdatetime_definitions.PRECISION_10_MICROSECONDS,
+      dfdatetime_definitions.PRECISION_1_MICROSECOND])
+
   def __init__(self):
     """Initializes a field formatting helper."""
     event_data_stream = events.EventDataStream()
 
     super(FieldFormattingHelper, self).__init__()
     self._callback_functions = {}
+    self._date_time_formatting_caches = {}
+    self._date_time_strings = {}
+    self._formatted_event_data = None
+    self._formatted_event_values = None
+    self._message_formatters = {}
+    self._message_formatters_output_mediator = None
     self._event_data_stream_field_names = event_data_stream.GetAttributeNames()
     self._event_tag_field_names = []
 
@@ -59,6 +235,153 @@ class FieldFormattingHelper(object):
         self._callback_functions[field_name] = getattr(
             self, callback_name, None)
 
+  def _CacheDateTimeString(self, lookup_key, date_time_string):
+    """Caches a date and time string.
+
+    Args:
+      lookup_key (tuple[int, str, datetime.tzinfo]): timestamp in
+          microseconds, precision and time zone of the date and time string.
+      date_time_string (str): date and time string.
+    """
+    if len(self._date_time_strings) >= self._MAXIMUM_CACHED_DATE_TIME_STRINGS:
+      self._date_time_strings = {}
+
+    self._date_time_strings[lookup_key] = date_time_string
+
+  def _CopyTimestampToDateTimeString(self, timestamp, time_zone):
+    """Copies a timestamp to an ISO 8601 date and time string.
+
+    Args:
+      timestamp (int): number of microseconds since 1970-01-01 00:00:00 UTC.
+      time_zone (datetime.tzinfo): time zone.
+
+    Returns:
+      str: date and time string formatted as "YYYY-MM-DDTHH:MM:SS.######+HH:MM"
+          in the time zone.
+
+    Raises:
+      OverflowError: if the timestamp is out of bounds.
+      TypeError: if the timestamp is not an integer.
+      ValueError: if the timestamp is out of bounds.
+    """
+    lookup_key = (
+        timestamp, dfdatetime_definitions.PRECISION_1_MICROSECOND, time_zone)
+
+    date_time_string = self._date_time_strings.get(lookup_key, None)
+    if not date_time_string:
+      timestamp, microseconds = divmod(timestamp, 1000000)
+
+      date_time_formatting_cache = self._GetDateTimeFormattingCache(time_zone)
+      (year, month, day_of_month, hours, minutes, seconds, time_zone_offset,
+       _) = date_time_formatting_cache.GetDateTimeValues(timestamp)
+
+      date_time_string = (
+          f'{year:04d}-{month:02d}-{day_of_month:02d}T{hours:02d}:'
+          f'{minutes:02d}:{seconds:02d}.{microseconds:06d}{time_zone_offset:s}')
+
+      self._CacheDateTimeString(lookup_key, date_time_string)
+
+    return date_time_string
+
+  def _GetDateTimeFormattingCache(self, time_zone):
+    """Retrieves the date and time formatting cache of a specific time zone.
+
+    Args:
+      time_zone (datetime.tzinfo): time zone.
+
+    Returns:
+      DateTimeFormattingCache: date and time formatting cache.
+    """
+    date_time_formatting_cache = self._date_time_formatting_caches.get(
+        time_zone, None)
+    if not date_time_formatting_cache:
+      date_time_formatting_cache = DateTimeFormattingCache(time_zone)
+      self._date_time_formatting_caches[time_zone] = date_time_formatting_cache
+
+    return date_time_formatting_cache
+
+  def _GetFormattedEventValues(self, output_mediator, event_data):
+    """Retrieves the formatted event values of specific event data.
+
+    The formatted event values of the last event data are cached, since
+    multiple fields, such as message and short message, are formatted for
+    the same event data.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      event_data (EventData): event data.
+
+    Returns:
+      tuple[EventFormatter, dict[str, object]]: message formatter and
+          formatted event values.
+    """
+    message_formatter = self._GetMessageFormatter(
+        output_mediator, event_data.data_type)
+
+    if event_data is not self._formatted_event_data:
+      event_values = event_data.CopyToDict()
+      message_formatter.FormatEventValues(output_mediator, event_values)
+
+      self._formatted_event_data = event_data
+      self._formatted_event_values = event_values
+
+    return message_formatter, self._formatted_event_values
+
+  def _GetLocalDateTimeValues(self, date_time, time_zone):
+    """Retrieves the date and time values in a specific time zone.
+
+    Args:
+      date_time (dfdatetime.DateTimeValues): date and time values.
+      time_zone (datetime.tzinfo): time zone.
+
+    Returns:
+      tuple[int, int, int, int, int, int, str, str]: year, month, day of month,
+          hours, minutes and seconds in the time zone, time zone offset
+          formatted as "+HH:MM" and time zone name.
+
+    Raises:
+      OverflowError: if the date and time values are out of bounds.
+      TypeError: if the date and time values do not represent a date and time.
+      ValueError: if the date and time values are out of bounds.
+    """
+    # Note that GetDateWithTimeOfDay will return the date and time in UTC,
+    # so no adjustment for date_time.time_zone_offset is needed.
+    timestamp = calendar.timegm(date_time.GetDateWithTimeOfDay())
+
+    date_time_formatting_cache = self._GetDateTimeFormattingCache(time_zone)
+    return date_time_formatting_cache.GetDateTimeValues(timestamp)
+
+  def _GetMessageFormatter(self, output_mediator, data_type):
+    """Retrieves the message formatter for a specific data type.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      data_type (str): data type of the event data.
+
+    Returns:
+      EventFormatter: message formatter of the data type or the default
+          message formatter if not available.
+    """
+    if output_mediator is not self._message_formatters_output_mediator:
+      self._formatted_event_data = None
+      self._formatted_event_values = None
+      self._message_formatters = {}
+      self._message_formatters_output_mediator = output_mediator
+
+    message_formatter = self._message_formatters.get(data_type, None)
+    if not message_formatter:
+      message_formatter = output_mediator.GetMessageFormatter(data_type)
+      if not message_formatter:
+        logger.warning(
+            f'Using default message formatter for data type: {data_type:s}')
+        message_formatter = self._DEFAULT_MESSAGE_FORMATTER
+
+      self._message_formatters[data_type] = message_formatter
+
+    return message_formatter
+
   # The field format callback methods require specific arguments hence
   # the check for unused arguments is disabled here.
   # pylint: disable=unused-argument
@@ -92,6 +415,21 @@ class FieldFormattingHelper(object):
           date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
               timestamp=event.timestamp)
 
+      lookup_key = None
+      if date_time.precision in self._MICROSECOND_COMPATIBLE_PRECISIONS:
+        try:
+          timestamp = date_time.GetPlasoTimestamp()
+        except ValueError:
+          timestamp = None
+
+        if timestamp is not None:
+          lookup_key = (
+              timestamp, date_time.precision, output_mediator.time_zone)
+
+          iso8601_string = self._date_time_strings.get(lookup_key, None)
+          if iso8601_string:
+            return iso8601_string
+
       iso8601_string = date_time.CopyToDateTimeStringISO8601()
       if not iso8601_string:
         return 'Invalid'
@@ -102,24 +440,22 @@ class FieldFormattingHelper(object):
       if output_mediator.time_zone != pytz.UTC or date_time.time_zone_offset:
         # For output in a specific time zone overwrite the date, time in
         # seconds and time zone offset in the UTC ISO8601 string.
-        year, month, day_of_month, hours, minutes, seconds = (
-            date_time.GetDateWithTimeOfDay())
-
         try:
-          datetime_object = datetime.datetime(
-              year, month, day_of_month, hours, minutes, seconds,
-              tzinfo=pytz.UTC)
-
-          datetime_object = datetime_object.astimezone(
-              output_mediator.time_zone)
+          (year, month, day_of_month, hours, minutes, seconds,
+           time_zone_offset, _) = self._GetLocalDateTimeValues(
+               date_time, output_mediator.time_zone)
 
-          isoformat_string = datetime_object.isoformat()
-          iso8601_string = ''.join([
-              isoformat_string[:19], iso8601_string[19:-6],
-              isoformat_string[-6:]])
         except (OSError, OverflowError, TypeError, ValueError):
           return 'Invalid'
 
+        iso8601_string = ''.join([
+            (f'{year:04d}-{month:02d}-{day_of_month:02d}T{hours:02d}:'
+             f'{minutes:02d}:{seconds:02d}'),
+            iso8601_string[19:-6], time_zone_offset])
+
+      if lookup_key:
+        self._CacheDateTimeString(lookup_key, iso8601_string)
+
     else:
       if not event.date_time or event.date_time.is_local_time:
         timestamp = event.timestamp
@@ -143,15 +479,8 @@ class FieldFormattingHelper(object):
         return '0000-00-00T00:00:00.000000+00:00'
 
       try:
-        datetime_object = datetime.datetime(1970, 1, 1) + datetime.timedelta(
-            microseconds=timestamp)
-
-        datetime_object = datetime_object.astimezone(output_mediator.time_zone)
-
-        iso8601_string = datetime_object.isoformat()
-        iso8601_string = '{0:s}.{1:06d}{2:s}'.format(
-            iso8601_string[:19], datetime_object.microsecond,
-            iso8601_string[-6:])
+        iso8601_string = self._CopyTimestampToDateTimeString(
+            timestamp, output_mediator.time_zone)
 
       except (OSError, OverflowError, TypeError, ValueError) as exception:
         iso8601_string = '0000-00-00T00:00:00.000000+00:00'
@@ -303,16 +632,8 @@ class FieldFormattingHelper(object):
     Returns:
       str: message field.
     """
-    message_formatter = output_mediator.GetMessageFormatter(
-        event_data.data_type)
-    if not message_formatter:
-      logger.warning(
-          'Using default message formatter for data type: {0:s}'.format(
-              event_data.data_type))
-      message_formatter = self._DEFAULT_MESSAGE_FORMATTER
-
-    event_values = event_data.CopyToDict()
-    message_formatter.FormatEventValues(output_mediator, event_values)
+    message_formatter, event_values = self._GetFormattedEventValues(
+        output_mediator, event_data)
 
     return message_formatter.GetMessage(event_values)
 
@@ -330,16 +651,8 @@ class FieldFormattingHelper(object):
     Returns:
       str: short message field.
     """
-    message_formatter = output_mediator.GetMessageFormatter(
-        event_data.data_type)
-    if not message_formatter:
-      logger.warning(
-          'Using default message formatter for data type: {0:s}'.format(
-              event_data.data_type))
-      message_formatter = self._DEFAULT_MESSAGE_FORMATTER
-
-    event_values = event_data.CopyToDict()
-    message_formatter.FormatEventValues(output_mediator, event_values)
+    message_formatter, event_values = self._GetFormattedEventValues(
+        output_mediator, event_data)
 
     return message_formatter.GetMessageShort(event_values)
 
@@ -434,20 +747,12 @@ class FieldFormattingHelper(object):
       date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
           timestamp=event.timestamp)
 
-    year, month, day_of_month, hours, minutes, seconds = (
-        date_time.GetDateWithTimeOfDay())
+    _, _, _, hours, minutes, seconds = date_time.GetDateWithTimeOfDay()
 
     if output_mediator.time_zone != pytz.UTC:
       try:
-        datetime_object = datetime.datetime(
-            year, month, day_of_month, hours, minutes, seconds,
-            tzinfo=pytz.UTC)
-
-        datetime_object = datetime_object.astimezone(output_mediator.time_zone)
-
-        hours, minutes, seconds = (
-            datetime_object.hour, datetime_object.minute,
-            datetime_object.second)
+        _, _, _, hours, minutes, seconds, _, _ = self._GetLocalDateTimeValues(
+            date_time, output_mediator.time_zone)
 
       except (OSError, OverflowError, TypeError, ValueError):
         hours, minutes, seconds = (None, None, None)
@@ -485,17 +790,12 @@ class FieldFormattingHelper(object):
     if output_mediator.time_zone == pytz.UTC:
       return 'UTC'
 
-    year, month, day_of_month, hours, minutes, seconds = (
-        date_time.GetDateWithTimeOfDay())
-
     try:
-      # For tzname to work the datetime object must be naive (without
-      # a time zone).
-      datetime_object = datetime.datetime(
-          year, month, day_of_month, hours, minutes, seconds)
-      return output_mediator.time_zone.tzname(datetime_object)
+      _, _, _, _, _, _, _, time_zone_name = self._GetLocalDateTimeValues(
+          date_time, output_mediator.time_zone)
+      return time_zone_name
 
-    except (OverflowError, TypeError, ValueError):
+    except (OSError, OverflowError, TypeError, ValueError):
       self._ReportEventError(event, event_data, (
           'unable to copy timestamp: {0!s} to a human readable time zone. '
           'Defaulting to: "-"').format(event.timestamp))
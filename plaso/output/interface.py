@@ -7,7 +7,13 @@ from plaso.output import logger
 
 
 class OutputModule(object):
-  """Output module interface."""
+  """Output module interface.
+
+  The output engine passes events to the output module in their final order,
+  which is by timestamp and for events with the same timestamp by event values
+  hash and timestamp description. Output modules should not sort the events
+  again.
+  """
 
   NAME = ''
   DESCRIPTION = ''
@@ -18,6 +24,13 @@ class OutputModule(object):
   # Value to indicate the output module supports outputting custom fields.
   SUPPORTS_CUSTOM_FIELDS = False
 
+  # Value to indicate the output module supports writing the events of
+  # separate time ranges to separate output files that can be concatenated.
+  # This requires that the output of an event does not depend on preceding
+  # events in other time ranges and that the footer only writes buffered
+  # output.
+  SUPPORTS_TIME_RANGES = False
+
   # Value to indicate the output module writes to an output file.
   WRITES_OUTPUT_FILE = False
 
@@ -71,6 +84,15 @@ class OutputModule(object):
     """
     return []
 
+  # pylint: disable=redundant-returns-doc
+  def GetStatus(self):
+    """Retrieves the status of the output.
+
+    Returns:
+      OutputStatus: output status or None if not available.
+    """
+    return None
+
   def Open(self, **kwargs):  # pylint: disable=unused-argument
     """Opens the output."""
     return
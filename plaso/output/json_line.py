@@ -17,6 +17,8 @@ class JSONLineOutputModule(shared_json.SharedJSONOutputModule):
   NAME = 'json_line'
   DESCRIPTION = 'Saves the events into a JSON line format.'
 
+  SUPPORTS_TIME_RANGES = True
+
   def WriteFieldValues(self, output_mediator, field_values):
     """Writes field values to the output.
 
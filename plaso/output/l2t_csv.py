@@ -5,7 +5,6 @@ For documentation on the L2T CSV format see:
   https://forensics.wiki/l2t_csv
 """
 
-import datetime
 import pytz
 
 from acstore.containers import interface as containers_interface
@@ -141,20 +140,12 @@ class L2TCSVFieldFormattingHelper(formatting_helper.FieldFormattingHelper):
 
     # Note that GetDateWithTimeOfDay will return the date and time in UTC,
     # so no adjustment for date_time.time_zone_offset is needed.
-    year, month, day_of_month, hours, minutes, seconds = (
-        date_time.GetDateWithTimeOfDay())
+    year, month, day_of_month, _, _, _ = date_time.GetDateWithTimeOfDay()
 
     if output_mediator.time_zone != pytz.UTC:
       try:
-        datetime_object = datetime.datetime(
-            year, month, day_of_month, hours, minutes, seconds,
-            tzinfo=pytz.UTC)
-
-        datetime_object = datetime_object.astimezone(output_mediator.time_zone)
-
-        year = datetime_object.year
-        month = datetime_object.month
-        day_of_month = datetime_object.day
+        year, month, day_of_month, _, _, _, _, _ = (
+            self._GetLocalDateTimeValues(date_time, output_mediator.time_zone))
 
       except (OSError, OverflowError, TypeError, ValueError):
         year, month, day_of_month = (None, None, None)
@@ -181,21 +172,16 @@ class L2TCSVFieldFormattingHelper(formatting_helper.FieldFormattingHelper):
     Returns:
       str: extra attributes field.
     """
-    message_formatter = output_mediator.GetMessageFormatter(
-        event_data.data_type)
-    if not message_formatter:
-      logger.warning(
-          'Using default message formatter for data type: {0:s}'.format(
-              event_data.data_type))
-      message_formatter = self._DEFAULT_MESSAGE_FORMATTER
+    message_formatter = self._GetMessageFormatter(
+        output_mediator, event_data.data_type)
 
     formatted_attribute_names = (
         message_formatter.GetFormatStringAttributeNames())
-    formatted_attribute_names.update(self._RESERVED_VARIABLE_NAMES)
 
     extra_attributes = []
     for attribute_name, attribute_value in event_data.GetAttributes():
-      if attribute_name in formatted_attribute_names:
+      if (attribute_name in formatted_attribute_names or
+          attribute_name in self._RESERVED_VARIABLE_NAMES):
         continue
 
       # Ignore attribute container identifier and date and time values.
@@ -278,8 +264,6 @@ class L2TCSVOutputModule(text_file.SortedTextFileOutputModule):
       'user', 'host', 'short', 'desc', 'version', 'filename', 'inode', 'notes',
       'format', 'extra']
 
-  _SORT_KEY_FIELD_NAMES = ['time', 'filename', 'inode']
-
   def __init__(self):
     """Initializes an output module."""
     field_formatting_helper = L2TCSVFieldFormattingHelper()
@@ -83,6 +83,8 @@ class OutputMediator(object):
     Raises:
       KeyError: if the message formatter is already set for the corresponding
           data type and override existing is False.
+      RuntimeError: if a message formatter contains an invalid format string
+          piece.
     """
     message_formatters_file = yaml_formatters_file.YAMLFormattersFile()
     for message_formatter in message_formatters_file.ReadFromFile(path):
@@ -99,6 +101,8 @@ class OutputMediator(object):
         if custom_formatter_helper:
           message_formatter.AddHelper(custom_formatter_helper)
 
+      message_formatter.Compile()
+
       self._message_formatters[message_formatter.data_type] = message_formatter
       self._source_mappings[message_formatter.data_type] = (
           message_formatter.source_mapping)
@@ -365,6 +369,8 @@ class OutputMediator(object):
     Raises:
       KeyError: if the message formatter is already set for the corresponding
           data type.
+      RuntimeError: if a message formatter contains an invalid format string
+          piece.
     """
     for formatters_file_path in glob.glob(os.path.join(path, '*.yaml')):
       self._ReadMessageFormattersFile(formatters_file_path)
@@ -381,6 +387,8 @@ class OutputMediator(object):
     Raises:
       KeyError: if the message formatter is already set for the corresponding
           data type.
+      RuntimeError: if a message formatter contains an invalid format string
+          piece.
     """
     self._ReadMessageFormattersFile(path, override_existing=override_existing)
 
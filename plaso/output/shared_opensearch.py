@@ -1,13 +1,19 @@
 # -*- coding: utf-8 -*-
 """Shared functionality for OpenSearch output modules."""
 
+import collections
 import logging
 import os
+import queue
+import random
+import threading
+import time
+
+import pytz
 
 from acstore.containers import interface as containers_interface
 
 from dfdatetime import interface as dfdatetime_interface
-from dfdatetime import posix_time as dfdatetime_posix_time
 
 from dfvfs.serializer.json_serializer import JsonPathSpecSerializer
 
@@ -16,6 +22,7 @@ try:
 except ImportError:
   opensearchpy = None
 
+from plaso.engine import processing_status
 from plaso.lib import errors
 from plaso.output import formatting_helper
 from plaso.output import interface
@@ -62,11 +69,12 @@ class SharedOpenSearchFieldFormattingHelper(
       event_data_stream (EventDataStream): event data stream.
 
     Returns:
-      str: date and time field.
+      str: date and time field or None if the timestamp is out of bounds.
     """
-    date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-        timestamp=event.timestamp)
-    return date_time.CopyToDateTimeStringISO8601()
+    try:
+      return self._CopyTimestampToDateTimeString(event.timestamp, pytz.UTC)
+    except (OverflowError, TypeError, ValueError):
+      return None
 
   def _FormatTag(self, output_mediator, event_tag):
     """Formats an event tag field.
@@ -196,8 +204,14 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
   SUPPORTS_ADDITIONAL_FIELDS = True
   SUPPORTS_CUSTOM_FIELDS = True
 
+  # Default maximum size of the body of a bulk request in bytes.
+  _DEFAULT_BULK_REQUEST_SIZE = 5 * 1024 * 1024
+
   _DEFAULT_FLUSH_INTERVAL = 1000
 
+  # Default number of bulk requests that are sent concurrently.
+  _DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS = 2
+
   # Number of seconds to wait before a request to OpenSearch is timed out.
   _DEFAULT_REQUEST_TIMEOUT = 300
 
@@ -211,12 +225,29 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
       'timestamp',
       'timestamp_desc']
 
+  # Maximum number of times a bulk request or a document is retried.
+  _MAXIMUM_NUMBER_OF_RETRIES = 5
+
+  # Maximum number of bulk requests, per concurrent request, that are queued
+  # before writing field values blocks.
+  _MAXIMUM_NUMBER_OF_QUEUED_REQUESTS = 2
+
+  # Number of seconds to wait before the first retry, which is doubled for
+  # every subsequent retry up to the maximum.
+  _RETRY_DELAY = 0.5
+
+  _RETRY_DELAY_MAXIMUM = 30.0
+
   def __init__(self):
     """Initializes an output module."""
     super(SharedOpenSearchOutputModule, self).__init__()
+    self._bulk_request_queue = None
+    self._bulk_request_senders = []
+    self._bulk_request_size = self._DEFAULT_BULK_REQUEST_SIZE
     self._client = None
     self._custom_fields = {}
     self._event_documents = []
+    self._event_documents_size = 0
     self._field_names = self._DEFAULT_FIELD_NAMES
     self._field_formatting_helper = SharedOpenSearchFieldFormattingHelper()
     self._flush_interval = self._DEFAULT_FLUSH_INTERVAL
@@ -224,13 +255,54 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
     self._index_name = None
     self._mappings = None
     self._number_of_buffered_events = 0
+    self._number_of_concurrent_requests = (
+        self._DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS)
+    self._output_status = processing_status.OutputStatus()
+    self._output_status_lock = threading.Lock()
     self._password = None
     self._port = None
+    self._rejected_events_per_error_type = collections.Counter()
+    self._serializer = None
     self._username = None
+    self._use_http_compression = False
     self._use_ssl = None
     self._ca_certs = None
     self._url_prefix = None
 
+    if opensearchpy:
+      self._serializer = opensearchpy.serializer.JSONSerializer()
+
+  def _BufferEventDocument(self, field_values):
+    """Buffers an event document for a bulk insert into OpenSearch.
+
+    The buffered event documents are flushed when either the flush interval
+    or the bulk request size has been reached.
+
+    Args:
+      field_values (dict[str, str]): output field values per name.
+    """
+    event_document = {'index': {'_index': self._index_name}}
+
+    try:
+      event_document_data = '\n'.join([
+          self._serializer.dumps(event_document),
+          self._serializer.dumps(field_values), '']).encode('utf-8')
+
+    except (TypeError, ValueError,
+            opensearchpy.exceptions.SerializationError) as exception:
+      logger.warning(f'Unable to serialize event with error: {exception!s}')
+      self._UpdateOutputStatus(
+          number_of_rejected_events=1, error_type='serialization_error')
+      return
+
+    self._event_documents.append(event_document_data)
+    self._event_documents_size += len(event_document_data)
+    self._number_of_buffered_events += 1
+
+    if (self._number_of_buffered_events >= self._flush_interval or
+        self._event_documents_size >= self._bulk_request_size):
+      self._FlushEvents()
+
   def _Connect(self):
     """Connects to an OpenSearch server.
 
@@ -247,9 +319,16 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
     if self._username is not None:
       opensearch_http_auth = (self._username, self._password)
 
+    # The connection pool size is set to the number of concurrent bulk
+    # requests so that every request has its own connection. Retries are
+    # disabled in the client since failed bulk requests are retried with
+    # back-off by _SendBulkRequest.
     self._client = opensearchpy.OpenSearch(
         [opensearch_host],
         http_auth=opensearch_http_auth,
+        http_compress=self._use_http_compression,
+        max_retries=0,
+        pool_maxsize=max(self._number_of_concurrent_requests, 1),
         use_ssl=self._use_ssl,
         ca_certs=self._ca_certs)
 
@@ -268,7 +347,7 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
       RuntimeError: if the OpenSearch index cannot be created.
     """
     try:
-      if not self._client.indices.exists(index_name):
+      if not self._client.indices.exists(index=index_name):
         self._client.indices.create(
             body={'mappings': mappings}, index=index_name)
 
@@ -277,27 +356,107 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
           f'Unable to create OpenSearch index with error: {exception!s}')
 
   def _FlushEvents(self):
-    """Inserts the buffered event documents into OpenSearch."""
-    try:
-      # pylint: disable=unexpected-keyword-arg
-      bulk_arguments = {
-          'body': self._event_documents,
-          'index': self._index_name,
-          'request_timeout': self._DEFAULT_REQUEST_TIMEOUT}
+    """Queues the buffered event documents for a bulk insert into OpenSearch.
+
+    The bulk insert is done by the bulk request sender threads. If the
+    maximum number of queued bulk requests has been reached this function
+    blocks until a bulk request sender is available.
+    """
+    if not self._event_documents:
+      return
 
-      self._client.bulk(**bulk_arguments)
+    if not self._bulk_request_senders:
+      self._StartBulkRequestSenders()
 
-    except (ValueError,
-            opensearchpy.exceptions.OpenSearchException) as exception:
-      # Ignore problematic events
-      logger.warning(f'Unable to bulk insert with error: {exception!s}')
+    self._bulk_request_queue.put(self._event_documents)
 
-    logger.debug(
-        'Inserted {self._number_of_buffered_events:d} events into OpenSearch')
+    logger.debug((
+        f'Queued bulk insert of {self._number_of_buffered_events:d} events '
+        f'({self._event_documents_size:d} bytes) into OpenSearch'))
 
     self._event_documents = []
+    self._event_documents_size = 0
     self._number_of_buffered_events = 0
 
+  def _GetRetryDelay(self, number_of_retries):
+    """Retrieves the number of seconds to wait before a retry.
+
+    The delay is determined with exponential back-off and full jitter, to
+    prevent concurrent bulk requests from being retried in lockstep.
+
+    Args:
+      number_of_retries (int): number of the retry, where 1 represents the
+          first retry.
+
+    Returns:
+      float: number of seconds to wait.
+    """
+    maximum_delay = min(
+        self._RETRY_DELAY * (2 ** (number_of_retries - 1)),
+        self._RETRY_DELAY_MAXIMUM)
+
+    return random.uniform(0.0, maximum_delay)  # nosec
+
+  def _IsRetryableStatusCode(self, status_code):
+    """Determines if a request or document with a status code can be retried.
+
+    Args:
+      status_code (int|str): HTTP status code, where "N/A" represents that
+          the server could not be reached.
+
+    Returns:
+      bool: True if the request or document can be retried.
+    """
+    if not isinstance(status_code, int):
+      return True
+
+    return status_code == 429 or status_code >= 500
+
+  def _ProcessBulkResponse(self, event_documents, response):
+    """Processes the response of a bulk request.
+
+    Args:
+      event_documents (list[bytes]): serialized event documents of the bulk
+          request.
+      response (dict[str, object]): response of the bulk request.
+
+    Returns:
+      list[bytes]: serialized event documents that should be retried.
+    """
+    if not response.get('errors', False):
+      self._UpdateOutputStatus(number_of_written_events=len(event_documents))
+      return []
+
+    number_of_written_events = 0
+    retry_event_documents = []
+
+    for event_document, item in zip(
+        event_documents, response.get('items', None) or []):
+      result = next(iter(item.values()), None) or {}
+      status_code = result.get('status', None) or 0
+
+      if 200 <= status_code < 300:
+        number_of_written_events += 1
+
+      elif self._IsRetryableStatusCode(status_code):
+        retry_event_documents.append(event_document)
+
+      else:
+        error = result.get('error', None) or {}
+        if isinstance(error, dict):
+          error_type = error.get('type', None) or 'unknown'
+        else:
+          error_type = 'unknown'
+
+        logger.debug(
+            f'Unable to insert event into OpenSearch with error: {error!s}')
+        self._UpdateOutputStatus(
+            number_of_rejected_events=1, error_type=error_type)
+
+    self._UpdateOutputStatus(number_of_written_events=number_of_written_events)
+
+    return retry_event_documents
+
   def _SanitizeField(self, data_type, attribute_name, field):
     """Sanitizes a field for output.
 
@@ -318,13 +477,155 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
 
     return field
 
+  def _SendBulkRequest(self, event_documents):
+    """Inserts event documents into OpenSearch.
+
+    The bulk request is retried when OpenSearch cannot be reached or is
+    overloaded. When only part of the event documents are rejected because
+    OpenSearch is overloaded only those event documents are retried.
+
+    Args:
+      event_documents (list[bytes]): serialized event documents.
+    """
+    number_of_retries = 0
+
+    while event_documents:
+      request_body = b''.join(event_documents)
+
+      error_type = None
+      try:
+        # pylint: disable=unexpected-keyword-arg
+        response = self._client.bulk(
+            body=request_body, index=self._index_name,
+            request_timeout=self._DEFAULT_REQUEST_TIMEOUT)
+
+      except opensearchpy.exceptions.TransportError as exception:
+        if not self._IsRetryableStatusCode(exception.status_code):
+          error_type = f'http_status_{exception.status_code!s}'
+
+        elif number_of_retries >= self._MAXIMUM_NUMBER_OF_RETRIES:
+          error_type = 'maximum_number_of_retries'
+
+        if error_type:
+          logger.warning(f'Unable to bulk insert with error: {exception!s}')
+
+        response = None
+
+      except (ValueError,
+              opensearchpy.exceptions.OpenSearchException) as exception:
+        logger.warning(f'Unable to bulk insert with error: {exception!s}')
+        error_type = 'bulk_request_error'
+        response = None
+
+      if response is not None:
+        self._UpdateOutputStatus(number_of_bytes_written=len(request_body))
+
+        event_documents = self._ProcessBulkResponse(event_documents, response)
+        if (event_documents and
+            number_of_retries >= self._MAXIMUM_NUMBER_OF_RETRIES):
+          error_type = 'maximum_number_of_retries'
+
+      if error_type:
+        self._UpdateOutputStatus(
+            number_of_rejected_events=len(event_documents),
+            error_type=error_type)
+        break
+
+      if event_documents:
+        number_of_retries += 1
+        self._UpdateOutputStatus(number_of_retries=1)
+
+        time.sleep(self._GetRetryDelay(number_of_retries))
+
+  def _SendBulkRequests(self):
+    """Sends the queued bulk requests until the sentinel (None) is received."""
+    while True:
+      event_documents = self._bulk_request_queue.get()
+      try:
+        if event_documents is None:
+          break
+
+        self._SendBulkRequest(event_documents)
+
+      except Exception as exception:  # pylint: disable=broad-except
+        logger.error(f'Unable to bulk insert with error: {exception!s}')
+        self._UpdateOutputStatus(
+            number_of_rejected_events=len(event_documents),
+            error_type='bulk_request_error')
+
+      finally:
+        self._bulk_request_queue.task_done()
+
+  def _StartBulkRequestSenders(self):
+    """Starts the bulk request sender threads."""
+    number_of_concurrent_requests = max(self._number_of_concurrent_requests, 1)
+
+    self._bulk_request_queue = queue.Queue(
+        maxsize=number_of_concurrent_requests * (
+            self._MAXIMUM_NUMBER_OF_QUEUED_REQUESTS))
+
+    for _ in range(number_of_concurrent_requests):
+      bulk_request_sender = threading.Thread(
+          name='OpenSearch bulk request sender',
+          target=self._SendBulkRequests)
+      bulk_request_sender.daemon = True
+      bulk_request_sender.start()
+
+      self._bulk_request_senders.append(bulk_request_sender)
+
+  def _StopBulkRequestSenders(self):
+    """Waits for the queued bulk requests and stops the sender threads."""
+    for _ in self._bulk_request_senders:
+      self._bulk_request_queue.put(None)
+
+    for bulk_request_sender in self._bulk_request_senders:
+      bulk_request_sender.join()
+
+    self._bulk_request_queue = None
+    self._bulk_request_senders = []
+
+  def _UpdateOutputStatus(
+      self, error_type=None, number_of_bytes_written=0,
+      number_of_rejected_events=0, number_of_retries=0,
+      number_of_written_events=0):
+    """Updates the output status.
+
+    Args:
+      error_type (Optional[str]): type of the error the events were rejected
+          with.
+      number_of_bytes_written (Optional[int]): number of bytes written.
+      number_of_rejected_events (Optional[int]): number of rejected events.
+      number_of_retries (Optional[int]): number of retries.
+      number_of_written_events (Optional[int]): number of written events.
+    """
+    with self._output_status_lock:
+      self._output_status.number_of_bytes_written += number_of_bytes_written
+      self._output_status.number_of_rejected_events += (
+          number_of_rejected_events)
+      self._output_status.number_of_retries += number_of_retries
+      self._output_status.number_of_written_events += number_of_written_events
+
+      if error_type and number_of_rejected_events:
+        self._rejected_events_per_error_type[error_type] += (
+            number_of_rejected_events)
+
   def Close(self):
     """Closes connection to OpenSearch.
 
-    Inserts any remaining buffered event documents.
+    Inserts any remaining buffered event documents and waits for the queued
+    bulk requests to complete.
     """
     self._FlushEvents()
 
+    if self._bulk_request_senders:
+      self._StopBulkRequestSenders()
+
+    for error_type, number_of_rejected_events in sorted(
+        self._rejected_events_per_error_type.items()):
+      logger.warning((
+          f'OpenSearch rejected {number_of_rejected_events:d} events with '
+          f'error: {error_type:s}'))
+
     self._client = None
 
   def GetFieldValues(
@@ -399,6 +700,25 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
 
     return field_values
 
+  def GetStatus(self):
+    """Retrieves the status of the output.
+
+    Returns:
+      OutputStatus: output status.
+    """
+    output_status = processing_status.OutputStatus()
+
+    with self._output_status_lock:
+      output_status.number_of_bytes_written = (
+          self._output_status.number_of_bytes_written)
+      output_status.number_of_rejected_events = (
+          self._output_status.number_of_rejected_events)
+      output_status.number_of_retries = self._output_status.number_of_retries
+      output_status.number_of_written_events = (
+          self._output_status.number_of_written_events)
+
+    return output_status
+
   def SetAdditionalFields(self, field_names):
     """Sets the names of additional fields to output.
 
@@ -407,6 +727,16 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
     """
     self._field_names.extend(field_names)
 
+  def SetBulkRequestSize(self, bulk_request_size):
+    """Sets the maximum size of a bulk request.
+
+    Args:
+      bulk_request_size (int): maximum size of the body of a bulk request
+          in bytes.
+    """
+    self._bulk_request_size = bulk_request_size
+    logger.debug(f'OpenSearch bulk request size: {bulk_request_size:d}')
+
   def SetCustomFields(self, field_names_and_values):
     """Sets the names and values of custom fields to output.
 
@@ -444,6 +774,18 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
     """
     self._mappings = mappings
 
+  def SetNumberOfConcurrentRequests(self, number_of_concurrent_requests):
+    """Sets the number of bulk requests that are sent concurrently.
+
+    Args:
+      number_of_concurrent_requests (int): number of bulk requests that are
+          sent concurrently.
+    """
+    self._number_of_concurrent_requests = number_of_concurrent_requests
+    logger.debug((
+        f'OpenSearch number of concurrent requests: '
+        f'{number_of_concurrent_requests:d}'))
+
   def SetPassword(self, password):
     """Sets the password.
 
@@ -473,6 +815,16 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
     self._username = username
     logger.debug(f'OpenSearch username: {username!s}')
 
+  def SetUseHTTPCompression(self, use_http_compression):
+    """Sets the use of HTTP compression.
+
+    Args:
+      use_http_compression (bool): True if the bodies of requests should be
+          compressed with gzip.
+    """
+    self._use_http_compression = use_http_compression
+    logger.debug(f'OpenSearch use HTTP compression: {use_http_compression!s}')
+
   def SetUseSSL(self, use_ssl):
     """Sets the use of ssl.
 
@@ -510,3 +862,14 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
     """
     self._url_prefix = url_prefix
     logger.debug('OpenSearch URL prefix: {0!s}')
+
+  def WriteFooter(self):
+    """Writes the footer to the output.
+
+    Inserts any remaining buffered event documents and waits for the queued
+    bulk requests to complete, so that the output status is final.
+    """
+    self._FlushEvents()
+
+    if self._bulk_request_queue:
+      self._bulk_request_queue.join()
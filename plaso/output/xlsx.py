@@ -5,10 +5,10 @@ import datetime
 import os
 import re
 
-import pytz
 import xlsxwriter
 
 from plaso.output import dynamic
+from plaso.output import formatting_helper
 from plaso.output import interface
 from plaso.output import manager
 
@@ -44,6 +44,7 @@ class XLSXOutputModule(interface.OutputModule):
     self._column_widths = []
     self._current_row = 0
     self._custom_fields = {}
+    self._date_time_formatting_cache = None
     self._field_formatting_helper = dynamic.DynamicFieldFormattingHelper()
     self._field_names = self._DEFAULT_FIELDS
     self._sheet = None
@@ -66,13 +67,19 @@ class XLSXOutputModule(interface.OutputModule):
       datetime.datetime|str: date and time value or a string containing
           "ERROR" on OverflowError.
     """
+    time_zone = output_mediator.time_zone
+    if (not self._date_time_formatting_cache or
+        self._date_time_formatting_cache.time_zone != time_zone):
+      self._date_time_formatting_cache = (
+          formatting_helper.DateTimeFormattingCache(time_zone))
+
     try:
-      datetime_object = datetime.datetime(
-          1970, 1, 1, 0, 0, 0, 0, tzinfo=pytz.UTC)
-      datetime_object += datetime.timedelta(microseconds=event.timestamp)
-      datetime_object.astimezone(output_mediator.time_zone)
+      timestamp, microseconds = divmod(event.timestamp, 1000000)
+      year, month, day_of_month, hours, minutes, seconds, _, _ = (
+          self._date_time_formatting_cache.GetDateTimeValues(timestamp))
 
-      return datetime_object.replace(tzinfo=None)
+      return datetime.datetime(
+          year, month, day_of_month, hours, minutes, seconds, microseconds)
 
     except (OSError, OverflowError, TypeError, ValueError) as exception:
       self._ReportEventError(event, event_data, (
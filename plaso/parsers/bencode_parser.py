@@ -147,6 +147,8 @@ class BencodeParser(interface.FileObjectParser):
   NAME = 'bencode'
   DATA_FORMAT = 'Bencoded file'
 
+  DATA_STREAM_PREFIXES = frozenset([b'd'])
+
   # Regex match for a bencode dictionary followed by a field size.
   _BENCODE_RE = re.compile(b'd[0-9]')
 
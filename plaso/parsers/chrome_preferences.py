@@ -87,6 +87,8 @@ class ChromePreferencesParser(interface.FileObjectParser):
 
   DATA_FORMAT = 'Google Chrome Preferences file'
 
+  DATA_STREAM_PREFIXES = frozenset([b'{'])
+
   REQUIRED_KEYS = frozenset(['browser', 'extensions'])
 
   _ENCODING = 'utf-8'
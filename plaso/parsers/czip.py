@@ -19,6 +19,9 @@ class CompoundZIPParser(interface.FileObjectParser):
   NAME = 'czip'
   DATA_FORMAT = 'Compound ZIP file'
 
+  # A ZIP file contains at least an end of central directory record.
+  MINIMUM_DATA_STREAM_SIZE = 22
+
   _plugin_classes = {}
 
   def ParseFileObject(self, parser_mediator, file_object):
@@ -144,6 +144,10 @@ class FirefoxCacheParser(
   NAME = 'firefox_cache'
   DATA_FORMAT = 'Mozilla Firefox Cache version 1 file (version 31 or earlier)'
 
+  FILTERS = frozenset([
+      interface.FileNamePrefixFileEntryFilter('_CACHE_00'),
+      interface.FileNameRegexFileEntryFilter(r'^[0-9A-Fa-f]{5}m[0-9]{2}$')])
+
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'firefox_cache.yaml')
 
@@ -366,6 +370,9 @@ class FirefoxCache2Parser(
   NAME = 'firefox_cache2'
   DATA_FORMAT = 'Mozilla Firefox Cache version 2 file (version 32 or later)'
 
+  FILTERS = frozenset([
+      interface.FileNameRegexFileEntryFilter(r'^[0-9A-Fa-f]{40}$')])
+
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'firefox_cache.yaml')
 
@@ -381,6 +388,8 @@ class FirefoxCache2Parser(
   # location in the file.
   _MINIMUM_FILE_SIZE = 36
 
+  MINIMUM_DATA_STREAM_SIZE = _MINIMUM_FILE_SIZE
+
   def _GetCacheFileMetadataHeaderOffset(self, file_object):
     """Determines the offset of the cache file metadata header.
 
@@ -40,6 +40,9 @@ class FishHistoryParser(interface.FileObjectParser):
   NAME = 'fish_history'
   DATA_FORMAT = 'Fish history file'
 
+  FILTERS = frozenset([
+      interface.FileNameFileEntryFilter('fish_history')])
+
   _ENCODING = 'utf-8'
 
   # 50 MiB is the maximum supported fish history file size.
@@ -3,6 +3,7 @@
 
 import abc
 import os
+import re
 
 from plaso.lib import errors
 
@@ -35,6 +36,11 @@ class FileNameFileEntryFilter(BaseFileEntryFilter):
     super(FileNameFileEntryFilter, self).__init__()
     self._filename = filename.lower()
 
+  @property
+  def filename(self):
+    """str: lower case name of the file."""
+    return self._filename
+
   def Match(self, file_entry):
     """Determines if a file entry matches the filter.
 
@@ -51,6 +57,62 @@ class FileNameFileEntryFilter(BaseFileEntryFilter):
     return filename == self._filename
 
 
+class FileNamePrefixFileEntryFilter(BaseFileEntryFilter):
+  """File name prefix file entry filter."""
+
+  def __init__(self, prefix):
+    """Initializes a file entry filter.
+
+    Args:
+      prefix (str): prefix of the name of the file.
+    """
+    super(FileNamePrefixFileEntryFilter, self).__init__()
+    self._prefix = prefix.lower()
+
+  def Match(self, file_entry):
+    """Determines if a file entry matches the filter.
+
+    Args:
+      file_entry (dfvfs.FileEntry): a file entry.
+
+    Returns:
+      bool: True if the file entry matches the filter.
+    """
+    if not file_entry:
+      return False
+
+    filename = file_entry.name.lower()
+    return filename.startswith(self._prefix)
+
+
+class FileNameRegexFileEntryFilter(BaseFileEntryFilter):
+  """File name regular expression file entry filter."""
+
+  def __init__(self, pattern):
+    """Initializes a file entry filter.
+
+    Args:
+      pattern (str): regular expression pattern the name of the file should
+          match.
+    """
+    super(FileNameRegexFileEntryFilter, self).__init__()
+    self._regex = re.compile(pattern)
+
+  def Match(self, file_entry):
+    """Determines if a file entry matches the filter.
+
+    Args:
+      file_entry (dfvfs.FileEntry): a file entry.
+
+    Returns:
+      bool: True if the file entry matches the filter.
+    """
+    if not file_entry:
+      return False
+
+    return bool(self._regex.match(file_entry.name))
+
+
 class BaseParser(object):
   """The parser interface."""
 
@@ -66,6 +128,14 @@ class BaseParser(object):
   # List of filters that should match for the parser to be applied.
   FILTERS = frozenset()
 
+  # Byte sequences of which one should be at the start of the data stream for
+  # the parser to be applied, where an empty set represents any data stream.
+  # This is used to pre-filter parsers that do not define a format signature.
+  DATA_STREAM_PREFIXES = frozenset()
+
+  # Minimum size of the data stream, in bytes, for the parser to be applied.
+  MINIMUM_DATA_STREAM_SIZE = 0
+
   ALL_PLUGINS = set(['*'])
 
   # Every derived parser class that implements plugins should define
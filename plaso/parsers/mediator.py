@@ -56,10 +56,12 @@ class ParserMediator(object):
     self._environment_variables_per_path_spec = None
     self._event_data_stream = None
     self._event_data_stream_identifier = None
+    self._event_data_stream_values_hash = None
     self._extract_winevt_resources = True
     self._extract_winreg_binary_values = False
     self._file_entry = None
     self._format_checks_cpu_time_profiler = None
+    self._format_checks_index_profiler = None
     self._language_tag = None
     self._last_event_data_hash = None
     self._last_event_data_identifier = None
@@ -486,7 +488,8 @@ class ParserMediator(object):
           self._event_data_stream_identifier)
 
     event_values_hash = events.CalculateEventValuesHash(
-        event_data, self._event_data_stream)
+        event_data, self._event_data_stream,
+        event_data_stream_values_hash=self._event_data_stream_values_hash)
     setattr(event_data, '_event_values_hash', event_values_hash)
 
     self._storage_writer.AddAttributeContainer(event_data)
@@ -510,6 +513,7 @@ class ParserMediator(object):
     if not event_data_stream:
       self._event_data_stream = None
       self._event_data_stream_identifier = None
+      self._event_data_stream_values_hash = None
     else:
       if not event_data_stream.path_spec:
         event_data_stream.path_spec = getattr(
@@ -520,6 +524,11 @@ class ParserMediator(object):
       self._event_data_stream = event_data_stream
       self._event_data_stream_identifier = event_data_stream.GetIdentifier()
 
+      # The event data stream values hash is calculated once per event data
+      # stream instead of for every event data produced.
+      self._event_data_stream_values_hash = (
+          events.CalculateEventDataStreamValuesHash(event_data_stream))
+
     self.last_activity_timestamp = time.time()
 
   def ProduceEventSource(self, event_source):
@@ -604,6 +613,22 @@ class ParserMediator(object):
     """Resets the active file entry."""
     self._file_entry = None
 
+  def SampleFormatCheckIndex(
+      self, parser_name, number_of_hits, number_of_misses, number_of_skipped):
+    """Takes a sample of a format check index lookup for profiling.
+
+    Args:
+      parser_name (str): name of the parser.
+      number_of_hits (int): number of candidate plugins returned by the index
+          that matched the format.
+      number_of_misses (int): number of candidate plugins returned by the
+          index that did not match the format.
+      number_of_skipped (int): number of plugins not returned by the index.
+    """
+    if self._format_checks_index_profiler:
+      self._format_checks_index_profiler.Sample(
+          parser_name, number_of_hits, number_of_misses, number_of_skipped)
+
   def SampleFormatCheckStartTiming(self, parser_name):
     """Starts timing a CPU time sample for profiling.
 
@@ -676,6 +701,7 @@ class ParserMediator(object):
     """
     self._event_data_stream = None
     self._event_data_stream_identifier = None
+    self._event_data_stream_values_hash = None
     self._file_entry = file_entry
 
   def SetPreferredCodepage(self, code_page):
@@ -754,6 +780,10 @@ class ParserMediator(object):
           identifier, configuration)
       self._format_checks_cpu_time_profiler.Start()
 
+      self._format_checks_index_profiler = profilers.IndexProfiler(
+          identifier, configuration)
+      self._format_checks_index_profiler.Start()
+
     if configuration.HaveProfileParsers():
       identifier = f'{identifier:s}-parsers'
 
@@ -773,6 +803,10 @@ class ParserMediator(object):
       self._format_checks_cpu_time_profiler.Stop()
       self._format_checks_cpu_time_profiler = None
 
+    if self._format_checks_index_profiler:
+      self._format_checks_index_profiler.Stop()
+      self._format_checks_index_profiler = None
+
     if self._parsers_cpu_time_profiler:
       self._parsers_cpu_time_profiler.Stop()
       self._parsers_cpu_time_profiler = None
@@ -70,6 +70,8 @@ class OperaTypedHistoryParser(interface.FileObjectParser):
   NAME = 'opera_typed_history'
   DATA_FORMAT = 'Opera typed history (typed_history.xml) file'
 
+  DATA_STREAM_PREFIXES = frozenset([b'<?xml'])
+
   _HEADER_READ_SIZE = 128
 
   def ParseFileObject(self, parser_mediator, file_object):
@@ -49,6 +49,9 @@ class WinRecycleBinParser(
   NAME = 'recycle_bin'
   DATA_FORMAT = 'Windows $Recycle.Bin $I file'
 
+  FILTERS = frozenset([
+      interface.FileNamePrefixFileEntryFilter('$I')])
+
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'recycler.yaml')
 
@@ -147,6 +150,9 @@ class WinRecyclerInfo2Parser(
   NAME = 'recycle_bin_info2'
   DATA_FORMAT = 'Windows Recycler INFO2 file'
 
+  FILTERS = frozenset([
+      interface.FileNamePrefixFileEntryFilter('INFO2')])
+
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'recycler.yaml')
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """SQLite parser."""
 
+import collections
 import os
 import sqlite3
 import tempfile
@@ -305,6 +306,53 @@ class SQLiteParser(interface.FileEntryParser):
 
   _plugin_classes = {}
 
+  def __init__(self):
+    """Initializes a SQLite parser."""
+    super(SQLiteParser, self).__init__()
+    self._number_of_required_tables_per_plugin_name = None
+    self._plugin_names_per_table_name = None
+
+  def _CreatePluginIndex(self):
+    """Creates an index of the enabled plugins per required table name."""
+    self._number_of_required_tables_per_plugin_name = {}
+    self._plugin_names_per_table_name = collections.defaultdict(list)
+
+    for plugin_name, plugin in self._plugins_per_name.items():
+      # Plugins without a required structure never match a database, see
+      # SQLitePlugin.CheckRequiredTablesAndColumns.
+      if not plugin.REQUIRED_STRUCTURE:
+        continue
+
+      self._number_of_required_tables_per_plugin_name[plugin_name] = len(
+          plugin.REQUIRED_STRUCTURE)
+
+      for table_name in plugin.REQUIRED_STRUCTURE.keys():
+        self._plugin_names_per_table_name[table_name].append(plugin_name)
+
+  def _GetPluginsWithRequiredTables(self, database):
+    """Retrieves the enabled plugins of which the required tables are present.
+
+    Args:
+      database (SQLiteDatabase): database.
+
+    Returns:
+      list[SQLitePlugin]: plugins of which the required tables are present in
+          the database, in order of the enabled plugins.
+    """
+    if self._plugin_names_per_table_name is None:
+      self._CreatePluginIndex()
+
+    number_of_tables_per_plugin_name = collections.Counter()
+    for table_name in database.tables:
+      number_of_tables_per_plugin_name.update(
+          self._plugin_names_per_table_name.get(table_name, []))
+
+    return [
+        plugin for plugin_name, plugin in self._plugins_per_name.items()
+        if number_of_tables_per_plugin_name[plugin_name] == (
+            self._number_of_required_tables_per_plugin_name.get(
+                plugin_name, -1))]
+
   def _OpenDatabaseWithWAL(
       self, parser_mediator, database_file_entry, database_file_object,
       filename):
@@ -366,6 +414,10 @@ class SQLiteParser(interface.FileEntryParser):
       database (SQLiteDatabase): database.
       display_name (str): display name.
       cache (SQLiteCache): cache.
+
+    Returns:
+      bool: True if the database has the tables and columns required by
+          the plugin.
     """
     profiling_name = '/'.join([self.NAME, plugin.NAME])
 
@@ -379,7 +431,7 @@ class SQLiteParser(interface.FileEntryParser):
     if not result:
       logger.debug('Skipped parsing file: {0:s} with plugin: {1:s}'.format(
           display_name, plugin.NAME))
-      return
+      return False
 
     logger.debug('Parsing file: {0:s} with plugin: {1:s}'.format(
         display_name, plugin.NAME))
@@ -404,6 +456,34 @@ class SQLiteParser(interface.FileEntryParser):
     finally:
       parser_mediator.SampleStopTiming(profiling_name)
 
+    return True
+
+  def _ParseFileEntryWithPlugins(
+      self, parser_mediator, database, display_name, cache):
+    """Parses a SQLite database file entry with the matching plugins.
+
+    Only the plugins of which the required tables are present in the database,
+    according to the plugin index, are checked and applied.
+
+    Args:
+      parser_mediator (ParserMediator): parser mediator.
+      database (SQLiteDatabase): database.
+      display_name (str): display name.
+      cache (SQLiteCache): cache.
+    """
+    plugins_with_required_tables = self._GetPluginsWithRequiredTables(database)
+
+    number_of_hits = 0
+    for plugin in plugins_with_required_tables:
+      if self._ParseFileEntryWithPlugin(
+          parser_mediator, plugin, database, display_name, cache):
+        number_of_hits += 1
+
+    number_of_candidates = len(plugins_with_required_tables)
+    parser_mediator.SampleFormatCheckIndex(
+        self.NAME, number_of_hits, number_of_candidates - number_of_hits,
+        len(self._plugins_per_name) - number_of_candidates)
+
   @classmethod
   def GetFormatSpecification(cls):
     """Retrieves the format specification.
@@ -415,6 +495,20 @@ class SQLiteParser(interface.FileEntryParser):
     format_specification.AddNewSignature(b'SQLite format 3', offset=0)
     return format_specification
 
+  def EnablePlugins(self, plugin_includes):
+    """Enables parser plugins.
+
+    Args:
+      plugin_includes (set[str]): names of the plugins to enable, where
+          set(['*']) represents all plugins. Note the default plugin, if
+          it exists, is always enabled and cannot be disabled.
+    """
+    super(SQLiteParser, self).EnablePlugins(plugin_includes)
+
+    # The plugin index is created on first use.
+    self._number_of_required_tables_per_plugin_name = None
+    self._plugin_names_per_table_name = None
+
   def ParseFileEntry(self, parser_mediator, file_entry):
     """Parses a SQLite database file entry.
 
@@ -441,9 +535,8 @@ class SQLiteParser(interface.FileEntryParser):
     display_name = parser_mediator.GetDisplayName(file_entry=file_entry)
 
     try:
-      for plugin in self._plugins_per_name.values():
-        self._ParseFileEntryWithPlugin(
-            parser_mediator, plugin, database, display_name, cache)
+      self._ParseFileEntryWithPlugins(
+          parser_mediator, database, display_name, cache)
     finally:
       database.Close()
 
@@ -468,9 +561,8 @@ class SQLiteParser(interface.FileEntryParser):
     display_name = parser_mediator.GetDisplayName(file_entry=wal_file_entry)
 
     try:
-      for plugin in self._plugins_per_name.values():
-        self._ParseFileEntryWithPlugin(
-            parser_mediator, plugin, database_wal, display_name, cache)
+      self._ParseFileEntryWithPlugins(
+          parser_mediator, database_wal, display_name, cache)
     finally:
       database_wal.Close()
 
@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+"""Binary attribute container serializer."""
+
+import struct
+
+
+class BinaryAttributeContainerSerializer(object):
+  """Binary attribute container serializer.
+
+  The binary serializer encodes the serialized dictionary form of an attribute
+  container, as created by the JSON attribute container serializer, with the
+  attribute names stored once per schema instead of in every serialized
+  attribute container.
+
+  A schema defines the names of the attributes of attribute containers of
+  a specific container type and data type. When an attribute container has
+  attributes that are not defined by the current schema of its container and
+  data type, a new schema is added that extends the current schema.
+
+  A binary serialized attribute container consists of:
+  * the identifier of the schema, a 16-bit little-endian integer;
+  * the values of the attributes in the order defined by the schema, where
+    values of trailing attributes that are not set are omitted.
+
+  Every value starts with a type indicator byte, followed by the data of
+  the value, where integers are stored little-endian and strings are stored
+  UTF-8 encoded, including surrogates.
+  """
+
+  # The maximum schema identifier.
+  _MAXIMUM_SCHEMA_IDENTIFIER = 0xffff
+
+  # Value type indicators.
+  _VALUE_TYPE_NOT_SET = 0
+  _VALUE_TYPE_NONE = 1
+  _VALUE_TYPE_FALSE = 2
+  _VALUE_TYPE_TRUE = 3
+  _VALUE_TYPE_INT8 = 4
+  _VALUE_TYPE_INT16 = 5
+  _VALUE_TYPE_INT32 = 6
+  _VALUE_TYPE_INT64 = 7
+  _VALUE_TYPE_INTEGER_STRING = 8
+  _VALUE_TYPE_FLOAT = 9
+  _VALUE_TYPE_STRING8 = 10
+  _VALUE_TYPE_STRING32 = 11
+  _VALUE_TYPE_LIST = 12
+  _VALUE_TYPE_DICT = 13
+
+  _STRUCT_FLOAT = struct.Struct('<d')
+  _STRUCT_INT8 = struct.Struct('<b')
+  _STRUCT_INT16 = struct.Struct('<h')
+  _STRUCT_INT32 = struct.Struct('<i')
+  _STRUCT_INT64 = struct.Struct('<q')
+  _STRUCT_UINT16 = struct.Struct('<H')
+  _STRUCT_UINT32 = struct.Struct('<I')
+
+  def __init__(self):
+    """Initializes a binary attribute container serializer."""
+    super(BinaryAttributeContainerSerializer, self).__init__()
+    self._new_schema_identifiers = []
+    self._schema_identifier_per_data_type = {}
+    self._schemas = {}
+
+  def _AddSchema(self, identifier, container_type, data_type, attribute_names):
+    """Adds a schema.
+
+    Args:
+      identifier (int): identifier of the schema.
+      container_type (str): attribute container type.
+      data_type (str): data type or None if not available.
+      attribute_names (tuple[str]): names of the attributes.
+    """
+    self._schemas[identifier] = (container_type, data_type, attribute_names)
+
+    lookup_key = (container_type, data_type)
+    current_identifier = self._schema_identifier_per_data_type.get(
+        lookup_key, 0)
+    if identifier > current_identifier:
+      self._schema_identifier_per_data_type[lookup_key] = identifier
+
+  def _GetSchemaIdentifier(self, container_type, data_type, attribute_names):
+    """Retrieves the identifier of a schema that defines specific attributes.
+
+    Args:
+      container_type (str): attribute container type.
+      data_type (str): data type or None if not available.
+      attribute_names (list[str]): names of the attributes.
+
+    Returns:
+      int: identifier of the schema.
+
+    Raises:
+      ValueError: if the maximum number of schemas has been reached.
+    """
+    lookup_key = (container_type, data_type)
+    identifier = self._schema_identifier_per_data_type.get(lookup_key, None)
+
+    schema_attribute_names = ()
+    if identifier:
+      _, _, schema_attribute_names = self._schemas[identifier]
+
+      if not set(attribute_names).difference(schema_attribute_names):
+        return identifier
+
+    identifier = len(self._schemas) + 1
+    if identifier > self._MAXIMUM_SCHEMA_IDENTIFIER:
+      raise ValueError('Maximum number of schemas reached.')
+
+    new_attribute_names = [
+        name for name in attribute_names if name not in schema_attribute_names]
+    schema_attribute_names = schema_attribute_names + tuple(
+        new_attribute_names)
+
+    self._AddSchema(
+        identifier, container_type, data_type, schema_attribute_names)
+    self._new_schema_identifiers.append(identifier)
+
+    return identifier
+
+  def _ReadValue(self, data, offset):
+    """Reads a value.
+
+    Args:
+      data (bytes): binary serialized data.
+      offset (int): offset of the value in the data.
+
+    Returns:
+      tuple[object, int]: value and offset of the next value.
+
+    Raises:
+      ValueError: if the value type is not supported.
+    """
+    value_type = data[offset]
+    offset += 1
+
+    if value_type == self._VALUE_TYPE_STRING8:
+      size = data[offset]
+      offset += 1
+      value = data[offset:offset + size].decode('utf-8', 'surrogatepass')
+      return value, offset + size
+
+    if value_type == self._VALUE_TYPE_STRING32:
+      size = self._STRUCT_UINT32.unpack_from(data, offset)[0]
+      offset += 4
+      value = data[offset:offset + size].decode('utf-8', 'surrogatepass')
+      return value, offset + size
+
+    if value_type == self._VALUE_TYPE_INT8:
+      return self._STRUCT_INT8.unpack_from(data, offset)[0], offset + 1
+
+    if value_type == self._VALUE_TYPE_INT16:
+      return self._STRUCT_INT16.unpack_from(data, offset)[0], offset + 2
+
+    if value_type == self._VALUE_TYPE_INT32:
+      return self._STRUCT_INT32.unpack_from(data, offset)[0], offset + 4
+
+    if value_type == self._VALUE_TYPE_INT64:
+      return self._STRUCT_INT64.unpack_from(data, offset)[0], offset + 8
+
+    if value_type == self._VALUE_TYPE_NONE:
+      return None, offset
+
+    if value_type == self._VALUE_TYPE_FALSE:
+      return False, offset
+
+    if value_type == self._VALUE_TYPE_TRUE:
+      return True, offset
+
+    if value_type == self._VALUE_TYPE_LIST:
+      number_of_values = self._STRUCT_UINT32.unpack_from(data, offset)[0]
+      offset += 4
+
+      value = []
+      for _ in range(number_of_values):
+        element, offset = self._ReadValue(data, offset)
+        value.append(element)
+
+      return value, offset
+
+    if value_type == self._VALUE_TYPE_DICT:
+      number_of_values = self._STRUCT_UINT32.unpack_from(data, offset)[0]
+      offset += 4
+
+      value = {}
+      for _ in range(number_of_values):
+        key, offset = self._ReadValue(data, offset)
+        value[key], offset = self._ReadValue(data, offset)
+
+      return value, offset
+
+    if value_type == self._VALUE_TYPE_FLOAT:
+      return self._STRUCT_FLOAT.unpack_from(data, offset)[0], offset + 8
+
+    if value_type == self._VALUE_TYPE_INTEGER_STRING:
+      string, offset = self._ReadValue(data, offset)
+      return int(string, 10), offset
+
+    raise ValueError(f'Unsupported value type: {value_type:d}')
+
+  def _WriteValue(self, value, data):
+    """Writes a value.
+
+    Args:
+      value (object): value.
+      data (bytearray): binary serialized data to append the value to.
+
+    Raises:
+      TypeError: if the type of the value is not supported.
+    """
+    if isinstance(value, str):
+      encoded_value = value.encode('utf-8', 'surrogatepass')
+      size = len(encoded_value)
+      if size <= 0xff:
+        data.append(self._VALUE_TYPE_STRING8)
+        data.append(size)
+      else:
+        data.append(self._VALUE_TYPE_STRING32)
+        data.extend(self._STRUCT_UINT32.pack(size))
+
+      data.extend(encoded_value)
+
+    elif value is None:
+      data.append(self._VALUE_TYPE_NONE)
+
+    elif value is False:
+      data.append(self._VALUE_TYPE_FALSE)
+
+    elif value is True:
+      data.append(self._VALUE_TYPE_TRUE)
+
+    elif isinstance(value, int):
+      if -0x80 <= value <= 0x7f:
+        data.append(self._VALUE_TYPE_INT8)
+        data.extend(self._STRUCT_INT8.pack(value))
+      elif -0x8000 <= value <= 0x7fff:
+        data.append(self._VALUE_TYPE_INT16)
+        data.extend(self._STRUCT_INT16.pack(value))
+      elif -0x80000000 <= value <= 0x7fffffff:
+        data.append(self._VALUE_TYPE_INT32)
+        data.extend(self._STRUCT_INT32.pack(value))
+      elif -0x8000000000000000 <= value <= 0x7fffffffffffffff:
+        data.append(self._VALUE_TYPE_INT64)
+        data.extend(self._STRUCT_INT64.pack(value))
+      else:
+        data.append(self._VALUE_TYPE_INTEGER_STRING)
+        self._WriteValue(f'{value:d}', data)
+
+    elif isinstance(value, float):
+      data.append(self._VALUE_TYPE_FLOAT)
+      data.extend(self._STRUCT_FLOAT.pack(value))
+
+    elif isinstance(value, (list, tuple)):
+      data.append(self._VALUE_TYPE_LIST)
+      data.extend(self._STRUCT_UINT32.pack(len(value)))
+      for element in value:
+        self._WriteValue(element, data)
+
+    elif isinstance(value, dict):
+      data.append(self._VALUE_TYPE_DICT)
+      data.extend(self._STRUCT_UINT32.pack(len(value)))
+      for key, element in value.items():
+        if not isinstance(key, str):
+          raise TypeError(f'Unsupported dictionary key type: {type(key)!s}')
+
+        self._WriteValue(key, data)
+        self._WriteValue(element, data)
+
+    else:
+      raise TypeError(f'Unsupported value type: {type(value)!s}')
+
+  def AddSchema(self, identifier, container_type, data_type, attribute_names):
+    """Adds a schema, such as a schema that was read from storage.
+
+    Args:
+      identifier (int): identifier of the schema.
+      container_type (str): attribute container type.
+      data_type (str): data type or None if not available.
+      attribute_names (list[str]): names of the attributes.
+    """
+    self._AddSchema(
+        identifier, container_type, data_type, tuple(attribute_names))
+
+  def GetSchema(self, identifier):
+    """Retrieves a schema.
+
+    Args:
+      identifier (int): identifier of the schema.
+
+    Returns:
+      tuple[str, str, tuple[str]]: container type, data type and names of
+          the attributes of the schema or None if not available.
+    """
+    return self._schemas.get(identifier, None)
+
+  def GetSchemaIdentifier(self, serialized_data):
+    """Retrieves the identifier of the schema of binary serialized data.
+
+    Args:
+      serialized_data (bytes): binary serialized attribute container.
+
+    Returns:
+      int: identifier of the schema.
+
+    Raises:
+      ValueError: if the schema identifier cannot be read.
+    """
+    try:
+      return self._STRUCT_UINT16.unpack_from(serialized_data, 0)[0]
+    except struct.error as exception:
+      raise ValueError(
+          f'Unable to read schema identifier with error: {exception!s}')
+
+  def PopNewSchemaIdentifiers(self):
+    """Retrieves the identifiers of the schemas added by serialization.
+
+    Returns:
+      list[int]: identifiers of the schemas that were added by WriteSerialized
+          since the last time this method was called.
+    """
+    new_schema_identifiers = self._new_schema_identifiers
+    self._new_schema_identifiers = []
+    return new_schema_identifiers
+
+  def ReadSerialized(self, serialized_data):
+    """Reads an attribute container dictionary from binary serialized form.
+
+    Args:
+      serialized_data (bytes): binary serialized attribute container.
+
+    Returns:
+      dict[str, object]: JSON serialized objects of the attribute container.
+
+    Raises:
+      ValueError: if the schema or a value type is not supported or the data
+          is truncated.
+    """
+    identifier = self.GetSchemaIdentifier(serialized_data)
+
+    schema = self._schemas.get(identifier, None)
+    if not schema:
+      raise ValueError(f'Unsupported schema identifier: {identifier:d}')
+
+    container_type, data_type, attribute_names = schema
+
+    json_dict = {
+        '__type__': 'AttributeContainer',
+        '__container_type__': container_type}
+
+    if data_type is not None:
+      json_dict['data_type'] = data_type
+
+    data_size = len(serialized_data)
+    offset = 2
+
+    try:
+      for attribute_name in attribute_names:
+        if offset >= data_size:
+          break
+
+        if serialized_data[offset] == self._VALUE_TYPE_NOT_SET:
+          offset += 1
+          continue
+
+        json_dict[attribute_name], offset = self._ReadValue(
+            serialized_data, offset)
+
+    except (IndexError, UnicodeDecodeError, struct.error) as exception:
+      raise ValueError(f'Unable to read value with error: {exception!s}')
+
+    if offset != data_size:
+      raise ValueError('Unsupported trailing data.')
+
+    return json_dict
+
+  def WriteSerialized(self, json_dict):
+    """Writes an attribute container dictionary to binary serialized form.
+
+    Args:
+      json_dict (dict[str, object]): JSON serialized objects of the attribute
+          container.
+
+    Returns:
+      bytes: binary serialized attribute container.
+
+    Raises:
+      TypeError: if the type of a value is not supported.
+      ValueError: if the dictionary does not contain an attribute container or
+          the maximum number of schemas has been reached.
+    """
+    if json_dict.get('__type__', None) != 'AttributeContainer':
+      raise ValueError('Unsupported JSON dictionary, missing attribute '
+                       'container.')
+
+    container_type = json_dict.get('__container_type__', None)
+
+    # A string data type is stored in the schema.
+    data_type = json_dict.get('data_type', None)
+    if not isinstance(data_type, str):
+      data_type = None
+
+    attribute_names = [
+        name for name in json_dict
+        if name not in ('__type__', '__container_type__') and (
+            name != 'data_type' or data_type is None)]
+
+    identifier = self._GetSchemaIdentifier(
+        container_type, data_type, attribute_names)
+    _, _, schema_attribute_names = self._schemas[identifier]
+
+    data = bytearray(self._STRUCT_UINT16.pack(identifier))
+
+    number_of_values_not_set = 0
+    for attribute_name in schema_attribute_names:
+      if attribute_name not in json_dict:
+        number_of_values_not_set += 1
+        continue
+
+      if number_of_values_not_set:
+        data.extend(bytes([self._VALUE_TYPE_NOT_SET]) * (
+            number_of_values_not_set))
+        number_of_values_not_set = 0
+
+      self._WriteValue(json_dict[attribute_name], data)
+
+    return bytes(data)
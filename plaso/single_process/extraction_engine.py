@@ -475,7 +475,8 @@ class SingleProcessEngine(engine.BaseEngine):
             processing_configuration.parser_filter_expression))
 
     self._extraction_worker.SetExtractionConfiguration(
-        processing_configuration.extraction)
+        processing_configuration.extraction,
+        temporary_directory=processing_configuration.temporary_directory)
 
     self._event_data_timeliner = timeliner.EventDataTimeliner(
         data_location=processing_configuration.data_location,
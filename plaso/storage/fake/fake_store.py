@@ -15,13 +15,104 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
   """
 
   _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
   def __init__(self):
     """Initializes a fake (in-memory only) store."""
     super(FakeStore, self).__init__()
+    self._event_tag_identifier_per_event_identifier = {}
     self._serializers_profiler = None
     self.serialization_format = None
 
+  def _WriteNewAttributeContainer(self, container):
+    """Writes a new attribute container to the store.
+
+    Args:
+      container (AttributeContainer): attribute container.
+    """
+    super(FakeStore, self)._WriteNewAttributeContainer(container)
+
+    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_TAG:
+      event_identifier = container.GetEventIdentifier()
+      lookup_key = event_identifier.CopyToString()
+
+      self._event_tag_identifier_per_event_identifier[lookup_key] = (
+          container.GetIdentifier())
+
+  def GetEventTagByEventIdentifier(self, event_identifier):
+    """Retrieves the event tag of a specific event.
+
+    Args:
+      event_identifier (AttributeContainerIdentifier): event attribute
+          container identifier.
+
+    Returns:
+      EventTag: event tag or None if the event has no event tag.
+    """
+    lookup_key = event_identifier.CopyToString()
+
+    identifier = self._event_tag_identifier_per_event_identifier.get(
+        lookup_key, None)
+    if not identifier:
+      return None
+
+    return self.GetAttributeContainerByIdentifier(
+        self._CONTAINER_TYPE_EVENT_TAG, identifier)
+
+  def GetEventTimestampQuantiles(self, number_of_quantiles):
+    """Retrieves timestamps that divide the events into equal sized groups.
+
+    Args:
+      number_of_quantiles (int): number of groups to divide the events into.
+
+    Returns:
+      list[int]: timestamp of the first event of each group, in chronological
+          order, where the list contains fewer timestamps if there are fewer
+          events than groups.
+    """
+    timestamps = sorted(
+        event.timestamp for event in self.GetAttributeContainers(
+            self._CONTAINER_TYPE_EVENT))
+
+    # The first groups contain one more event when the number of events
+    # cannot be divided equally.
+    group_size, remainder = divmod(len(timestamps), number_of_quantiles)
+
+    return [
+        timestamps[quantile * group_size + min(quantile, remainder)]
+        for quantile in range(min(number_of_quantiles, len(timestamps)))]
+
+  def GetEventsWithEventDataByDataType(self, data_types):
+    """Retrieves the events and event data of specific data types.
+
+    Args:
+      data_types (set[str]): data types of the event data to retrieve.
+
+    Yields:
+      tuple: containing:
+
+        EventObject: event.
+        EventData: event data.
+        EventDataStream: event data stream or None if not available.
+    """
+    for event in self.GetAttributeContainers(self._CONTAINER_TYPE_EVENT):
+      event_data_identifier = event.GetEventDataIdentifier()
+      event_data = self.GetAttributeContainerByIdentifier(
+          self._CONTAINER_TYPE_EVENT_DATA, event_data_identifier)
+      if event_data.data_type not in data_types:
+        continue
+
+      event_data_stream = None
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        event_data_stream = self.GetAttributeContainerByIdentifier(
+            self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+            event_data_stream_identifier)
+
+      yield event, event_data, event_data_stream
+
   def GetSortedEvents(self, time_range=None):
     """Retrieves the events in increasing chronological order.
 
@@ -54,6 +145,67 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
 
     return iter(sorted_events.PopEvents())
 
+  def GetSortedEventsWithEventData(self, time_range=None):
+    """Retrieves the events and their event data in chronological order.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+
+    Yields:
+      tuple: containing:
+
+        EventObject: event.
+        EventData: event data.
+        EventDataStream: event data stream or None if not available.
+        EventTag: event tag or None if the event has no event tag.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    event_tags = {}
+    for event_tag in self.GetAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_TAG):
+      event_identifier = event_tag.GetEventIdentifier()
+      lookup_key = event_identifier.CopyToString()
+      event_tags[lookup_key] = event_tag
+
+    for event in self.GetSortedEvents(time_range=time_range):
+      event_data_identifier = event.GetEventDataIdentifier()
+      event_data = self.GetAttributeContainerByIdentifier(
+          self._CONTAINER_TYPE_EVENT_DATA, event_data_identifier)
+
+      event_data_stream = None
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        event_data_stream = self.GetAttributeContainerByIdentifier(
+            self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+            event_data_stream_identifier)
+
+      event_identifier = event.GetIdentifier()
+      lookup_key = event_identifier.CopyToString()
+      event_tag = event_tags.get(lookup_key, None)
+
+      yield event, event_data, event_data_stream, event_tag
+
+  def GetTaggedEventIdentifiers(self):
+    """Retrieves the identifiers of the events that have an event tag.
+
+    Returns:
+      set[str]: string representations of the identifiers of the tagged events.
+    """
+    return set(self._event_tag_identifier_per_event_identifier.keys())
+
+  def HasEventsSortedByEventValuesHash(self):
+    """Determines if sorted events are sorted by event values hash.
+
+    Returns:
+      bool: True if GetSortedEventsWithEventData sorts events with the same
+          timestamp by event values hash and timestamp description.
+    """
+    return False
+
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
 
@@ -3,7 +3,6 @@
 
 from plaso.containers import events
 from plaso.containers import sessions
-from plaso.storage import logger
 
 
 class StorageReader(object):
@@ -18,6 +17,7 @@ class StorageReader(object):
     self._serializers_profiler = None
     self._storage_profiler = None
     self._store = None
+    self._tagged_event_identifiers = None
 
   def __enter__(self):
     """Make usable with "with" statement."""
@@ -32,6 +32,7 @@ class StorageReader(object):
     """Closes the storage reader."""
     self._store.Close()
     self._store = None
+    self._tagged_event_identifiers = None
 
   def GetAttributeContainerByIdentifier(self, container_type, identifier):
     """Retrieves a specific type of container with a specific identifier.
@@ -75,6 +76,9 @@ class StorageReader(object):
   def GetEventTagByEventIdentifer(self, event_identifier):
     """Retrieves the event tag of a specific event.
 
+    The identifiers of the tagged events are read once, hence for most events,
+    which have no event tag, the store is not queried.
+
     Args:
       event_identifier (AttributeContainerIdentifier): event attribute
           container identifier.
@@ -82,19 +86,44 @@ class StorageReader(object):
     Returns:
       EventTag: event tag or None if the event has no event tag.
     """
+    if self._tagged_event_identifiers is None:
+      self._tagged_event_identifiers = self._store.GetTaggedEventIdentifiers()
+
     lookup_key = event_identifier.CopyToString()
+    if lookup_key not in self._tagged_event_identifiers:
+      return None
 
-    event_tags = list(self.GetAttributeContainers(
-        self._CONTAINER_TYPE_EVENT_TAG,
-        filter_expression=f'_event_identifier == "{lookup_key:s}"'))
+    return self._store.GetEventTagByEventIdentifier(event_identifier)
 
-    if not event_tags:
-      return None
+  def GetEventTimestampQuantiles(self, number_of_quantiles):
+    """Retrieves timestamps that divide the events into equal sized groups.
+
+    Args:
+      number_of_quantiles (int): number of groups to divide the events into.
+
+    Returns:
+      list[int]: timestamp of the first event of each group, in chronological
+          order, where the list contains fewer timestamps if there are fewer
+          events than groups.
+    """
+    return self._store.GetEventTimestampQuantiles(number_of_quantiles)
 
-    if len(event_tags) > 1:
-      logger.warning('More than 1 event tag returned.')
+  def GetEventsWithEventDataByDataType(self, data_types):
+    """Retrieves the events and event data of specific data types.
 
-    return event_tags[0]
+    The events are not sorted, which is considerably cheaper than reading
+    all events in chronological order when only a few data types are of
+    interest.
+
+    Args:
+      data_types (set[str]): data types of the event data to retrieve.
+
+    Returns:
+      generator(tuple[EventObject, EventData, EventDataStream]): generator of
+          event, event data and event data stream, where the event data stream
+          is None if not available.
+    """
+    return self._store.GetEventsWithEventDataByDataType(data_types)
 
   def GetFormatVersion(self):
     """Retrieves the format version of the underlying storage file.
@@ -146,6 +175,25 @@ class StorageReader(object):
     """
     return self._store.GetSortedEvents(time_range=time_range)
 
+  def GetSortedEventsWithEventData(self, time_range=None):
+    """Retrieves the events and their event data in chronological order.
+
+    The event data, event data stream and event tag are retrieved together
+    with the event, which is considerably cheaper than looking them up
+    separately for every event.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+
+    Returns:
+      generator(tuple[EventObject, EventData, EventDataStream, EventTag]):
+          generator of event, event data, event data stream and event tag,
+          where the event data stream and event tag are None if not
+          available.
+    """
+    return self._store.GetSortedEventsWithEventData(time_range=time_range)
+
   def HasAttributeContainers(self, container_type):
     """Determines if a store contains a specific type of attribute container.
 
@@ -158,6 +206,15 @@ class StorageReader(object):
     """
     return self._store.HasAttributeContainers(container_type)
 
+  def HasEventsSortedByEventValuesHash(self):
+    """Determines if sorted events are sorted by event values hash.
+
+    Returns:
+      bool: True if GetSortedEventsWithEventData sorts events with the same
+          timestamp by event values hash and timestamp description.
+    """
+    return self._store.HasEventsSortedByEventValuesHash()
+
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
 
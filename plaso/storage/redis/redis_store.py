@@ -342,9 +342,17 @@ class RedisAttributeContainerStore(BaseRedisAttributeContainerStore):
   _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
   _EVENT_INDEX_NAME = 'sorted_event_identifier'
 
+  # Name of the index that maps an event identifier to its event tag
+  # identifier.
+  _EVENT_TAG_INDEX_NAME = 'event_tag_per_event_identifier'
+
+  # The maximum number of events retrieved per pipelined request.
+  _MAXIMUM_PIPELINED_EVENTS = 1000
+
   def __init__(self):
     """Initializes a Redis attribute container store."""
     super(RedisAttributeContainerStore, self).__init__()
@@ -389,6 +397,83 @@ class RedisAttributeContainerStore(BaseRedisAttributeContainerStore):
 
     return attribute_container
 
+  def _GetEventsWithEventData(
+      self, redis_keys, event_tags_per_event, event_data_streams):
+    """Retrieves events and their event data using pipelined requests.
+
+    Args:
+      redis_keys (list[bytes]): Redis keys of the events.
+      event_tags_per_event (dict[str, EventTag]): event tags per event
+          identifier.
+      event_data_streams (dict[str, EventDataStream]): event data streams
+          per identifier, used to cache event data streams.
+
+    Yields:
+      tuple: containing:
+
+        EventObject: event.
+        EventData: event data.
+        EventDataStream: event data stream or None if not available.
+        EventTag: event tag or None if the event has no event tag.
+    """
+    redis_hash_name = self._GetRedisHashName(self._CONTAINER_TYPE_EVENT)
+
+    pipeline = self._redis_client.pipeline(transaction=False)
+    for redis_key in redis_keys:
+      pipeline.hget(redis_hash_name, redis_key)
+
+    events_list = []
+    for redis_key, json_string in zip(redis_keys, pipeline.execute()):
+      if not json_string:
+        continue
+
+      json_dict = json.loads(json_string)
+      event = self._json_serializer.ConvertJSONToAttributeContainer(json_dict)
+
+      identifier = containers_interface.AttributeContainerIdentifier()
+      identifier.CopyFromString(redis_key.decode('utf-8'))
+      event.SetIdentifier(identifier)
+
+      events_list.append(event)
+
+    redis_hash_name = self._GetRedisHashName(self._CONTAINER_TYPE_EVENT_DATA)
+
+    pipeline = self._redis_client.pipeline(transaction=False)
+    for event in events_list:
+      event_data_identifier = event.GetEventDataIdentifier()
+      pipeline.hget(redis_hash_name, event_data_identifier.CopyToString())
+
+    for event, serialized_data in zip(events_list, pipeline.execute()):
+      event_data = self._DeserializeAttributeContainer(
+          self._CONTAINER_TYPE_EVENT_DATA, serialized_data)
+      if not event_data:
+        continue
+
+      event_data.SetIdentifier(event.GetEventDataIdentifier())
+
+      event_data_stream = None
+      sequence_number = getattr(
+          event_data, '_event_data_stream_identifier', None)
+      if sequence_number:
+        event_data_stream_identifier = (
+            containers_interface.AttributeContainerIdentifier(
+                name=self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+                sequence_number=sequence_number))
+        event_data.SetEventDataStreamIdentifier(event_data_stream_identifier)
+
+        lookup_key = event_data_stream_identifier.CopyToString()
+        event_data_stream = event_data_streams.get(lookup_key, None)
+        if not event_data_stream:
+          event_data_stream = self.GetAttributeContainerByIdentifier(
+              self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+              event_data_stream_identifier)
+          event_data_streams[lookup_key] = event_data_stream
+
+      lookup_key = event.GetIdentifier().CopyToString()
+      event_tag = event_tags_per_event.get(lookup_key, None)
+
+      yield event, event_data, event_data_stream, event_tag
+
   def _SerializeAttributeContainer(self, attribute_container):
     """Serializes an attribute container.
 
@@ -459,6 +544,16 @@ class RedisAttributeContainerStore(BaseRedisAttributeContainerStore):
 
       self._redis_client.zincrby(index_name, container.timestamp, redis_key)
 
+    elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_TAG:
+      index_name = self._GetRedisHashName(self._EVENT_TAG_INDEX_NAME)
+
+      event_identifier = container.GetEventIdentifier()
+      identifier = container.GetIdentifier()
+
+      self._redis_client.hset(
+          index_name, key=event_identifier.CopyToString(),
+          value=identifier.CopyToString())
+
   def GetAttributeContainerByIndex(self, container_type, index):
     """Retrieves a specific attribute container.
 
@@ -540,6 +635,56 @@ class RedisAttributeContainerStore(BaseRedisAttributeContainerStore):
         if container.MatchesExpression(filter_expression):
           yield container
 
+  def GetEventTagByEventIdentifier(self, event_identifier):
+    """Retrieves the event tag of a specific event.
+
+    Args:
+      event_identifier (AttributeContainerIdentifier): event attribute
+          container identifier.
+
+    Returns:
+      EventTag: event tag or None if the event has no event tag.
+    """
+    index_name = self._GetRedisHashName(self._EVENT_TAG_INDEX_NAME)
+
+    redis_value = self._redis_client.hget(
+        index_name, event_identifier.CopyToString())
+    if not redis_value:
+      return None
+
+    identifier = containers_interface.AttributeContainerIdentifier()
+    identifier.CopyFromString(redis_value.decode('utf-8'))
+
+    return self.GetAttributeContainerByIdentifier(
+        self._CONTAINER_TYPE_EVENT_TAG, identifier)
+
+  def GetEventTimestampQuantiles(self, number_of_quantiles):
+    """Retrieves timestamps that divide the events into equal sized groups.
+
+    Args:
+      number_of_quantiles (int): number of groups to divide the events into.
+
+    Returns:
+      list[int]: timestamp of the first event of each group, in chronological
+          order, where the list contains fewer timestamps if there are fewer
+          events than groups.
+    """
+    event_index_name = self._GetRedisHashName(self._EVENT_INDEX_NAME)
+    number_of_events = self._redis_client.zcard(event_index_name)
+
+    # The first groups contain one more event when the number of events
+    # cannot be divided equally.
+    group_size, remainder = divmod(number_of_events, number_of_quantiles)
+
+    timestamps = []
+    for quantile in range(min(number_of_quantiles, number_of_events)):
+      rank = quantile * group_size + min(quantile, remainder)
+      for _, score in self._redis_client.zrange(
+          event_index_name, rank, rank, withscores=True):
+        timestamps.append(int(score))
+
+    return timestamps
+
   def GetSortedEvents(self, time_range=None):
     """Retrieves the events in increasing chronological order.
 
@@ -565,6 +710,75 @@ class RedisAttributeContainerStore(BaseRedisAttributeContainerStore):
       yield self.GetAttributeContainerByIdentifier(
           self._CONTAINER_TYPE_EVENT, identifier)
 
+  def GetSortedEventsWithEventData(self, time_range=None):
+    """Retrieves the events and their event data in chronological order.
+
+    The events and their event data are retrieved in batches using pipelined
+    requests instead of separate requests per event.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+
+    Yields:
+      tuple: containing:
+
+        EventObject: event.
+        EventData: event data.
+        EventDataStream: event data stream or None if not available.
+        EventTag: event tag or None if the event has no event tag.
+    """
+    event_tags_per_event = {}
+    for event_tag in self.GetAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_TAG):
+      event_identifier = event_tag.GetEventIdentifier()
+      event_tags_per_event[event_identifier.CopyToString()] = event_tag
+
+    minimum_timestamp = '-inf'
+    maximum_timestamp = '+inf'
+    if time_range:
+      if time_range.start_timestamp is not None:
+        minimum_timestamp = time_range.start_timestamp
+      if time_range.end_timestamp is not None:
+        maximum_timestamp = time_range.end_timestamp
+
+    event_index_name = self._GetRedisHashName(self._EVENT_INDEX_NAME)
+    event_data_streams = {}
+    start_index = 0
+
+    while True:
+      redis_keys = self._redis_client.zrangebyscore(
+          event_index_name, minimum_timestamp, maximum_timestamp,
+          start=start_index, num=self._MAXIMUM_PIPELINED_EVENTS)
+      if not redis_keys:
+        break
+
+      yield from self._GetEventsWithEventData(
+          redis_keys, event_tags_per_event, event_data_streams)
+
+      start_index += len(redis_keys)
+
+  def GetTaggedEventIdentifiers(self):
+    """Retrieves the identifiers of the events that have an event tag.
+
+    Returns:
+      set[str]: string representations of the identifiers of the tagged events.
+    """
+    index_name = self._GetRedisHashName(self._EVENT_TAG_INDEX_NAME)
+
+    return {
+        redis_key.decode('utf-8')
+        for redis_key in self._redis_client.hkeys(index_name)}
+
+  def HasEventsSortedByEventValuesHash(self):
+    """Determines if sorted events are sorted by event values hash.
+
+    Returns:
+      bool: True if GetSortedEventsWithEventData sorts events with the same
+          timestamp by event values hash and timestamp description.
+    """
+    return False
+
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
 
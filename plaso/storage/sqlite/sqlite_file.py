@@ -2,16 +2,24 @@
 """SQLite-based storage file."""
 
 import ast
+import collections
 import json
 import sqlite3
+import sys
 import zlib
 
+import lz4.frame
+import zstd
+
 from acstore import sqlite_store
 from acstore.containers import interface as containers_interface
 
+from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.lib import definitions
+from plaso.serializer import binary_serializer
 from plaso.serializer import json_serializer
+from plaso.storage import logger
 
 
 class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
@@ -21,7 +29,7 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     compression_format (str): compression format.
   """
 
-  _FORMAT_VERSION = 20230327
+  _FORMAT_VERSION = 20261020
 
   _APPEND_COMPATIBLE_FORMAT_VERSION = 20230327
 
@@ -31,16 +39,109 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
   _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
+  # Names of the columns of the event data table and their index, where None
+  # represents a column without an index. The columns contain a copy of
+  # the corresponding attribute values of the serialized event data, so that
+  # event data can be queried and sorted without deserializing it.
+  _EVENT_DATA_COLUMNS = {
+      '_event_data_stream_identifier': 'event_data_per_event_data_stream',
+      '_event_values_hash': None,
+      '_parser_chain': 'event_data_per_parser_chain',
+      'data_type': 'event_data_per_data_type'}
+
+  # Schema of the attributes that contain a reference to another attribute
+  # container, of attribute containers that are stored serialized.
+  _SERIALIZED_CONTAINER_SCHEMAS = {
+      _CONTAINER_TYPE_EVENT_DATA: {
+          '_event_data_stream_identifier': 'AttributeContainerIdentifier'}}
+
+  # Format version from which the binary serialization format is supported.
+  _BINARY_SERIALIZATION_FORMAT_VERSION = 20261019
+
+  # Format version from which the event data table contains the event data
+  # columns.
+  _EVENT_DATA_COLUMNS_FORMAT_VERSION = 20261020
+
+  # Format version from which the event source table contains the size column.
+  _EVENT_SOURCE_SIZE_FORMAT_VERSION = 20261018
+
+  # Container types that are cached in the event data cache, since they are
+  # typically shared by multiple events.
+  _EVENT_DATA_CACHE_CONTAINER_TYPES = frozenset([
+      _CONTAINER_TYPE_EVENT_DATA, _CONTAINER_TYPE_EVENT_DATA_STREAM])
+
+  # The maximum (estimated) size of the event data cache in bytes.
+  _MAXIMUM_EVENT_DATA_CACHE_SIZE = 64 * 1024 * 1024
+
+  # Name of the database of the storage file that is merged.
+  _MERGE_DATABASE_NAME = 'merge_store'
+
+  # Number of serialized attribute containers that are merged per chunk.
+  _MERGE_CHUNK_SIZE = 1000
+
+  # Number of rows that are read per batch by long running reads, such that
+  # no read lock is held on the database between batches.
+  _READ_BATCH_SIZE = 1000
+
+  # Name of the table that contains the schemas of the binary serialization
+  # format.
+  _SERIALIZATION_SCHEMA_TABLE_NAME = 'serialization_schema'
+
   def __init__(self):
     """Initializes a SQLite-based storage file."""
     super(SQLiteStorageFile, self).__init__()
+    self._binary_serializer = None
+    self._event_data_cache = collections.OrderedDict()
+    self._event_data_cache_hits = collections.Counter()
+    self._event_data_cache_misses = collections.Counter()
+    self._event_data_cache_size = 0
     self._serializer = json_serializer.JSONAttributeContainerSerializer
     self._serializers_profiler = None
 
     self.compression_format = definitions.COMPRESSION_FORMAT_ZLIB
 
+  def _CacheAttributeContainerByIndex(self, attribute_container, index):
+    """Caches a specific attribute container.
+
+    Event data and event data streams read from a read-only storage file are
+    cached in a separate cache that is bounded by the estimated size of
+    the cached attribute containers, so that they are not evicted by other
+    types of attribute containers. Writable storage files use the attribute
+    container cache of the base class, so that writing attribute containers
+    does not require estimating their size.
+
+    Args:
+      attribute_container (AttributeContainer): attribute container.
+      index (int): attribute container index.
+    """
+    container_type = attribute_container.CONTAINER_TYPE
+    if (not self._read_only or
+        container_type not in self._EVENT_DATA_CACHE_CONTAINER_TYPES):
+      super(SQLiteStorageFile, self)._CacheAttributeContainerByIndex(
+          attribute_container, index)
+      return
+
+    lookup_key = f'{container_type:s}.{index:d}'
+
+    _, container_size = self._event_data_cache.pop(lookup_key, (None, 0))
+    self._event_data_cache_size -= container_size
+
+    container_size = self._GetAttributeContainerSize(attribute_container)
+
+    while self._event_data_cache and (
+        self._event_data_cache_size + container_size >
+        self._MAXIMUM_EVENT_DATA_CACHE_SIZE):
+      _, (_, evicted_size) = self._event_data_cache.popitem(last=True)
+      self._event_data_cache_size -= evicted_size
+
+    self._event_data_cache[lookup_key] = (attribute_container, container_size)
+    self._event_data_cache.move_to_end(lookup_key, last=False)
+    self._event_data_cache_size += container_size
+
   def _CheckStorageMetadata(self, metadata_values, check_readable_only=False):
     """Checks the storage metadata.
 
@@ -54,13 +155,54 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       IOError: if the format version or the serializer format is not supported.
       OSError: if the format version or the serializer format is not supported.
     """
+    serialization_format = metadata_values.get('serialization_format', None)
+
+    # The base class only supports the JSON serialization format, hence the
+    # serialization format is checked separately.
+    base_metadata_values = dict(
+        metadata_values, serialization_format=(
+            definitions.SERIALIZER_FORMAT_JSON))
+
     super(SQLiteStorageFile, self)._CheckStorageMetadata(
-        metadata_values, check_readable_only=check_readable_only)
+        base_metadata_values, check_readable_only=check_readable_only)
+
+    format_version = base_metadata_values['format_version']
+    metadata_values['format_version'] = format_version
 
     compression_format = metadata_values.get('compression_format', None)
     if compression_format not in definitions.COMPRESSION_FORMATS:
       raise IOError(f'Unsupported compression format: {compression_format!s}')
 
+    if serialization_format not in definitions.SERIALIZER_FORMATS:
+      raise IOError(
+          f'Unsupported serialization format: {serialization_format!s}')
+
+    if (serialization_format == definitions.SERIALIZER_FORMAT_BINARY and
+        format_version < self._BINARY_SERIALIZATION_FORMAT_VERSION):
+      raise IOError((
+          f'Serialization format: {serialization_format:s} not supported by '
+          f'format version: {format_version:d}.'))
+
+  def _CompressData(self, data):
+    """Compresses data with the compression format of the storage file.
+
+    Args:
+      data (bytes): data to compress.
+
+    Returns:
+      bytes: compressed data.
+    """
+    if self.compression_format == definitions.COMPRESSION_FORMAT_LZ4:
+      return lz4.frame.compress(data)
+
+    if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+      return zlib.compress(data)
+
+    if self.compression_format == definitions.COMPRESSION_FORMAT_ZSTD:
+      return zstd.compress(data)
+
+    return data
+
   def _CreateAttributeContainerFromRow(
       self, container_type, column_names, row, first_column_index):
     """Creates an attribute container of a row in the database.
@@ -79,12 +221,13 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       return super(SQLiteStorageFile, self)._CreateAttributeContainerFromRow(
           container_type, column_names, row, first_column_index)
 
-    if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-      compressed_data = row[first_column_index]
-      serialized_data = zlib.decompress(compressed_data)
-    else:
+    if self.compression_format == definitions.COMPRESSION_FORMAT_NONE:
       compressed_data = b''
       serialized_data = row[first_column_index]
+    else:
+      compressed_data = row[first_column_index]
+      serialized_data = self._DecompressData(
+          compressed_data, self.compression_format)
 
     if self._storage_profiler:
       self._storage_profiler.Sample(
@@ -110,21 +253,33 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       super(SQLiteStorageFile, self)._CreateAttributeContainerTable(
           container_type)
     else:
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-        data_column_type = 'BLOB'
-      else:
+      if self.compression_format == definitions.COMPRESSION_FORMAT_NONE:
         data_column_type = 'TEXT'
+      else:
+        data_column_type = 'BLOB'
 
-      query = (
-          f'CREATE TABLE {container_type:s} (_identifier INTEGER PRIMARY KEY '
-          f'AUTOINCREMENT, _data {data_column_type:s});')
+      column_definitions = [
+          '_identifier INTEGER PRIMARY KEY AUTOINCREMENT',
+          f'_data {data_column_type:s}']
+
+      if (container_type == self._CONTAINER_TYPE_EVENT_DATA and
+          self._HasEventDataColumns()):
+        column_definitions.extend([
+            f'{name:s} TEXT' for name in sorted(self._EVENT_DATA_COLUMNS)])
+
+      column_definitions = ', '.join(column_definitions)
+      query = f'CREATE TABLE {container_type:s} ({column_definitions:s});'
 
       try:
         self._cursor.execute(query)
       except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
         raise IOError(f'Unable to query storage file with error: {exception!s}')
 
-    if container_type == self._CONTAINER_TYPE_EVENT_TAG:
+    if (container_type == self._CONTAINER_TYPE_EVENT_DATA and
+        self._HasEventDataColumns()):
+      self._CreateEventDataIndexes()
+
+    elif container_type == self._CONTAINER_TYPE_EVENT_TAG:
       query = ('CREATE INDEX event_tag_per_event '
              'ON event_tag (_event_identifier)')
       try:
@@ -132,6 +287,55 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
         raise IOError(f'Unable to query storage file with error: {exception!s}')
 
+  def _CreateEventDataIndexes(self):
+    """Creates the indexes of the event data columns.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    for column_name, index_name in sorted(self._EVENT_DATA_COLUMNS.items()):
+      if not index_name:
+        continue
+
+      query = (
+          f'CREATE INDEX IF NOT EXISTS {index_name:s} ON event_data '
+          f'({column_name:s})')
+
+      try:
+        self._cursor.execute(query)
+      except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+        raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+  def _DecompressData(self, compressed_data, compression_format):
+    """Decompresses data.
+
+    Args:
+      compressed_data (bytes): compressed data.
+      compression_format (str): compression format.
+
+    Returns:
+      bytes: decompressed data.
+
+    Raises:
+      IOError: if the data cannot be decompressed.
+      OSError: if the data cannot be decompressed.
+    """
+    try:
+      if compression_format == definitions.COMPRESSION_FORMAT_LZ4:
+        return lz4.frame.decompress(compressed_data)
+
+      if compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+        return zlib.decompress(compressed_data)
+
+      if compression_format == definitions.COMPRESSION_FORMAT_ZSTD:
+        return zstd.decompress(compressed_data)
+
+    except (RuntimeError, zlib.error, zstd.Error) as exception:
+      raise IOError(f'Unable to decompress data with error: {exception!s}')
+
+    return compressed_data
+
   def _DeserializeAttributeContainer(self, container_type, serialized_data):
     """Deserializes an attribute container.
 
@@ -153,8 +357,13 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       self._serializers_profiler.StartTiming(container_type)
 
     try:
-      serialized_string = serialized_data.decode('utf-8')
-      container = self._serializer.ReadSerialized(serialized_string)
+      if self._binary_serializer:
+        json_dict = self._ReadBinarySerializedData(serialized_data)
+        container = self._serializer.ReadSerializedDict(json_dict)
+
+      else:
+        serialized_string = serialized_data.decode('utf-8')
+        container = self._serializer.ReadSerialized(serialized_string)
 
     except UnicodeDecodeError as exception:
       raise IOError(
@@ -179,6 +388,367 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
     return container
 
+  def _GetAttributeContainerSchema(self, container_type):
+    """Retrieves the schema of an attribute container.
+
+    Attributes that are not stored by the format version of the storage file
+    are not part of the schema.
+
+    Args:
+      container_type (str): attribute container type.
+
+    Returns:
+      dict[str, str]: attribute container schema or an empty dictionary if
+          no schema available.
+    """
+    schema = super(SQLiteStorageFile, self)._GetAttributeContainerSchema(
+        container_type)
+
+    if (container_type == self._CONTAINER_TYPE_EVENT_SOURCE and
+        not self._HasEventSourceSizeColumn()):
+      schema = {
+          name: data_type for name, data_type in schema.items()
+          if name != 'size'}
+
+    return schema
+
+  def _GetAttributeContainerSize(self, attribute_container):
+    """Estimates the size of an attribute container in memory.
+
+    Args:
+      attribute_container (AttributeContainer): attribute container.
+
+    Returns:
+      int: estimated size of the attribute container in bytes.
+    """
+    container_size = sys.getsizeof(attribute_container)
+    for _, attribute_value in attribute_container.GetAttributes():
+      container_size += sys.getsizeof(attribute_value)
+
+    return container_size
+
+  def _GetCachedAttributeContainer(self, container_type, index):
+    """Retrieves a specific cached attribute container.
+
+    Args:
+      container_type (str): attribute container type.
+      index (int): attribute container index.
+
+    Returns:
+      AttributeContainer: attribute container or None if not available.
+    """
+    if (not self._read_only or
+        container_type not in self._EVENT_DATA_CACHE_CONTAINER_TYPES):
+      return super(SQLiteStorageFile, self)._GetCachedAttributeContainer(
+          container_type, index)
+
+    lookup_key = f'{container_type:s}.{index:d}'
+    attribute_container, _ = self._event_data_cache.get(
+        lookup_key, (None, 0))
+    if not attribute_container:
+      self._event_data_cache_misses[container_type] += 1
+    else:
+      self._event_data_cache_hits[container_type] += 1
+      self._event_data_cache.move_to_end(lookup_key, last=False)
+
+    return attribute_container
+
+  def _GetRemappedIdentifierExpression(self, column_name, identifier_offsets):
+    """Retrieves a SQL expression that remaps an identifier column.
+
+    Args:
+      column_name (str): name of the column that contains the string
+          representation of an attribute container identifier.
+      identifier_offsets (dict[str, int]): sequence number offsets per
+          referenced attribute container type.
+
+    Returns:
+      str: SQL expression.
+    """
+    when_expressions = []
+    for container_type, offset in sorted(identifier_offsets.items()):
+      prefix = f'{container_type:s}.'
+      prefix_length = len(prefix)
+      when_expressions.append((
+          f'WHEN SUBSTR({column_name:s}, 1, {prefix_length:d}) = '
+          f'\'{prefix:s}\' THEN \'{prefix:s}\' || (CAST(SUBSTR('
+          f'{column_name:s}, {prefix_length + 1:d}) AS INTEGER) + '
+          f'{offset:d})'))
+
+    if not when_expressions:
+      return column_name
+
+    when_expressions = ' '.join(when_expressions)
+    return f'CASE {when_expressions:s} ELSE {column_name:s} END'
+
+  def _GetRowsInBatches(self, cursor, query, parameters):
+    """Retrieves rows in batches.
+
+    Every batch is read completely before its rows are returned, hence the
+    query does not hold a read lock on the database between batches and
+    other processes, such as the foreman merging task results, are not
+    blocked while the rows are processed.
+
+    Args:
+      cursor (sqlite3.Cursor): cursor.
+      query (str): query, where the first parameter is the identifier after
+          which to continue and that is ordered by and limited to a batch of
+          identifiers.
+      parameters (list[object]): remaining parameters of the query.
+
+    Yields:
+      tuple[object]: row, where the first value is the identifier.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    last_identifier = 0
+    while True:
+      try:
+        cursor.execute(query, [last_identifier] + parameters)
+        rows = cursor.fetchall()
+      except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+        raise IOError(
+            f'Unable to query storage file with error: {exception!s}')
+
+      if not rows:
+        break
+
+      yield from rows
+
+      last_identifier = rows[-1][0]
+
+  def _HasEventDataColumns(self):
+    """Determines if the event data table contains the event data columns.
+
+    Returns:
+      bool: True if the event data table contains the event data columns.
+    """
+    return self.format_version >= self._EVENT_DATA_COLUMNS_FORMAT_VERSION
+
+  def _HasEventSourceSizeColumn(self):
+    """Determines if the event source table contains the size column.
+
+    Returns:
+      bool: True if the event source table contains the size column.
+    """
+    return self.format_version >= self._EVENT_SOURCE_SIZE_FORMAT_VERSION
+
+  def _IsEventDataColumnsExpression(self, expression_ast):
+    """Determines if an expression only refers to the event data columns.
+
+    Args:
+      expression_ast (ast.Expression): Python AST of the expression.
+
+    Returns:
+      bool: True if the event data table contains the event data columns and
+          all names in the expression refer to an event data column.
+    """
+    if not self._HasEventDataColumns():
+      return False
+
+    return all(
+        ast_node.id in self._EVENT_DATA_COLUMNS
+        for ast_node in ast.walk(expression_ast)
+        if isinstance(ast_node, ast.Name))
+
+  def _MergeAttributeContainers(self, container_type, identifier_offsets):
+    """Merges attribute containers of a specific type from the merge database.
+
+    Args:
+      container_type (str): attribute container type.
+      identifier_offsets (dict[str, int]): sequence number offsets per
+          referenced attribute container type.
+
+    Returns:
+      int: number of attribute containers that were merged.
+
+    Raises:
+      IOError: if an unsupported attribute container is provided.
+      OSError: if an unsupported attribute container is provided.
+      sqlite3.OperationalError: when there is an error querying the storage
+          file.
+    """
+    query = (
+        f'SELECT name FROM {self._MERGE_DATABASE_NAME:s}.sqlite_master '
+        f'WHERE type = "table" AND name = ?')
+    self._cursor.execute(query, (container_type, ))
+    if not self._cursor.fetchone():
+      return 0
+
+    if not self._HasTable(container_type):
+      self._CreateAttributeContainerTable(container_type)
+
+    schema = self._GetAttributeContainerSchema(container_type)
+    if not schema:
+      return self._MergeSerializedAttributeContainers(
+          container_type, identifier_offsets)
+
+    column_names = sorted(schema.keys())
+
+    select_expressions = []
+    for name in column_names:
+      if schema[name] == 'AttributeContainerIdentifier':
+        expression = self._GetRemappedIdentifierExpression(
+            name, identifier_offsets)
+      else:
+        expression = name
+
+      select_expressions.append(expression)
+
+    column_names_string = ', '.join(column_names)
+    select_expressions_string = ', '.join(select_expressions)
+
+    query = (
+        f'INSERT INTO main.{container_type:s} ({column_names_string:s}) '
+        f'SELECT {select_expressions_string:s} FROM '
+        f'{self._MERGE_DATABASE_NAME:s}.{container_type:s} '
+        f'ORDER BY _identifier')
+    self._cursor.execute(query)
+
+    return self._cursor.rowcount
+
+  def _MergeSerializedAttributeContainers(
+      self, container_type, identifier_offsets):
+    """Merges serialized attribute containers from the merge database.
+
+    Attribute containers without a schema are stored serialized, therefore
+    references to other attribute containers are remapped in the serialized
+    data, which is stored in the serialization format of this storage file.
+    The attribute containers are merged in chunks to limit memory usage.
+
+    Args:
+      container_type (str): attribute container type.
+      identifier_offsets (dict[str, int]): sequence number offsets per
+          referenced attribute container type.
+
+    Returns:
+      int: number of attribute containers that were merged.
+
+    Raises:
+      IOError: if the serialized data cannot be decoded.
+      OSError: if the serialized data cannot be decoded.
+      sqlite3.OperationalError: when there is an error querying the storage
+          file.
+    """
+    schema = self._SERIALIZED_CONTAINER_SCHEMAS.get(container_type, {})
+    identifier_attribute_names = sorted(
+        name for name, data_type in schema.items()
+        if data_type == 'AttributeContainerIdentifier')
+
+    query = f'SELECT key, value FROM {self._MERGE_DATABASE_NAME:s}.metadata'
+    self._cursor.execute(query)
+    merge_metadata_values = {row[0]: row[1] for row in self._cursor.fetchall()}
+
+    merge_compression_format = merge_metadata_values.get(
+        'compression_format', None)
+
+    merge_binary_serializer = None
+    if (merge_metadata_values.get('serialization_format', None) ==
+        definitions.SERIALIZER_FORMAT_BINARY):
+      merge_binary_serializer = self._ReadSerializationSchemas(
+          database_name=self._MERGE_DATABASE_NAME)
+
+    select_cursor = self._connection.cursor()
+    select_cursor.execute((
+        f'SELECT _data FROM {self._MERGE_DATABASE_NAME:s}.{container_type:s} '
+        f'ORDER BY _identifier'))
+
+    column_names = ['_data']
+    if (container_type == self._CONTAINER_TYPE_EVENT_DATA and
+        self._HasEventDataColumns()):
+      column_names.extend(sorted(self._EVENT_DATA_COLUMNS))
+
+    column_names_string = ', '.join(column_names)
+    values_string = ', '.join(['?'] * len(column_names))
+
+    query = (
+        f'INSERT INTO main.{container_type:s} ({column_names_string:s}) '
+        f'VALUES ({values_string:s})')
+
+    number_of_containers = 0
+
+    rows = select_cursor.fetchmany(self._MERGE_CHUNK_SIZE)
+    while rows:
+      values = []
+      for row in rows:
+        serialized_data = self._DecompressData(
+            row[0], merge_compression_format)
+
+        try:
+          if merge_binary_serializer:
+            json_dict = merge_binary_serializer.ReadSerialized(serialized_data)
+          else:
+            json_dict = json.loads(serialized_data)
+        except (TypeError, ValueError) as exception:
+          raise IOError(
+              f'Unable to read serialized data with error: {exception!s}')
+
+        for name in identifier_attribute_names:
+          identifier_string = json_dict.get(name, None)
+          if not identifier_string:
+            continue
+
+          identifier = containers_interface.AttributeContainerIdentifier()
+          try:
+            identifier.CopyFromString(identifier_string)
+          except (AttributeError, ValueError) as exception:
+            raise IOError((
+                f'Unable to read attribute container identifier: {name:s} '
+                f'with error: {exception!s}'))
+
+          offset = identifier_offsets.get(identifier.name, None)
+          if offset:
+            identifier.sequence_number += offset
+            json_dict[name] = identifier.CopyToString()
+
+        try:
+          serialized_data = self._WriteSerializedData(json_dict)
+        except (TypeError, ValueError) as exception:
+          raise IOError(
+              f'Unable to write serialized data with error: {exception!s}')
+
+        if self.compression_format != definitions.COMPRESSION_FORMAT_NONE:
+          serialized_data = sqlite3.Binary(self._CompressData(serialized_data))
+
+        # The event data columns are read from the remapped serialized data.
+        row_values = [serialized_data]
+        row_values.extend([
+            json_dict.get(name, None) for name in column_names[1:]])
+
+        values.append(row_values)
+
+      self._cursor.executemany(query, values)
+      number_of_containers += len(values)
+
+      rows = select_cursor.fetchmany(self._MERGE_CHUNK_SIZE)
+
+    return number_of_containers
+
+  def _ReadBinarySerializedData(self, serialized_data):
+    """Reads binary serialized data of an attribute container.
+
+    Args:
+      serialized_data (bytes): binary serialized attribute container data.
+
+    Returns:
+      dict[str, object]: JSON serialized objects of the attribute container.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+      ValueError: if the serialized data cannot be read.
+    """
+    schema_identifier = self._binary_serializer.GetSchemaIdentifier(
+        serialized_data)
+    if not self._binary_serializer.GetSchema(schema_identifier):
+      # The schema could have been added after the storage file was opened,
+      # for example by another process.
+      self._binary_serializer = self._ReadSerializationSchemas()
+
+    return self._binary_serializer.ReadSerialized(serialized_data)
+
   def _ReadAndCheckStorageMetadata(self, check_readable_only=False):
     """Reads storage metadata and checks that the values are valid.
 
@@ -200,6 +770,93 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     self.compression_format = metadata_values['compression_format']
     self.serialization_format = metadata_values['serialization_format']
 
+    self._binary_serializer = None
+    if self.serialization_format == definitions.SERIALIZER_FORMAT_BINARY:
+      self._binary_serializer = self._ReadSerializationSchemas()
+
+  def _ReadSerializationSchemas(self, database_name='main'):
+    """Reads the schemas of the binary serialization format.
+
+    Args:
+      database_name (Optional[str]): name of the database that contains the
+          schemas.
+
+    Returns:
+      BinaryAttributeContainerSerializer: binary attribute container serializer
+          with the schemas.
+
+    Raises:
+      IOError: when there is an error querying the storage file or if the
+          schemas cannot be read.
+      OSError: when there is an error querying the storage file or if the
+          schemas cannot be read.
+    """
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+
+    table_name = self._SERIALIZATION_SCHEMA_TABLE_NAME
+    query = (
+        f'SELECT name FROM {database_name:s}.sqlite_master WHERE '
+        f'type = "table" AND name = "{table_name:s}"')
+
+    try:
+      self._cursor.execute(query)
+      if not self._cursor.fetchone():
+        return serializer
+
+      self._cursor.execute((
+          f'SELECT _identifier, container_type, data_type, attribute_names '
+          f'FROM {database_name:s}.{table_name:s}'))
+      rows = self._cursor.fetchall()
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+    for identifier, container_type, data_type, attribute_names in rows:
+      try:
+        attribute_names = json.loads(attribute_names)
+      except (TypeError, ValueError) as exception:
+        raise IOError((
+            f'Unable to read attribute names of serialization schema: '
+            f'{identifier:d} with error: {exception!s}'))
+
+      serializer.AddSchema(
+          identifier, container_type, data_type, attribute_names)
+
+    return serializer
+
+  def _RollbackMerge(self):
+    """Rolls back the transaction of a merge.
+
+    The schemas of the binary serialization format that were added by the
+    merge are rolled back as well.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self._connection.rollback()
+
+    if self._binary_serializer:
+      self._binary_serializer = self._ReadSerializationSchemas()
+
+  def _SampleEventDataCacheStatistics(self):
+    """Samples the event data cache hits and misses for profiling.
+
+    The number of hits and misses are reset after they have been sampled.
+    """
+    if self._storage_profiler:
+      for container_type in sorted(self._EVENT_DATA_CACHE_CONTAINER_TYPES):
+        number_of_hits = self._event_data_cache_hits[container_type]
+        number_of_misses = self._event_data_cache_misses[container_type]
+        if number_of_hits or number_of_misses:
+          self._storage_profiler.Sample(
+              'event_data_cache', 'hit', container_type, number_of_hits, 0)
+          self._storage_profiler.Sample(
+              'event_data_cache', 'miss', container_type, number_of_misses, 0)
+
+    self._event_data_cache_hits = collections.Counter()
+    self._event_data_cache_misses = collections.Counter()
+
   def _SerializeAttributeContainer(self, container):
     """Serializes an attribute container.
 
@@ -226,55 +883,167 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
               event_data_stream_identifier.CopyToString())
 
       try:
-        serialized_string = json.dumps(json_dict)
-      except TypeError as exception:
+        serialized_data = self._WriteSerializedData(json_dict)
+      except (TypeError, ValueError) as exception:
         raise IOError((
             f'Unable to serialize attribute container: '
             f'{container.CONTAINER_TYPE:s} with error: {exception!s}.'))
 
-      if not serialized_string:
+      if not serialized_data:
         raise IOError((
             f'Unable to serialize attribute container: '
             f'{container.CONTAINER_TYPE:s}'))
 
-      serialized_string = serialized_string.encode('utf-8')
-
     finally:
       if self._serializers_profiler:
         self._serializers_profiler.StopTiming(container.CONTAINER_TYPE)
 
-    return serialized_string
+    return serialized_data
 
-  def _WriteMetadata(self):
-    """Writes metadata.
+  def _UpdateStorageMetadataFormatVersion(self):
+    """Updates the storage metadata format version.
+
+    The event data and event source tables of a storage file with an older
+    format version are upgraded as well.
 
     Raises:
-      IOError: when there is an error querying the attribute container store.
-      OSError: when there is an error querying the attribute container store.
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
     """
-    try:
-      self._cursor.execute(self._CREATE_METADATA_TABLE_QUERY)
-    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
-      raise IOError((
-          f'Unable to query attribute container store with error: '
-          f'{exception!s}'))
+    if self.format_version < self._UPGRADE_COMPATIBLE_FORMAT_VERSION:
+      return
 
-    self._WriteMetadataValue('format_version', f'{self._FORMAT_VERSION:d}')
-    self._WriteMetadataValue('compression_format', self.compression_format)
-    self._WriteMetadataValue('serialization_format', self.serialization_format)
+    if (not self._HasEventDataColumns() and
+        self._HasTable(self._CONTAINER_TYPE_EVENT_DATA)):
+      self._UpgradeEventDataTable()
 
-  def _WriteNewAttributeContainer(self, container):
-    """Writes a new attribute container to the store.
+    if (not self._HasEventSourceSizeColumn() and
+        self._HasTable(self._CONTAINER_TYPE_EVENT_SOURCE)):
+      self._UpgradeEventSourceTable()
 
-    The table for the container type must exist.
+    super(SQLiteStorageFile, self)._UpdateStorageMetadataFormatVersion()
 
-    Args:
-      container (AttributeContainer): attribute container.
+    self.format_version = self._FORMAT_VERSION
+
+  def _UpgradeEventDataTable(self):
+    """Upgrades the event data table to contain the event data columns.
+
+    The values of the event data columns are read from the serialized event
+    data, in chunks to limit memory usage. Columns and indexes that already
+    exist, such as after an interrupted upgrade, are not added again.
 
     Raises:
-      IOError: when there is an error querying the storage file.
-      OSError: when there is an error querying the storage file.
-    """
+      IOError: when there is an error querying the storage file or if
+          the serialized data cannot be decoded.
+      OSError: when there is an error querying the storage file or if
+          the serialized data cannot be decoded.
+    """
+    column_names = sorted(self._EVENT_DATA_COLUMNS)
+
+    select_query = (
+        'SELECT _identifier, _data FROM event_data WHERE _identifier > ? '
+        f'ORDER BY _identifier LIMIT {self._MERGE_CHUNK_SIZE:d}')
+
+    column_names_string = ', '.join([f'{name:s} = ?' for name in column_names])
+    update_query = (
+        f'UPDATE event_data SET {column_names_string:s} WHERE _identifier = ?')
+
+    try:
+      self._cursor.execute('PRAGMA table_info(event_data)')
+      existing_column_names = [row[1] for row in self._cursor.fetchall()]
+
+      for column_name in column_names:
+        if column_name not in existing_column_names:
+          self._cursor.execute(
+              f'ALTER TABLE event_data ADD COLUMN {column_name:s} TEXT')
+
+      last_identifier = 0
+      while True:
+        self._cursor.execute(select_query, (last_identifier, ))
+        rows = self._cursor.fetchall()
+        if not rows:
+          break
+
+        values = []
+        for identifier, compressed_data in rows:
+          serialized_data = self._DecompressData(
+              compressed_data, self.compression_format)
+
+          try:
+            if self._binary_serializer:
+              json_dict = self._ReadBinarySerializedData(serialized_data)
+            else:
+              json_dict = json.loads(serialized_data)
+          except (TypeError, ValueError) as exception:
+            raise IOError(
+                f'Unable to read serialized data with error: {exception!s}')
+
+          row_values = [json_dict.get(name, None) for name in column_names]
+          row_values.append(identifier)
+          values.append(row_values)
+
+        self._cursor.executemany(update_query, values)
+
+        last_identifier = rows[-1][0]
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+    self._CreateEventDataIndexes()
+
+  def _UpgradeEventSourceTable(self):
+    """Upgrades the event source table to contain the size column.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    try:
+      self._cursor.execute('PRAGMA table_info(event_source)')
+      column_names = [row[1] for row in self._cursor.fetchall()]
+
+      if 'size' not in column_names:
+        self._cursor.execute(
+            'ALTER TABLE event_source ADD COLUMN size INTEGER')
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+  def _WriteMetadata(self):
+    """Writes metadata.
+
+    Raises:
+      IOError: when there is an error querying the attribute container store.
+      OSError: when there is an error querying the attribute container store.
+    """
+    try:
+      self._cursor.execute(self._CREATE_METADATA_TABLE_QUERY)
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError((
+          f'Unable to query attribute container store with error: '
+          f'{exception!s}'))
+
+    self._WriteMetadataValue('format_version', f'{self._FORMAT_VERSION:d}')
+    self._WriteMetadataValue('compression_format', self.compression_format)
+    self._WriteMetadataValue('serialization_format', self.serialization_format)
+
+    self._binary_serializer = None
+    if self.serialization_format == definitions.SERIALIZER_FORMAT_BINARY:
+      self._binary_serializer = (
+          binary_serializer.BinaryAttributeContainerSerializer())
+
+  def _WriteNewAttributeContainer(self, container):
+    """Writes a new attribute container to the store.
+
+    The table for the container type must exist.
+
+    Args:
+      container (AttributeContainer): attribute container.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
     schema = self._GetAttributeContainerSchema(container.CONTAINER_TYPE)
     if schema:
       super(SQLiteStorageFile, self)._WriteNewAttributeContainer(container)
@@ -292,11 +1061,11 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
       serialized_data = self._SerializeAttributeContainer(container)
 
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-        compressed_data = zlib.compress(serialized_data)
-        serialized_data = sqlite3.Binary(compressed_data)
-      else:
+      if self.compression_format == definitions.COMPRESSION_FORMAT_NONE:
         compressed_data = ''
+      else:
+        compressed_data = self._CompressData(serialized_data)
+        serialized_data = sqlite3.Binary(compressed_data)
 
       if self._storage_profiler:
         self._storage_profiler.Sample(
@@ -306,11 +1075,112 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       column_names = ['_data']
       values = [serialized_data]
 
+      if (container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA and
+          self._HasEventDataColumns()):
+        event_data_stream_identifier = container.GetEventDataStreamIdentifier()
+        if event_data_stream_identifier:
+          event_data_stream_identifier = (
+              event_data_stream_identifier.CopyToString())
+
+        column_names.extend(sorted(self._EVENT_DATA_COLUMNS))
+        values.extend([
+            event_data_stream_identifier,
+            getattr(container, '_event_values_hash', None),
+            getattr(container, '_parser_chain', None), container.data_type])
+
       self._CacheAttributeContainerForWrite(
           container.CONTAINER_TYPE, column_names, values)
 
       self._CacheAttributeContainerByIndex(container, next_sequence_number - 1)
 
+  def _WriteSerializationSchemas(self):
+    """Writes the schemas of the binary serialization format added since
+    the last write.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    identifiers = self._binary_serializer.PopNewSchemaIdentifiers()
+    if not identifiers:
+      return
+
+    values = []
+    for identifier in identifiers:
+      container_type, data_type, attribute_names = (
+          self._binary_serializer.GetSchema(identifier))
+      values.append((
+          identifier, container_type, data_type,
+          json.dumps(attribute_names)))
+
+    try:
+      if not self._HasTable(self._SERIALIZATION_SCHEMA_TABLE_NAME):
+        self._cursor.execute((
+            f'CREATE TABLE {self._SERIALIZATION_SCHEMA_TABLE_NAME:s} ('
+            f'_identifier INTEGER PRIMARY KEY, container_type TEXT, '
+            f'data_type TEXT, attribute_names TEXT)'))
+
+      self._cursor.executemany((
+          f'INSERT INTO {self._SERIALIZATION_SCHEMA_TABLE_NAME:s} '
+          f'(_identifier, container_type, data_type, attribute_names) '
+          f'VALUES (?, ?, ?, ?)'), values)
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+  def _WriteSerializedData(self, json_dict):
+    """Writes serialized data of an attribute container.
+
+    Args:
+      json_dict (dict[str, object]): JSON serialized objects of the attribute
+          container.
+
+    Returns:
+      bytes: serialized attribute container data in the serialization format
+          of the storage file.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+      TypeError: if a value cannot be serialized.
+      ValueError: if a value cannot be serialized.
+    """
+    if not self._binary_serializer:
+      return json.dumps(json_dict).encode('utf-8')
+
+    serialized_data = self._binary_serializer.WriteSerialized(json_dict)
+
+    self._WriteSerializationSchemas()
+
+    return serialized_data
+
+  def Close(self):
+    """Closes the file.
+
+    Raises:
+      IOError: if the attribute container store is already closed.
+      OSError: if the attribute container store is already closed.
+    """
+    super(SQLiteStorageFile, self).Close()
+
+    self._SampleEventDataCacheStatistics()
+
+    self._event_data_cache = collections.OrderedDict()
+    self._event_data_cache_size = 0
+
+  def Flush(self):
+    """Writes cached attribute containers and commits them to the file.
+
+    Raises:
+      IOError: when the storage file is closed or read-only or when there is
+          an error querying the storage file.
+      OSError: when the storage file is closed or read-only or when there is
+          an error querying the storage file.
+    """
+    self._RaiseIfNotWritable()
+
+    self._Flush()
+
   def GetAttributeContainerByIndex(self, container_type, index):
     """Retrieves a specific attribute container.
 
@@ -417,12 +1287,222 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       sql_filter_expression = None
       if filter_expression:
         expression_ast = ast.parse(filter_expression, mode='eval')
+
+        if (container_type == self._CONTAINER_TYPE_EVENT_DATA and
+            not self._IsEventDataColumnsExpression(expression_ast)):
+          # The filter expression cannot be evaluated by SQLite, hence it is
+          # matched against the deserialized event data instead.
+          for container in self._GetAttributeContainersWithFilter(
+              container_type, column_names=['_data']):
+            if container.MatchesExpression(filter_expression):
+              yield container
+
+          return
+
         sql_filter_expression = sqlite_store.PythonAST2SQL(expression_ast.body)
 
       yield from self._GetAttributeContainersWithFilter(
           container_type, column_names=['_data'],
           filter_expression=sql_filter_expression)
 
+  def GetEventTagByEventIdentifier(self, event_identifier):
+    """Retrieves the event tag of a specific event.
+
+    The event tag is looked up with a parameterized query on the event tag
+    per event index, so the query is prepared only once.
+
+    Args:
+      event_identifier (AttributeContainerIdentifier): event attribute
+          container identifier.
+
+    Returns:
+      EventTag: event tag or None if the event has no event tag.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self._CommitWriteCache(self._CONTAINER_TYPE_EVENT_TAG)
+
+    if not self._attribute_container_sequence_numbers[
+        self._CONTAINER_TYPE_EVENT_TAG]:
+      return None
+
+    schema = self._GetAttributeContainerSchema(self._CONTAINER_TYPE_EVENT_TAG)
+    column_names = sorted(schema.keys())
+    column_names_string = ', '.join(column_names)
+
+    query = (
+        f'SELECT _identifier, {column_names_string:s} FROM event_tag '
+        f'WHERE _event_identifier = ?')
+
+    if self._storage_profiler:
+      self._storage_profiler.StartTiming('get_event_tag')
+
+    try:
+      self._cursor.execute(query, (event_identifier.CopyToString(), ))
+      rows = self._cursor.fetchall()
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+    finally:
+      if self._storage_profiler:
+        self._storage_profiler.StopTiming('get_event_tag')
+
+    if not rows:
+      return None
+
+    if len(rows) > 1:
+      logger.warning('More than 1 event tag returned.')
+
+    event_tag = self._CreateAttributeContainerFromRow(
+        self._CONTAINER_TYPE_EVENT_TAG, column_names, rows[0], 1)
+
+    identifier = containers_interface.AttributeContainerIdentifier(
+        name=self._CONTAINER_TYPE_EVENT_TAG, sequence_number=rows[0][0])
+    event_tag.SetIdentifier(identifier)
+
+    return event_tag
+
+  def GetEventTimestampQuantiles(self, number_of_quantiles):
+    """Retrieves timestamps that divide the events into equal sized groups.
+
+    Args:
+      number_of_quantiles (int): number of groups to divide the events into.
+
+    Returns:
+      list[int]: timestamp of the first event of each group, in chronological
+          order, where the list contains fewer timestamps if there are fewer
+          events than groups.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self._CommitWriteCache(self._CONTAINER_TYPE_EVENT)
+
+    if not self._attribute_container_sequence_numbers[
+        self._CONTAINER_TYPE_EVENT]:
+      return []
+
+    # Note that NTILE divides the sorted events into groups whose number of
+    # events differ by at most 1.
+    query = (
+        f'SELECT MIN(timestamp) FROM (SELECT timestamp, NTILE('
+        f'{number_of_quantiles:d}) OVER (ORDER BY timestamp) AS quantile '
+        f'FROM event) GROUP BY quantile ORDER BY quantile')
+
+    try:
+      self._cursor.execute(query)
+      rows = self._cursor.fetchall()
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+    return [row[0] for row in rows]
+
+  def GetEventsWithEventDataByDataType(self, data_types):
+    """Retrieves the events and event data of specific data types.
+
+    The events are retrieved in the order they were stored instead of in
+    chronological order, which does not require the events to be sorted. If
+    the event data table contains the event data columns, only event data of
+    the specified data types is read and deserialized.
+
+    Args:
+      data_types (set[str]): data types of the event data to retrieve.
+
+    Yields:
+      tuple: containing:
+
+        EventObject: event.
+        EventData: event data.
+        EventDataStream: event data stream or None if not available.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    for container_type in (
+        self._CONTAINER_TYPE_EVENT, self._CONTAINER_TYPE_EVENT_DATA):
+      self._CommitWriteCache(container_type)
+
+    if not self._attribute_container_sequence_numbers[
+        self._CONTAINER_TYPE_EVENT]:
+      return
+
+    # Use a local cursor to prevent another query interrupting the generator.
+    cursor = self._connection.cursor()
+
+    query = 'SELECT _identifier, _data FROM event_data WHERE _identifier > ?'
+    parameters = []
+
+    if self._HasEventDataColumns():
+      parameters = sorted(data_types)
+      parameters_string = ', '.join(['?'] * len(parameters))
+      query = f'{query:s} AND data_type IN ({parameters_string:s})'
+
+    query = (
+        f'{query:s} ORDER BY _identifier LIMIT {self._READ_BATCH_SIZE:d}')
+
+    event_data_per_identifier = {}
+    for row in self._GetRowsInBatches(cursor, query, parameters):
+      event_data = self._CreateAttributeContainerFromRow(
+          self._CONTAINER_TYPE_EVENT_DATA, ['_data'], row, 1)
+      if event_data.data_type not in data_types:
+        continue
+
+      identifier = containers_interface.AttributeContainerIdentifier(
+          name=self._CONTAINER_TYPE_EVENT_DATA, sequence_number=row[0])
+      event_data.SetIdentifier(identifier)
+
+      event_data_per_identifier[identifier.CopyToString()] = event_data
+
+    if not event_data_per_identifier:
+      return
+
+    event_schema = self._GetAttributeContainerSchema(
+        self._CONTAINER_TYPE_EVENT)
+    event_column_names = sorted(event_schema.keys())
+
+    column_names_string = ', '.join(event_column_names)
+    query = (
+        f'SELECT _identifier, {column_names_string:s} FROM event '
+        f'WHERE _identifier > ? ORDER BY _identifier '
+        f'LIMIT {self._READ_BATCH_SIZE:d}')
+
+    # The event data identifier is compared before the event is created, hence
+    # only events of the specified data types are deserialized.
+    event_data_identifier_column_index = event_column_names.index(
+        '_event_data_identifier') + 1
+
+    event_data_streams = {}
+    for row in self._GetRowsInBatches(cursor, query, []):
+      event_data = event_data_per_identifier.get(
+          row[event_data_identifier_column_index], None)
+      if not event_data:
+        continue
+
+      event = self._CreateAttributeContainerFromRow(
+          self._CONTAINER_TYPE_EVENT, event_column_names, row, 1)
+
+      identifier = containers_interface.AttributeContainerIdentifier(
+          name=self._CONTAINER_TYPE_EVENT, sequence_number=row[0])
+      event.SetIdentifier(identifier)
+
+      event_data_stream = None
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        lookup_key = event_data_stream_identifier.CopyToString()
+        event_data_stream = event_data_streams.get(lookup_key, None)
+        if not event_data_stream:
+          event_data_stream = self.GetAttributeContainerByIdentifier(
+              self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+              event_data_stream_identifier)
+          event_data_streams[lookup_key] = event_data_stream
+
+      yield event, event_data, event_data_stream
+
   def GetSortedEvents(self, time_range=None):
     """Retrieves the events in increasing chronological order.
 
@@ -440,10 +1520,10 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     if time_range:
       filter_expression = []
 
-      if time_range.start_timestamp:
+      if time_range.start_timestamp is not None:
         filter_expression.append(f'timestamp >= {time_range.start_timestamp:d}')
 
-      if time_range.end_timestamp:
+      if time_range.end_timestamp is not None:
         filter_expression.append(f'timestamp <= {time_range.end_timestamp:d}')
 
       filter_expression = ' AND '.join(filter_expression)
@@ -452,6 +1532,272 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
         self._CONTAINER_TYPE_EVENT, column_names=column_names,
         filter_expression=filter_expression, order_by='timestamp')
 
+  def GetSortedEventsWithEventData(self, time_range=None):
+    """Retrieves the events and their event data in chronological order.
+
+    The event data and event tag of the events are retrieved by joining them
+    in a single query instead of separate queries per event. If the event data
+    table contains the event data columns, events with the same timestamp are
+    sorted by event values hash and timestamp description.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+
+    Yields:
+      tuple: containing:
+
+        EventObject: event.
+        EventData: event data.
+        EventDataStream: event data stream or None if not available.
+        EventTag: event tag or None if the event has no event tag.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    for container_type in (
+        self._CONTAINER_TYPE_EVENT, self._CONTAINER_TYPE_EVENT_DATA,
+        self._CONTAINER_TYPE_EVENT_TAG):
+      self._CommitWriteCache(container_type)
+
+    if not self._attribute_container_sequence_numbers[
+        self._CONTAINER_TYPE_EVENT]:
+      return
+
+    event_schema = self._GetAttributeContainerSchema(
+        self._CONTAINER_TYPE_EVENT)
+    event_column_names = sorted(event_schema.keys())
+
+    event_data_column_names = ['_data']
+
+    column_names = ['event._identifier']
+    column_names.extend([f'event.{name:s}' for name in event_column_names])
+    column_names.extend(['event_data._identifier', 'event_data._data'])
+
+    # The event data identifier is stored as a string, such as
+    # "event_data.1", from which the row identifier is extracted.
+    event_data_row_offset = len(self._CONTAINER_TYPE_EVENT_DATA) + 2
+
+    query = (
+        f'FROM event JOIN event_data ON event_data._identifier = '
+        f'CAST(SUBSTR(event._event_data_identifier, '
+        f'{event_data_row_offset:d}) AS INTEGER)')
+
+    has_event_tags = bool(self._attribute_container_sequence_numbers[
+        self._CONTAINER_TYPE_EVENT_TAG])
+    if has_event_tags:
+      event_tag_schema = self._GetAttributeContainerSchema(
+          self._CONTAINER_TYPE_EVENT_TAG)
+      event_tag_column_names = sorted(event_tag_schema.keys())
+
+      column_names.append('event_tag._identifier')
+      column_names.extend([
+          f'event_tag.{name:s}' for name in event_tag_column_names])
+
+      # Note that this join uses the event_tag_per_event index.
+      query = (
+          f'{query:s} LEFT JOIN event_tag ON event_tag._event_identifier = '
+          f'\'{self._CONTAINER_TYPE_EVENT:s}.\' || event._identifier')
+
+    column_names_string = ', '.join(column_names)
+    query = f'SELECT {column_names_string:s} {query:s}'
+
+    if time_range:
+      filter_expression = []
+
+      if time_range.start_timestamp is not None:
+        filter_expression.append(
+            f'event.timestamp >= {time_range.start_timestamp:d}')
+
+      if time_range.end_timestamp is not None:
+        filter_expression.append(
+            f'event.timestamp <= {time_range.end_timestamp:d}')
+
+      if filter_expression:
+        filter_expression = ' AND '.join(filter_expression)
+        query = f'{query:s} WHERE {filter_expression:s}'
+
+    if self._HasEventDataColumns():
+      query = (
+          f'{query:s} ORDER BY event.timestamp, '
+          f'event_data._event_values_hash, event.timestamp_desc, '
+          f'event._identifier')
+    else:
+      query = f'{query:s} ORDER BY event.timestamp, event._identifier'
+
+    # Use a local cursor to prevent another query interrupting the generator.
+    cursor = self._connection.cursor()
+
+    try:
+      cursor.execute(query)
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+    event_data_column_index = len(event_column_names) + 1
+    event_tag_column_index = event_data_column_index + 2
+
+    while True:
+      if self._storage_profiler:
+        self._storage_profiler.StartTiming('get_sorted_events')
+
+      try:
+        row = cursor.fetchone()
+      finally:
+        if self._storage_profiler:
+          self._storage_profiler.StopTiming('get_sorted_events')
+
+      if not row:
+        break
+
+      event = self._CreateAttributeContainerFromRow(
+          self._CONTAINER_TYPE_EVENT, event_column_names, row, 1)
+
+      identifier = containers_interface.AttributeContainerIdentifier(
+          name=self._CONTAINER_TYPE_EVENT, sequence_number=row[0])
+      event.SetIdentifier(identifier)
+
+      event_data_row_number = row[event_data_column_index]
+      event_data = self._GetCachedAttributeContainer(
+          self._CONTAINER_TYPE_EVENT_DATA, event_data_row_number - 1)
+      if not event_data:
+        event_data = self._CreateAttributeContainerFromRow(
+            self._CONTAINER_TYPE_EVENT_DATA, event_data_column_names, row,
+            event_data_column_index + 1)
+
+        identifier = containers_interface.AttributeContainerIdentifier(
+            name=self._CONTAINER_TYPE_EVENT_DATA,
+            sequence_number=event_data_row_number)
+        event_data.SetIdentifier(identifier)
+
+        self._CacheAttributeContainerByIndex(
+            event_data, event_data_row_number - 1)
+
+      event_data_stream = None
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        event_data_stream = self.GetAttributeContainerByIdentifier(
+            self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+            event_data_stream_identifier)
+
+      event_tag = None
+      if has_event_tags and row[event_tag_column_index] is not None:
+        event_tag = self._CreateAttributeContainerFromRow(
+            self._CONTAINER_TYPE_EVENT_TAG, event_tag_column_names, row,
+            event_tag_column_index + 1)
+
+        identifier = containers_interface.AttributeContainerIdentifier(
+            name=self._CONTAINER_TYPE_EVENT_TAG,
+            sequence_number=row[event_tag_column_index])
+        event_tag.SetIdentifier(identifier)
+
+      yield event, event_data, event_data_stream, event_tag
+
+  def GetTaggedEventIdentifiers(self):
+    """Retrieves the identifiers of the events that have an event tag.
+
+    Returns:
+      set[str]: string representations of the identifiers of the tagged events.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self._CommitWriteCache(self._CONTAINER_TYPE_EVENT_TAG)
+
+    if not self._attribute_container_sequence_numbers[
+        self._CONTAINER_TYPE_EVENT_TAG]:
+      return set()
+
+    query = 'SELECT _event_identifier FROM event_tag'
+
+    try:
+      self._cursor.execute(query)
+      return {row[0] for row in self._cursor.fetchall()}
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+  def HasEventsSortedByEventValuesHash(self):
+    """Determines if sorted events are sorted by event values hash.
+
+    Returns:
+      bool: True if GetSortedEventsWithEventData sorts events with the same
+          timestamp by event values hash and timestamp description.
+    """
+    return self._HasEventDataColumns()
+
+  def MergeAttributeContainers(
+      self, path, container_type, identifier_offsets=None):
+    """Merges attribute containers of a specific type from another storage file.
+
+    The other storage file is attached to the database connection and its
+    attribute containers are copied in a single transaction. References to
+    attribute containers, that were merged previously, are remapped by adding
+    the sequence number offset of the referenced attribute container type.
+
+    Args:
+      path (str): path of the storage file to merge.
+      container_type (str): attribute container type.
+      identifier_offsets (Optional[dict[str, int]]): sequence number offsets
+          per referenced attribute container type.
+
+    Returns:
+      int: number of attribute containers that were merged.
+
+    Raises:
+      IOError: when there is an error querying the storage file or if
+          an unsupported attribute container is provided.
+      OSError: when there is an error querying the storage file or if
+          an unsupported attribute container is provided.
+    """
+    self._RaiseIfNotWritable()
+
+    identifier_offsets = identifier_offsets or {}
+
+    # Attaching a database is not supported within a transaction.
+    self._Flush()
+
+    try:
+      self._cursor.execute(
+          f'ATTACH DATABASE ? AS {self._MERGE_DATABASE_NAME:s}', (path, ))
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to attach storage file with error: {exception!s}')
+
+    if self._storage_profiler:
+      self._storage_profiler.StartTiming('merge')
+
+    is_committed = False
+
+    try:
+      number_of_containers = self._MergeAttributeContainers(
+          container_type, identifier_offsets)
+
+      self._connection.commit()
+      is_committed = True
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError,
+            ValueError) as exception:
+      raise IOError(f'Unable to merge storage file with error: {exception!s}')
+
+    finally:
+      # The transaction is rolled back on any error, since the merge database
+      # cannot be detached while the transaction is open.
+      if not is_committed:
+        self._RollbackMerge()
+
+      if self._storage_profiler:
+        self._storage_profiler.StopTiming('merge')
+
+      self._cursor.execute(f'DETACH DATABASE {self._MERGE_DATABASE_NAME:s}')
+
+    next_sequence_number = self._attribute_container_sequence_numbers[
+        container_type]
+    self._SetAttributeContainerNextSequenceNumber(
+        container_type, next_sequence_number + number_of_containers)
+
+    return number_of_containers
+
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
 
@@ -459,3 +1805,66 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       serializers_profiler (SerializersProfiler): serializers profiler.
     """
     self._serializers_profiler = serializers_profiler
+
+  def SetStorageProfiler(self, storage_profiler):
+    """Sets the storage profiler.
+
+    The event data cache hits and misses are sampled by the storage profiler
+    that is replaced.
+
+    Args:
+      storage_profiler (StorageProfiler): storage profiler.
+    """
+    self._SampleEventDataCacheStatistics()
+
+    super(SQLiteStorageFile, self).SetStorageProfiler(storage_profiler)
+
+  def TruncateAttributeContainers(self, container_type, number_of_containers):
+    """Removes the attribute containers of a specific type after an index.
+
+    The sequence numbers of attribute containers added after truncation
+    continue from the number of remaining attribute containers.
+
+    Args:
+      container_type (str): attribute container type.
+      number_of_containers (int): number of attribute containers to keep.
+
+    Raises:
+      IOError: when the storage file is closed or read-only or when there is
+          an error querying the storage file.
+      OSError: when the storage file is closed or read-only or when there is
+          an error querying the storage file.
+    """
+    self._RaiseIfNotWritable()
+
+    next_sequence_number = self._attribute_container_sequence_numbers[
+        container_type]
+    if next_sequence_number <= number_of_containers:
+      return
+
+    self._Flush()
+
+    try:
+      self._cursor.execute(
+          f'DELETE FROM {container_type:s} WHERE rowid > ?',
+          (number_of_containers, ))
+
+      # Reset the AUTOINCREMENT value of the table, so that the rowid of
+      # the next attribute container corresponds with its sequence number.
+      self._cursor.execute(
+          'UPDATE sqlite_sequence SET seq = ? WHERE name = ?',
+          (number_of_containers, container_type))
+
+      self._connection.commit()
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      self._connection.rollback()
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+    self._SetAttributeContainerNextSequenceNumber(
+        container_type, number_of_containers)
+
+    # Cached attribute containers can refer to removed rows.
+    self._attribute_container_cache = collections.OrderedDict()
+    self._event_data_cache = collections.OrderedDict()
+    self._event_data_cache_size = 0
@@ -21,6 +21,17 @@ class SQLiteStorageWriter(writer.StorageWriter):
     self._written_event_data_index = 0
     self._written_event_source_index = 0
 
+  def Flush(self):
+    """Writes cached attribute containers and commits them to the storage.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    self._RaiseIfNotWritable()
+
+    self._store.Flush()
+
   def GetFirstWrittenEventData(self):
     """Retrieves the first event data that was written after open.
 
@@ -107,12 +118,48 @@ class SQLiteStorageWriter(writer.StorageWriter):
       self._written_event_source_index += 1
     return event_source
 
+  def MergeAttributeContainers(
+      self, path, container_type, identifier_offsets=None):
+    """Merges attribute containers of a specific type from a storage file.
+
+    Args:
+      path (str): path of the SQLite storage file to merge.
+      container_type (str): attribute container type.
+      identifier_offsets (Optional[dict[str, int]]): sequence number offsets
+          per referenced attribute container type.
+
+    Returns:
+      int: number of attribute containers that were merged.
+
+    Raises:
+      IOError: when the storage writer is closed or when there is an error
+          querying the storage file.
+      OSError: when the storage writer is closed or when there is an error
+          querying the storage file.
+    """
+    self._RaiseIfNotWritable()
+
+    number_of_containers = self._store.MergeAttributeContainers(
+        path, container_type, identifier_offsets=identifier_offsets)
+
+    self._attribute_containers_counter[container_type] += number_of_containers
+
+    return number_of_containers
+
   # pylint: disable=arguments-differ
-  def Open(self, path=None, **unused_kwargs):
+  def Open(
+      self, path=None, compression_format=None, serialization_format=None,
+      **unused_kwargs):
     """Opens the storage writer.
 
     Args:
       path (Optional[str]): path to the output SQLite database.
+      compression_format (Optional[str]): compression format of serialized
+          attribute containers, where None represents the default. Note that
+          the compression format of an existing storage file is preserved.
+      serialization_format (Optional[str]): serialization format of attribute
+          containers, where None represents the default. Note that the
+          serialization format of an existing storage file is preserved.
 
     Raises:
       IOError: if the storage writer is already opened.
@@ -123,6 +170,12 @@ class SQLiteStorageWriter(writer.StorageWriter):
 
     self._store = sqlite_file.SQLiteStorageFile()
 
+    if compression_format:
+      self._store.compression_format = compression_format
+
+    if serialization_format:
+      self._store.serialization_format = serialization_format
+
     if self._serializers_profiler:
       self._store.SetSerializersProfiler(self._serializers_profiler)
 
@@ -140,3 +193,33 @@ class SQLiteStorageWriter(writer.StorageWriter):
         self._CONTAINER_TYPE_EVENT_SOURCE)
     self._first_written_event_source_index = number_of_containers
     self._written_event_source_index = self._first_written_event_source_index
+
+  def TruncateAttributeContainers(self, container_type, number_of_containers):
+    """Removes the attribute containers of a specific type after an index.
+
+    Args:
+      container_type (str): attribute container type.
+      number_of_containers (int): number of attribute containers to keep.
+
+    Raises:
+      IOError: when the storage writer is closed or when there is an error
+          querying the storage file.
+      OSError: when the storage writer is closed or when there is an error
+          querying the storage file.
+    """
+    self._RaiseIfNotWritable()
+
+    self._store.TruncateAttributeContainers(
+        container_type, number_of_containers)
+
+    if container_type == self._CONTAINER_TYPE_EVENT_DATA:
+      self._first_written_event_data_index = min(
+          self._first_written_event_data_index, number_of_containers)
+      self._written_event_data_index = min(
+          self._written_event_data_index, number_of_containers)
+
+    elif container_type == self._CONTAINER_TYPE_EVENT_SOURCE:
+      self._first_written_event_source_index = min(
+          self._first_written_event_source_index, number_of_containers)
+      self._written_event_source_index = min(
+          self._written_event_source_index, number_of_containers)
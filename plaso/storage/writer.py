@@ -74,14 +74,8 @@ class StorageWriter(reader.StorageReader):
 
     event_tag = self._event_tag_per_event_identifier.get(lookup_key, None)
     if not event_tag:
-      generator = self._store.GetAttributeContainers(
-          self._CONTAINER_TYPE_EVENT_TAG,
-          filter_expression=f'_event_identifier == "{lookup_key:s}"')
-
-      existing_event_tags = list(generator)
-      if len(existing_event_tags) == 1:
-        event_tag = existing_event_tags[0]
-
+      event_tag = self._store.GetEventTagByEventIdentifier(event_identifier)
+      if event_tag:
         if len(self._event_tag_per_event_identifier) >= (
             self._MAXIMUM_CACHED_EVENT_TAGS):
           self._event_tag_per_event_identifier.popitem(last=True)
@@ -119,6 +113,11 @@ class StorageWriter(reader.StorageReader):
 
     self._attribute_containers_counter[container.CONTAINER_TYPE] += 1
 
+    if (container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_TAG and
+        self._tagged_event_identifiers is not None):
+      event_identifier = container.GetEventIdentifier()
+      self._tagged_event_identifiers.add(event_identifier.CopyToString())
+
   def AddOrUpdateEventTag(self, event_tag):
     """Adds a new or updates an existing event tag.
 
@@ -159,6 +158,7 @@ class StorageWriter(reader.StorageReader):
 
     self._store.Close()
     self._store = None
+    self._tagged_event_identifiers = None
 
   @abc.abstractmethod
   def GetFirstWrittenEventData(self):
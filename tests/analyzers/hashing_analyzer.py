@@ -12,6 +12,31 @@ from tests import test_lib as shared_test_lib
 from tests.analyzers.hashers import manager as manager_test
 
 
+class TestAnalyzersProfiler(object):
+  """Analyzers profiler for testing.
+
+  Attributes:
+    samples (list[tuple[str, int, float]]): hasher name, number of bytes and
+        processing time of the samples.
+  """
+
+  def __init__(self):
+    """Initializes an analyzers profiler for testing."""
+    super(TestAnalyzersProfiler, self).__init__()
+    self.samples = []
+
+  def SampleHasher(self, hasher_name, number_of_bytes, processing_time):
+    """Takes a sample of the hasher throughput for profiling.
+
+    Args:
+      hasher_name (str): name of the hasher.
+      number_of_bytes (int): number of bytes processed by the hasher.
+      processing_time (float): time in seconds the hasher spent processing
+          the bytes.
+    """
+    self.samples.append((hasher_name, number_of_bytes, processing_time))
+
+
 class HashingAnalyzerTest(shared_test_lib.BaseTestCase):
   """Test the Hashing analyzer."""
 
@@ -46,6 +71,46 @@ class HashingAnalyzerTest(shared_test_lib.BaseTestCase):
     self.assertEqual(first_result.attribute_value, '4')
     self.assertEqual(len(results), 1)
 
+  def testHashFileWithThreads(self):
+    """Tests that results are produced correctly when using threads."""
+    analyzer = hashing_analyzer.HashingAnalyzer()
+    analyzer.SetHasherNames('md5,sha1,sha256')
+    analyzer.SetNumberOfThreads(2)
+    analyzer.Analyze(b'test ')
+    analyzer.Analyze(b'data')
+    analyzer.SetNumberOfThreads(0)
+
+    results = analyzer.GetResults()
+    self.assertEqual(len(results), 3)
+
+    expected_hashes = {
+        'md5_hash': 'eb733a00c0c9d336e65691a37ab54293',
+        'sha1_hash': 'f48dd853820860816c75d54d0f584dc863327a7c',
+        'sha256_hash': (
+            '916f0027a575074ce72a331777c3478d6513f786a591bd892da1a577bf2335f9')}
+    hashes = {
+        result.attribute_name: result.attribute_value for result in results}
+    self.assertEqual(hashes, expected_hashes)
+
+  def testSampleHasherStatistics(self):
+    """Tests the SampleHasherStatistics function."""
+    analyzer = hashing_analyzer.HashingAnalyzer()
+    analyzer.SetHasherNames('testhash')
+    analyzer.Analyze(b'test data')
+    analyzer.Reset()
+    analyzer.Analyze(b'data')
+
+    test_profiler = TestAnalyzersProfiler()
+    analyzer.SampleHasherStatistics(test_profiler)
+
+    self.assertEqual(len(test_profiler.samples), 1)
+    self.assertEqual(test_profiler.samples[0][:2], ('testhash', 13))
+
+    test_profiler = TestAnalyzersProfiler()
+    analyzer.SampleHasherStatistics(test_profiler)
+
+    self.assertEqual(test_profiler.samples, [])
+
 
 if __name__ == '__main__':
   unittest.main()
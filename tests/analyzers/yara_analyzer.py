@@ -2,10 +2,20 @@
 # -*- coding: utf-8 -*-
 """Tests for the Yara analyzer."""
 
+import os
 import unittest
 
+from unittest import mock
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+import yara
+
 from plaso.containers import analyzer_result
 from plaso.analyzers import yara_analyzer
+from plaso.lib import bytes_file
 
 from tests import test_lib as shared_test_lib
 
@@ -31,6 +41,93 @@ class YaraAnalyzerTest(shared_test_lib.BaseTestCase):
     with open(yara_rules_path, 'r', encoding='utf-8') as file_object:
       return file_object.read()
 
+  def testAnalyzeFileObject(self):
+    """Tests the AnalyzeFileObject function."""
+    test_yara_rules = self._ReadTestRuleFile()
+
+    test_file_path = self._GetTestFilePath(['test_pe.exe'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetRules(test_yara_rules)
+
+    # Test with a file-like object that is not stored in memory.
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_object = path_spec_resolver.Resolver.OpenFileObject(path_spec)
+
+    analyzer.AnalyzeFileObject(file_object)
+
+    results = analyzer.GetResults()
+    self.assertEqual(len(results), 1)
+    self.assertEqual(results[0].attribute_value, ['PEfileBasic', 'PEfile'])
+
+    analyzer.Reset()
+
+    # Test with a temporary directory.
+    with shared_test_lib.TempDirectory() as temp_directory:
+      analyzer.SetTemporaryDirectory(temp_directory)
+
+      analyzer.AnalyzeFileObject(file_object)
+
+    analyzer.SetTemporaryDirectory(None)
+
+    results = analyzer.GetResults()
+    self.assertEqual(len(results), 1)
+    self.assertEqual(results[0].attribute_value, ['PEfileBasic', 'PEfile'])
+
+    analyzer.Reset()
+
+    # Test with not enough free disk space for a temporary file.
+    with mock.patch.object(
+        yara_analyzer.YaraAnalyzer, '_HasFreeDiskSpace', return_value=False):
+      analyzer.AnalyzeFileObject(file_object)
+
+    results = analyzer.GetResults()
+    self.assertEqual(len(results), 1)
+    self.assertEqual(results[0].attribute_value, ['PEfileBasic', 'PEfile'])
+
+    analyzer.Reset()
+
+    # Test with a file-like object that is stored in memory.
+    with open(test_file_path, 'rb') as file_object:
+      test_data = file_object.read()
+
+    file_object = bytes_file.BytesFileIO(test_data)
+
+    analyzer.AnalyzeFileObject(file_object)
+
+    results = analyzer.GetResults()
+    self.assertEqual(len(results), 1)
+    self.assertEqual(results[0].attribute_value, ['PEfileBasic', 'PEfile'])
+
+    # Test that matches of multiple blocks of data are reported only once.
+    analyzer.Reset()
+
+    analyzer.Analyze(test_data)
+    analyzer.Analyze(test_data)
+
+    results = analyzer.GetResults()
+    self.assertEqual(len(results), 1)
+    self.assertEqual(results[0].attribute_value, ['PEfileBasic', 'PEfile'])
+
+  def testHasFreeDiskSpace(self):
+    """Tests the _HasFreeDiskSpace function."""
+    analyzer = yara_analyzer.YaraAnalyzer()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      analyzer.SetTemporaryDirectory(temp_directory)
+
+      result = analyzer._HasFreeDiskSpace(0)
+      self.assertTrue(result)
+
+      result = analyzer._HasFreeDiskSpace(1 << 62)
+      self.assertFalse(result)
+
+    # Test with a temporary directory that no longer exists.
+    result = analyzer._HasFreeDiskSpace(0)
+    self.assertFalse(result)
+
   def testFileRuleParse(self):
     """Tests that the Yara analyzer can read rules."""
     test_yara_rules = self._ReadTestRuleFile()
@@ -40,6 +137,21 @@ class YaraAnalyzerTest(shared_test_lib.BaseTestCase):
 
     self.assertIsNotNone(analyzer._rules)
 
+  def testLoadRules(self):
+    """Tests the LoadRules function."""
+    test_yara_rules = self._ReadTestRuleFile()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      compiled_rules_path = os.path.join(temp_directory, 'rules.yarac')
+
+      rules = yara.compile(source=test_yara_rules)
+      rules.save(compiled_rules_path)
+
+      analyzer = yara_analyzer.YaraAnalyzer()
+      analyzer.LoadRules(compiled_rules_path)
+
+    self.assertIsNotNone(analyzer._rules)
+
   def testMatchFile(self):
     """Tests that the Yara analyzer correctly matches a file."""
     test_yara_rules = self._ReadTestRuleFile()
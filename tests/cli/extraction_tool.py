@@ -3,6 +3,7 @@
 """Tests for the extraction tool object."""
 
 import argparse
+import os
 import unittest
 
 try:
@@ -11,7 +12,11 @@ except ImportError:
   resource = None
 
 from plaso.cli import extraction_tool
+from plaso.containers import sessions
+from plaso.lib import errors
+from plaso.storage.sqlite import writer as sqlite_writer
 
+from tests import test_lib as shared_test_lib
 from tests.cli import test_lib
 
 
@@ -22,6 +27,7 @@ class ExtractionToolTest(test_lib.CLIToolTestCase):
 
   _EXPECTED_PERFORMANCE_OPTIONS = """\
 usage: extraction_tool_test.py [--buffer_size BUFFER_SIZE]
+                               [--data_stream_buffer_size SIZE]
                                [--queue_size QUEUE_SIZE]
 
 Test argument parser.
@@ -29,6 +35,12 @@ Test argument parser.
 {0:s}:
   --buffer_size BUFFER_SIZE, --buffer-size BUFFER_SIZE, --bs BUFFER_SIZE
                         The buffer size for the output (defaults to 196MiB).
+  --data_stream_buffer_size SIZE, --data-stream-buffer-size SIZE
+                        The maximum size of a data stream that is buffered in
+                        memory, so that the data read by the analyzers, such
+                        as the hashers, is reused by the parsers. A size
+                        suffix of "m" represents MiB, where 0 disables
+                        buffering (defaults to 16MiB).
   --queue_size QUEUE_SIZE, --queue-size QUEUE_SIZE
                         The maximum number of queued items per worker
                         (defaults to 125000)
@@ -36,17 +48,32 @@ Test argument parser.
 
   if resource is None:
     _EXPECTED_PROCESSING_OPTIONS = """\
-usage: extraction_tool_test.py [--single_process]
+usage: extraction_tool_test.py [--resume] [--single_process]
                                [--temporary_directory DIRECTORY]
                                [--vfs_back_end TYPE]
+                               [--task_batch_file_size_limit SIZE]
+                               [--task_batch_size NUMBER]
                                [--worker_memory_limit SIZE]
                                [--worker_timeout MINUTES] [--workers WORKERS]
 
 Test argument parser.
 
 {0:s}:
+  --resume              Resume an aborted extraction into the existing storage
+                        file from its last checkpoint. Event sources that were
+                        processed before the checkpoint are not processed
+                        again.
   --single_process, --single-process
                         Indicate that the tool should run in a single process.
+  --task_batch_file_size_limit SIZE, --task-batch-file-size-limit SIZE
+                        Maximum size of a file in bytes, for it to be
+                        processed together with other small files in a single
+                        task, where 0 represents no batching. The default
+                        limit is 262144 (256 KiB).
+  --task_batch_size NUMBER, --task-batch-size NUMBER
+                        Maximum number of small files that are processed
+                        together in a single task, where 1 represents no
+                        batching. The default is 32.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
@@ -72,10 +99,12 @@ Test argument parser.
 
   else:
     _EXPECTED_PROCESSING_OPTIONS = """\
-usage: extraction_tool_test.py [--single_process]
+usage: extraction_tool_test.py [--resume] [--single_process]
                                [--process_memory_limit SIZE]
                                [--temporary_directory DIRECTORY]
                                [--vfs_back_end TYPE]
+                               [--task_batch_file_size_limit SIZE]
+                               [--task_batch_size NUMBER]
                                [--worker_memory_limit SIZE]
                                [--worker_timeout MINUTES] [--workers WORKERS]
 
@@ -90,8 +119,21 @@ Test argument parser.
                         worker processes. This limit is enforced by the
                         operating system and will supersede the worker memory
                         limit (--worker_memory_limit).
+  --resume              Resume an aborted extraction into the existing storage
+                        file from its last checkpoint. Event sources that were
+                        processed before the checkpoint are not processed
+                        again.
   --single_process, --single-process
                         Indicate that the tool should run in a single process.
+  --task_batch_file_size_limit SIZE, --task-batch-file-size-limit SIZE
+                        Maximum size of a file in bytes, for it to be
+                        processed together with other small files in a single
+                        task, where 0 represents no batching. The default
+                        limit is 262144 (256 KiB).
+  --task_batch_size NUMBER, --task-batch-size NUMBER
+                        Maximum number of small files that are processed
+                        together in a single task, where 1 represents no
+                        batching. The default is 32.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
@@ -183,6 +225,46 @@ Test argument parser.
         filename='bar')
     self.assertRegex(storage_filename, expected_storage_filename)
 
+  def testGetResumableSession(self):
+    """Tests the _GetResumableSession function."""
+    test_tool = extraction_tool.ExtractionTool()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      storage_writer = sqlite_writer.SQLiteStorageWriter()
+      storage_writer.Open(path=temp_file)
+
+      try:
+        with self.assertRaises(errors.BadConfigOption):
+          test_tool._GetResumableSession(storage_writer)
+
+        session = sessions.Session()
+        storage_writer.AddAttributeContainer(session)
+
+        with self.assertRaises(errors.BadConfigOption):
+          test_tool._GetResumableSession(storage_writer)
+
+        session_checkpoint = sessions.SessionCheckpoint(
+            session_identifier=session.identifier)
+        storage_writer.AddAttributeContainer(session_checkpoint)
+
+        resumable_session, resumable_session_checkpoint = (
+            test_tool._GetResumableSession(storage_writer))
+        self.assertEqual(resumable_session.identifier, session.identifier)
+        self.assertEqual(
+            resumable_session_checkpoint.session_identifier,
+            session.identifier)
+
+        session.aborted = False
+        session.completion_time = 1
+        storage_writer.UpdateAttributeContainer(session)
+
+        with self.assertRaises(errors.BadConfigOption):
+          test_tool._GetResumableSession(storage_writer)
+
+      finally:
+        storage_writer.Close()
+
   def testParseExtractionOptions(self):
     """Tests the _ParseExtractionOptions function."""
     test_tool = extraction_tool.ExtractionTool()
@@ -208,6 +290,19 @@ Test argument parser.
 
     test_tool._ParsePerformanceOptions(options)
 
+    self.assertIsNone(test_tool._data_stream_buffer_size)
+
+    options.data_stream_buffer_size = '8m'
+
+    test_tool._ParsePerformanceOptions(options)
+
+    self.assertEqual(test_tool._data_stream_buffer_size, 8 * 1024 * 1024)
+
+    options.data_stream_buffer_size = 'bogus'
+
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool._ParsePerformanceOptions(options)
+
   def testParseProcessingOptions(self):
     """Tests the _ParseProcessingOptions function."""
     test_tool = extraction_tool.ExtractionTool()
@@ -216,6 +311,12 @@ Test argument parser.
 
     test_tool._ParseProcessingOptions(options)
 
+    options.resume = True
+    options.single_process = True
+
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool._ParseProcessingOptions(options)
+
   # TODO: add test for _ReadParserPresetsFromFile
   # TODO: add test for _SetExtractionPreferredTimeZone
 
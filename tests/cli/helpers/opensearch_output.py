@@ -22,8 +22,10 @@ class OpenSearchOutputArgumentsHelperTest(
 
   _EXPECTED_OUTPUT = """\
 usage: cli_helper.py [--index_name NAME] [--flush_interval INTERVAL]
-                     [--opensearch-server HOSTNAME] [--opensearch-port PORT]
-                     [--opensearch-user USERNAME]
+                     [--opensearch-bulk-request-size SIZE]
+                     [--opensearch-concurrent-requests NUMBER]
+                     [--opensearch-compress] [--opensearch-server HOSTNAME]
+                     [--opensearch-port PORT] [--opensearch-user USERNAME]
                      [--opensearch-password PASSWORD]
                      [--opensearch-mappings PATH]
                      [--opensearch-url-prefix URL_PREFIX] [--use_ssl]
@@ -39,6 +41,15 @@ Test argument parser.
                         Events to queue up before bulk insert to OpenSearch.
   --index_name NAME, --index-name NAME
                         Name of the index in OpenSearch.
+  --opensearch-bulk-request-size SIZE, --opensearch_bulk_request_size SIZE
+                        Maximum size, in bytes, of the events to queue up
+                        before bulk insert to OpenSearch.
+  --opensearch-compress, --opensearch_compress
+                        Compress the bulk inserts sent to OpenSearch with
+                        gzip.
+  --opensearch-concurrent-requests NUMBER, --opensearch_concurrent_requests NUMBER
+                        Number of bulk inserts to send to OpenSearch
+                        concurrently.
   --opensearch-mappings PATH, --opensearch_mappings PATH
                         Path to a file containing mappings for OpenSearch
                         indexing.
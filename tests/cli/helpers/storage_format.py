@@ -18,14 +18,25 @@ class StorageFormatArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--storage_format FORMAT] [--task_storage_format FORMAT]
+usage: cli_helper.py [--storage_format FORMAT]
+                     [--storage_compression_format FORMAT]
+                     [--storage_serialization_format FORMAT]
+                     [--task_storage_format FORMAT]
 
 Test argument parser.
 
 {0:s}:
+  --storage_compression_format FORMAT, --storage-compression-format FORMAT
+                        Compression format of serialized data in the storage
+                        file, the default is: zlib. Supported options: lz4,
+                        none, zlib, zstd
   --storage_format FORMAT, --storage-format FORMAT
                         Format of the storage file, the default is: sqlite.
                         Supported options: sqlite
+  --storage_serialization_format FORMAT, --storage-serialization-format FORMAT
+                        Serialization format of attribute containers without a
+                        schema, such as event data, in the storage file, the
+                        default is: json. Supported options: binary, json
   --task_storage_format FORMAT, --task-storage-format FORMAT
                         Format for task storage, the default is: sqlite.
                         Supported options: redis, sqlite
@@ -46,19 +57,41 @@ Test argument parser.
   def testParseOptions(self):
     """Tests the ParseOptions function."""
     options = cli_test_lib.TestOptions()
+    options.storage_compression_format = 'zstd'
     options.storage_format = 'sqlite'
+    options.storage_serialization_format = 'binary'
     options.task_storage_format = 'sqlite'
 
     test_tool = tools.CLITool()
     storage_format.StorageFormatArgumentsHelper.ParseOptions(options, test_tool)
 
+    self.assertEqual(
+        test_tool._storage_compression_format,
+        options.storage_compression_format)
     self.assertEqual(test_tool._storage_format, options.storage_format)
+    self.assertEqual(
+        test_tool._storage_serialization_format,
+        options.storage_serialization_format)
     self.assertEqual(
         test_tool._task_storage_format, options.task_storage_format)
 
     with self.assertRaises(errors.BadConfigObject):
       storage_format.StorageFormatArgumentsHelper.ParseOptions(options, None)
 
+    with self.assertRaises(errors.BadConfigOption):
+      options.storage_compression_format = 'bogus'
+      storage_format.StorageFormatArgumentsHelper.ParseOptions(
+          options, test_tool)
+
+    options.storage_compression_format = 'zstd'
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.storage_serialization_format = 'bogus'
+      storage_format.StorageFormatArgumentsHelper.ParseOptions(
+          options, test_tool)
+
+    options.storage_serialization_format = 'binary'
+
     with self.assertRaises(errors.BadConfigOption):
       options.storage_format = 'bogus'
       storage_format.StorageFormatArgumentsHelper.ParseOptions(
@@ -18,12 +18,22 @@ class WorkersArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
-                     [--workers WORKERS]
+usage: cli_helper.py [--task_batch_file_size_limit SIZE]
+                     [--task_batch_size NUMBER] [--worker_memory_limit SIZE]
+                     [--worker_timeout MINUTES] [--workers WORKERS]
 
 Test argument parser.
 
 {0:s}:
+  --task_batch_file_size_limit SIZE, --task-batch-file-size-limit SIZE
+                        Maximum size of a file in bytes, for it to be
+                        processed together with other small files in a single
+                        task, where 0 represents no batching. The default
+                        limit is 262144 (256 KiB).
+  --task_batch_size NUMBER, --task-batch-size NUMBER
+                        Maximum number of small files that are processed
+                        together in a single task, where 1 represents no
+                        batching. The default is 32.
   --worker_memory_limit SIZE, --worker-memory-limit SIZE
                         Maximum amount of memory (data segment and shared
                         memory) a worker process is allowed to consume in
@@ -74,6 +84,18 @@ Test argument parser.
       options.workers = -1
       workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
 
+    with self.assertRaises(errors.BadConfigOption):
+      options.task_batch_file_size_limit = -1
+      workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.task_batch_file_size_limit = None
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.task_batch_size = 0
+      workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.task_batch_size = None
+
     with self.assertRaises(errors.BadConfigOption):
       options.worker_memory_limit = 'bogus'
       workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
@@ -99,6 +99,7 @@ class PsortToolTest(test_lib.CLIToolTestCase):
     _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--temporary_directory DIRECTORY]
                      [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--workers WORKERS]
 
 Test argument parser.
 
@@ -118,6 +119,12 @@ Test argument parser.
                         default timeout is 15.0 minutes. If a worker process
                         exceeds this timeout it is killed by the main
                         (foreman) process.
+  --workers WORKERS     Number of worker processes used to format the events.
+                        The events are divided into time ranges that are
+                        formatted in parallel, which is supported by text
+                        based output formats, such as dynamic and json_line.
+                        The default is 0, which represents that the events are
+                        formatted by the main process.
 """.format(test_lib.ARGPARSE_OPTIONS)
 
   else:
@@ -125,6 +132,7 @@ Test argument parser.
 usage: psort_test.py [--process_memory_limit SIZE]
                      [--temporary_directory DIRECTORY]
                      [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--workers WORKERS]
 
 Test argument parser.
 
@@ -152,6 +160,12 @@ Test argument parser.
                         default timeout is 15.0 minutes. If a worker process
                         exceeds this timeout it is killed by the main
                         (foreman) process.
+  --workers WORKERS     Number of worker processes used to format the events.
+                        The events are divided into time ranges that are
+                        formatted in parallel, which is supported by text
+                        based output formats, such as dynamic and json_line.
+                        The default is 0, which represents that the events are
+                        formatted by the main process.
 """.format(test_lib.ARGPARSE_OPTIONS)
 
   # TODO: add test for _CreateOutputModule.
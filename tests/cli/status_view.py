@@ -227,6 +227,47 @@ class StatusViewTest(test_lib.CLIToolTestCase):
 
     self.assertEqual(processing_time, '5 days, 05:01:01')
 
+  def testPrintOutputStatus(self):
+    """Tests the _PrintOutputStatus function."""
+    output_writer = test_lib.TestOutputWriter()
+
+    process_status = processing_status.ProcessingStatus()
+    process_status.start_time = 0
+
+    output_status = processing_status.OutputStatus()
+    output_status.number_of_bytes_written = 3 * 1024 * 1024
+    output_status.number_of_rejected_events = 2
+    output_status.number_of_retries = 1
+    output_status.number_of_written_events = 1000
+
+    process_status.UpdateOutputStatus(output_status)
+
+    test_view = status_view.StatusView(output_writer, 'test_tool')
+
+    self._mocked_time = 10
+    test_view._PrintOutputStatus(process_status)
+
+    table_header = (
+        'Output:         '
+        'Written         '
+        'Rejected        '
+        'Retries         '
+        'Size written    '
+        'Events/s')
+
+    if not sys.platform.startswith('win'):
+      table_header = f'\x1b[1m{table_header:s}\x1b[0m'
+
+    expected_output = [
+        '',
+        table_header,
+        ('                1000            2               1               '
+         '3.0 MiB         100'),
+        '']
+
+    output = output_writer.ReadOutput()
+    self.assertEqual(output.split('\n'), expected_output)
+
   # TODO: add tests for _PrintTasksStatus
   # TODO: add tests for GetAnalysisStatusUpdateCallback
   # TODO: add tests for GetExtractionStatusUpdateCallback
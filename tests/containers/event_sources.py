@@ -17,7 +17,7 @@ class EventSourceTest(shared_test_lib.BaseTestCase):
     attribute_container = event_sources.EventSource()
 
     expected_attribute_names = [
-        'data_type', 'file_entry_type', 'path_spec']
+        'data_type', 'file_entry_type', 'path_spec', 'size']
 
     attribute_names = sorted(attribute_container.GetAttributeNames())
 
@@ -32,7 +32,7 @@ class FileEntryEventSourceTest(shared_test_lib.BaseTestCase):
     attribute_container = event_sources.FileEntryEventSource()
 
     expected_attribute_names = [
-        'data_type', 'file_entry_type', 'path_spec']
+        'data_type', 'file_entry_type', 'path_spec', 'size']
 
     attribute_names = sorted(attribute_container.GetAttributeNames())
 
@@ -44,6 +44,17 @@ class DateLessLogHelperTest(shared_test_lib.BaseTestCase):
 class EventValuesHelperTest(shared_test_lib.BaseTestCase):
   """Tests for the event values helper functions."""
 
+  def testCalculateEventDataStreamValuesHash(self):
+    """Tests the CalculateEventDataStreamValuesHash function."""
+    event_data_stream = events.EventDataStream()
+    event_data_stream.attribute1 = 'ATTR1'
+    event_data_stream.attribute2 = 99
+
+    content_identifier = events.CalculateEventDataStreamValuesHash(
+        event_data_stream)
+
+    self.assertEqual(content_identifier, '8ced9a2833f27da29b6ec4faecab2292')
+
   def testCalculateEventValuesHash(self):
     """Tests the CalculateEventValuesHash function."""
     event_data = events.EventData()
@@ -59,7 +70,20 @@ class EventValuesHelperTest(shared_test_lib.BaseTestCase):
     content_identifier = events.CalculateEventValuesHash(
         event_data, event_data_stream)
 
-    self.assertEqual(content_identifier, '31aac7b1f8c1446f4b638c0dc5f92981')
+    self.assertEqual(content_identifier, '00feb3d76181543255fabe8039b755ac')
+
+    event_data_stream_values_hash = events.CalculateEventDataStreamValuesHash(
+        event_data_stream)
+
+    content_identifier = events.CalculateEventValuesHash(
+        event_data, None,
+        event_data_stream_values_hash=event_data_stream_values_hash)
+
+    self.assertEqual(content_identifier, '00feb3d76181543255fabe8039b755ac')
+
+    content_identifier = events.CalculateEventValuesHash(event_data, None)
+
+    self.assertNotEqual(content_identifier, '00feb3d76181543255fabe8039b755ac')
 
 
 class EventDataTest(shared_test_lib.BaseTestCase):
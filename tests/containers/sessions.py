@@ -40,5 +40,28 @@ class SessionTest(shared_test_lib.BaseTestCase):
     self.assertEqual(attribute_names, expected_attribute_names)
 
 
+class SessionCheckpointTest(shared_test_lib.BaseTestCase):
+  """Tests for the session checkpoint attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = sessions.SessionCheckpoint()
+
+    expected_attribute_names = [
+        'container_types',
+        'event_source_indexes',
+        'next_event_source_index',
+        'number_of_containers',
+        'number_of_events',
+        'parser_names',
+        'path_specs',
+        'session_identifier',
+        'timestamp']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -45,6 +45,13 @@ class TaskTest(shared_test_lib.BaseTestCase):
     self.assertTrue(task.has_retry)
     self.assertFalse(retry_task.has_retry)
     self.assertEqual(retry_task.path_spec, task.path_spec)
+    self.assertIsNone(retry_task.path_specs)
+
+    task = tasks.Task(session_identifier=session_identifier)
+    task.path_specs = ['test_path_spec1', 'test_path_spec2']
+
+    retry_task = task.CreateRetryTask()
+    self.assertEqual(retry_task.path_specs, task.path_specs)
 
   def testUpdateProcessingTime(self):
     """Tests the UpdateProcessingTime function."""
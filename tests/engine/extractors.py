@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the extractor classes."""
 
+import gzip
 import os
 import shutil
 import unittest
@@ -12,13 +13,65 @@ from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.engine import configurations
 from plaso.engine import extractors
+from plaso.engine import profilers
+from plaso.parsers import manager as parsers_manager
 from plaso.parsers import mediator as parsers_mediator
 
 from tests import test_lib as shared_test_lib
 from tests.engine import test_lib
 
 
+class NonSignatureParserIndexTest(test_lib.EngineTestCase):
+  """Tests for the index of parsers without a format signature."""
+
+  def _GetParserNames(self, test_index, path_segments):
+    """Retrieves the parser names of a test file from the index.
+
+    Args:
+      test_index (NonSignatureParserIndex): index.
+      path_segments (list[str]): path segments inside the test data directory.
+
+    Returns:
+      list[str]: names of the parsers that should be applied to the test file.
+    """
+    test_file_path = self._GetTestFilePath(path_segments)
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+    file_object = file_entry.GetFileObject()
+
+    file_object.seek(5, os.SEEK_SET)
+
+    parser_names = test_index.GetParserNames(file_entry, file_object)
+
+    self.assertEqual(file_object.get_offset(), 5)
+
+    return parser_names
+
+  def testGetParserNames(self):
+    """Tests the GetParserNames function."""
+    parsers = parsers_manager.ParsersManager.GetParserObjects(
+        parser_filter_expression=(
+            'bencode,bodyfile,chrome_preferences,czip,recycle_bin'))
+    test_index = extractors.NonSignatureParserIndex(parsers)
+
+    parser_names = self._GetParserNames(test_index, ['Preferences'])
+    self.assertEqual(sorted(parser_names), [
+        'bodyfile', 'chrome_preferences', 'czip'])
+
+    parser_names = self._GetParserNames(
+        test_index, ['recycler', '$I103S5F.jpg'])
+    self.assertEqual(sorted(parser_names), [
+        'bodyfile', 'czip', 'recycle_bin'])
+
+    parser_names = self._GetParserNames(test_index, ['bencode', 'utorrent'])
+    self.assertEqual(sorted(parser_names), ['bencode', 'bodyfile', 'czip'])
+
+
 class EventDataExtractorTest(test_lib.EngineTestCase):
   """Tests for the event data extractor."""
 
@@ -109,6 +162,46 @@ class EventDataExtractorTest(test_lib.EngineTestCase):
   # TODO: add test for ParseFileEntryMetadata
   # TODO: add test for ParseMetadataFile
 
+  def testSampleNonSignatureParserStatistics(self):
+    """Tests the SampleNonSignatureParserStatistics function."""
+    test_file_path = self._GetTestFilePath(['recycler', 'INFO2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_extractor = extractors.EventDataExtractor(
+        parser_filter_expression='recycle_bin,recycle_bin_info2')
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(
+        storage_writer, file_entry=file_entry)
+
+    test_extractor.ParseDataStream(parser_mediator, file_entry, '')
+
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.ProcessingProfiler(
+          'test', profiling_configuration)
+      test_profiler.Start()
+
+      test_extractor.SampleNonSignatureParserStatistics(test_profiler)
+      test_extractor.SampleNonSignatureParserStatistics(test_profiler)
+
+      test_profiler.Stop()
+
+      path = os.path.join(temp_directory, 'processing_parsers-test.csv.gz')
+      with gzip.open(path, 'rt', encoding='utf-8') as file_object:
+        lines = [line.rstrip().split('\t')[1:] for line in file_object]
+
+    self.assertEqual(lines[1:], [
+        ['recycle_bin', '0', '0', '1'],
+        ['recycle_bin_info2', '1', '0', '0']])
+
 
 class PathSpecExtractorTest(test_lib.EngineTestCase):
   """Tests for the path specification extractor."""
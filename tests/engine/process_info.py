@@ -20,6 +20,15 @@ class ProcessInfoTest(unittest.TestCase):
     with self.assertRaises(IOError):
       process_info.ProcessInfo(-1)
 
+  def testGetCPUUtilization(self):
+    """Tests the GetCPUUtilization function."""
+    pid = os.getpid()
+    process_information = process_info.ProcessInfo(pid)
+
+    cpu_utilization = process_information.GetCPUUtilization()
+    self.assertIsNotNone(cpu_utilization)
+    self.assertGreaterEqual(cpu_utilization, 0.0)
+
   def testGetUsedMemory(self):
     """Tests the GetUsedMemory function."""
     pid = os.getpid()
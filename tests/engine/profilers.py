@@ -2,14 +2,16 @@
 # -*- coding: utf-8 -*-
 """Tests for the profiler classes."""
 
+import gzip
+import os
 import time
 import unittest
 
-
 from plaso.containers import tasks
 from plaso.engine import configurations
 from plaso.engine import processing_status
 from plaso.engine import profilers
+from plaso.multi_process import worker_pool
 
 from tests import test_lib as shared_test_lib
 
@@ -99,6 +101,30 @@ class MemoryProfilerTest(shared_test_lib.BaseTestCase):
 class AnalyzersProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the analyzers CPU time profiler."""
 
+  def testSampleHasher(self):
+    """Tests the SampleHasher function."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.AnalyzersProfiler(
+          'test', profiling_configuration)
+
+      test_profiler.Start()
+
+      test_profiler.SampleHasher('sha256', 4 * 1024 * 1024, 2.0)
+
+      test_profiler.Stop()
+
+      path = os.path.join(temp_directory, 'analyzers_hashers-test.csv.gz')
+      with gzip.open(path, 'rt', encoding='utf-8') as file_object:
+        lines = file_object.readlines()
+
+      self.assertEqual(len(lines), 2)
+      self.assertEqual(lines[1].split('\t')[1:], [
+          'sha256', '4194304', '2.000000', '2.000000\n'])
+
   def testStartStopTiming(self):
     """Tests the StartTiming and StopTiming functions."""
     profiling_configuration = configurations.ProfilingConfiguration()
@@ -119,9 +145,53 @@ class AnalyzersProfilerTest(shared_test_lib.BaseTestCase):
       test_profiler.Stop()
 
 
+class IndexProfilerTest(shared_test_lib.BaseTestCase):
+  """Tests for the index profiler."""
+
+  def testSample(self):
+    """Tests the Sample function."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.IndexProfiler('test', profiling_configuration)
+
+      test_profiler.Start()
+
+      for _ in range(5):
+        test_profiler.Sample('test_profile', 1, 2, 3)
+
+      test_profiler.Stop()
+
+
 class ProcessingProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the processing CPU time profiler."""
 
+  def testSampleParser(self):
+    """Tests the SampleParser function."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.ProcessingProfiler(
+          'test', profiling_configuration)
+
+      test_profiler.Start()
+
+      test_profiler.SampleParser('test_parser', 1, 2, 3)
+
+      test_profiler.Stop()
+
+      path = os.path.join(temp_directory, 'processing_parsers-test.csv.gz')
+      with gzip.open(path, 'rt', encoding='utf-8') as file_object:
+        lines = file_object.readlines()
+
+      self.assertEqual(len(lines), 2)
+      self.assertEqual(lines[1].split('\t')[1:], [
+          'test_parser', '1', '2', '3\n'])
+
   def testStartStopTiming(self):
     """Tests the StartTiming and StopTiming functions."""
     profiling_configuration = configurations.ProfilingConfiguration()
@@ -210,8 +280,25 @@ class TaskQueueProfilerTest(shared_test_lib.BaseTestCase):
         test_profiler.Sample(task_status)
         time.sleep(0.01)
 
+      worker_pool_decision = worker_pool.WorkerPoolDecision(
+          action='grow', cpu_utilization=25.0, memory_headroom=1024,
+          number_of_workers=3, reason='I/O bound')
+      test_profiler.Sample(
+          task_status, worker_pool_decision=worker_pool_decision)
+
       test_profiler.Stop()
 
+      path = os.path.join(temp_directory, 'task_queue-test.csv.gz')
+      with gzip.open(path, 'rt', encoding='utf-8') as file_object:
+        lines = file_object.readlines()
+
+      self.assertEqual(len(lines), 7)
+      self.assertEqual(lines[1].split('\t')[1:], [
+          '0', '0', '0', '0', '0', '', '', '', '', '\n'])
+      self.assertEqual(lines[6].split('\t')[1:], [
+          '0', '0', '0', '0', '0', '3', '25.0', '1024', 'grow',
+          'I/O bound\n'])
+
 
 class TasksProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the tasks profiler."""
@@ -267,6 +267,33 @@ class EventDataTimelinerTest(test_lib.EngineTestCase):
 
     self.assertEqual(event_data_timeliner.number_of_produced_events, 0)
 
+  def testReset(self):
+    """Tests the Reset function."""
+    event_data_timeliner = timeliner.EventDataTimeliner(
+        data_location=shared_test_lib.TEST_DATA_PATH)
+
+    event_data = TestEventData1()
+    event_data.value = 'MyValue'
+
+    storage_writer = self._CreateStorageWriter(
+        event_data, base_date=(2012, 3, 30))
+
+    event_data_timeliner.ProcessEventData(storage_writer, event_data, None)
+
+    self.assertEqual(len(event_data_timeliner._base_dates), 0)
+    self.assertEqual(event_data_timeliner.number_of_produced_events, 1)
+    self.assertEqual(event_data_timeliner.parsers_counter['total'], 1)
+
+    base_date = event_data_timeliner._GetBaseDate(storage_writer, event_data)
+    self.assertEqual(base_date, (2012, 0, 0))
+    self.assertEqual(len(event_data_timeliner._base_dates), 1)
+
+    event_data_timeliner.Reset()
+
+    self.assertEqual(len(event_data_timeliner._base_dates), 0)
+    self.assertEqual(event_data_timeliner.number_of_produced_events, 0)
+    self.assertEqual(event_data_timeliner.parsers_counter['total'], 0)
+
   def testSetPreferredTimeZone(self):
     """Tests the SetPreferredTimeZone function."""
     event_data_timeliner = timeliner.EventDataTimeliner(
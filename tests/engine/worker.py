@@ -3,6 +3,7 @@
 """Tests the event extraction worker."""
 
 import collections
+import os
 import unittest
 
 from dfvfs.lib import definitions as dfvfs_definitions
@@ -13,6 +14,7 @@ from plaso.containers import events
 from plaso.containers import sessions
 from plaso.engine import configurations
 from plaso.engine import worker
+from plaso.lib import definitions
 from plaso.parsers import mediator as parsers_mediator
 from plaso.storage.fake import writer as fake_writer
 
@@ -217,7 +219,7 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
     display_name = parser_mediator.GetDisplayName()
     event_data_stream = events.EventDataStream()
 
-    extraction_worker._AnalyzeFileObject(
+    data_stream_file_object = extraction_worker._AnalyzeFileObject(
         file_object, display_name, event_data_stream)
 
     storage_writer.UpdateAttributeContainer(session)
@@ -229,6 +231,23 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
     event_attribute = getattr(event_data_stream, 'test_result', None)
     self.assertEqual(event_attribute, 'is_vegetable')
 
+    self.assertEqual(
+        extraction_worker.processing_status,
+        definitions.STATUS_INDICATOR_RUNNING)
+
+    self.assertIsNotNone(data_stream_file_object)
+    self.assertEqual(
+        data_stream_file_object.get_size(), file_object.get_size())
+
+    file_object.seek(0, os.SEEK_SET)
+    self.assertEqual(data_stream_file_object.read(), file_object.read())
+
+    extraction_worker._data_stream_buffer_size = 0
+
+    data_stream_file_object = extraction_worker._AnalyzeFileObject(
+        file_object, display_name, event_data_stream)
+    self.assertIsNone(data_stream_file_object)
+
   def testCanSkipDataStream(self):
     """Tests the _CanSkipDataStream function."""
     extraction_worker = worker.EventExtractionWorker()
@@ -77,6 +77,8 @@ class FlagsEventFormatterHelperTest(test_lib.EventFormatterTestCase):
 class EventFormatterTest(test_lib.EventFormatterTestCase):
   """Tests for the event formatter."""
 
+  # pylint: disable=protected-access
+
   _TEST_EVENTS = [
       {'data_type': 'test:event',
        'description': 'this is beyond words',
@@ -94,6 +96,14 @@ class EventFormatterTest(test_lib.EventFormatterTestCase):
   # TODO: add tests for _FormatMessage
   # TODO: add tests for _FormatMessages
 
+  def testCompile(self):
+    """Tests the Compile function."""
+    event_formatter = interface.BasicEventFormatter(
+        data_type='test', format_string='{text}')
+    event_formatter.Compile()
+
+    self.assertEqual(
+        event_formatter._format_string_attribute_names, frozenset(['text']))
   def testGetFormatStringAttributeNames(self):
     """Tests the GetFormatStringAttributeNames function."""
     event_formatter = interface.BasicEventFormatter(
@@ -153,6 +163,47 @@ class ConditionalEventFormatterTest(test_lib.EventFormatterTestCase):
       'Optional: {optional}',
       'Text: {text}']
 
+  def testConditionalFormatMessage(self):
+    """Tests the _ConditionalFormatMessage function."""
+    event_formatter = interface.ConditionalEventFormatter(
+        data_type='test', format_string_pieces=self._TEST_FORMAT_STRING_PIECES)
+    event_formatter.Compile()
+
+    _, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+    event_values = event_data.CopyToDict()
+
+    format_strings = {}
+    message = event_formatter._ConditionalFormatMessage(
+        event_formatter._format_string_pieces,
+        event_formatter._format_string_pieces_map, format_strings,
+        event_values)
+
+    expected_message = (
+        'Description: this is beyond words Comment Value: 0x0c '
+        'Text: but we\'re still trying to say something about the event')
+    self.assertEqual(message, expected_message)
+
+    expected_format_strings = {
+        (True, True, False, True): (
+            'Description: {description} Comment Value: 0x{numeric:02x} '
+            'Text: {text}')}
+    self.assertEqual(format_strings, expected_format_strings)
+
+    event_values['optional'] = 'value'
+    event_values['text'] = None
+
+    message = event_formatter._ConditionalFormatMessage(
+        event_formatter._format_string_pieces,
+        event_formatter._format_string_pieces_map, format_strings,
+        event_values)
+
+    expected_message = (
+        'Description: this is beyond words Comment Value: 0x0c '
+        'Optional: value')
+    self.assertEqual(message, expected_message)
+    self.assertEqual(len(format_strings), 2)
+
   def testCreateFormatStringMaps(self):
     """Tests the _CreateFormatStringMaps function."""
     event_formatter = interface.ConditionalEventFormatter(
@@ -165,6 +216,24 @@ class ConditionalEventFormatterTest(test_lib.EventFormatterTestCase):
           data_type='test', format_string_pieces=format_string_pieces)
       event_formatter._CreateFormatStringMaps()
 
+  def testCompile(self):
+    """Tests the Compile function."""
+    event_formatter = interface.ConditionalEventFormatter(
+        data_type='test', format_string_pieces=self._TEST_FORMAT_STRING_PIECES)
+    event_formatter.Compile()
+
+    expected_format_string_pieces_map = [
+        'description', '', 'numeric', 'optional', 'text']
+    self.assertEqual(
+        event_formatter._format_string_pieces_map,
+        expected_format_string_pieces_map)
+
+    with self.assertRaises(RuntimeError):
+      format_string_pieces = ['{too} {many} formatting placeholders']
+      event_formatter = interface.ConditionalEventFormatter(
+          data_type='test', format_string_pieces=format_string_pieces)
+      event_formatter.Compile()
+
   def testGetFormatStringAttributeNames(self):
     """Tests the GetFormatStringAttributeNames function."""
     event_formatter = interface.ConditionalEventFormatter(
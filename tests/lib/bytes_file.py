@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the in-memory bytes file-like object."""
+
+import os
+import unittest
+
+from plaso.lib import bytes_file
+
+from tests import test_lib as shared_test_lib
+
+
+class BytesFileIOTest(shared_test_lib.BaseTestCase):
+  """Tests for the in-memory bytes file-like object."""
+
+  def testReadAndSeek(self):
+    """Tests the read and seek functions."""
+    file_object = bytes_file.BytesFileIO(b'0123456789')
+
+    self.assertEqual(file_object.get_size(), 10)
+    self.assertEqual(file_object.get_offset(), 0)
+
+    data = file_object.read(4)
+    self.assertEqual(data, b'0123')
+    self.assertEqual(file_object.get_offset(), 4)
+
+    file_object.seek(2, os.SEEK_CUR)
+    self.assertEqual(file_object.read(2), b'67')
+
+    file_object.seek(-3, os.SEEK_END)
+    self.assertEqual(file_object.read(), b'789')
+
+    file_object.seek(20, os.SEEK_SET)
+    self.assertEqual(file_object.read(), b'')
+
+    with self.assertRaises(IOError):
+      file_object.seek(-20, os.SEEK_END)
+
+    with self.assertRaises(IOError):
+      file_object.seek(0, 5)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -171,6 +171,58 @@ class AnalysisEngineMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
       finally:
         storage_writer.Close()
 
+  def testAnalyzeEventsWithStorageFile(self):
+    """Tests the AnalyzeEvents function reading from the storage file."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_tagging_file_path = self._GetTestFilePath([
+        'tagging_file', 'valid.txt'])
+    self._SkipIfPathNotExists(test_tagging_file_path)
+
+    session = sessions.Session()
+
+    data_location = ''
+
+    analysis_plugin = tagging.TaggingAnalysisPlugin()
+    analysis_plugin.SetAndLoadTagFile(test_tagging_file_path)
+    analysis_plugin.DATA_TYPES = frozenset(['fs:stat', 'syslog:line'])
+
+    analysis_plugins = {'tagging': analysis_plugin}
+
+    configuration = configurations.ProcessingConfiguration()
+    test_engine = analysis_engine.AnalysisMultiProcessEngine()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      shutil.copyfile(test_file_path, temp_file)
+
+      storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+          definitions.DEFAULT_STORAGE_FORMAT)
+
+      storage_writer.Open(path=temp_file)
+
+      try:
+        processing_status = test_engine.AnalyzeEvents(
+            session, storage_writer, data_location, analysis_plugins,
+            configuration, storage_file_path=temp_file)
+
+        number_of_reports = storage_writer.GetNumberOfAttributeContainers(
+            'analysis_report')
+        self.assertEqual(number_of_reports, 3)
+
+      finally:
+        storage_writer.Close()
+
+    # The events of the data types of the analysis plugin are read by
+    # the analysis process instead of the foreman.
+    foreman_status = processing_status.foreman_status
+    self.assertEqual(foreman_status.number_of_consumed_events, 0)
+
+    workers_status = processing_status.workers_status
+    self.assertEqual(len(workers_status), 1)
+    self.assertEqual(workers_status[0].number_of_consumed_events, 32)
+
   # TODO: add bogus data location test.
 
 
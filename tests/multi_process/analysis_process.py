@@ -3,10 +3,12 @@
 """Tests for the multi-processing analysis process."""
 
 import os
+import pickle
 import time
 import unittest
 
 from plaso.analysis import interface as analysis_interface
+from plaso.containers import events
 from plaso.engine import configurations
 from plaso.multi_process import analysis_process
 from plaso.multi_process import plaso_queue
@@ -46,7 +48,15 @@ class TestAnalysisPlugin(analysis_interface.AnalysisPlugin):
       event_data (EventData): event data.
       event_data_stream (EventDataStream): event data stream.
     """
-    return
+    self._analysis_counter[event_data.data_type] += 1
+
+
+class TestDataTypesAnalysisPlugin(TestAnalysisPlugin):
+  """Analysis plugin for testing that only analyzes specific data types."""
+
+  NAME = 'test_data_types_plugin'
+
+  DATA_TYPES = frozenset(['fs:stat', 'syslog:cron:task_run'])
 
 
 class AnalysisProcessTest(test_lib.MultiProcessingTestCase):
@@ -120,6 +130,51 @@ class AnalysisProcessTest(test_lib.MultiProcessingTestCase):
 
   # TODO: add test for _ProcessEvent.
 
+  def testProcessEventBatch(self):
+    """Tests the _ProcessEventBatch function."""
+    analysis_plugin = TestAnalysisPlugin()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ProcessingConfiguration()
+      configuration.task_storage_path = temp_directory
+
+      test_process = analysis_process.AnalysisProcess(
+          None, analysis_plugin, configuration, [], name='TestAnalysis')
+
+      event_batch = []
+      for data_type in ('test:event1', 'test:event2', 'test:event1'):
+        event = events.EventObject()
+        event_data = events.EventData(data_type=data_type)
+        event_batch.append((event, event_data, None))
+
+      serialized_event_batch = pickle.dumps(event_batch)
+      test_process._ProcessEventBatch(None, serialized_event_batch)
+
+      self.assertEqual(test_process._number_of_consumed_events, 3)
+      self.assertEqual(analysis_plugin._analysis_counter, {
+          'test:event1': 2, 'test:event2': 1})
+
+  def testProcessStorageFile(self):
+    """Tests the _ProcessStorageFile function."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    analysis_plugin = TestDataTypesAnalysisPlugin()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ProcessingConfiguration()
+      configuration.task_storage_path = temp_directory
+
+      test_process = analysis_process.AnalysisProcess(
+          None, analysis_plugin, configuration, [],
+          storage_file_path=test_file_path, name='TestAnalysis')
+
+      test_process._ProcessStorageFile(None)
+
+      self.assertEqual(test_process._number_of_consumed_events, 12)
+      self.assertEqual(analysis_plugin._analysis_counter, {
+          'fs:stat': 6, 'syslog:cron:task_run': 6})
+
   def testSignalAbort(self):
     """Tests the SignalAbort function."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -3,14 +3,20 @@
 """Tests the multi-process processing engine."""
 
 import collections
+import multiprocessing
 import os
+import sys
 import unittest
 
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+from plaso.containers import counts
+from plaso.containers import event_sources
 from plaso.containers import sessions
+from plaso.containers import warnings
 from plaso.lib import definitions
+from plaso.lib import errors
 from plaso.engine import configurations
 from plaso.multi_process import extraction_engine
 from plaso.storage.sqlite import writer as sqlite_writer
@@ -18,9 +24,147 @@ from plaso.storage.sqlite import writer as sqlite_writer
 from tests import test_lib as shared_test_lib
 
 
+class EventSourceHeapTest(shared_test_lib.BaseTestCase):
+  """Tests for the event source heap."""
+
+  # pylint: disable=protected-access
+
+  def testGetEventSources(self):
+    """Tests the GetEventSources function."""
+    event_source_heap = extraction_engine._EventSourceHeap()
+
+    event_sources_list = event_source_heap.GetEventSources()
+    self.assertEqual(event_sources_list, [])
+
+    for location in ('/file1', '/file2'):
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_FAKE, location=location)
+      event_source = event_sources.EventSource(
+          file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+          path_spec=path_spec)
+      event_source_heap.PushEventSource(event_source)
+
+    event_sources_list = event_source_heap.GetEventSources()
+    locations = sorted(
+        event_source.path_spec.location for event_source in event_sources_list)
+    self.assertEqual(locations, ['/file1', '/file2'])
+
+    # Retrieving the event sources should not remove them from the heap.
+    event_source = event_source_heap.PopEventSource()
+    self.assertIsNotNone(event_source)
+
+  def testPopAndPushEventSource(self):
+    """Tests the PopEventSource and PushEventSource functions."""
+    event_source_heap = extraction_engine._EventSourceHeap()
+
+    for location, file_entry_type, size in (
+        ('/small', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, 10),
+        ('/unknown', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, None),
+        ('/large', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, 1000),
+        ('/directory', dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY, None)):
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_FAKE, location=location)
+      event_source = event_sources.EventSource(
+          file_entry_type=file_entry_type, path_spec=path_spec, size=size)
+      event_source_heap.PushEventSource(event_source)
+
+    self.assertFalse(event_source_heap.IsFull())
+
+    locations = []
+    event_source = event_source_heap.PopEventSource()
+    while event_source:
+      locations.append(event_source.path_spec.location)
+      event_source = event_source_heap.PopEventSource()
+
+    self.assertEqual(locations, ['/directory', '/large', '/small', '/unknown'])
+
+
 class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
   """Tests for the task-based multi-process extraction engine."""
 
+  # pylint: disable=protected-access
+
+  def testCompileYaraRules(self):
+    """Tests the _CompileYaraRules and _RemoveCompiledYaraRules functions."""
+    yara_rules_path = self._GetTestFilePath(['rules.yara'])
+    self._SkipIfPathNotExists(yara_rules_path)
+
+    with open(yara_rules_path, 'r', encoding='utf-8') as file_object:
+      yara_rules_string = file_object.read()
+
+    test_engine = extraction_engine.ExtractionMultiProcessEngine()
+
+    extraction_configuration = configurations.ExtractionConfiguration()
+    extraction_configuration.yara_rules_string = yara_rules_string
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_engine._CompileYaraRules(extraction_configuration, temp_directory)
+
+      compiled_rules_path = extraction_configuration.compiled_yara_rules_path
+      self.assertIsNotNone(compiled_rules_path)
+      self.assertEqual(os.path.dirname(compiled_rules_path), temp_directory)
+      self.assertTrue(os.path.exists(compiled_rules_path))
+
+      test_engine._RemoveCompiledYaraRules(extraction_configuration)
+
+      self.assertIsNone(extraction_configuration.compiled_yara_rules_path)
+      self.assertFalse(os.path.exists(compiled_rules_path))
+
+    extraction_configuration.yara_rules_string = 'bogus'
+
+    with self.assertRaises(errors.BadConfigOption):
+      test_engine._CompileYaraRules(extraction_configuration, None)
+
+  def testCreateTask(self):
+    """Tests the _CreateBatchTask and _CreateTask functions."""
+    session = sessions.Session()
+
+    test_engine = extraction_engine.ExtractionMultiProcessEngine()
+    test_engine._task_batch_file_size_limit = 1024
+    test_engine._task_batch_size = 2
+
+    event_sources_list = []
+    for filename in ('filter_1.txt', 'filter2.txt', 'filter_3.txt'):
+      test_file_path = self._GetTestFilePath(['testdir', filename])
+      self._SkipIfPathNotExists(test_file_path)
+
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+      event_source = event_sources.EventSource(
+          file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+          path_spec=path_spec, size=1)
+      event_sources_list.append(event_source)
+
+    task = test_engine._CreateTask(
+        session.identifier, event_sources_list[0])
+    self.assertIsNone(task)
+
+    task = test_engine._CreateTask(
+        session.identifier, event_sources_list[1])
+    self.assertIsNotNone(task)
+    self.assertIsNone(task.path_spec)
+    self.assertEqual(task.path_specs, [
+        event_sources_list[0].path_spec, event_sources_list[1].path_spec])
+
+    task = test_engine._CreateTask(
+        session.identifier, event_sources_list[2])
+    self.assertIsNone(task)
+
+    task = test_engine._CreateBatchTask(session.identifier)
+    self.assertIsNotNone(task)
+    self.assertEqual(task.path_spec, event_sources_list[2].path_spec)
+    self.assertIsNone(task.path_specs)
+
+    task = test_engine._CreateBatchTask(session.identifier)
+    self.assertIsNone(task)
+
+    test_engine._task_batch_size = 1
+
+    task = test_engine._CreateTask(
+        session.identifier, event_sources_list[0])
+    self.assertIsNotNone(task)
+    self.assertEqual(task.path_spec, event_sources_list[0].path_spec)
+
   def testProcessSource(self):
     """Tests the PreprocessSource and ProcessSource functions."""
     test_artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
@@ -92,6 +236,130 @@ class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
         'total': 15})
     self.assertEqual(parsers_counter, expected_parsers_counter)
 
+  def testStopRetiredWorkerProcess(self):
+    """Tests the _StopRetiredWorkerProcess function."""
+    test_engine = extraction_engine.ExtractionMultiProcessEngine()
+
+    # A retired worker process can stop with a non-zero exit code.
+    process = multiprocessing.Process(
+        name='Worker_00', target=sys.exit, args=(1, ))
+    process.start()
+    process.join()
+
+    test_engine._processes_per_pid[process.pid] = process
+    test_engine._process_information_per_pid[process.pid] = None
+
+    result = test_engine._StopRetiredWorkerProcess(process.pid)
+    self.assertFalse(result)
+    self.assertIn(process.pid, test_engine._processes_per_pid)
+
+    test_engine._number_of_retiring_worker_processes = 1
+
+    result = test_engine._StopRetiredWorkerProcess(process.pid)
+    self.assertTrue(result)
+    self.assertEqual(test_engine._number_of_retiring_worker_processes, 0)
+    self.assertNotIn(process.pid, test_engine._processes_per_pid)
+    self.assertNotIn(process.pid, test_engine._process_information_per_pid)
+
+    workers_status = test_engine._processing_status.workers_status
+    self.assertEqual(len(workers_status), 1)
+    self.assertEqual(
+        workers_status[0].status, definitions.STATUS_INDICATOR_COMPLETED)
+
+  def testWriteAndRestoreSessionCheckpoint(self):
+    """Tests writing and restoring a session checkpoint."""
+    session = sessions.Session()
+
+    test_engine = extraction_engine.ExtractionMultiProcessEngine()
+
+    path_specs = []
+    for location in ('/file1', '/file2', '/file3', '/file4'):
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_FAKE, location=location)
+      path_specs.append(path_spec)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      storage_writer = sqlite_writer.SQLiteStorageWriter()
+      storage_writer.Open(path=temp_file)
+
+      try:
+        for path_spec in path_specs[:3]:
+          event_source = event_sources.FileEntryEventSource(
+              file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+              path_spec=path_spec)
+          storage_writer.AddAttributeContainer(event_source)
+
+        parser_count = counts.ParserCount(name='filestat', number_of_events=3)
+        storage_writer.AddAttributeContainer(parser_count)
+
+        # The first event source was processed, the second is pending on
+        # the heap and the third is being scheduled.
+        event_source_heap = extraction_engine._EventSourceHeap()
+        event_source_heap.PushEventSource(
+            storage_writer.GetAttributeContainerByIndex('event_source', 1))
+        event_source = storage_writer.GetAttributeContainerByIndex(
+            'event_source', 2)
+
+        test_engine._next_event_source_index = 3
+        test_engine._parsers_counter = collections.Counter({'filestat': 2})
+        test_engine._task_batch_path_specs = [path_specs[3]]
+
+        test_engine._WriteSessionCheckpoint(
+            storage_writer, session.identifier, event_source_heap,
+            event_source)
+
+        session_checkpoint = test_engine._session_checkpoint
+        self.assertIsNotNone(session_checkpoint)
+        self.assertEqual(
+            session_checkpoint.session_identifier, session.identifier)
+        self.assertEqual(session_checkpoint.container_types, ['event_source'])
+        self.assertEqual(session_checkpoint.event_source_indexes, [1, 2])
+        self.assertEqual(session_checkpoint.next_event_source_index, 3)
+        self.assertEqual(session_checkpoint.number_of_containers, [3])
+        self.assertEqual(session_checkpoint.number_of_events, [5])
+        self.assertEqual(session_checkpoint.parser_names, ['filestat'])
+        self.assertEqual(session_checkpoint.path_specs, [path_specs[3]])
+
+        # Results added after the checkpoint should be removed on restore.
+        event_source = event_sources.FileEntryEventSource(
+            file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+            path_spec=path_specs[3])
+        storage_writer.AddAttributeContainer(event_source)
+
+        extraction_warning = warnings.ExtractionWarning(message='Test')
+        storage_writer.AddAttributeContainer(extraction_warning)
+
+        test_engine = extraction_engine.ExtractionMultiProcessEngine()
+
+        pending_event_sources = test_engine._RestoreSessionCheckpoint(
+            storage_writer, session_checkpoint)
+
+        locations = [
+            event_source.path_spec.location
+            for event_source in pending_event_sources]
+        self.assertEqual(locations, ['/file2', '/file3', '/file4'])
+
+        self.assertEqual(test_engine._next_event_source_index, 3)
+
+        number_of_event_sources = (
+            storage_writer.GetNumberOfAttributeContainers('event_source'))
+        self.assertEqual(number_of_event_sources, 3)
+
+        number_of_extraction_warnings = (
+            storage_writer.GetNumberOfAttributeContainers(
+                'extraction_warning'))
+        self.assertEqual(number_of_extraction_warnings, 0)
+
+        parsers_counter = collections.Counter({
+            parser_count.name: parser_count.number_of_events
+            for parser_count in storage_writer.GetAttributeContainers(
+                'parser_count')})
+        self.assertEqual(parsers_counter, collections.Counter({'filestat': 5}))
+
+      finally:
+        storage_writer.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -2,14 +2,19 @@
 # -*- coding: utf-8 -*-
 """Tests for the multi-processing worker process."""
 
+import os
 import unittest
 
+from dfdatetime import time_elements as dfdatetime_time_elements
+from dfvfs.helpers import file_system_searcher
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+from plaso.containers import events
 from plaso.containers import sessions
 from plaso.containers import tasks
 from plaso.engine import configurations
+from plaso.engine import timeliner
 from plaso.engine import worker
 from plaso.lib import definitions
 from plaso.multi_process import extraction_process
@@ -20,6 +25,21 @@ from tests import test_lib as shared_test_lib
 from tests.multi_process import test_lib
 
 
+class TestEventData(events.EventData):
+  """Test event data.
+
+  Attributes:
+    access_time (dfdatetime.DateTimeValues): access date and time.
+  """
+
+  DATA_TYPE = 'test:fs:stat'
+
+  def __init__(self):
+    """Initializes event data."""
+    super(TestEventData, self).__init__(data_type=self.DATA_TYPE)
+    self.access_time = None
+
+
 class TestEventExtractionWorker(worker.EventExtractionWorker):
   """Event extraction worker for testing."""
 
@@ -91,6 +111,7 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
 
     with shared_test_lib.TempDirectory() as temp_directory:
       configuration = configurations.ProcessingConfiguration()
+      configuration.data_location = shared_test_lib.DATA_PATH
       configuration.task_storage_path = temp_directory
 
       test_process = extraction_process.ExtractionWorkerProcess(
@@ -101,6 +122,50 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       output_task_queue.PushItem(plaso_queue.QueueAbort(), block=False)
       output_task_queue.Close(abort=True)
 
+  def testProduceEvents(self):
+    """Tests the _ProduceEvents function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ProcessingConfiguration()
+      configuration.task_storage_path = temp_directory
+
+      test_process = extraction_process.ExtractionWorkerProcess(
+          None, configuration, [], [], None, name='TestWorker')
+      test_process._event_data_timeliner = timeliner.EventDataTimeliner(
+          data_location=shared_test_lib.TEST_DATA_PATH)
+
+      task_storage_writer = self._CreateStorageWriter()
+
+      event_data_stream = events.EventDataStream()
+      task_storage_writer.AddAttributeContainer(event_data_stream)
+
+      event_data = TestEventData()
+      event_data.access_time = (
+          dfdatetime_time_elements.TimeElementsInMicroseconds(
+              time_elements_tuple=(2010, 8, 12, 20, 6, 31, 429876)))
+      event_data._parser_chain = 'test_parser'
+      event_data.SetEventDataStreamIdentifier(
+          event_data_stream.GetIdentifier())
+      task_storage_writer.AddAttributeContainer(event_data)
+
+      event_data = TestEventData()
+      event_data._parser_chain = 'test_parser'
+      task_storage_writer.AddAttributeContainer(event_data)
+
+      test_process._ProduceEvents(task_storage_writer)
+
+      self.assertEqual(test_process._number_of_consumed_event_data, 2)
+      self.assertEqual(test_process._number_of_produced_events, 2)
+
+      number_of_events = task_storage_writer.GetNumberOfAttributeContainers(
+          'event')
+      self.assertEqual(number_of_events, 2)
+
+      parsers_counter = {
+          parser_count.name: parser_count.number_of_events
+          for parser_count in task_storage_writer.GetAttributeContainers(
+              'parser_count')}
+      self.assertEqual(parsers_counter, {'test_parser': 2, 'total': 2})
+
   def testProcessPathSpec(self):
     """Tests the _ProcessPathSpec function."""
     test_file_path = self._GetTestFilePath(['testdir', 'filter_1.txt'])
@@ -127,6 +192,34 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       test_process._ProcessPathSpec(None, parser_mediator, path_spec)
       self.assertEqual(parser_mediator._number_of_extraction_warnings, 1)
 
+  def testProcessPathSpecWithExcludedPathSpec(self):
+    """Tests the _ProcessPathSpec function with an excluded path spec."""
+    test_file_path = self._GetTestFilePath(['testdir', 'filter_1.txt'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+
+    find_spec = file_system_searcher.FindSpec(
+        case_sensitive=False, location=test_file_path,
+        location_separator=os.path.sep)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ProcessingConfiguration()
+      configuration.task_storage_path = temp_directory
+
+      test_process = extraction_process.ExtractionWorkerProcess(
+          None, configuration, [], [], None, excluded_find_specs=[find_spec],
+          name='TestWorker')
+
+      task_storage_writer = self._CreateStorageWriter()
+      parser_mediator = self._CreateParserMediator(task_storage_writer)
+
+      # The excluded path specification is not passed to the extraction
+      # worker, hence the missing extraction worker produces no warning.
+      test_process._ProcessPathSpec(None, parser_mediator, path_spec)
+      self.assertEqual(parser_mediator._number_of_extraction_warnings, 0)
+
   def testProcessTask(self):
     """Tests the _ProcessTask function."""
     session = sessions.Session()
@@ -137,6 +230,38 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
 
       test_process = extraction_process.ExtractionWorkerProcess(
           None, configuration, [], [], None, name='TestWorker')
+      test_process._event_data_timeliner = timeliner.EventDataTimeliner(
+          data_location=shared_test_lib.DATA_PATH)
+      test_process._extraction_worker = TestEventExtractionWorker()
+
+      task_storage_writer = self._CreateStorageWriter()
+      test_process._parser_mediator = self._CreateParserMediator(
+          task_storage_writer)
+
+      task = tasks.Task(session_identifier=session.identifier)
+      test_process._ProcessTask(task)
+
+  def testProcessTaskWithBatchTask(self):
+    """Tests the _ProcessTask function with a batch task."""
+    path_specs = []
+    for filename in ('filter_1.txt', 'filter2.txt'):
+      test_file_path = self._GetTestFilePath(['testdir', filename])
+      self._SkipIfPathNotExists(test_file_path)
+
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+      path_specs.append(path_spec)
+
+    session = sessions.Session()
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ProcessingConfiguration()
+      configuration.task_storage_path = temp_directory
+      configuration.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+
+      test_process = extraction_process.ExtractionWorkerProcess(
+          None, configuration, [], [], None, name='TestWorker')
+      test_process._event_data_timeliner = timeliner.EventDataTimeliner(
+          data_location=shared_test_lib.DATA_PATH)
       test_process._extraction_worker = TestEventExtractionWorker()
 
       task_storage_writer = self._CreateStorageWriter()
@@ -144,8 +269,11 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
           task_storage_writer)
 
       task = tasks.Task(session_identifier=session.identifier)
+      task.path_specs = path_specs
       test_process._ProcessTask(task)
 
+      self.assertEqual(test_process._number_of_consumed_sources, 2)
+
   def testStartAndStopProfiling(self):
     """Tests the _StartProfiling and _StopProfiling functions."""
     with shared_test_lib.TempDirectory() as temp_directory:
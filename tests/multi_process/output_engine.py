@@ -250,7 +250,66 @@ class OutputAndFormattingMultiProcessEngineTest(
 
     storage_file.Close()
 
-  # TODO: add test for _ExportEvent.
+  def testGetExportTimeRanges(self):
+    """Tests the _GetExportTimeRanges function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file))
+
+      try:
+        test_engine = output_engine.OutputAndFormattingMultiProcessEngine(
+            number_of_worker_processes=3)
+
+        time_ranges = test_engine._GetExportTimeRanges(storage_reader)
+
+      finally:
+        storage_reader.Close()
+
+    self.assertEqual(len(time_ranges), 2)
+    self.assertEqual(time_ranges[0].start_timestamp, 2134324321)
+    self.assertEqual(time_ranges[0].end_timestamp, 5133999999)
+    self.assertEqual(time_ranges[1].start_timestamp, 5134000000)
+    self.assertEqual(
+        time_ranges[1].end_timestamp, test_engine._MAXIMUM_TIMESTAMP)
+
+  def testInternalExportEvent(self):
+    """Tests the _ExportEvent function."""
+    test_events = containers_test_lib.CreateEventsFromValues([
+        self._TEST_EVENTS[1], self._TEST_EVENTS[0],
+        {'data_type': 'test:event',
+         'text': 'Another text',
+         'timestamp': 5134324321,
+         'timestamp_desc': definitions.TIME_DESCRIPTION_WRITTEN}])
+    test_events = list(test_events)
+
+    # Test with events that are sorted by timestamp only.
+    output_module = TestOutputModule()
+
+    test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+
+    for event, event_data, event_data_stream in test_events:
+      test_engine._ExportEvent(
+          output_module, event, event_data, event_data_stream, None)
+
+    self.assertEqual(test_engine._export_event_heap.number_of_events, 3)
+    self.assertEqual(len(output_module.events), 0)
+
+    # Test with events that are also sorted by event values hash.
+    output_module = TestOutputModule()
+
+    test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+    test_engine._events_sorted_by_event_values_hash = True
+
+    for event, event_data, event_data_stream in test_events:
+      test_engine._ExportEvent(
+          output_module, event, event_data, event_data_stream, None)
+
+    self.assertEqual(test_engine._export_event_heap.number_of_events, 1)
+    self.assertEqual(len(output_module.events), 2)
+    self.assertEqual(len(output_module.macb_groups), 1)
 
   def testInternalExportEvents(self):
     """Tests the _ExportEvents function."""
@@ -344,5 +403,45 @@ class OutputAndFormattingMultiProcessEngineTest(
     self.assertEqual(lines[14], expected_line)
 
 
+  def testExportEventsWithWorkerProcesses(self):
+    """Tests the ExportEvents function with worker processes."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    configuration = configurations.ProcessingConfiguration()
+    configuration.data_location = shared_test_lib.DATA_PATH
+    configuration.preferred_language = 'en-US'
+
+    expected_output = None
+    for number_of_worker_processes in (0, 3):
+      test_file_object = io.StringIO()
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(
+              test_file_path))
+
+      output_module = dynamic.DynamicOutputModule()
+      output_module._file_object = test_file_object
+
+      test_engine = output_engine.OutputAndFormattingMultiProcessEngine(
+          number_of_worker_processes=number_of_worker_processes)
+
+      with shared_test_lib.TempDirectory() as temp_directory:
+        configuration.temporary_directory = temp_directory
+
+        test_engine.ExportEvents(
+            storage_reader, output_module, configuration,
+            storage_file_path=test_file_path)
+
+      output = test_file_object.getvalue()
+      if expected_output is None:
+        expected_output = output
+      else:
+        self.assertEqual(output, expected_output)
+
+    lines = expected_output.split('\n')
+    self.assertEqual(len(lines), 22)
+
+
 if __name__ == '__main__':
   unittest.main()
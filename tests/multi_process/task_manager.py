@@ -29,6 +29,17 @@ class PendingMergeTaskHeapTest(shared_test_lib.BaseTestCase):
 
     self.assertIn(task.identifier, heap)
 
+  def testIter(self):
+    """Tests the __iter__ function."""
+    task = tasks.Task()
+    task.storage_file_size = 10
+
+    heap = task_manager._PendingMergeTaskHeap()
+    self.assertEqual(list(heap), [])
+
+    heap.PushTask(task)
+    self.assertEqual(list(heap), [task])
+
   def testLength(self):
     """Tests the __len__ function."""
     task = tasks.Task()
@@ -334,6 +345,40 @@ class TaskManagerTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(manager._total_number_of_tasks, 2)
 
+  def testCreateRetryTaskWithBatchTask(self):
+    """Tests the CreateRetryTask function with a batch task."""
+    manager = task_manager.TaskManager()
+    task = manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+    task.path_specs = ['test_path_spec1', 'test_path_spec2']
+
+    manager._AbandonQueuedTasks()
+
+    self.assertEqual(len(manager._tasks_queued), 0)
+    self.assertEqual(len(manager._tasks_abandoned), 1)
+    self.assertTrue(manager.HasPendingTasks())
+
+    retry_task = manager.CreateRetryTask()
+    self.assertIsNotNone(retry_task)
+    self.assertEqual(retry_task.path_spec, 'test_path_spec1')
+    self.assertIsNone(retry_task.path_specs)
+    self.assertTrue(task.has_retry)
+
+    self.assertEqual(len(manager._tasks_queued), 1)
+    self.assertTrue(manager.HasPendingTasks())
+
+    retry_task = manager.CreateRetryTask()
+    self.assertIsNotNone(retry_task)
+    self.assertEqual(retry_task.path_spec, 'test_path_spec2')
+    self.assertIsNone(retry_task.path_specs)
+
+    self.assertEqual(len(manager._tasks_queued), 2)
+    self.assertEqual(len(manager._tasks_abandoned), 1)
+
+    retry_task = manager.CreateRetryTask()
+    self.assertIsNone(retry_task)
+
+    self.assertEqual(manager._total_number_of_tasks, 3)
+
   def testCreateTask(self):
     """Tests the CreateTask function."""
     manager = task_manager.TaskManager()
@@ -478,6 +523,36 @@ class TaskManagerTest(shared_test_lib.BaseTestCase):
     result_tasks = manager.GetFailedTasks()
     self.assertEqual(set(result_tasks), set(test_tasks))
 
+  def testGetPendingTaskPathSpecs(self):
+    """Tests the GetPendingTaskPathSpecs function."""
+    manager = task_manager.TaskManager()
+
+    task = manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+    task.path_specs = ['test_path_spec1', 'test_path_spec2']
+
+    path_specs = manager.GetPendingTaskPathSpecs()
+    self.assertEqual(path_specs, ['test_path_spec1', 'test_path_spec2'])
+
+    manager._AbandonQueuedTasks()
+
+    path_specs = manager.GetPendingTaskPathSpecs()
+    self.assertEqual(path_specs, ['test_path_spec1', 'test_path_spec2'])
+
+    retry_task = manager.CreateRetryTask()
+    self.assertIsNotNone(retry_task)
+
+    # The path specifications of the abandoned task are part of the retry
+    # tasks.
+    path_specs = manager.GetPendingTaskPathSpecs()
+    self.assertEqual(path_specs, ['test_path_spec1', 'test_path_spec2'])
+
+    task = manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+    task.path_spec = 'test_path_spec3'
+
+    path_specs = manager.GetPendingTaskPathSpecs()
+    self.assertEqual(sorted(path_specs), [
+        'test_path_spec1', 'test_path_spec2', 'test_path_spec3'])
+
   def testGetProcessedTaskByIdentifier(self):
     """Tests the GetProcessedTaskByIdentifier function."""
     manager = task_manager.TaskManager()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""This file contains tests for the worker pool controller."""
+
+import unittest
+
+from plaso.multi_process import worker_pool
+
+from tests import test_lib as shared_test_lib
+
+
+class WorkerPoolControllerTest(shared_test_lib.BaseTestCase):
+  """Tests for the worker pool controller."""
+
+  _GIGABYTE = 1024 * 1024 * 1024
+
+  def testDetermineNumberOfWorkers(self):
+    """Tests the DetermineNumberOfWorkers function."""
+    controller = worker_pool.WorkerPoolController(
+        2, 8, 4, number_of_cpus=4, worker_memory_limit=self._GIGABYTE)
+
+    # Grow up to the preferred number of workers when tasks are queued.
+    decision = controller.DetermineNumberOfWorkers(
+        2, 1, 2, 0, [90.0, 100.0], 0, 4 * self._GIGABYTE)
+    self.assertEqual(decision.action, 'grow')
+    self.assertEqual(decision.cpu_utilization, 95.0)
+    self.assertEqual(decision.memory_headroom, 3 * self._GIGABYTE)
+    self.assertEqual(decision.number_of_workers, 3)
+    self.assertEqual(decision.reason, 'tasks queued')
+
+    # Grow beyond the preferred number of workers when I/O bound.
+    decision = controller.DetermineNumberOfWorkers(
+        4, 1, 4, 0, [20.0] * 4, 0, 4 * self._GIGABYTE)
+    self.assertEqual(decision.action, 'grow')
+    self.assertEqual(decision.number_of_workers, 5)
+    self.assertEqual(decision.reason, 'I/O bound')
+
+    # Do not grow beyond the preferred number of workers when CPU bound.
+    decision = controller.DetermineNumberOfWorkers(
+        4, 1, 4, 0, [70.0] * 4, 0, 4 * self._GIGABYTE)
+    self.assertEqual(decision.action, 'keep')
+    self.assertEqual(decision.number_of_workers, 4)
+
+    # Do not grow beyond the preferred number of workers when no CPU is
+    # available, such as when the workers share the CPUs.
+    decision = controller.DetermineNumberOfWorkers(
+        7, 1, 7, 0, [45.0] * 7, 0, 8 * self._GIGABYTE)
+    self.assertEqual(decision.action, 'keep')
+    self.assertEqual(decision.number_of_workers, 7)
+
+    # Do not grow beyond the maximum number of workers.
+    decision = controller.DetermineNumberOfWorkers(
+        8, 1, 8, 0, [20.0] * 8, 0, 16 * self._GIGABYTE)
+    self.assertEqual(decision.action, 'keep')
+    self.assertEqual(decision.number_of_workers, 8)
+
+    # Do not grow when not all workers are busy.
+    decision = controller.DetermineNumberOfWorkers(
+        3, 1, 2, 0, [20.0] * 3, 0, 4 * self._GIGABYTE)
+    self.assertEqual(decision.action, 'keep')
+
+    # Shrink when merging falls behind.
+    decision = controller.DetermineNumberOfWorkers(
+        3, 1, 3, 7, [20.0] * 3, 0, 4 * self._GIGABYTE)
+    self.assertEqual(decision.action, 'shrink')
+    self.assertEqual(decision.number_of_workers, 2)
+    self.assertEqual(decision.reason, 'merge backlog')
+
+    # Shrink when there is insufficient memory headroom.
+    decision = controller.DetermineNumberOfWorkers(
+        3, 1, 3, 0, [20.0] * 3, 0, self._GIGABYTE // 2)
+    self.assertEqual(decision.action, 'shrink')
+    self.assertEqual(decision.number_of_workers, 2)
+    self.assertEqual(decision.reason, 'insufficient memory headroom')
+
+    # Do not shrink below the minimum number of workers.
+    decision = controller.DetermineNumberOfWorkers(
+        2, 1, 2, 0, [20.0] * 2, 0, self._GIGABYTE // 2)
+    self.assertEqual(decision.action, 'keep')
+    self.assertEqual(decision.number_of_workers, 2)
+
+    # Shrink towards the preferred number of workers when the CPUs are
+    # saturated.
+    decision = controller.DetermineNumberOfWorkers(
+        6, 1, 6, 0, [60.0] * 6, 0, 4 * self._GIGABYTE)
+    self.assertEqual(decision.action, 'shrink')
+    self.assertEqual(decision.number_of_workers, 5)
+    self.assertEqual(decision.reason, 'CPU saturated')
+
+    # Use the memory used by the workers when there is no memory limit.
+    controller = worker_pool.WorkerPoolController(2, 8, 4)
+
+    decision = controller.DetermineNumberOfWorkers(
+        3, 0, 3, 0, [], self._GIGABYTE, 4 * self._GIGABYTE)
+    self.assertEqual(decision.action, 'keep')
+    self.assertIsNone(decision.cpu_utilization)
+    self.assertEqual(decision.memory_headroom, 3 * self._GIGABYTE)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -68,6 +68,33 @@ class ZeroMQQueuesTest(shared_test_lib.BaseTestCase):
     with self.assertRaises(errors.QueueAlreadyClosed):
       test_queue.PushItem('This shouldn\'t work')
 
+  def testPushItemFirst(self):
+    """Tests the PushItemFirst function of the buffered reply queue."""
+    reply_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
+        name='pushitemfirst_replybind', delay_open=False, linger_seconds=1,
+        buffer_max_size=2)
+    request_queue = zeromq_queue.ZeroMQRequestConnectQueue(
+        name='pushitemfirst_requestconnect', delay_open=False,
+        port=reply_queue.port, linger_seconds=1)
+
+    try:
+      # Prevent the responder thread from taking items from the buffer until
+      # all items have been pushed.
+      with reply_queue._queue.mutex:
+        reply_queue._queue.queue.extend(['first', 'second'])
+        reply_queue._queue.unfinished_tasks += 2
+
+      # An item can be pushed first when the buffer is full.
+      reply_queue.PushItemFirst('priority')
+
+      self.assertEqual(request_queue.PopItem(), 'priority')
+      self.assertEqual(request_queue.PopItem(), 'first')
+      self.assertEqual(request_queue.PopItem(), 'second')
+
+    finally:
+      reply_queue.Close()
+      request_queue.Close()
+
   def testPushPullQueues(self):
     """Tests than an item can be transferred between push and pull queues."""
     push_queue = zeromq_queue.ZeroMQPushBindQueue(
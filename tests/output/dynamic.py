@@ -211,8 +211,6 @@ class DynamicOutputModuleTest(test_lib.OutputModuleTestCase):
 
     output_module.WriteFieldValues(output_mediator, field_values)
 
-    output_module._FlushSortedStringsHeap()
-
     expected_event_body = (
         '2012-06-27,18:17:01,UTC,..C.,FILE,Test log file,Metadata '
         'Modification Time,-,ubuntu,Reporter <CRON> PID: 8442 '
@@ -254,8 +252,6 @@ class DynamicOutputModuleTest(test_lib.OutputModuleTestCase):
 
     output_module.WriteFieldValues(output_mediator, field_values)
 
-    output_module._FlushSortedStringsHeap()
-
     expected_event_body = (
         '2012-06-27T18:17:01.000000+00:00,-,ubuntu,Reporter <CRON> PID: 8442'
         ' (pam_unix(cron:session): session closed for user root)\n')
@@ -2,9 +2,10 @@
 # -*- coding: utf-8 -*-
 """Tests for the output module field formatting helper."""
 
-import platform
 import unittest
 
+import pytz
+
 from dfdatetime import posix_time as dfdatetime_posix_time
 from dfdatetime import semantic_time as dfdatetime_semantic_time
 
@@ -18,6 +19,66 @@ from tests.containers import test_lib as containers_test_lib
 from tests.output import test_lib
 
 
+class DateTimeFormattingCacheTest(test_lib.OutputModuleTestCase):
+  """Tests the date and time formatting cache."""
+
+  # pylint: disable=protected-access
+
+  def testGetTimeZoneOffsetAndName(self):
+    """Tests the _GetTimeZoneOffsetAndName function."""
+    time_zone = pytz.timezone('Europe/Amsterdam')
+    test_cache = formatting_helper.DateTimeFormattingCache(time_zone)
+
+    # 2015-10-25 00:59:59 UTC, before the end of daylight saving time.
+    time_zone_offset, time_zone_name = test_cache._GetTimeZoneOffsetAndName(
+        1445734799)
+    self.assertEqual(time_zone_offset, 7200)
+    self.assertEqual(time_zone_name, 'CEST')
+
+    # 2015-10-25 01:00:00 UTC, the end of daylight saving time.
+    time_zone_offset, time_zone_name = test_cache._GetTimeZoneOffsetAndName(
+        1445734800)
+    self.assertEqual(time_zone_offset, 3600)
+    self.assertEqual(time_zone_name, 'CET')
+
+    # 2015-12-31 23:59:59 UTC, within the same transition window.
+    time_zone_offset, time_zone_name = test_cache._GetTimeZoneOffsetAndName(
+        1451606399)
+    self.assertEqual(time_zone_offset, 3600)
+    self.assertEqual(time_zone_name, 'CET')
+    self.assertEqual(test_cache._transition_start_timestamp, 1445734800)
+
+    test_cache = formatting_helper.DateTimeFormattingCache(pytz.UTC)
+
+    time_zone_offset, time_zone_name = test_cache._GetTimeZoneOffsetAndName(
+        1445734800)
+    self.assertEqual(time_zone_offset, 0)
+    self.assertEqual(time_zone_name, 'UTC')
+
+  def testGetDateTimeValues(self):
+    """Tests the GetDateTimeValues function."""
+    time_zone = pytz.timezone('Europe/Amsterdam')
+    test_cache = formatting_helper.DateTimeFormattingCache(time_zone)
+
+    date_time_values = test_cache.GetDateTimeValues(1340821021)
+    self.assertEqual(
+        date_time_values, (2012, 6, 27, 20, 17, 1, '+02:00', 'CEST'))
+
+    date_time_values = test_cache.GetDateTimeValues(-1567517140)
+    self.assertEqual(
+        date_time_values, (1920, 4, 30, 11, 34, 20, '+01:00', 'WEST'))
+
+    time_zone = pytz.timezone('America/New_York')
+    test_cache = formatting_helper.DateTimeFormattingCache(time_zone)
+
+    date_time_values = test_cache.GetDateTimeValues(1340821021)
+    self.assertEqual(
+        date_time_values, (2012, 6, 27, 14, 17, 1, '-04:00', 'EDT'))
+
+    with self.assertRaises(OverflowError):
+      test_cache.GetDateTimeValues(-9223372036854775808)
+
+
 class TestFieldFormattingHelper(formatting_helper.FieldFormattingHelper):
   """Field formatter helper for testing purposes."""
 
@@ -51,6 +112,27 @@ class FieldFormattingHelperTest(test_lib.OutputModuleTestCase):
        'timestamp': '2012-06-27 20:17:01',
        'timestamp_desc': definitions.TIME_DESCRIPTION_METADATA_MODIFICATION}]
 
+  def testCopyTimestampToDateTimeString(self):
+    """Tests the _CopyTimestampToDateTimeString function."""
+    test_helper = formatting_helper.FieldFormattingHelper()
+
+    date_time_string = test_helper._CopyTimestampToDateTimeString(
+        1340821021000000, pytz.UTC)
+    self.assertEqual(date_time_string, '2012-06-27T18:17:01.000000+00:00')
+
+    time_zone = pytz.timezone('Europe/Amsterdam')
+    date_time_string = test_helper._CopyTimestampToDateTimeString(
+        1340821021000000, time_zone)
+    self.assertEqual(date_time_string, '2012-06-27T20:17:01.000000+02:00')
+
+    date_time_string = test_helper._CopyTimestampToDateTimeString(
+        -1567517139327447, pytz.UTC)
+    self.assertEqual(date_time_string, '1920-04-30T10:34:20.672553+00:00')
+
+    with self.assertRaises(ValueError):
+      test_helper._CopyTimestampToDateTimeString(
+          -9223372036854775808, pytz.UTC)
+
   def testFormatDateTime(self):
     """Tests the _FormatDateTime function with dynamic time."""
     output_mediator = self._CreateOutputMediator(dynamic_time=True)
@@ -129,33 +211,21 @@ class FieldFormattingHelperTest(test_lib.OutputModuleTestCase):
 
     date_time_string = test_helper._FormatDateTime(
         output_mediator, event, event_data, event_data_stream)
-    if platform.system() == 'Windows':
-      expected_date_time_string = '0000-00-00T00:00:00.000000+00:00'
-    else:
-      expected_date_time_string = '1920-04-30T10:34:20.673000+00:00'
-    self.assertEqual(date_time_string, expected_date_time_string)
+    self.assertEqual(date_time_string, '1920-04-30T10:34:20.673000+00:00')
 
     event.date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
         timestamp=-1567517139327447)
 
     date_time_string = test_helper._FormatDateTime(
         output_mediator, event, event_data, event_data_stream)
-    if platform.system() == 'Windows':
-      expected_date_time_string = '0000-00-00T00:00:00.000000+00:00'
-    else:
-      expected_date_time_string = '1920-04-30T10:34:20.672553+00:00'
-    self.assertEqual(date_time_string, expected_date_time_string)
+    self.assertEqual(date_time_string, '1920-04-30T10:34:20.672553+00:00')
 
     event.date_time = dfdatetime_posix_time.PosixTimeInNanoseconds(
         timestamp=-1567517139327447871)
 
     date_time_string = test_helper._FormatDateTime(
         output_mediator, event, event_data, event_data_stream)
-    if platform.system() == 'Windows':
-      expected_date_time_string = '0000-00-00T00:00:00.000000+00:00'
-    else:
-      expected_date_time_string = '1920-04-30T10:34:20.672552+00:00'
-    self.assertEqual(date_time_string, expected_date_time_string)
+    self.assertEqual(date_time_string, '1920-04-30T10:34:20.672552+00:00')
 
     event.date_time = dfdatetime_semantic_time.InvalidTime()
 
@@ -190,11 +260,7 @@ class FieldFormattingHelperTest(test_lib.OutputModuleTestCase):
     event.timestamp = -1567517139327447
     date_time_string = test_helper._FormatDateTime(
         output_mediator, event, event_data, event_data_stream)
-    if platform.system() == 'Windows':
-      expected_date_time_string = '0000-00-00T00:00:00.000000+00:00'
-    else:
-      expected_date_time_string = '1920-04-30T10:34:20.672553+00:00'
-    self.assertEqual(date_time_string, expected_date_time_string)
+    self.assertEqual(date_time_string, '1920-04-30T10:34:20.672553+00:00')
 
     event.timestamp = -9223372036854775808
     date_time_string = test_helper._FormatDateTime(
@@ -426,6 +492,14 @@ class FieldFormattingHelperTest(test_lib.OutputModuleTestCase):
         output_mediator, event, event_data, event_data_stream)
     self.assertEqual(zone_string, 'CEST')
 
+    # Test with a date and time that is ambiguous in the time zone.
+    event.date_time = dfdatetime_posix_time.PosixTime(timestamp=1445736196)
+    event.timestamp = 1445736196000000
+
+    zone_string = test_helper._FormatTimeZone(
+        output_mediator, event, event_data, event_data_stream)
+    self.assertEqual(zone_string, 'CET')
+
     output_mediator.SetTimeZone('UTC')
 
     event, event_data, event_data_stream = (
@@ -459,6 +533,80 @@ class FieldFormattingHelperTest(test_lib.OutputModuleTestCase):
 
   # TODO: add coverage for _ReportEventError
 
+  def testGetFormattedEventValues(self):
+    """Tests the _GetFormattedEventValues function."""
+    output_mediator = self._CreateOutputMediator()
+
+    formatters_directory_path = self._GetTestFilePath(['formatters'])
+    output_mediator.ReadMessageFormattersFromDirectory(
+        formatters_directory_path)
+
+    test_helper = formatting_helper.FieldFormattingHelper()
+
+    _, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    message_formatter, event_values = test_helper._GetFormattedEventValues(
+        output_mediator, event_data)
+    self.assertIsNotNone(message_formatter)
+    self.assertEqual(message_formatter.data_type, 'test:event')
+    self.assertEqual(event_values['hostname'], 'ubuntu')
+
+    _, cached_event_values = test_helper._GetFormattedEventValues(
+        output_mediator, event_data)
+    self.assertIs(cached_event_values, event_values)
+
+    _, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[1])
+
+    _, other_event_values = test_helper._GetFormattedEventValues(
+        output_mediator, event_data)
+    self.assertIsNot(other_event_values, event_values)
+
+  def testGetLocalDateTimeValues(self):
+    """Tests the _GetLocalDateTimeValues function."""
+    test_helper = formatting_helper.FieldFormattingHelper()
+
+    date_time = dfdatetime_posix_time.PosixTime(timestamp=1340821021)
+    time_zone = pytz.timezone('Australia/Sydney')
+
+    date_time_values = test_helper._GetLocalDateTimeValues(
+        date_time, time_zone)
+    self.assertEqual(
+        date_time_values, (2012, 6, 28, 4, 17, 1, '+10:00', 'AEST'))
+
+    date_time = dfdatetime_semantic_time.InvalidTime()
+
+    with self.assertRaises(TypeError):
+      test_helper._GetLocalDateTimeValues(date_time, time_zone)
+
+  def testGetMessageFormatter(self):
+    """Tests the _GetMessageFormatter function."""
+    output_mediator = self._CreateOutputMediator()
+
+    formatters_directory_path = self._GetTestFilePath(['formatters'])
+    output_mediator.ReadMessageFormattersFromDirectory(
+        formatters_directory_path)
+
+    test_helper = formatting_helper.FieldFormattingHelper()
+
+    message_formatter = test_helper._GetMessageFormatter(
+        output_mediator, 'test:event')
+    self.assertIsNotNone(message_formatter)
+    self.assertEqual(message_formatter.data_type, 'test:event')
+    self.assertIs(
+        test_helper._message_formatters['test:event'], message_formatter)
+
+    message_formatter = test_helper._GetMessageFormatter(
+        output_mediator, 'test:bogus')
+    self.assertIsNotNone(message_formatter)
+    self.assertIs(
+        message_formatter, test_helper._DEFAULT_MESSAGE_FORMATTER)
+
+    other_output_mediator = self._CreateOutputMediator()
+    test_helper._GetMessageFormatter(other_output_mediator, 'test:bogus')
+    self.assertNotIn('test:event', test_helper._message_formatters)
+
   def testGetFormattedField(self):
     """Tests the GetFormattedField function."""
     output_mediator = self._CreateOutputMediator()
@@ -242,8 +242,6 @@ class L2TCSVTest(test_lib.OutputModuleTestCase):
 
     output_module.WriteFieldValues(output_mediator, field_values)
 
-    output_module._FlushSortedStringsHeap()
-
     expected_event_body = (
         '06/27/2012,18:17:01,UTC,M...,FILE,Test log file,Content Modification '
         'Time,-,ubuntu,Reporter <CRON> PID: 8442 (pam_unix(cron:session): '
@@ -22,6 +22,7 @@ class TestOpenSearchOutputModule(opensearch.OpenSearchOutputModule):
   def _Connect(self):
     """Connects to an OpenSearch server."""
     self._client = MagicMock()
+    self._client.bulk.return_value = {'errors': False, 'items': []}
 
 
 class OpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
@@ -72,7 +73,7 @@ class OpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
 
     output_module.WriteFieldValues(output_mediator, field_values)
 
-    self.assertEqual(len(output_module._event_documents), 2)
+    self.assertEqual(len(output_module._event_documents), 1)
     self.assertEqual(output_module._number_of_buffered_events, 1)
 
     output_module._FlushEvents()
@@ -80,6 +81,11 @@ class OpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
     self.assertEqual(len(output_module._event_documents), 0)
     self.assertEqual(output_module._number_of_buffered_events, 0)
 
+    output_module.Close()
+
+    output_status = output_module.GetStatus()
+    self.assertEqual(output_status.number_of_written_events, 1)
+
   def testWriteFieldValues(self):
     """Tests the WriteFieldValues function.
 
@@ -112,7 +118,7 @@ class OpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
 
     output_module.WriteFieldValues(output_mediator, field_values)
 
-    self.assertEqual(len(output_module._event_documents), 2)
+    self.assertEqual(len(output_module._event_documents), 1)
     self.assertEqual(output_module._number_of_buffered_events, 1)
 
   def testWriteHeader(self):
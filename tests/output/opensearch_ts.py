@@ -23,6 +23,7 @@ class TestOpenSearchTimesketchOutputModule(
   def _Connect(self):
     """Connects to an OpenSearch server."""
     self._client = MagicMock()
+    self._client.bulk.return_value = {'errors': False, 'items': []}
 
 
 class OpenSearchTimesketchOutputModuleTest(test_lib.OutputModuleTestCase):
@@ -73,7 +74,7 @@ class OpenSearchTimesketchOutputModuleTest(test_lib.OutputModuleTestCase):
 
     output_module.WriteFieldValues(output_mediator, field_values)
 
-    self.assertEqual(len(output_module._event_documents), 2)
+    self.assertEqual(len(output_module._event_documents), 1)
     self.assertEqual(output_module._number_of_buffered_events, 1)
 
     output_module._FlushEvents()
@@ -81,6 +82,11 @@ class OpenSearchTimesketchOutputModuleTest(test_lib.OutputModuleTestCase):
     self.assertEqual(len(output_module._event_documents), 0)
     self.assertEqual(output_module._number_of_buffered_events, 0)
 
+    output_module.Close()
+
+    output_status = output_module.GetStatus()
+    self.assertEqual(output_status.number_of_written_events, 1)
+
   def testWriteFieldValues(self):
     """Tests the WriteFieldValues function.
 
@@ -113,7 +119,7 @@ class OpenSearchTimesketchOutputModuleTest(test_lib.OutputModuleTestCase):
 
     output_module.WriteFieldValues(output_mediator, field_values)
 
-    self.assertEqual(len(output_module._event_documents), 2)
+    self.assertEqual(len(output_module._event_documents), 1)
     self.assertEqual(output_module._number_of_buffered_events, 1)
 
   def testWriteHeader(self):
@@ -2,8 +2,13 @@
 # -*- coding: utf-8 -*-
 """Tests for the shared functionality for OpenSearch output modules."""
 
+import gzip
+import json
+import threading
 import unittest
 
+from http import server as http_server
+from unittest import mock
 from unittest.mock import MagicMock
 
 from dfvfs.path import fake_path_spec
@@ -37,6 +42,88 @@ class TestOpenSearchOutputModule(
     return
 
 
+class StubOpenSearchRequestHandler(http_server.BaseHTTPRequestHandler):
+  """Stub OpenSearch HTTP request handler for testing.
+
+  The handler replies to the bulk requests with the responses of the stub
+  server in order. A response that is an integer represents a failed bulk
+  request with that HTTP status code and a response that is a list of
+  integers the HTTP status codes of the individual documents.
+  """
+
+  # pylint: disable=invalid-name
+
+  def do_POST(self):
+    """Handles a POST request."""
+    content_length = int(self.headers.get('Content-Length', '0'), 10)
+    request_body = self.rfile.read(content_length)
+
+    if self.headers.get('Content-Encoding', None) == 'gzip':
+      request_body = gzip.decompress(request_body)
+
+    documents = [
+        json.loads(line) for line in request_body.split(b'\n') if line]
+    self.server.requests.append(documents)
+
+    response = 200
+    if self.server.responses:
+      response = self.server.responses.pop(0)
+
+    if isinstance(response, int):
+      if response == 200:
+        response_data = {'errors': False, 'items': [
+            {'index': {'status': 201}} for _ in documents[1::2]]}
+      else:
+        response_data = {'error': 'stub error', 'status': response}
+
+      status_code = response
+
+    else:
+      items = []
+      for document_status_code in response:
+        item = {'status': document_status_code}
+        if document_status_code >= 300:
+          item['error'] = {
+              'reason': 'stub error', 'type': 'mapper_parsing_exception'}
+        items.append({'index': item})
+
+      response_data = {'errors': True, 'items': items}
+      status_code = 200
+
+    response_body = json.dumps(response_data).encode('utf-8')
+
+    self.send_response(status_code)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', f'{len(response_body):d}')
+    self.end_headers()
+    self.wfile.write(response_body)
+
+  def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+    """Suppresses logging of requests."""
+    return
+
+
+class StubOpenSearchServer(http_server.ThreadingHTTPServer):
+  """Stub OpenSearch HTTP server for testing.
+
+  Attributes:
+    requests (list[list[dict[str, object]]]): documents of the bulk requests
+        received by the server.
+    responses (list[int|list[int]]): responses of the server.
+  """
+
+  def __init__(self, responses=None):
+    """Initializes a stub OpenSearch HTTP server.
+
+    Args:
+      responses (Optional[list[int|list[int]]]): responses of the server.
+    """
+    super(StubOpenSearchServer, self).__init__(
+        ('127.0.0.1', 0), StubOpenSearchRequestHandler)
+    self.requests = []
+    self.responses = responses or []
+
+
 class SharedOpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
   """Tests the shared functionality for OpenSearch output modules."""
 
@@ -56,6 +143,75 @@ class SharedOpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
        'timestamp': '2012-06-27 18:17:01+00:00',
        'timestamp_desc': definitions.TIME_DESCRIPTION_WRITTEN}]
 
+  def _CreateOutputModuleWithStubServer(self, stub_server):
+    """Creates an output module that is connected to a stub server.
+
+    Args:
+      stub_server (StubOpenSearchServer): stub OpenSearch server.
+
+    Returns:
+      SharedOpenSearchOutputModule: output module.
+    """
+    retry_delay_patcher = mock.patch.object(
+        shared_opensearch.SharedOpenSearchOutputModule, '_RETRY_DELAY', 0.0)
+    retry_delay_patcher.start()
+    self.addCleanup(retry_delay_patcher.stop)
+
+    output_module = shared_opensearch.SharedOpenSearchOutputModule()
+
+    output_module.SetIndexName('test')
+    output_module.SetServerInformation('127.0.0.1', stub_server.server_port)
+
+    output_module._Connect()
+
+    return output_module
+
+  def _StartStubServer(self, responses=None):
+    """Starts a stub OpenSearch server.
+
+    Args:
+      responses (Optional[list[int|list[int]]]): responses of the server.
+
+    Returns:
+      StubOpenSearchServer: stub OpenSearch server.
+    """
+    stub_server = StubOpenSearchServer(responses=responses)
+
+    server_thread = threading.Thread(target=stub_server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+
+    self.addCleanup(stub_server.server_close)
+    self.addCleanup(stub_server.shutdown)
+
+    return stub_server
+
+  def testBufferEventDocument(self):
+    """Tests the _BufferEventDocument function.
+
+    Raises:
+      SkipTest: if opensearch-py is missing.
+    """
+    if shared_opensearch.opensearchpy is None:
+      raise unittest.SkipTest('missing opensearch-py')
+
+    output_module = TestOpenSearchOutputModule()
+    output_module.SetIndexName('test')
+
+    output_module._BufferEventDocument({'message': 'test'})
+
+    self.assertEqual(output_module._event_documents, [
+        b'{"index":{"_index":"test"}}\n{"message":"test"}\n'])
+    self.assertEqual(output_module._event_documents_size, 47)
+    self.assertEqual(output_module._number_of_buffered_events, 1)
+
+    output_module._BufferEventDocument({'message': {'unsupported'}})
+
+    self.assertEqual(output_module._number_of_buffered_events, 1)
+
+    output_status = output_module.GetStatus()
+    self.assertEqual(output_status.number_of_rejected_events, 1)
+
   def testConnect(self):
     """Tests the _Connect function.
 
@@ -106,6 +262,145 @@ class SharedOpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
 
     self.assertIsNone(output_module._client)
 
+  def testFlushEventsWithCompression(self):
+    """Tests the _FlushEvents function with HTTP compression.
+
+    Raises:
+      SkipTest: if opensearch-py is missing.
+    """
+    if shared_opensearch.opensearchpy is None:
+      raise unittest.SkipTest('missing opensearch-py')
+
+    stub_server = self._StartStubServer()
+
+    output_module = shared_opensearch.SharedOpenSearchOutputModule()
+    output_module.SetBulkRequestSize(100)
+    output_module.SetIndexName('test')
+    output_module.SetNumberOfConcurrentRequests(2)
+    output_module.SetServerInformation('127.0.0.1', stub_server.server_port)
+    output_module.SetUseHTTPCompression(True)
+
+    output_module._Connect()
+
+    for index in range(10):
+      output_module._BufferEventDocument({'number': index})
+
+    output_module.Close()
+
+    self.assertEqual(len(stub_server.requests), 4)
+
+    numbers = sorted(
+        document['number'] for documents in stub_server.requests
+        for document in documents[1::2])
+    self.assertEqual(numbers, list(range(10)))
+
+    output_status = output_module.GetStatus()
+    self.assertEqual(output_status.number_of_rejected_events, 0)
+    self.assertEqual(output_status.number_of_written_events, 10)
+
+  def testGetRetryDelay(self):
+    """Tests the _GetRetryDelay function."""
+    output_module = TestOpenSearchOutputModule()
+
+    retry_delay = output_module._GetRetryDelay(1)
+    self.assertGreaterEqual(retry_delay, 0.0)
+    self.assertLessEqual(retry_delay, output_module._RETRY_DELAY)
+
+    retry_delay = output_module._GetRetryDelay(100)
+    self.assertLessEqual(retry_delay, output_module._RETRY_DELAY_MAXIMUM)
+
+  def testIsRetryableStatusCode(self):
+    """Tests the _IsRetryableStatusCode function."""
+    output_module = TestOpenSearchOutputModule()
+
+    self.assertTrue(output_module._IsRetryableStatusCode(429))
+    self.assertTrue(output_module._IsRetryableStatusCode(503))
+    self.assertTrue(output_module._IsRetryableStatusCode('N/A'))
+    self.assertFalse(output_module._IsRetryableStatusCode(400))
+
+  def testProcessBulkResponse(self):
+    """Tests the _ProcessBulkResponse function."""
+    output_module = TestOpenSearchOutputModule()
+
+    event_documents = [b'1', b'2', b'3']
+
+    retry_event_documents = output_module._ProcessBulkResponse(
+        event_documents, {'errors': False, 'items': []})
+    self.assertEqual(retry_event_documents, [])
+
+    response = {'errors': True, 'items': [
+        {'index': {'status': 201}},
+        {'index': {'status': 429}},
+        {'index': {'error': {'type': 'mapper_parsing_exception'},
+                   'status': 400}}]}
+
+    retry_event_documents = output_module._ProcessBulkResponse(
+        event_documents, response)
+    self.assertEqual(retry_event_documents, [b'2'])
+
+    output_status = output_module.GetStatus()
+    self.assertEqual(output_status.number_of_rejected_events, 1)
+    self.assertEqual(output_status.number_of_written_events, 4)
+
+    self.assertEqual(
+        output_module._rejected_events_per_error_type,
+        {'mapper_parsing_exception': 1})
+
+  def testSendBulkRequest(self):
+    """Tests the _SendBulkRequest function.
+
+    Raises:
+      SkipTest: if opensearch-py is missing.
+    """
+    if shared_opensearch.opensearchpy is None:
+      raise unittest.SkipTest('missing opensearch-py')
+
+    stub_server = self._StartStubServer(responses=[429, [201, 429, 400], 200])
+
+    output_module = self._CreateOutputModuleWithStubServer(stub_server)
+
+    for index in range(3):
+      output_module._BufferEventDocument({'number': index})
+
+    event_documents = output_module._event_documents
+    output_module._SendBulkRequest(event_documents)
+
+    self.assertEqual(len(stub_server.requests), 3)
+    self.assertEqual(len(stub_server.requests[0]), 6)
+    self.assertEqual(len(stub_server.requests[1]), 6)
+    self.assertEqual(stub_server.requests[2], [
+        {'index': {'_index': 'test'}}, {'number': 1}])
+
+    output_status = output_module.GetStatus()
+    self.assertEqual(output_status.number_of_rejected_events, 1)
+    self.assertEqual(output_status.number_of_retries, 2)
+    self.assertEqual(output_status.number_of_written_events, 2)
+    self.assertGreater(output_status.number_of_bytes_written, 0)
+
+    # Test a bulk request that keeps failing.
+    stub_server.requests = []
+    stub_server.responses = [503] * 10
+
+    output_module._SendBulkRequest(event_documents)
+
+    self.assertEqual(
+        len(stub_server.requests),
+        output_module._MAXIMUM_NUMBER_OF_RETRIES + 1)
+
+    output_status = output_module.GetStatus()
+    self.assertEqual(output_status.number_of_rejected_events, 4)
+
+    # Test a bulk request that is not retried.
+    stub_server.requests = []
+    stub_server.responses = [400]
+
+    output_module._SendBulkRequest(event_documents)
+
+    self.assertEqual(len(stub_server.requests), 1)
+
+    output_status = output_module.GetStatus()
+    self.assertEqual(output_status.number_of_rejected_events, 7)
+
   def testGetFieldValues(self):
     """Tests the GetFieldValues function."""
     output_mediator = self._CreateOutputMediator()
@@ -200,6 +495,37 @@ class SharedOpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
 
     self.assertEqual(output_module._username, 'test_username')
 
+  def testWriteFooter(self):
+    """Tests the WriteFooter function.
+
+    Raises:
+      SkipTest: if opensearch-py is missing.
+    """
+    if shared_opensearch.opensearchpy is None:
+      raise unittest.SkipTest('missing opensearch-py')
+
+    stub_server = self._StartStubServer()
+
+    output_module = self._CreateOutputModuleWithStubServer(stub_server)
+    output_module.SetBulkRequestSize(100)
+    output_module.SetNumberOfConcurrentRequests(2)
+
+    try:
+      for index in range(10):
+        output_module._BufferEventDocument({'number': index})
+
+      output_module.WriteFooter()
+
+      # The queued bulk requests are completed before WriteFooter returns.
+      self.assertEqual(output_module._bulk_request_queue.unfinished_tasks, 0)
+      self.assertEqual(len(stub_server.requests), 4)
+
+      output_status = output_module.GetStatus()
+      self.assertEqual(output_status.number_of_written_events, 10)
+
+    finally:
+      output_module.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -182,8 +182,6 @@ class TLNOutputModuleTest(test_lib.OutputModuleTestCase):
 
     output_module.WriteFieldValues(output_mediator, field_values)
 
-    output_module._FlushSortedStringsHeap()
-
     expected_event_body = (
         '1340821021|FILE|ubuntu|root|2012-06-27T18:17:01.000000+00:00; '
         'Unknown Time; '
@@ -288,8 +286,6 @@ class L2TTLNOutputModuleTest(test_lib.OutputModuleTestCase):
 
     output_module.WriteFieldValues(output_mediator, field_values)
 
-    output_module._FlushSortedStringsHeap()
-
     expected_event_body = (
         '1340821021|FILE|ubuntu|root|2012-06-27T18:17:01.000000+00:00; '
         'Unknown Time; '
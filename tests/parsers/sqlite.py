@@ -120,6 +120,26 @@ class SQLiteParserTest(test_lib.ParserTestCase):
     parser.EnablePlugins(['chrome_27_history'])
     self.assertEqual(len(parser._plugins_per_name), 1)
 
+  def testGetPluginsWithRequiredTables(self):
+    """Tests the _GetPluginsWithRequiredTables function."""
+    database_file_path = self._GetTestFilePath(['contacts2.db'])
+    self._SkipIfPathNotExists(database_file_path)
+
+    parser = sqlite.SQLiteParser()
+    parser.EnablePlugins(['android_calls', 'chrome_27_history'])
+
+    database = sqlite.SQLiteDatabase('contacts2.db')
+    with open(database_file_path, 'rb') as database_file_object:
+      database.Open(database_file_object)
+
+    try:
+      plugins = parser._GetPluginsWithRequiredTables(database)
+    finally:
+      database.Close()
+
+    plugin_names = [plugin.NAME for plugin in plugins]
+    self.assertEqual(plugin_names, ['android_calls'])
+
   def testGetFormatSpecification(self):
     """Tests the GetFormatSpecification function."""
     format_specification = sqlite.SQLiteParser.GetFormatSpecification()
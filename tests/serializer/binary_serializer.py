@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the binary attribute container serializer."""
+
+import unittest
+
+from plaso.serializer import binary_serializer
+
+from tests import test_lib as shared_test_lib
+
+
+class BinaryAttributeContainerSerializerTest(shared_test_lib.BaseTestCase):
+  """Tests for the binary attribute container serializer."""
+
+  # pylint: disable=protected-access
+
+  def testAddSchema(self):
+    """Tests the AddSchema and GetSchema functions."""
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+
+    serializer.AddSchema(3, 'event_data', 'test:event', ['body', 'offset'])
+
+    schema = serializer.GetSchema(3)
+    self.assertEqual(schema, ('event_data', 'test:event', ('body', 'offset')))
+
+    schema = serializer.GetSchema(4)
+    self.assertIsNone(schema)
+
+    # Schemas read from storage are not reported as new.
+    new_schema_identifiers = serializer.PopNewSchemaIdentifiers()
+    self.assertEqual(new_schema_identifiers, [])
+
+  def testGetSchemaIdentifier(self):
+    """Tests the GetSchemaIdentifier function."""
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+
+    identifier = serializer.GetSchemaIdentifier(b'\x02\x01\x01')
+    self.assertEqual(identifier, 0x0102)
+
+    with self.assertRaises(ValueError):
+      serializer.GetSchemaIdentifier(b'\x02')
+
+  def testReadAndWriteSerialized(self):
+    """Tests the ReadSerialized and WriteSerialized functions."""
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+
+    json_dict = {
+        '__type__': 'AttributeContainer',
+        '__container_type__': 'event_data',
+        'data_type': 'test:event',
+        'body': 'Body with a \udcff surrogate',
+        'empty': '',
+        'flags': [True, False, None],
+        'large': 0x123456789abcdef0123,
+        'long_string': 'x' * 300,
+        'negative': -0x81,
+        'offset': 0x7fffffffffffffff,
+        'ratio': 0.5,
+        'values': {'a': 1, 'b': [0x8000, -0x80000001]}}
+
+    serialized_data = serializer.WriteSerialized(json_dict)
+    self.assertIsInstance(serialized_data, bytes)
+
+    new_schema_identifiers = serializer.PopNewSchemaIdentifiers()
+    self.assertEqual(new_schema_identifiers, [1])
+
+    schema = serializer.GetSchema(1)
+    self.assertEqual(schema[:2], ('event_data', 'test:event'))
+    self.assertNotIn('data_type', schema[2])
+
+    test_json_dict = serializer.ReadSerialized(serialized_data)
+    self.assertEqual(test_json_dict, json_dict)
+
+    # Test that the schema is reused by containers with the same attributes.
+    serializer.WriteSerialized(json_dict)
+
+    new_schema_identifiers = serializer.PopNewSchemaIdentifiers()
+    self.assertEqual(new_schema_identifiers, [])
+
+  def testReadSerializedWithUnsupportedData(self):
+    """Tests the ReadSerialized function with unsupported data."""
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+    serializer.AddSchema(1, 'event_data', 'test:event', ['body'])
+
+    # Unsupported schema identifier.
+    with self.assertRaises(ValueError):
+      serializer.ReadSerialized(b'\x02\x00')
+
+    # Truncated string.
+    with self.assertRaises(ValueError):
+      serializer.ReadSerialized(b'\x01\x00\x0a\x04abc')
+
+    # Unsupported value type.
+    with self.assertRaises(ValueError):
+      serializer.ReadSerialized(b'\x01\x00\xff')
+
+    # Trailing data.
+    with self.assertRaises(ValueError):
+      serializer.ReadSerialized(b'\x01\x00\x01\x01')
+
+  def testWriteSerializedWithSchemaExtension(self):
+    """Tests the WriteSerialized function with a schema that is extended."""
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+
+    json_dict1 = {
+        '__type__': 'AttributeContainer',
+        '__container_type__': 'event_data',
+        'data_type': 'test:event',
+        'body': 'first',
+        'offset': 1}
+
+    json_dict2 = {
+        '__type__': 'AttributeContainer',
+        '__container_type__': 'event_data',
+        'data_type': 'test:event',
+        'offset': 2,
+        'parser': 'test'}
+
+    json_dict3 = {
+        '__type__': 'AttributeContainer',
+        '__container_type__': 'event_data',
+        'data_type': 'test:other',
+        'body': 'other'}
+
+    serialized_data1 = serializer.WriteSerialized(json_dict1)
+    serialized_data2 = serializer.WriteSerialized(json_dict2)
+    serialized_data3 = serializer.WriteSerialized(json_dict3)
+
+    new_schema_identifiers = serializer.PopNewSchemaIdentifiers()
+    self.assertEqual(new_schema_identifiers, [1, 2, 3])
+
+    schema = serializer.GetSchema(2)
+    self.assertEqual(
+        schema, ('event_data', 'test:event', ('body', 'offset', 'parser')))
+
+    # The first value is not set since the schema has been extended.
+    self.assertEqual(serialized_data2[2], serializer._VALUE_TYPE_NOT_SET)
+
+    test_json_dict = serializer.ReadSerialized(serialized_data1)
+    self.assertEqual(test_json_dict, json_dict1)
+
+    test_json_dict = serializer.ReadSerialized(serialized_data2)
+    self.assertEqual(test_json_dict, json_dict2)
+
+    test_json_dict = serializer.ReadSerialized(serialized_data3)
+    self.assertEqual(test_json_dict, json_dict3)
+
+    # Containers with a subset of the attributes use the most recent schema.
+    serialized_data = serializer.WriteSerialized(json_dict1)
+    self.assertEqual(serializer.GetSchemaIdentifier(serialized_data), 2)
+
+  def testWriteSerializedWithUnsupportedData(self):
+    """Tests the WriteSerialized function with unsupported data."""
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+
+    with self.assertRaises(ValueError):
+      serializer.WriteSerialized({'__type__': 'DateTimeValues'})
+
+    json_dict = {
+        '__type__': 'AttributeContainer',
+        '__container_type__': 'event_data',
+        'value': b'bytes'}
+
+    with self.assertRaises(TypeError):
+      serializer.WriteSerialized(json_dict)
+
+    json_dict = {
+        '__type__': 'AttributeContainer',
+        '__container_type__': 'event_data',
+        'value': {1: 'integer key'}}
+
+    with self.assertRaises(TypeError):
+      serializer.WriteSerialized(json_dict)
+
+
+if __name__ == '__main__':
+  unittest.main()
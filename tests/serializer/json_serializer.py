@@ -333,7 +333,12 @@ class JSONAttributeContainerSerializerTest(JSONSerializerTestCase):
     """Test ReadSerialized and WriteSerialized of Task."""
     session_identifier = '{0:s}'.format(uuid.uuid4().hex)
 
+    test_path_specs = [
+        fake_path_spec.FakePathSpec(location='/opt/plaso.txt'),
+        fake_path_spec.FakePathSpec(location='/opt/psort.txt')]
+
     expected_task = tasks.Task(session_identifier=session_identifier)
+    expected_task.path_specs = test_path_specs
 
     json_string = (
         json_serializer.JSONAttributeContainerSerializer.WriteSerialized(
@@ -351,6 +356,7 @@ class JSONAttributeContainerSerializerTest(JSONSerializerTestCase):
         'aborted': False,
         'has_retry': False,
         'identifier': task.identifier,
+        'path_specs': test_path_specs,
         'session_identifier': session_identifier,
         'start_time': task.start_time}
 
@@ -140,6 +140,29 @@ class FakeStorageWriterTest(test_lib.StorageTestCase):
 
     # TODO: add test with time range.
 
+  def testGetSortedEventsWithEventData(self):
+    """Tests the GetSortedEventsWithEventData function."""
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    try:
+      test_events = self._AddTestEvents(storage_writer)
+
+      event_tag = events.EventTag()
+      event_tag.SetEventIdentifier(test_events[1].GetIdentifier())
+      event_tag.AddLabel('Malware')
+      storage_writer.AddOrUpdateEventTag(event_tag)
+
+      test_tuples = list(storage_writer.GetSortedEventsWithEventData())
+      self.assertEqual(len(test_tuples), 4)
+
+      event_tags = [
+          event_tag for _, _, _, event_tag in test_tuples if event_tag]
+      self.assertEqual(len(event_tags), 1)
+
+    finally:
+      storage_writer.Close()
+
   def testOpenClose(self):
     """Tests the Open and Close functions."""
     storage_writer = fake_writer.FakeStorageWriter()
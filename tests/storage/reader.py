@@ -7,6 +7,7 @@ import unittest
 from acstore.containers import interface as containers_interface
 
 from plaso.containers import event_sources
+from plaso.containers import events
 from plaso.storage import reader
 from plaso.storage.fake import fake_store
 
@@ -89,6 +90,82 @@ class StorageReaderTest(test_lib.StorageTestCase):
     finally:
       test_reader._store.Close()
 
+  def testGetEventTagByEventIdentifer(self):
+    """Tests the GetEventTagByEventIdentifer function."""
+    test_reader = reader.StorageReader()
+    test_reader._store = fake_store.FakeStore()
+    test_reader._store.Open()
+
+    try:
+      test_events = []
+      for _ in range(2):
+        event = events.EventObject()
+        test_reader._store.AddAttributeContainer(event)
+        test_events.append(event)
+
+      event_tag = events.EventTag()
+      event_tag.SetEventIdentifier(test_events[1].GetIdentifier())
+      event_tag.AddLabel('Malware')
+      test_reader._store.AddAttributeContainer(event_tag)
+
+      test_event_tag = test_reader.GetEventTagByEventIdentifer(
+          test_events[0].GetIdentifier())
+      self.assertIsNone(test_event_tag)
+
+      test_event_tag = test_reader.GetEventTagByEventIdentifer(
+          test_events[1].GetIdentifier())
+      self.assertIsNotNone(test_event_tag)
+      self.assertEqual(test_event_tag.labels, ['Malware'])
+
+    finally:
+      test_reader._store.Close()
+
+  def testGetEventTimestampQuantiles(self):
+    """Tests the GetEventTimestampQuantiles function."""
+    test_reader = reader.StorageReader()
+    test_reader._store = fake_store.FakeStore()
+    test_reader._store.Open()
+
+    try:
+      for timestamp in (3, 1, 4, 1, 5):
+        event = events.EventObject()
+        event.timestamp = timestamp
+        test_reader._store.AddAttributeContainer(event)
+
+      timestamps = test_reader.GetEventTimestampQuantiles(2)
+      self.assertEqual(timestamps, [1, 4])
+
+      timestamps = test_reader.GetEventTimestampQuantiles(10)
+      self.assertEqual(timestamps, [1, 1, 3, 4, 5])
+
+    finally:
+      test_reader._store.Close()
+
+  def testGetEventsWithEventDataByDataType(self):
+    """Tests the GetEventsWithEventDataByDataType function."""
+    test_reader = reader.StorageReader()
+    test_reader._store = fake_store.FakeStore()
+    test_reader._store.Open()
+
+    try:
+      for data_type in ('fs:stat', 'text:entry', 'fs:stat'):
+        event_data = events.EventData(data_type=data_type)
+        test_reader._store.AddAttributeContainer(event_data)
+
+        event = events.EventObject()
+        event.SetEventDataIdentifier(event_data.GetIdentifier())
+        test_reader._store.AddAttributeContainer(event)
+
+      test_tuples = list(test_reader.GetEventsWithEventDataByDataType(
+          frozenset(['fs:stat'])))
+      self.assertEqual(len(test_tuples), 2)
+
+      data_types = [event_data.data_type for _, event_data, _ in test_tuples]
+      self.assertEqual(data_types, ['fs:stat', 'fs:stat'])
+
+    finally:
+      test_reader._store.Close()
+
   def testGetFormatVersion(self):
     """Tests the GetFormatVersion function."""
     test_reader = reader.StorageReader()
@@ -299,6 +299,77 @@ class RedisAttributeContainerStoreTest(test_lib.StorageTestCase):
 
       self._RemoveSessionData(redis_client, session.identifier)
 
+  def testGetEventTagByEventIdentifier(self):
+    """Tests the GetEventTagByEventIdentifier function."""
+    redis_client = self._CreateRedisClient()
+
+    session = sessions.Session()
+    task = tasks.Task(session_identifier=session.identifier)
+
+    test_store = redis_store.RedisAttributeContainerStore()
+    test_store.Open(
+        redis_client=redis_client, session_identifier=task.session_identifier,
+        task_identifier=task.identifier)
+
+    try:
+      test_events = []
+      for event, _, _ in containers_test_lib.CreateEventsFromValues(
+          self._TEST_EVENTS):
+        test_store.AddAttributeContainer(event)
+        test_events.append(event)
+
+      event_tag = test_store.GetEventTagByEventIdentifier(
+          test_events[0].GetIdentifier())
+      self.assertIsNone(event_tag)
+
+      event_tag = events.EventTag()
+      event_tag.SetEventIdentifier(test_events[1].GetIdentifier())
+      event_tag.AddLabel('Malware')
+      test_store.AddAttributeContainer(event_tag)
+
+      event_tag = test_store.GetEventTagByEventIdentifier(
+          test_events[1].GetIdentifier())
+      self.assertIsNotNone(event_tag)
+      self.assertEqual(event_tag.labels, ['Malware'])
+
+      event_tag = test_store.GetEventTagByEventIdentifier(
+          test_events[0].GetIdentifier())
+      self.assertIsNone(event_tag)
+
+      tagged_event_identifiers = test_store.GetTaggedEventIdentifiers()
+      self.assertEqual(tagged_event_identifiers, {
+          test_events[1].GetIdentifier().CopyToString()})
+
+    finally:
+      test_store.Close()
+
+      self._RemoveSessionData(redis_client, session.identifier)
+
+  def testGetEventTimestampQuantiles(self):
+    """Tests the GetEventTimestampQuantiles method."""
+    redis_client = self._CreateRedisClient()
+
+    session = sessions.Session()
+    task = tasks.Task(session_identifier=session.identifier)
+
+    test_store = redis_store.RedisAttributeContainerStore()
+    test_store.Open(
+        redis_client=redis_client, session_identifier=task.session_identifier,
+        task_identifier=task.identifier)
+
+    try:
+      for event, _, _ in containers_test_lib.CreateEventsFromValues(
+          self._TEST_EVENTS):
+        test_store.AddAttributeContainer(event)
+
+      timestamps = test_store.GetEventTimestampQuantiles(2)
+      self.assertEqual(timestamps, [1238934459000000, 1334961526929596])
+
+    finally:
+      test_store.Close()
+
+      self._RemoveSessionData(redis_client, session.identifier)
+
   def testGetNumberOfAttributeContainers(self):
     """Tests the GetNumberOfAttributeContainers function."""
     redis_client = self._CreateRedisClient()
@@ -354,6 +425,61 @@ class RedisAttributeContainerStoreTest(test_lib.StorageTestCase):
 
       self._RemoveSessionData(redis_client, session.identifier)
 
+  def testGetSortedEventsWithEventData(self):
+    """Tests the GetSortedEventsWithEventData method."""
+    redis_client = self._CreateRedisClient()
+
+    session = sessions.Session()
+    task = tasks.Task(session_identifier=session.identifier)
+
+    test_store = redis_store.RedisAttributeContainerStore()
+    test_store.Open(
+        redis_client=redis_client, session_identifier=task.session_identifier,
+        task_identifier=task.identifier)
+
+    try:
+      test_events = []
+      for event, event_data, event_data_stream in (
+          containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+        test_store.AddAttributeContainer(event_data_stream)
+
+        event_data.SetEventDataStreamIdentifier(
+            event_data_stream.GetIdentifier())
+        test_store.AddAttributeContainer(event_data)
+
+        event.SetEventDataIdentifier(event_data.GetIdentifier())
+        test_store.AddAttributeContainer(event)
+
+        test_events.append(event)
+
+      event_tag = events.EventTag()
+      event_tag.SetEventIdentifier(test_events[1].GetIdentifier())
+      event_tag.AddLabel('Malware')
+      test_store.AddAttributeContainer(event_tag)
+
+      test_tuples = list(test_store.GetSortedEventsWithEventData())
+      self.assertEqual(len(test_tuples), 4)
+
+      timestamps = [event.timestamp for event, _, _, _ in test_tuples]
+      self.assertEqual(timestamps, sorted(timestamps))
+
+      number_of_event_tags = 0
+      for event, event_data, event_data_stream, event_tag in test_tuples:
+        self.assertEqual(
+            event_data.GetIdentifier().CopyToString(),
+            event.GetEventDataIdentifier().CopyToString())
+        self.assertIsNotNone(event_data_stream)
+
+        if event_tag:
+          number_of_event_tags += 1
+
+      self.assertEqual(number_of_event_tags, 1)
+
+    finally:
+      test_store.Close()
+
+      self._RemoveSessionData(redis_client, session.identifier)
+
   def testHasAttributeContainers(self):
     """Tests the HasAttributeContainers method."""
     redis_client = self._CreateRedisClient()
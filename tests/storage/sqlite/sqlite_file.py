@@ -3,9 +3,19 @@
 """Tests for the SQLite-based storage."""
 
 import os
+import sqlite3
 import unittest
+import zlib
 
+from unittest import mock
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
+from plaso.containers import event_sources
 from plaso.containers import events
+from plaso.engine import configurations
+from plaso.engine import profilers
 from plaso.lib import definitions
 from plaso.storage.sqlite import sqlite_file
 
@@ -32,6 +42,18 @@ class _TestSQLiteStorageFileV20221023(sqlite_file.SQLiteStorageFile):
   _READ_COMPATIBLE_FORMAT_VERSION = 20211121
 
 
+class _TestSQLiteStorageFileV20230327(sqlite_file.SQLiteStorageFile):
+  """Test class for testing format upgrades."""
+
+  _FORMAT_VERSION = 20230327
+
+
+class _TestSQLiteStorageFileV20261019(sqlite_file.SQLiteStorageFile):
+  """Test class for testing format upgrades."""
+
+  _FORMAT_VERSION = 20261019
+
+
 class SQLiteStorageFileTest(test_lib.StorageTestCase):
   """Tests for the SQLite-based storage file object."""
 
@@ -45,14 +67,55 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
   def testCacheAttributeContainerByIndex(self):
     """Tests the _CacheAttributeContainerByIndex function."""
     event_data_stream = events.EventDataStream()
+    event_tag = events.EventTag()
 
     with shared_test_lib.TempDirectory():
       test_store = sqlite_file.SQLiteStorageFile()
 
       self.assertEqual(len(test_store._attribute_container_cache), 0)
+      self.assertEqual(len(test_store._event_data_cache), 0)
+
+      test_store._CacheAttributeContainerByIndex(event_tag, 0)
+      self.assertEqual(len(test_store._attribute_container_cache), 1)
 
       test_store._CacheAttributeContainerByIndex(event_data_stream, 0)
       self.assertEqual(len(test_store._attribute_container_cache), 1)
+      self.assertEqual(len(test_store._event_data_cache), 1)
+
+      container_size = test_store._GetAttributeContainerSize(event_data_stream)
+      self.assertEqual(test_store._event_data_cache_size, container_size)
+
+      # Caching the same attribute container again should not change the size.
+      test_store._CacheAttributeContainerByIndex(event_data_stream, 0)
+      self.assertEqual(len(test_store._event_data_cache), 1)
+      self.assertEqual(test_store._event_data_cache_size, container_size)
+
+  def testCacheAttributeContainerByIndexWithEviction(self):
+    """Tests the _CacheAttributeContainerByIndex function with eviction."""
+    event_data_stream = events.EventDataStream()
+
+    with shared_test_lib.TempDirectory():
+      test_store = sqlite_file.SQLiteStorageFile()
+
+      container_size = test_store._GetAttributeContainerSize(event_data_stream)
+
+      with mock.patch.object(
+          sqlite_file.SQLiteStorageFile, '_MAXIMUM_EVENT_DATA_CACHE_SIZE',
+          2 * container_size):
+        for index in range(3):
+          test_store._CacheAttributeContainerByIndex(event_data_stream, index)
+
+      self.assertEqual(len(test_store._event_data_cache), 2)
+      self.assertEqual(test_store._event_data_cache_size, 2 * container_size)
+
+      # The least recently used attribute container should have been evicted.
+      attribute_container = test_store._GetCachedAttributeContainer(
+          event_data_stream.CONTAINER_TYPE, 0)
+      self.assertIsNone(attribute_container)
+
+      attribute_container = test_store._GetCachedAttributeContainer(
+          event_data_stream.CONTAINER_TYPE, 2)
+      self.assertIsNotNone(attribute_container)
 
   def testCheckStorageMetadata(self):
     """Tests the _CheckStorageMetadata function."""
@@ -90,6 +153,45 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       with self.assertRaises(IOError):
         test_store._CheckStorageMetadata(metadata_values)
 
+  def testCheckStorageMetadataWithBinarySerializationFormat(self):
+    """Tests the _CheckStorageMetadata function with binary serialization."""
+    test_store = sqlite_file.SQLiteStorageFile()
+
+    metadata_values = {
+        'compression_format': definitions.COMPRESSION_FORMAT_ZLIB,
+        'format_version': '{0:d}'.format(test_store._FORMAT_VERSION),
+        'serialization_format': definitions.SERIALIZER_FORMAT_BINARY}
+    test_store._CheckStorageMetadata(metadata_values)
+
+    metadata_values = {
+        'compression_format': definitions.COMPRESSION_FORMAT_ZLIB,
+        'format_version': '20230327',
+        'serialization_format': definitions.SERIALIZER_FORMAT_BINARY}
+    with self.assertRaises(IOError):
+      test_store._CheckStorageMetadata(
+          metadata_values, check_readable_only=True)
+
+  def testCompressData(self):
+    """Tests the _CompressData and _DecompressData functions."""
+    test_data = b'{"data_type": "test:event"}' * 16
+
+    test_store = sqlite_file.SQLiteStorageFile()
+
+    for compression_format in sorted(definitions.COMPRESSION_FORMATS):
+      test_store.compression_format = compression_format
+
+      compressed_data = test_store._CompressData(test_data)
+      if compression_format == definitions.COMPRESSION_FORMAT_NONE:
+        self.assertEqual(compressed_data, test_data)
+      else:
+        self.assertLess(len(compressed_data), len(test_data))
+
+      data = test_store._DecompressData(compressed_data, compression_format)
+      self.assertEqual(data, test_data)
+
+    with self.assertRaises(IOError):
+      test_store._DecompressData(b'bogus', definitions.COMPRESSION_FORMAT_ZSTD)
+
   def testCreateAttributeContainerTable(self):
     """Tests the _CreateAttributeContainerTable function."""
     event_data_stream = events.EventDataStream()
@@ -155,6 +257,19 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       finally:
         test_store.Close()
 
+  def testGetAttributeContainerSize(self):
+    """Tests the _GetAttributeContainerSize function."""
+    test_store = sqlite_file.SQLiteStorageFile()
+
+    event_data_stream = events.EventDataStream()
+    container_size = test_store._GetAttributeContainerSize(event_data_stream)
+    self.assertGreater(container_size, 0)
+
+    event_data_stream.md5_hash = 'e3df0d2abd2c27fbdadfb41a47442520'
+    self.assertGreater(
+        test_store._GetAttributeContainerSize(event_data_stream),
+        container_size)
+
   def testGetCachedAttributeContainer(self):
     """Tests the _GetCachedAttributeContainer function."""
     event_data_stream = events.EventDataStream()
@@ -172,6 +287,11 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
           event_data_stream.CONTAINER_TYPE, 1)
       self.assertIsNotNone(attribute_container)
 
+      self.assertEqual(test_store._event_data_cache_hits[
+          event_data_stream.CONTAINER_TYPE], 1)
+      self.assertEqual(test_store._event_data_cache_misses[
+          event_data_stream.CONTAINER_TYPE], 1)
+
   def testHasTable(self):
     """Tests the _HasTable function."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -205,6 +325,33 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
   # TODO: add tests for _UpdateEventTagBeforeSerialize
   # TODO: add tests for _UpdateStorageMetadataFormatVersion
 
+  def testSampleEventDataCacheStatistics(self):
+    """Tests the _SampleEventDataCacheStatistics function."""
+    event_data_stream = events.EventDataStream()
+
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.StorageProfiler(
+          'test', profiling_configuration)
+      test_profiler.Start()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.SetStorageProfiler(test_profiler)
+
+      test_store._CacheAttributeContainerByIndex(event_data_stream, 0)
+      test_store._GetCachedAttributeContainer(
+          event_data_stream.CONTAINER_TYPE, 0)
+
+      test_store._SampleEventDataCacheStatistics()
+
+      self.assertEqual(len(test_store._event_data_cache_hits), 0)
+      self.assertEqual(len(test_store._event_data_cache_misses), 0)
+
+      test_profiler.Stop()
+
   def testWriteExistingAttributeContainer(self):
     """Tests the _WriteExistingAttributeContainer function."""
     event_data_stream = events.EventDataStream()
@@ -257,6 +404,9 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
             event_data_stream.CONTAINER_TYPE)
         self.assertEqual(number_of_containers, 1)
 
+        # The event data cache is only used by read-only storage files.
+        self.assertEqual(len(test_store._event_data_cache), 0)
+
       finally:
         test_store.Close()
 
@@ -327,6 +477,38 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       finally:
         test_store.Close()
 
+  def testGetAttributeContainersWithEventDataColumns(self):
+    """Tests the GetAttributeContainers function with event data columns."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for _, event_data, _ in containers_test_lib.CreateEventsFromValues(
+            self._TEST_EVENTS):
+          test_store.AddAttributeContainer(event_data)
+
+        containers = list(test_store.GetAttributeContainers(
+            'event_data', filter_expression='data_type == "text:entry"'))
+        self.assertEqual(len(containers), 1)
+        self.assertEqual(containers[0].hostname, 'nomachine')
+
+        filter_expression = (
+            'data_type == "windows:registry:key_value" and '
+            '_parser_chain == "test_parser"')
+        containers = list(test_store.GetAttributeContainers(
+            'event_data', filter_expression=filter_expression))
+        self.assertEqual(len(containers), 3)
+
+        # Test a filter expression that cannot be evaluated by SQLite.
+        containers = list(test_store.GetAttributeContainers(
+            'event_data', filter_expression='key_path == "MY AutoRun key"'))
+        self.assertEqual(len(containers), 1)
+
+      finally:
+        test_store.Close()
+
   def testGetAttributeContainerByIdentifier(self):
     """Tests the GetAttributeContainerByIdentifier function."""
     event_data_stream = events.EventDataStream()
@@ -407,6 +589,200 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       finally:
         test_store.Close()
 
+  def testGetEventTagByEventIdentifier(self):
+    """Tests the GetEventTagByEventIdentifier function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        test_events = []
+        for event, _, _ in containers_test_lib.CreateEventsFromValues(
+            self._TEST_EVENTS):
+          test_store.AddAttributeContainer(event)
+          test_events.append(event)
+
+        event_tag = test_store.GetEventTagByEventIdentifier(
+            test_events[0].GetIdentifier())
+        self.assertIsNone(event_tag)
+
+        event_tag = events.EventTag()
+        event_tag.SetEventIdentifier(test_events[1].GetIdentifier())
+        event_tag.AddLabel('Malware')
+        test_store.AddAttributeContainer(event_tag)
+
+        event_tag = test_store.GetEventTagByEventIdentifier(
+            test_events[1].GetIdentifier())
+        self.assertIsNotNone(event_tag)
+        self.assertEqual(event_tag.labels, ['Malware'])
+
+        event_tag = test_store.GetEventTagByEventIdentifier(
+            test_events[0].GetIdentifier())
+        self.assertIsNone(event_tag)
+
+      finally:
+        test_store.Close()
+
+  def testGetAttributeContainersWithCompressionFormats(self):
+    """Tests the GetAttributeContainers function with compression formats."""
+    for compression_format in sorted(definitions.COMPRESSION_FORMATS):
+      with shared_test_lib.TempDirectory() as temp_directory:
+        test_path = os.path.join(temp_directory, 'plaso.sqlite')
+        test_store = sqlite_file.SQLiteStorageFile()
+        test_store.compression_format = compression_format
+        test_store.Open(path=test_path, read_only=False)
+
+        try:
+          for _, event_data, _ in containers_test_lib.CreateEventsFromValues(
+              self._TEST_EVENTS):
+            test_store.AddAttributeContainer(event_data)
+
+        finally:
+          test_store.Close()
+
+        test_store = sqlite_file.SQLiteStorageFile()
+        test_store.Open(path=test_path)
+
+        try:
+          self.assertEqual(test_store.compression_format, compression_format)
+
+          containers = list(test_store.GetAttributeContainers('event_data'))
+          self.assertEqual(len(containers), len(self._TEST_EVENTS))
+          self.assertEqual(
+              containers[0].data_type, self._TEST_EVENTS[0]['data_type'])
+
+        finally:
+          test_store.Close()
+
+  def testGetAttributeContainersWithBinarySerializationFormat(self):
+    """Tests the GetAttributeContainers function with binary serialization."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.serialization_format = definitions.SERIALIZER_FORMAT_BINARY
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for _, event_data, _ in containers_test_lib.CreateEventsFromValues(
+            self._TEST_EVENTS):
+          test_store.AddAttributeContainer(event_data)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        self.assertEqual(
+            test_store.serialization_format,
+            definitions.SERIALIZER_FORMAT_BINARY)
+
+        containers = list(test_store.GetAttributeContainers('event_data'))
+        self.assertEqual(len(containers), len(self._TEST_EVENTS))
+
+        for event_data, expected_event_values in zip(
+            containers, self._TEST_EVENTS):
+          for name, expected_value in expected_event_values.items():
+            if name not in ('timestamp', 'timestamp_desc'):
+              value = getattr(event_data, name, None)
+              self.assertEqual(value, expected_value)
+
+        test_store._cursor.execute(
+            'SELECT COUNT(*) FROM serialization_schema')
+        number_of_schemas = test_store._cursor.fetchone()[0]
+        self.assertGreater(number_of_schemas, 0)
+
+      finally:
+        test_store.Close()
+
+  def testGetEventTimestampQuantiles(self):
+    """Tests the GetEventTimestampQuantiles function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        timestamps = test_store.GetEventTimestampQuantiles(2)
+        self.assertEqual(timestamps, [])
+
+        for event, _, _ in containers_test_lib.CreateEventsFromValues(
+            self._TEST_EVENTS):
+          test_store.AddAttributeContainer(event)
+
+        timestamps = test_store.GetEventTimestampQuantiles(2)
+        self.assertEqual(timestamps, [1238934459000000, 1334961526929596])
+
+        timestamps = test_store.GetEventTimestampQuantiles(8)
+        self.assertEqual(timestamps, [
+            1238934459000000, 1334940286000000, 1334961526929596,
+            1334966206929596])
+
+      finally:
+        test_store.Close()
+
+  def testGetEventsWithEventDataByDataType(self):
+    """Tests the GetEventsWithEventDataByDataType function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for event, event_data, event_data_stream in (
+            containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+          test_store.AddAttributeContainer(event_data_stream)
+
+          event_data.SetEventDataStreamIdentifier(
+              event_data_stream.GetIdentifier())
+          test_store.AddAttributeContainer(event_data)
+
+          event.SetEventDataIdentifier(event_data.GetIdentifier())
+          test_store.AddAttributeContainer(event)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        test_tuples = list(test_store.GetEventsWithEventDataByDataType(
+            frozenset(['windows:registry:key_value'])))
+        self.assertEqual(len(test_tuples), 3)
+
+        for event, event_data, event_data_stream in test_tuples:
+          self.assertEqual(event_data.data_type, 'windows:registry:key_value')
+          self.assertEqual(
+              event_data.GetIdentifier().CopyToString(),
+              event.GetEventDataIdentifier().CopyToString())
+          self.assertIsNotNone(event_data_stream)
+
+        test_tuples = list(test_store.GetEventsWithEventDataByDataType(
+            frozenset(['bogus'])))
+        self.assertEqual(len(test_tuples), 0)
+
+        # Test that the database can be written while the events are read.
+        with mock.patch.object(
+            sqlite_file.SQLiteStorageFile, '_READ_BATCH_SIZE', 1):
+          generator = test_store.GetEventsWithEventDataByDataType(
+              frozenset(['windows:registry:key_value']))
+          next(generator)
+
+          connection = sqlite3.connect(test_path, timeout=0)
+          try:
+            connection.execute('CREATE TABLE test (value INTEGER)')
+            connection.commit()
+          finally:
+            connection.close()
+
+          self.assertEqual(len(list(generator)), 2)
+
+      finally:
+        test_store.Close()
+
   def testGetSortedEvents(self):
     """Tests the GetSortedEvents function."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -441,6 +817,135 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
     # TODO: add test with time range.
 
+  def testGetSortedEventsWithEventData(self):
+    """Tests the GetSortedEventsWithEventData function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        test_events = []
+        for event, event_data, event_data_stream in (
+            containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+          test_store.AddAttributeContainer(event_data_stream)
+
+          event_data.SetEventDataStreamIdentifier(
+              event_data_stream.GetIdentifier())
+          test_store.AddAttributeContainer(event_data)
+
+          event.SetEventDataIdentifier(event_data.GetIdentifier())
+          test_store.AddAttributeContainer(event)
+
+          test_events.append(event)
+
+        event_tag = events.EventTag()
+        event_tag.SetEventIdentifier(test_events[1].GetIdentifier())
+        event_tag.AddLabel('Malware')
+        test_store.AddAttributeContainer(event_tag)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        test_tuples = list(test_store.GetSortedEventsWithEventData())
+        self.assertEqual(len(test_tuples), 4)
+
+        timestamps = [event.timestamp for event, _, _, _ in test_tuples]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+        event_tags = []
+        for event, event_data, event_data_stream, event_tag in test_tuples:
+          self.assertEqual(
+              event_data.GetIdentifier().CopyToString(),
+              event.GetEventDataIdentifier().CopyToString())
+          self.assertIsNotNone(event_data_stream)
+
+          if event_tag:
+            event_tags.append(event_tag)
+            self.assertEqual(
+                event_tag.GetEventIdentifier().CopyToString(),
+                event.GetIdentifier().CopyToString())
+
+        self.assertEqual(len(event_tags), 1)
+        self.assertEqual(event_tags[0].labels, ['Malware'])
+
+      finally:
+        test_store.Close()
+
+  def testGetSortedEventsWithEventDataByEventValuesHash(self):
+    """Tests the GetSortedEventsWithEventData function with value hashes."""
+    test_values = [
+        ('hash2', definitions.TIME_DESCRIPTION_MODIFICATION),
+        ('hash1', definitions.TIME_DESCRIPTION_MODIFICATION),
+        ('hash2', definitions.TIME_DESCRIPTION_LAST_ACCESS),
+        ('hash1', definitions.TIME_DESCRIPTION_LAST_ACCESS)]
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for event_values_hash, timestamp_desc in test_values:
+          event_data = events.EventData(data_type='test:event')
+          event_data._event_values_hash = event_values_hash
+          test_store.AddAttributeContainer(event_data)
+
+          event = events.EventObject()
+          event.timestamp = 1542569948000000
+          event.timestamp_desc = timestamp_desc
+          event.SetEventDataIdentifier(event_data.GetIdentifier())
+          test_store.AddAttributeContainer(event)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        self.assertTrue(test_store.HasEventsSortedByEventValuesHash())
+
+        sort_values = [
+            (event_data._event_values_hash, event.timestamp_desc)
+            for event, event_data, _, _ in (
+                test_store.GetSortedEventsWithEventData())]
+        self.assertEqual(sort_values, sorted(test_values))
+
+      finally:
+        test_store.Close()
+
+  def testGetTaggedEventIdentifiers(self):
+    """Tests the GetTaggedEventIdentifiers function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        test_events = []
+        for event, _, _ in containers_test_lib.CreateEventsFromValues(
+            self._TEST_EVENTS):
+          test_store.AddAttributeContainer(event)
+          test_events.append(event)
+
+        tagged_event_identifiers = test_store.GetTaggedEventIdentifiers()
+        self.assertEqual(tagged_event_identifiers, set())
+
+        for event_tag in self._CreateTestEventTags(test_events)[:3]:
+          test_store.AddAttributeContainer(event_tag)
+
+        tagged_event_identifiers = test_store.GetTaggedEventIdentifiers()
+        self.assertEqual(tagged_event_identifiers, {
+            'event.1', 'event.2', 'event.3'})
+
+      finally:
+        test_store.Close()
+
   def testHasAttributeContainers(self):
     """Tests the HasAttributeContainers function."""
     event_data_stream = events.EventDataStream()
@@ -469,6 +974,261 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
   # TODO: add tests for Open and Close
 
+  def testMergeAttributeContainers(self):
+    """Tests the MergeAttributeContainers function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      for path in ('plaso.sqlite', 'task.sqlite'):
+        test_path = os.path.join(temp_directory, path)
+        test_store = sqlite_file.SQLiteStorageFile()
+        test_store.Open(path=test_path, read_only=False)
+
+        try:
+          for event, event_data, event_data_stream in (
+              containers_test_lib.CreateEventsFromValues(
+                  self._TEST_EVENTS[:2])):
+            test_store.AddAttributeContainer(event_data_stream)
+
+            event_data.SetEventDataStreamIdentifier(
+                event_data_stream.GetIdentifier())
+            test_store.AddAttributeContainer(event_data)
+
+            event.SetEventDataIdentifier(event_data.GetIdentifier())
+            test_store.AddAttributeContainer(event)
+
+        finally:
+          test_store.Close()
+
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      task_path = os.path.join(temp_directory, 'task.sqlite')
+
+      try:
+        identifier_offsets = {}
+        for container_type in (
+            'event_data_stream', 'event_data', 'event', 'event_tag'):
+          identifier_offset = test_store.GetNumberOfAttributeContainers(
+              container_type)
+
+          number_of_containers = test_store.MergeAttributeContainers(
+              task_path, container_type, identifier_offsets=identifier_offsets)
+
+          expected_number_of_containers = 0 if container_type == (
+              'event_tag') else 2
+          self.assertEqual(
+              number_of_containers, expected_number_of_containers)
+
+          identifier_offsets[container_type] = identifier_offset
+
+        for container_type in ('event_data_stream', 'event_data', 'event'):
+          number_of_containers = test_store.GetNumberOfAttributeContainers(
+              container_type)
+          self.assertEqual(number_of_containers, 4)
+
+        event_data = test_store.GetAttributeContainerByIndex('event_data', 3)
+        event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+        self.assertEqual(
+            event_data_stream_identifier.CopyToString(), 'event_data_stream.4')
+
+        event = test_store.GetAttributeContainerByIndex('event', 2)
+        event_data_identifier = event.GetEventDataIdentifier()
+        self.assertEqual(event_data_identifier.CopyToString(), 'event_data.3')
+
+        event_data = test_store.GetAttributeContainerByIdentifier(
+            'event_data', event_data_identifier)
+        self.assertIsNotNone(event_data)
+
+        test_store._cursor.execute((
+            'SELECT _event_data_stream_identifier, _parser_chain, data_type '
+            'FROM event_data WHERE _identifier = 4'))
+        row = test_store._cursor.fetchone()
+        self.assertEqual(row, (
+            'event_data_stream.4', 'test_parser', 'windows:registry:key_value'))
+
+      finally:
+        test_store.Close()
+
+  def testMergeAttributeContainersWithBinarySerializationFormat(self):
+    """Tests the MergeAttributeContainers function with binary serialization."""
+    serialization_formats = {
+        'plaso.sqlite': definitions.SERIALIZER_FORMAT_BINARY,
+        'binary.sqlite': definitions.SERIALIZER_FORMAT_BINARY,
+        'json.sqlite': definitions.SERIALIZER_FORMAT_JSON}
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      for path, serialization_format in serialization_formats.items():
+        test_path = os.path.join(temp_directory, path)
+        test_store = sqlite_file.SQLiteStorageFile()
+        test_store.serialization_format = serialization_format
+        test_store.Open(path=test_path, read_only=False)
+
+        try:
+          for _, event_data, event_data_stream in (
+              containers_test_lib.CreateEventsFromValues(
+                  self._TEST_EVENTS[:2])):
+            test_store.AddAttributeContainer(event_data_stream)
+
+            event_data.SetEventDataStreamIdentifier(
+                event_data_stream.GetIdentifier())
+            test_store.AddAttributeContainer(event_data)
+
+        finally:
+          test_store.Close()
+
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for path in ('binary.sqlite', 'json.sqlite'):
+          task_path = os.path.join(temp_directory, path)
+
+          identifier_offsets = {}
+          for container_type in ('event_data_stream', 'event_data'):
+            identifier_offset = test_store.GetNumberOfAttributeContainers(
+                container_type)
+
+            number_of_containers = test_store.MergeAttributeContainers(
+                task_path, container_type,
+                identifier_offsets=identifier_offsets)
+            self.assertEqual(number_of_containers, 2)
+
+            identifier_offsets[container_type] = identifier_offset
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        containers = list(test_store.GetAttributeContainers('event_data'))
+        self.assertEqual(len(containers), 6)
+
+        expected_data_types = [
+            event_values['data_type']
+            for event_values in self._TEST_EVENTS[:2]] * 3
+        data_types = [event_data.data_type for event_data in containers]
+        self.assertEqual(data_types, expected_data_types)
+
+        event_data_stream_identifier = (
+            containers[5].GetEventDataStreamIdentifier())
+        self.assertEqual(
+            event_data_stream_identifier.CopyToString(), 'event_data_stream.6')
+
+      finally:
+        test_store.Close()
+
+  def testMergeAttributeContainersWithInvalidData(self):
+    """Tests the MergeAttributeContainers function with invalid data."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      for path in ('plaso.sqlite', 'task.sqlite'):
+        test_path = os.path.join(temp_directory, path)
+        test_store = sqlite_file.SQLiteStorageFile()
+        test_store.Open(path=test_path, read_only=False)
+
+        try:
+          for _, event_data, event_data_stream in (
+              containers_test_lib.CreateEventsFromValues(
+                  self._TEST_EVENTS[:2])):
+            test_store.AddAttributeContainer(event_data_stream)
+
+            event_data.SetEventDataStreamIdentifier(
+                event_data_stream.GetIdentifier())
+            test_store.AddAttributeContainer(event_data)
+
+          if path == 'task.sqlite':
+            test_store.Flush()
+
+            serialized_data = zlib.compress(
+                b'{"_event_data_stream_identifier": "event_data_stream.bogus"}')
+            test_store._cursor.execute(
+                'UPDATE event_data SET _data = ? WHERE _identifier = 2',
+                (serialized_data, ))
+            test_store._connection.commit()
+
+        finally:
+          test_store.Close()
+
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      task_path = os.path.join(temp_directory, 'task.sqlite')
+
+      try:
+        number_of_containers = test_store.MergeAttributeContainers(
+            task_path, 'event_data_stream')
+        self.assertEqual(number_of_containers, 2)
+
+        with self.assertRaises(IOError):
+          test_store.MergeAttributeContainers(
+              task_path, 'event_data',
+              identifier_offsets={'event_data_stream': 2})
+
+        # The failed merge is rolled back and the store remains usable.
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            'event_data')
+        self.assertEqual(number_of_containers, 2)
+
+        test_store.AddAttributeContainer(events.EventData())
+        test_store.Flush()
+
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            'event_data')
+        self.assertEqual(number_of_containers, 3)
+
+      finally:
+        test_store.Close()
+
+  def testTruncateAttributeContainers(self):
+    """Tests the TruncateAttributeContainers function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for _ in range(3):
+          test_store.AddAttributeContainer(events.EventDataStream())
+
+        test_store.Flush()
+
+        test_store.TruncateAttributeContainers('event_data_stream', 1)
+
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            'event_data_stream')
+        self.assertEqual(number_of_containers, 1)
+
+        event_data_stream = test_store.GetAttributeContainerByIndex(
+            'event_data_stream', 1)
+        self.assertIsNone(event_data_stream)
+
+        event_data_stream = events.EventDataStream()
+        test_store.AddAttributeContainer(event_data_stream)
+
+        identifier = event_data_stream.GetIdentifier()
+        self.assertEqual(identifier.sequence_number, 2)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            'event_data_stream')
+        self.assertEqual(number_of_containers, 2)
+
+        event_data_stream = test_store.GetAttributeContainerByIndex(
+            'event_data_stream', 1)
+        self.assertIsNotNone(event_data_stream)
+
+      finally:
+        test_store.Close()
+
   def testUpdateAttributeContainer(self):
     """Tests the UpdateAttributeContainer function."""
     event_data_stream = events.EventDataStream()
@@ -498,6 +1258,131 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       finally:
         test_store.Close()
 
+  def testUpgradeEventDataTable(self):
+    """Tests the upgrade of the event data table."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = _TestSQLiteStorageFileV20230327()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for event, event_data, event_data_stream in (
+            containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+          test_store.AddAttributeContainer(event_data_stream)
+
+          event_data.SetEventDataStreamIdentifier(
+              event_data_stream.GetIdentifier())
+          test_store.AddAttributeContainer(event_data)
+
+          event.SetEventDataIdentifier(event_data.GetIdentifier())
+          test_store.AddAttributeContainer(event)
+
+      finally:
+        test_store.Close()
+
+      data_types = frozenset(['windows:registry:key_value'])
+      filter_expression = 'data_type == "text:entry"'
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        self.assertEqual(test_store.format_version, 20230327)
+        self.assertFalse(test_store._HasEventDataColumns())
+
+        test_tuples = list(
+            test_store.GetEventsWithEventDataByDataType(data_types))
+        self.assertEqual(len(test_tuples), 3)
+
+        containers = list(test_store.GetAttributeContainers(
+            'event_data', filter_expression=filter_expression))
+        self.assertEqual(len(containers), 1)
+
+      finally:
+        test_store.Close()
+
+      # Simulate an interrupted upgrade that added some of the event data
+      # columns and indexes but did not update the format version.
+      connection = sqlite3.connect(test_path)
+      connection.execute('ALTER TABLE event_data ADD COLUMN data_type TEXT')
+      connection.execute(
+          'CREATE INDEX event_data_per_data_type ON event_data (data_type)')
+      connection.commit()
+      connection.close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+      test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        self.assertEqual(
+            test_store.format_version, test_store._FORMAT_VERSION)
+        self.assertTrue(test_store._HasEventDataColumns())
+
+        test_store._cursor.execute(
+            'SELECT COUNT(*) FROM event_data WHERE data_type = "text:entry"')
+        self.assertEqual(test_store._cursor.fetchone(), (1, ))
+
+        test_tuples = list(
+            test_store.GetEventsWithEventDataByDataType(data_types))
+        self.assertEqual(len(test_tuples), 3)
+
+        containers = list(test_store.GetAttributeContainers(
+            'event_data', filter_expression=filter_expression))
+        self.assertEqual(len(containers), 1)
+
+      finally:
+        test_store.Close()
+
+  def testUpgradeEventDataTableWithBinarySerializationFormat(self):
+    """Tests the upgrade of the event data table with binary serialization."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = _TestSQLiteStorageFileV20261019()
+      test_store.serialization_format = definitions.SERIALIZER_FORMAT_BINARY
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        event_data = events.EventData(data_type='test:event')
+        event_data._event_values_hash = 'hash1'
+        test_store.AddAttributeContainer(event_data)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        self.assertEqual(test_store.format_version, 20261019)
+        self.assertFalse(test_store.HasEventsSortedByEventValuesHash())
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+      test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        self.assertEqual(
+            test_store.format_version, test_store._FORMAT_VERSION)
+        self.assertTrue(test_store.HasEventsSortedByEventValuesHash())
+
+        test_store._cursor.execute(
+            'SELECT _event_values_hash, data_type FROM event_data')
+        self.assertEqual(test_store._cursor.fetchall(), [
+            ('hash1', 'test:event')])
+
+      finally:
+        test_store.Close()
+
   def testVersionCompatibility(self):
     """Tests the version compatibility methods."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -515,6 +1400,79 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       v2_test_store_ro.Open(path=v1_storage_path, read_only=True)
       v2_test_store_ro.Close()
 
+  def testUpgradeEventSourceTable(self):
+    """Tests the upgrade of the event source table."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = _TestSQLiteStorageFileV20230327()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        # Create the event source table as defined by format 20230327.
+        test_store._cursor.execute((
+            'CREATE TABLE event_source (_identifier INTEGER PRIMARY KEY '
+            'AUTOINCREMENT, data_type TEXT, file_entry_type TEXT, '
+            'path_spec TEXT)'))
+
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_FAKE, location='/opt/old.txt')
+        event_source = event_sources.EventSource(
+            file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+            path_spec=path_spec)
+
+        test_store.AddAttributeContainer(event_source)
+
+      finally:
+        test_store.Close()
+
+      # Test that the event sources can be read without upgrading the table.
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        self.assertEqual(test_store.format_version, 20230327)
+
+        containers = list(test_store.GetAttributeContainers('event_source'))
+        self.assertEqual(len(containers), 1)
+        self.assertEqual(containers[0].path_spec.location, '/opt/old.txt')
+        self.assertIsNone(containers[0].size)
+
+        container = test_store.GetAttributeContainerByIndex('event_source', 0)
+        self.assertIsNotNone(container)
+
+      finally:
+        test_store.Close()
+
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_FAKE, location='/opt/plaso.txt')
+      event_source = event_sources.EventSource(
+          file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+          path_spec=path_spec, size=1024)
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        self.assertEqual(
+            test_store.format_version, test_store._FORMAT_VERSION)
+
+        test_store.AddAttributeContainer(event_source)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        containers = list(test_store.GetAttributeContainers('event_source'))
+        self.assertEqual(len(containers), 2)
+        self.assertIsNone(containers[0].size)
+        self.assertEqual(containers[1].size, 1024)
+
+      finally:
+        test_store.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -174,6 +174,32 @@ class SQLiteStorageWriterTest(test_lib.StorageTestCase):
       with self.assertRaises(IOError):
         storage_writer.Close()
 
+  def testTruncateAttributeContainers(self):
+    """Tests the TruncateAttributeContainers function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_writer = sqlite_writer.SQLiteStorageWriter()
+      storage_writer.Open(path=test_path)
+
+      try:
+        self._AddTestEvents(storage_writer)
+
+        number_of_containers = storage_writer.GetNumberOfAttributeContainers(
+            'event')
+        self.assertEqual(number_of_containers, 4)
+
+        storage_writer.TruncateAttributeContainers('event', 2)
+
+        number_of_containers = storage_writer.GetNumberOfAttributeContainers(
+            'event')
+        self.assertEqual(number_of_containers, 2)
+
+        test_events = list(storage_writer.GetSortedEvents())
+        self.assertEqual(len(test_events), 2)
+
+      finally:
+        storage_writer.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,211 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the calculation of event values hashes per parser."""
+
+import argparse
+import collections
+import hashlib
+import logging
+import sys
+import time
+
+from dfdatetime import interface as dfdatetime_interface
+
+from plaso.containers import events
+from plaso.storage import factory as storage_factory
+
+
+def CalculateLegacyEventValuesHash(event_data, event_data_stream):
+  """Calculates a digest hash of the event values as done previously.
+
+  The event data stream values are included for every event data and
+  the digest hash is calculated with MD5.
+
+  Args:
+    event_data (EventData): event data.
+    event_data_stream (EventDataStream): an event data stream or None if not
+        available.
+
+  Returns:
+    str: digest hash of the event values content.
+  """
+  attributes = ['data_type: {0:s}'.format(event_data.data_type)]
+
+  for attribute_name, attribute_value in sorted(event_data.GetAttributes()):
+    if attribute_value is None or attribute_name in (
+        '_event_data_stream_identifier', '_event_values_hash', '_parser_chain',
+        'data_type'):
+      continue
+
+    if isinstance(attribute_value, dfdatetime_interface.DateTimeValues):
+      continue
+
+    if (isinstance(attribute_value, list) and attribute_value and
+        isinstance(attribute_value[0], dfdatetime_interface.DateTimeValues)):
+      continue
+
+    attributes.append('{0:s}: {1!s}'.format(attribute_name, attribute_value))
+
+  if event_data_stream:
+    for attribute_name, attribute_value in sorted(
+        event_data_stream.GetAttributes()):
+      if attribute_name == 'path_spec':
+        attribute_value = attribute_value.comparable
+
+      attributes.append('{0:s}: {1!s}'.format(
+          attribute_name, attribute_value))
+
+  content = ', '.join(attributes)
+  content_data = content.encode('utf-8')
+
+  md5_context = hashlib.md5(content_data)
+
+  return md5_context.hexdigest()
+
+
+class EventValuesHashBenchmark(object):
+  """Event values hash benchmark."""
+
+  def __init__(self):
+    """Initializes an event values hash benchmark."""
+    super(EventValuesHashBenchmark, self).__init__()
+    self._legacy_times = collections.Counter()
+    self._new_times = collections.Counter()
+    self._number_of_event_data = collections.Counter()
+
+  def _BenchmarkEventData(self, storage_reader):
+    """Benchmarks the event values hash calculation of the event data.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+    """
+    event_data_streams = {}
+    event_data_stream_values_hashes = {}
+
+    for event_data in storage_reader.GetAttributeContainers('event_data'):
+      parser_name = getattr(event_data, '_parser_chain', None) or 'N/A'
+
+      event_data_stream = None
+      lookup_key = None
+
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        lookup_key = event_data_stream_identifier.CopyToString()
+        event_data_stream = event_data_streams.get(lookup_key, None)
+        if not event_data_stream:
+          event_data_stream = storage_reader.GetAttributeContainerByIdentifier(
+              'event_data_stream', event_data_stream_identifier)
+          event_data_streams[lookup_key] = event_data_stream
+
+      start_time = time.perf_counter()
+      CalculateLegacyEventValuesHash(event_data, event_data_stream)
+      self._legacy_times[parser_name] += time.perf_counter() - start_time
+
+      # Similar to the parser mediator the event data stream values hash
+      # is calculated once per event data stream.
+      start_time = time.perf_counter()
+
+      event_data_stream_values_hash = None
+      if event_data_stream:
+        event_data_stream_values_hash = event_data_stream_values_hashes.get(
+            lookup_key, None)
+        if not event_data_stream_values_hash:
+          event_data_stream_values_hash = (
+              events.CalculateEventDataStreamValuesHash(event_data_stream))
+          event_data_stream_values_hashes[lookup_key] = (
+              event_data_stream_values_hash)
+
+      events.CalculateEventValuesHash(
+          event_data, event_data_stream,
+          event_data_stream_values_hash=event_data_stream_values_hash)
+
+      self._new_times[parser_name] += time.perf_counter() - start_time
+
+      self._number_of_event_data[parser_name] += 1
+
+  def Benchmark(self, path):
+    """Benchmarks the event values hash calculation of a storage file.
+
+    Args:
+      path (str): path of the storage file.
+
+    Returns:
+      bool: True if successful or False if not.
+    """
+    storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+        path)
+    if not storage_reader:
+      logging.error(f'Unable to open storage file: {path:s}')
+      return False
+
+    try:
+      self._BenchmarkEventData(storage_reader)
+    finally:
+      storage_reader.Close()
+
+    return True
+
+  def PrintResults(self):
+    """Prints the benchmark results."""
+    print((
+        'Parser\tNumber of event data\tLegacy time (us)\tNew time (us)\t'
+        'Speedup'))
+
+    for parser_name, number_of_event_data in sorted(
+        self._number_of_event_data.items()):
+      legacy_time = self._legacy_times[parser_name]
+      new_time = self._new_times[parser_name]
+
+      legacy_time_per_event_data = (legacy_time * 1000000) / (
+          number_of_event_data)
+      new_time_per_event_data = (new_time * 1000000) / number_of_event_data
+
+      speedup = 0.0
+      if new_time:
+        speedup = legacy_time / new_time
+
+      print((
+          f'{parser_name:s}\t{number_of_event_data:d}\t'
+          f'{legacy_time_per_event_data:.2f}\t{new_time_per_event_data:.2f}\t'
+          f'{speedup:.2f}'))
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the calculation of event values hashes per parser.'))
+
+  argument_parser.add_argument(
+      'storage_file', nargs='?', action='store', metavar='PATH',
+      default=None, help='path of the storage file.')
+
+  options = argument_parser.parse_args()
+
+  if not options.storage_file:
+    print('Storage file missing.')
+    print('')
+    argument_parser.print_help()
+    print('')
+    return False
+
+  logging.basicConfig(
+      level=logging.INFO, format='[%(levelname)s] %(message)s')
+
+  benchmark = EventValuesHashBenchmark()
+  if not benchmark.Benchmark(options.storage_file):
+    return False
+
+  benchmark.PrintResults()
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,314 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the message formatters per data type."""
+
+import argparse
+import collections
+import logging
+import os
+import string
+import sys
+import time
+
+from plaso.containers import events
+from plaso.formatters import interface as formatters_interface
+from plaso.output import mediator as output_mediator
+from plaso.storage import factory as storage_factory
+
+
+class MessageFormattersBenchmark(object):
+  """Message formatters benchmark."""
+
+  # Format specification conversion types that require a floating-point value.
+  _FLOAT_CONVERSION_TYPES = frozenset('eEfFgG%')
+
+  # Format specification conversion types that require an integer value.
+  _INTEGER_CONVERSION_TYPES = frozenset('bcdnoxX')
+
+  # The maximum number of event data per data type read from a storage file.
+  _MAXIMUM_NUMBER_OF_EVENT_DATA = 100
+
+  def __init__(self, data_location, number_of_iterations=1000):
+    """Initializes a message formatters benchmark.
+
+    Args:
+      data_location (str): path of the formatter data files.
+      number_of_iterations (Optional[int]): number of times the messages of
+          an event data are formatted.
+    """
+    super(MessageFormattersBenchmark, self).__init__()
+    self._data_location = data_location
+    self._event_data_per_data_type = collections.defaultdict(list)
+    self._message_times = collections.Counter()
+    self._number_of_errors = collections.Counter()
+    self._number_of_iterations = number_of_iterations
+    self._output_mediator = None
+    self._short_message_times = collections.Counter()
+
+  def _CreateEventData(self, message_formatter):
+    """Creates representative event data for a message formatter.
+
+    The event data contains a value for every attribute in the format strings
+    and for the input attribute of every helper.
+
+    Args:
+      message_formatter (EventFormatter): message formatter.
+
+    Returns:
+      EventData: event data.
+    """
+    # pylint: disable=protected-access
+    if isinstance(
+        message_formatter, formatters_interface.ConditionalEventFormatter):
+      format_strings = []
+      for format_string_pieces in (
+          message_formatter._format_string_pieces,
+          message_formatter._format_string_short_pieces):
+        if isinstance(format_string_pieces, str):
+          format_string_pieces = [format_string_pieces]
+        format_strings.extend(format_string_pieces)
+    else:
+      format_strings = [
+          message_formatter._format_string,
+          message_formatter._format_string_short or '']
+
+    event_data = events.EventData(data_type=message_formatter.data_type)
+
+    formatter = string.Formatter()
+    for format_string in format_strings:
+      for _, attribute_name, format_specification, _ in formatter.parse(
+          format_string):
+        if not attribute_name:
+          continue
+
+        conversion_type = format_specification[-1:]
+        if conversion_type in self._INTEGER_CONVERSION_TYPES:
+          attribute_value = 1
+        elif conversion_type in self._FLOAT_CONVERSION_TYPES:
+          attribute_value = 1.0
+        else:
+          attribute_value = attribute_name
+
+        setattr(event_data, attribute_name, attribute_value)
+
+    for helper in message_formatter.helpers:
+      if isinstance(helper, formatters_interface.BooleanEventFormatterHelper):
+        attribute_value = True
+
+      elif isinstance(
+          helper, formatters_interface.EnumerationEventFormatterHelper):
+        attribute_value = next(iter(helper.values), 1)
+
+      elif isinstance(helper, formatters_interface.FlagsEventFormatterHelper):
+        attribute_value = 0
+        for flag in helper.values:
+          attribute_value |= flag
+
+      else:
+        continue
+
+      setattr(event_data, helper.input_attribute, attribute_value)
+
+    return event_data
+
+  def _BenchmarkEventData(self, message_formatter, event_data):
+    """Benchmarks the message formatting of specific event data.
+
+    Args:
+      message_formatter (EventFormatter): message formatter.
+      event_data (EventData): event data.
+    """
+    data_type = message_formatter.data_type
+
+    try:
+      start_time = time.perf_counter()
+      for _ in range(self._number_of_iterations):
+        event_values = event_data.CopyToDict()
+        message_formatter.FormatEventValues(self._output_mediator, event_values)
+        message_formatter.GetMessage(event_values)
+
+      self._message_times[data_type] += time.perf_counter() - start_time
+
+      start_time = time.perf_counter()
+      for _ in range(self._number_of_iterations):
+        event_values = event_data.CopyToDict()
+        message_formatter.FormatEventValues(self._output_mediator, event_values)
+        message_formatter.GetMessageShort(event_values)
+
+      self._short_message_times[data_type] += time.perf_counter() - start_time
+
+    except (AttributeError, IndexError, TypeError, ValueError) as exception:
+      logging.warning((
+          f'Unable to format message of data type: {data_type:s} with error: '
+          f'{exception!s}'))
+      self._number_of_errors[data_type] += 1
+
+  def _ReadEventData(self, storage_reader):
+    """Reads representative event data from a storage file.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+    """
+    for event_data in storage_reader.GetAttributeContainers('event_data'):
+      event_data_per_data_type = self._event_data_per_data_type[
+          event_data.data_type]
+      if len(event_data_per_data_type) < self._MAXIMUM_NUMBER_OF_EVENT_DATA:
+        event_data_per_data_type.append(event_data)
+
+  def Benchmark(self, storage_file_path=None):
+    """Benchmarks the message formatters.
+
+    Args:
+      storage_file_path (Optional[str]): path of a storage file to read
+          representative event data from, where None represents event data
+          created from the message formatter definitions.
+
+    Returns:
+      bool: True if successful or False if not.
+    """
+    storage_reader = None
+    if storage_file_path:
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(
+              storage_file_path))
+      if not storage_reader:
+        logging.error(f'Unable to open storage file: {storage_file_path:s}')
+        return False
+
+    try:
+      self._output_mediator = output_mediator.OutputMediator(
+          storage_reader, data_location=self._data_location)
+
+      formatters_directory_path = os.path.join(
+          self._data_location, 'formatters')
+      self._output_mediator.ReadMessageFormattersFromDirectory(
+          formatters_directory_path)
+
+      if storage_reader:
+        self._ReadEventData(storage_reader)
+
+      # pylint: disable=protected-access
+      for data_type, message_formatter in sorted(
+          self._output_mediator._message_formatters.items()):
+        event_data_per_data_type = self._event_data_per_data_type.get(
+            data_type, None)
+        if not event_data_per_data_type and not storage_reader:
+          event_data_per_data_type = [self._CreateEventData(message_formatter)]
+          self._event_data_per_data_type[data_type] = event_data_per_data_type
+
+        for event_data in event_data_per_data_type or []:
+          self._BenchmarkEventData(message_formatter, event_data)
+
+    finally:
+      if storage_reader:
+        storage_reader.Close()
+
+    return True
+
+  def PrintResults(self):
+    """Prints the benchmark results."""
+    print((
+        'Data type\tNumber of event data\tMessage time (us)\t'
+        'Short message time (us)\tNumber of errors'))
+
+    total_message_time = 0.0
+    total_number_of_messages = 0
+    total_short_message_time = 0.0
+
+    for data_type, event_data_per_data_type in sorted(
+        self._event_data_per_data_type.items()):
+      number_of_event_data = len(event_data_per_data_type)
+      number_of_errors = self._number_of_errors[data_type]
+
+      number_of_messages = (
+          number_of_event_data - number_of_errors) * self._number_of_iterations
+      if not number_of_messages:
+        print((
+            f'{data_type:s}\t{number_of_event_data:d}\tN/A\tN/A\t'
+            f'{number_of_errors:d}'))
+        continue
+
+      message_time = self._message_times[data_type]
+      short_message_time = self._short_message_times[data_type]
+
+      total_message_time += message_time
+      total_number_of_messages += number_of_messages
+      total_short_message_time += short_message_time
+
+      message_time_per_message = (message_time * 1000000) / number_of_messages
+      short_message_time_per_message = (
+          short_message_time * 1000000) / number_of_messages
+
+      print((
+          f'{data_type:s}\t{number_of_event_data:d}\t'
+          f'{message_time_per_message:.2f}\t'
+          f'{short_message_time_per_message:.2f}\t{number_of_errors:d}'))
+
+    if total_number_of_messages:
+      message_time_per_message = (
+          total_message_time * 1000000) / total_number_of_messages
+      short_message_time_per_message = (
+          total_short_message_time * 1000000) / total_number_of_messages
+
+      print((
+          f'Total\t\t{message_time_per_message:.2f}\t'
+          f'{short_message_time_per_message:.2f}\t'))
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the message formatters per data type.'))
+
+  default_data_location = os.path.join(
+      os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'plaso',
+      'data')
+
+  argument_parser.add_argument(
+      '--data_location', '--data-location', dest='data_location', type=str,
+      action='store', metavar='PATH', default=default_data_location, help=(
+          'path of the data files, which contains the message formatters.'))
+
+  argument_parser.add_argument(
+      '--iterations', dest='iterations', type=int, action='store',
+      metavar='NUMBER', default=1000, help=(
+          'number of times the messages of an event data are formatted.'))
+
+  argument_parser.add_argument(
+      'storage_file', nargs='?', action='store', metavar='PATH',
+      default=None, help=(
+          'path of the storage file to read representative event data from. '
+          'If not specified event data is created from the message formatter '
+          'definitions.'))
+
+  options = argument_parser.parse_args()
+
+  if options.iterations < 1:
+    print('Unsupported number of iterations.')
+    print('')
+    argument_parser.print_help()
+    print('')
+    return False
+
+  logging.basicConfig(
+      level=logging.ERROR, format='[%(levelname)s] %(message)s')
+
+  benchmark = MessageFormattersBenchmark(
+      options.data_location, number_of_iterations=options.iterations)
+  if not benchmark.Benchmark(storage_file_path=options.storage_file):
+    return False
+
+  benchmark.PrintResults()
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
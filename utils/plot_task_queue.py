@@ -40,7 +40,9 @@ def Main():
     print('No such directory: {0:s}'.format(options.profile_path))
     return False
 
-  names = ['time', 'queued', 'processing', 'to_merge', 'abandoned', 'total']
+  names = [
+      'time', 'queued', 'processing', 'to_merge', 'abandoned', 'total',
+      'workers', 'cpu_utilization', 'memory_headroom', 'decision', 'reason']
 
   glob_expression = os.path.join(options.profile_path, 'task_queue-*.csv.gz')
   for csv_file_name in glob.glob(glob_expression):
@@ -54,6 +56,14 @@ def Main():
       pyplot.plot(data['time'], data['to_merge'], label='to merge')
       pyplot.plot(data['time'], data['abandoned'], label='abandoned')
 
+      # The number of worker processes is only sampled when the worker pool
+      # controller made a decision.
+      if data['workers'].dtype.kind == 'f':
+        has_workers = ~numpy.isnan(data['workers'])
+        pyplot.step(
+            data['time'][has_workers], data['workers'][has_workers],
+            label='workers', where='post')
+
   pyplot.title('Number of tasks over time')
 
   pyplot.xlabel('Time')